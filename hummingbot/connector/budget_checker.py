@@ -2,9 +2,10 @@ import typing
 from collections import defaultdict
 from copy import copy
 from decimal import Decimal
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple
 
 from hummingbot.core.data_type.order_candidate import OrderCandidate
+from hummingbot.core.data_type.trade_fee import TradeFeeBase
 
 if typing.TYPE_CHECKING:  # avoid circular import problems
     from hummingbot.connector.exchange_base import ExchangeBase
@@ -28,6 +29,9 @@ class BudgetChecker:
         """
         self._exchange = exchange
         self._locked_collateral: Dict[str, Decimal] = defaultdict(lambda: Decimal("0"))
+        # Balances and fees shared by all the candidates while a batch is adjusted by `adjust_candidates`
+        self._batch_balances: Optional[Dict[Tuple[str, bool], Decimal]] = None
+        self._batch_fees: Optional[Dict[Tuple, TradeFeeBase]] = None
 
     def reset_locked_collateral(self):
         """
@@ -45,15 +49,25 @@ class BudgetChecker:
         See the doc string for `adjust_candidate` to learn more about how the adjusted order
         amount is derived.
 
+        The candidates are adjusted in order, in a single pass, with the same results as successive calls to
+        `adjust_candidate_and_lock_available_collateral`. The balances are read once per asset for the whole batch,
+        and the fee is built once for all the candidates sharing trading pair, side, order type and maker status.
+
         :param order_candidates: A list of candidate orders to check and adjust.
         :param all_or_none: Should the order amount be set to zero on insufficient balance.
         :return: The list of adjusted order candidates.
         """
         self.reset_locked_collateral()
-        adjusted_candidates = [
-            self.adjust_candidate_and_lock_available_collateral(order_candidate, all_or_none)
-            for order_candidate in order_candidates
-        ]
+        self._batch_balances = {}
+        self._batch_fees = {}
+        try:
+            adjusted_candidates = [
+                self.adjust_candidate_and_lock_available_collateral(order_candidate, all_or_none)
+                for order_candidate in order_candidates
+            ]
+        finally:
+            self._batch_balances = None
+            self._batch_fees = None
         self.reset_locked_collateral()
         return adjusted_candidates
 
@@ -116,35 +130,35 @@ class BudgetChecker:
         :return: The adjusted order candidate.
         """
         order_candidate = copy(order_candidate)
-        order_candidate.populate_collateral_entries(self._exchange)
+        order_candidate.populate_collateral_entries(self._exchange, fees=self._batch_fees)
         return order_candidate
 
     def _get_available_balances(self, order_candidate: OrderCandidate) -> Dict[str, Decimal]:
         available_balances = {}
-        balance_fn = (
-            self._exchange.get_available_balance
-            if not order_candidate.from_total_balances
-            else self._exchange.get_balance
-        )
-
-        if order_candidate.order_collateral is not None:
-            token, _ = order_candidate.order_collateral
-            available_balances[token] = (
-                balance_fn(token) - self._locked_collateral[token]
-            )
+        collateral_tokens = [entry.token for entry in order_candidate.fixed_fee_collaterals]
         if order_candidate.percent_fee_collateral is not None:
-            token, _ = order_candidate.percent_fee_collateral
-            available_balances[token] = (
-                balance_fn(token) - self._locked_collateral[token]
-            )
-        for entry in order_candidate.fixed_fee_collaterals:
-            token, _ = entry
-            available_balances[token] = (
-                balance_fn(token) - self._locked_collateral[token]
-            )
+            collateral_tokens.append(order_candidate.percent_fee_collateral.token)
+        if order_candidate.order_collateral is not None:
+            collateral_tokens.append(order_candidate.order_collateral.token)
+
+        for token in collateral_tokens:
+            if token not in available_balances:
+                available_balances[token] = (
+                    self._get_balance(token, order_candidate.from_total_balances) - self._locked_collateral[token]
+                )
 
         return available_balances
 
+    def _get_balance(self, token: str, from_total_balances: bool) -> Decimal:
+        balance_fn = self._exchange.get_available_balance if not from_total_balances else self._exchange.get_balance
+        if self._batch_balances is None:
+            balance = balance_fn(token)
+        else:
+            balance = self._batch_balances.get((token, from_total_balances))
+            if balance is None:
+                balance = self._batch_balances[(token, from_total_balances)] = balance_fn(token)
+        return balance
+
     def _quantize_adjusted_order(self, order_candidate: OrderCandidate) -> OrderCandidate:
         trading_pair = order_candidate.trading_pair
         adjusted_amount = order_candidate.amount
@@ -1,9 +1,10 @@
 import asyncio
 import logging
-from collections import defaultdict
+from collections import defaultdict, deque
 from decimal import Decimal
 from itertools import chain
-from typing import TYPE_CHECKING, Callable, Dict, Optional
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Callable, Deque, Dict, Iterator, Mapping, NamedTuple, Optional
 
 from cachetools import TTLCache
 
@@ -29,6 +30,43 @@ if TYPE_CHECKING:
 cot_logger = None
 
 
+class OrderIndexEntry(NamedTuple):
+    """
+    Keys under which an order is currently registered in the indexes of the tracker
+    """
+    exchange_order_id: Optional[str]
+    state: Optional[OrderState]
+    is_active: bool
+    is_lost: bool
+
+
+class ExchangeOrderIdIndexView(Mapping):
+    """
+    Read only view of an index of the tracker by exchange order id. The exchange order id of an order can be changed
+    directly, without going through the tracker, so each hit is checked against the current exchange order id of the
+    order, and the indexes are brought up to date on a mismatch or a miss before looking up again.
+    """
+
+    def __init__(self, tracker: "ClientOrderTracker", index: Dict[str, InFlightOrder]):
+        self._tracker = tracker
+        self._index = index
+
+    def __getitem__(self, exchange_order_id: str) -> InFlightOrder:
+        order = self._index.get(exchange_order_id)
+        if order is None or order.exchange_order_id != exchange_order_id:
+            self._tracker._reindex_changed_exchange_order_ids()
+            order = self._index[exchange_order_id]
+        return order
+
+    def __iter__(self) -> Iterator[str]:
+        self._tracker._reindex_changed_exchange_order_ids()
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        self._tracker._reindex_changed_exchange_order_ids()
+        return len(self._index)
+
+
 class ClientOrderTracker:
 
     MAX_CACHE_SIZE = 1000
@@ -62,6 +100,22 @@ class ClientOrderTracker:
         self._last_poll_timestamp: int = -1
         self._order_not_found_records: Dict[str, int] = defaultdict(lambda: 0)
 
+        # Indexes maintained incrementally when the orders are tracked, stop being tracked, are lost or change state,
+        # so that the lookups for every user stream event do not have to rebuild the orders maps
+        self._index_entries: Dict[str, OrderIndexEntry] = {}
+        self._indexed_active_orders_count: int = 0
+        self._indexed_lost_orders_count: int = 0
+        self._fillable_orders: Dict[str, InFlightOrder] = {}
+        self._updatable_orders: Dict[str, InFlightOrder] = {}
+        self._fillable_orders_by_exchange_order_id: Dict[str, InFlightOrder] = {}
+        self._updatable_orders_by_exchange_order_id: Dict[str, InFlightOrder] = {}
+        self._active_orders_by_trading_pair: Dict[str, Dict[str, InFlightOrder]] = defaultdict(dict)
+        self._active_orders_by_state: Dict[OrderState, Dict[str, InFlightOrder]] = defaultdict(dict)
+        # Orders indexed before getting their exchange order id, that is assigned later by the order update
+        self._orders_without_exchange_order_id: Dict[str, InFlightOrder] = {}
+        # Client order ids in the order they were cached, to remove the expired cached orders from the indexes
+        self._cached_orders_ids: Deque[str] = deque()
+
     @property
     def active_orders(self) -> Dict[str, InFlightOrder]:
         """
@@ -84,39 +138,51 @@ class ClientOrderTracker:
         return {**self.active_orders, **self.cached_orders}
 
     @property
-    def all_fillable_orders(self) -> Dict[str, InFlightOrder]:
+    def all_fillable_orders(self) -> Mapping[str, InFlightOrder]:
         """
         Returns all orders that could still be impacted by trades: active orders, cached orders and lost orders
         """
-        return {**self.active_orders, **self.cached_orders, **self.lost_orders}
+        self._refresh_indexes()
+        return MappingProxyType(self._fillable_orders)
 
     @property
-    def all_fillable_orders_by_exchange_order_id(self) -> Dict[str, InFlightOrder]:
+    def all_fillable_orders_by_exchange_order_id(self) -> Mapping[str, InFlightOrder]:
         """
         Same as `all_fillable_orders`, but the orders are mapped by exchange order ID.
         """
-        orders_map = {
-            order.exchange_order_id: order
-            for order in chain(self.active_orders.values(), self.cached_orders.values(), self.lost_orders.values())
-        }
-        return orders_map
+        self._refresh_indexes()
+        return ExchangeOrderIdIndexView(self, self._fillable_orders_by_exchange_order_id)
 
     @property
-    def all_updatable_orders(self) -> Dict[str, InFlightOrder]:
+    def all_updatable_orders(self) -> Mapping[str, InFlightOrder]:
         """
         Returns all orders that could receive status updates
         """
-        return {**self.active_orders, **self.lost_orders}
+        self._refresh_indexes()
+        return MappingProxyType(self._updatable_orders)
 
     @property
-    def all_updatable_orders_by_exchange_order_id(self) -> Dict[str, InFlightOrder]:
+    def all_updatable_orders_by_exchange_order_id(self) -> Mapping[str, InFlightOrder]:
         """
         Same as `all_updatable_orders`, but the orders are mapped by exchange order ID.
         """
-        orders_map = {
-            order.exchange_order_id: order for order in chain(self.active_orders.values(), self.lost_orders.values())
-        }
-        return orders_map
+        self._refresh_indexes()
+        return ExchangeOrderIdIndexView(self, self._updatable_orders_by_exchange_order_id)
+
+    def active_orders_by_trading_pair(self, trading_pair: str) -> Mapping[str, InFlightOrder]:
+        """
+        Returns the active orders of the trading pair
+        """
+        self._refresh_indexes()
+        return MappingProxyType(self._active_orders_by_trading_pair.get(trading_pair, {}))
+
+    def active_orders_by_state(self, state: OrderState) -> Mapping[str, InFlightOrder]:
+        """
+        Returns the active orders currently in the state
+        """
+        self._refresh_indexes()
+        self._reindex_changed_states()
+        return MappingProxyType(self._active_orders_by_state.get(state, {}))
 
     @property
     def current_timestamp(self) -> int:
@@ -142,11 +208,14 @@ class ClientOrderTracker:
 
     def start_tracking_order(self, order: InFlightOrder):
         self._in_flight_orders[order.client_order_id] = order
+        self._update_order_indexes(order.client_order_id)
 
     def stop_tracking_order(self, client_order_id: str):
         if client_order_id in self._in_flight_orders:
             self._cached_orders[client_order_id] = self._in_flight_orders[client_order_id]
             del self._in_flight_orders[client_order_id]
+            self._cached_orders_ids.append(client_order_id)
+            self._update_order_indexes(client_order_id)
             if client_order_id in self._order_not_found_records:
                 del self._order_not_found_records[client_order_id]
 
@@ -162,6 +231,7 @@ class ClientOrderTracker:
             elif order.is_failure:
                 # If the order is marked as failed but is still in the tracking states, it was a lost order
                 self._lost_orders[order.client_order_id] = order
+                self._update_order_indexes(order.client_order_id)
 
     def fetch_tracked_order(self, client_order_id: str) -> Optional[InFlightOrder]:
         return self._in_flight_orders.get(client_order_id, None)
@@ -172,14 +242,12 @@ class ClientOrderTracker:
     def fetch_order(
         self, client_order_id: Optional[str] = None, exchange_order_id: Optional[str] = None
     ) -> Optional[InFlightOrder]:
-        found_order = None
+        found_order = self._in_flight_orders.get(client_order_id) or self._cached_orders.get(client_order_id)
 
-        if client_order_id in self.all_orders:
-            found_order = self.all_orders[client_order_id]
-        elif exchange_order_id is not None:
-            found_order = next(
-                (order for order in self.all_orders.values() if order.exchange_order_id == exchange_order_id), None
-            )
+        if found_order is None and exchange_order_id is not None:
+            found_order = self.all_fillable_orders_by_exchange_order_id.get(exchange_order_id)
+            if found_order is not None and self._index_entries[found_order.client_order_id].is_lost:
+                found_order = None
 
         return found_order
 
@@ -191,9 +259,9 @@ class ClientOrderTracker:
         if client_order_id in self._lost_orders:
             found_order = self._lost_orders[client_order_id]
         elif exchange_order_id is not None:
-            found_order = next(
-                (order for order in self._lost_orders.values() if order.exchange_order_id == exchange_order_id),
-                None)
+            found_order = self.all_updatable_orders_by_exchange_order_id.get(exchange_order_id)
+            if found_order is not None and not self._index_entries[found_order.client_order_id].is_lost:
+                found_order = None
 
         return found_order
 
@@ -209,6 +277,7 @@ class ClientOrderTracker:
             previous_executed_amount_base: Decimal = tracked_order.executed_amount_base
 
             updated: bool = tracked_order.update_with_trade_update(trade_update)
+            self._update_order_indexes(client_order_id)
             if updated:
                 self._trigger_order_fills(
                     tracked_order=tracked_order,
@@ -249,6 +318,7 @@ class ClientOrderTracker:
                     await self._process_order_update(order_update)
                     del self._cached_orders[client_order_id]
                     self._lost_orders[tracked_order.client_order_id] = tracked_order
+                    self._update_order_indexes(client_order_id)
         else:
             lost_order = self._lost_orders.get(client_order_id)
             if lost_order is not None:
@@ -291,6 +361,7 @@ class ClientOrderTracker:
 
             updated: bool = tracked_order.update_with_order_update(order_update)
             if updated:
+                self._update_order_indexes(tracked_order.client_order_id)
                 self._trigger_order_creation(tracked_order, previous_state, order_update.new_state)
                 self._trigger_order_completion(tracked_order, order_update)
         else:
@@ -301,6 +372,7 @@ class ClientOrderTracker:
                 if order_update.new_state in [OrderState.CANCELED, OrderState.FILLED, OrderState.FAILED]:
                     # If the order officially reaches a final state after being lost it should be removed from the lost list
                     del self._lost_orders[lost_order.client_order_id]
+                    self._update_order_indexes(lost_order.client_order_id)
             else:
                 self.logger().debug(f"Order is not/no longer being tracked ({order_update})")
 
@@ -437,6 +509,102 @@ class ClientOrderTracker:
 
         self.stop_tracking_order(tracked_order.client_order_id)
 
+    def _update_order_indexes(self, client_order_id: str):
+        """
+        Registers the order in the indexes according to its current container, exchange order id and state
+        """
+        self._remove_from_indexes(client_order_id)
+
+        active_order = self._in_flight_orders.get(client_order_id)
+        lost_order = self._lost_orders.get(client_order_id)
+        order = lost_order or active_order or self._cached_orders.get(client_order_id)
+        if order is None:
+            return
+
+        is_active = active_order is not None
+        is_lost = lost_order is not None
+        exchange_order_id = order.exchange_order_id
+        self._fillable_orders[client_order_id] = order
+        if is_active or is_lost:
+            self._updatable_orders[client_order_id] = order
+        if exchange_order_id is None:
+            self._orders_without_exchange_order_id[client_order_id] = order
+        else:
+            self._fillable_orders_by_exchange_order_id[exchange_order_id] = order
+            if is_active or is_lost:
+                self._updatable_orders_by_exchange_order_id[exchange_order_id] = order
+        state = None
+        if is_active:
+            state = order.current_state
+            self._active_orders_by_trading_pair[order.trading_pair][client_order_id] = order
+            self._active_orders_by_state[state][client_order_id] = order
+            self._indexed_active_orders_count += 1
+        if is_lost:
+            self._indexed_lost_orders_count += 1
+        self._index_entries[client_order_id] = OrderIndexEntry(
+            exchange_order_id=exchange_order_id, state=state, is_active=is_active, is_lost=is_lost)
+
+    def _remove_from_indexes(self, client_order_id: str):
+        entry = self._index_entries.pop(client_order_id, None)
+        if entry is None:
+            return
+        order = self._fillable_orders.pop(client_order_id)
+        self._updatable_orders.pop(client_order_id, None)
+        self._orders_without_exchange_order_id.pop(client_order_id, None)
+        if entry.exchange_order_id is not None:
+            if self._fillable_orders_by_exchange_order_id.get(entry.exchange_order_id) is order:
+                del self._fillable_orders_by_exchange_order_id[entry.exchange_order_id]
+            if self._updatable_orders_by_exchange_order_id.get(entry.exchange_order_id) is order:
+                del self._updatable_orders_by_exchange_order_id[entry.exchange_order_id]
+        if entry.is_active:
+            self._active_orders_by_trading_pair[order.trading_pair].pop(client_order_id, None)
+            self._active_orders_by_state[entry.state].pop(client_order_id, None)
+            self._indexed_active_orders_count -= 1
+        if entry.is_lost:
+            self._indexed_lost_orders_count -= 1
+
+    def _refresh_indexes(self):
+        """
+        Brings the indexes up to date with the changes that do not go through the tracker methods: the expiration of
+        the cached orders, the exchange order ids assigned directly to the orders, and the orders added or removed
+        directly in the tracked orders maps.
+        """
+        if (self._indexed_active_orders_count != len(self._in_flight_orders)
+                or self._indexed_lost_orders_count != len(self._lost_orders)):
+            self._rebuild_indexes()
+            return
+
+        while self._cached_orders_ids and self._cached_orders_ids[0] not in self._cached_orders:
+            self._update_order_indexes(self._cached_orders_ids.popleft())
+
+        if self._orders_without_exchange_order_id:
+            for client_order_id, order in list(self._orders_without_exchange_order_id.items()):
+                if order.exchange_order_id is not None:
+                    self._update_order_indexes(client_order_id)
+
+    def _reindex_changed_exchange_order_ids(self):
+        """
+        Re-indexes the orders whose exchange order id was changed directly, without going through the tracker
+        """
+        for client_order_id, entry in list(self._index_entries.items()):
+            if self._fillable_orders[client_order_id].exchange_order_id != entry.exchange_order_id:
+                self._update_order_indexes(client_order_id)
+
+    def _reindex_changed_states(self):
+        """
+        Re-indexes the active orders whose state was changed directly, without going through the tracker
+        """
+        for client_order_id, entry in list(self._index_entries.items()):
+            if entry.is_active and self._fillable_orders[client_order_id].current_state != entry.state:
+                self._update_order_indexes(client_order_id)
+
+    def _rebuild_indexes(self):
+        for client_order_id in list(self._index_entries):
+            self._remove_from_indexes(client_order_id)
+        self._cached_orders_ids = deque(self._cached_orders)
+        for client_order_id in chain(self._in_flight_orders, self._cached_orders_ids, self._lost_orders):
+            self._update_order_indexes(client_order_id)
+
     @staticmethod
     def _restore_order_from_json(serialized_order: Dict):
         order = InFlightOrder.from_json(serialized_order)
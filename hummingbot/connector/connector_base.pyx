@@ -1,7 +1,7 @@
 import asyncio
 import time
 from decimal import Decimal
-from typing import Dict, List, Set, Tuple, TYPE_CHECKING, Union
+from typing import Dict, List, Optional, Set, Tuple, TYPE_CHECKING, Union
 
 from hummingbot.client.config.trade_fee_schema_loader import TradeFeeSchemaLoader
 from hummingbot.connector.in_flight_order_base import InFlightOrderBase
@@ -267,35 +267,36 @@ cdef class ConnectorBase(NetworkIterator):
         raise NotImplementedError
 
     def batch_order_create(
-        self, orders_to_create: List[Union[LimitOrder, MarketOrder]]
+        self, orders_to_create: List[Union[LimitOrder, MarketOrder]], order_type: Optional[OrderType] = None,
     ) -> List[Union[LimitOrder, MarketOrder]]:
         """
         Issues a batch order creation as a single API request for exchanges that implement this feature. The default
         implementation of this method is to send the requests discretely (one by one).
         :param orders_to_create: A list of LimitOrder or MarketOrder objects representing the orders to create. The
             order IDs can be blanc.
+        :param order_type: The type of all the orders (e.g. LIMIT_MAKER), the type of each order object by default.
         :returns: A list of LimitOrder or MarketOrder objects representing the created orders, complete with the
             generated order IDs.
         """
         creation_results = []
         for order in orders_to_create:
-            order_type = OrderType.LIMIT if isinstance(order, LimitOrder) else OrderType.MARKET
-            size = order.quantity if order_type == OrderType.LIMIT else order.amount
+            is_limit_order = isinstance(order, LimitOrder)
+            size = order.quantity if is_limit_order else order.amount
             if order.is_buy:
                 client_order_id = self.buy(
                     trading_pair=order.trading_pair,
                     amount=size,
-                    order_type=order_type,
-                    price=order.price if order_type == OrderType.LIMIT else s_decimal_NaN
+                    order_type=order_type or order.order_type(),
+                    price=order.price if is_limit_order else s_decimal_NaN
                 )
             else:
                 client_order_id = self.sell(
                     trading_pair=order.trading_pair,
                     amount=size,
-                    order_type=order_type,
-                    price=order.price if order_type == OrderType.LIMIT else s_decimal_NaN,
+                    order_type=order_type or order.order_type(),
+                    price=order.price if is_limit_order else s_decimal_NaN,
                 )
-            if order_type == OrderType.LIMIT:
+            if is_limit_order:
                 creation_results.append(
                     LimitOrder(
                         client_order_id=client_order_id,
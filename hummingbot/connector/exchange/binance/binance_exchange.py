@@ -32,6 +32,8 @@ if TYPE_CHECKING:
 
 class BinanceExchange(ExchangePyBase):
     UPDATE_ORDER_STATUS_MIN_INTERVAL = 10.0
+    ORDER_UPDATES_CONCURRENCY = 10
+    BULK_ORDER_STATUS_UPDATES = True
 
     web_utils = web_utils
 
@@ -510,6 +512,24 @@ class BinanceExchange(ExchangePyBase):
 
         return order_update
 
+    async def _request_open_orders_updates(self, trading_pair: str) -> List[OrderUpdate]:
+        symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
+        open_orders = await self._api_get(
+            path_url=CONSTANTS.OPEN_ORDERS_PATH_URL,
+            params={"symbol": symbol},
+            is_auth_required=True)
+
+        return [
+            OrderUpdate(
+                client_order_id=order_data["clientOrderId"],
+                exchange_order_id=str(order_data["orderId"]),
+                trading_pair=trading_pair,
+                update_timestamp=order_data["updateTime"] * 1e-3,
+                new_state=CONSTANTS.ORDER_STATE[order_data["status"]],
+            )
+            for order_data in open_orders
+        ]
+
     async def _update_balances(self):
         local_asset_names = set(self._account_balances.keys())
         remote_asset_names = set()
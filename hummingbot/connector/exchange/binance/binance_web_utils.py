@@ -2,7 +2,7 @@ from typing import Callable, Optional
 
 import hummingbot.connector.exchange.binance.binance_constants as CONSTANTS
 from hummingbot.connector.time_synchronizer import TimeSynchronizer
-from hummingbot.connector.utils import TimeSynchronizerRESTPreProcessor
+from hummingbot.connector.utils import RateLimitHeadersRESTPostProcessor, TimeSynchronizerRESTPreProcessor
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
@@ -46,6 +46,9 @@ def build_api_factory(
         auth=auth,
         rest_pre_processors=[
             TimeSynchronizerRESTPreProcessor(synchronizer=time_synchronizer, time_provider=time_provider),
+        ],
+        rest_post_processors=[
+            RateLimitHeadersRESTPostProcessor(throttler=throttler, headers_to_limit_ids=CONSTANTS.RATE_LIMIT_HEADERS),
         ])
     return api_factory
 
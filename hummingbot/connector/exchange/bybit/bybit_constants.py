@@ -36,6 +36,9 @@ SERVER_TIME_PATH_URL = "/spot/v1/time"
 ACCOUNTS_PATH_URL = "/spot/v1/account"
 MY_TRADES_PATH_URL = "/spot/v1/myTrades"
 ORDER_PATH_URL = "/spot/v1/order"
+BATCH_CANCEL_ORDERS_BY_IDS_PATH_URL = "/spot/order/batch-cancel-by-ids"
+
+MAX_ORDERS_PER_BATCH_CANCEL = 100
 
 # Order States
 ORDER_STATE = {
@@ -97,6 +100,9 @@ RATE_LIMITS = {
     RateLimit(limit_id=ORDER_PATH_URL, limit=MAX_REQUEST_GET, time_interval=TWO_MINUTES,
               linked_limits=[LinkedLimitWeightPair(REQUEST_POST, 1), LinkedLimitWeightPair(REQUEST_POST_BURST, 1),
                              LinkedLimitWeightPair(REQUEST_POST_MIXED, 1)]),
+    RateLimit(limit_id=BATCH_CANCEL_ORDERS_BY_IDS_PATH_URL, limit=MAX_REQUEST_GET, time_interval=TWO_MINUTES,
+              linked_limits=[LinkedLimitWeightPair(REQUEST_POST, 1), LinkedLimitWeightPair(REQUEST_POST_BURST, 1),
+                             LinkedLimitWeightPair(REQUEST_POST_MIXED, 1)]),
     RateLimit(limit_id=ACCOUNTS_PATH_URL, limit=MAX_REQUEST_GET, time_interval=TWO_MINUTES,
               linked_limits=[LinkedLimitWeightPair(REQUEST_POST, 1), LinkedLimitWeightPair(REQUEST_POST_BURST, 1),
                              LinkedLimitWeightPair(REQUEST_POST_MIXED, 1)]),
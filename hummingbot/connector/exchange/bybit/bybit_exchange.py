@@ -1,6 +1,6 @@
 import asyncio
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from bidict import bidict
 
@@ -18,6 +18,7 @@ from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderUpdate
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.trade_fee import TokenAmount, TradeFeeBase
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
+from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.core.utils.estimate_fee import build_trade_fee
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
@@ -30,6 +31,8 @@ s_decimal_NaN = Decimal("nan")
 
 
 class BybitExchange(ExchangePyBase):
+    BATCH_ORDER_CANCEL_MAX_SIZE = CONSTANTS.MAX_ORDERS_PER_BATCH_CANCEL
+
     web_utils = web_utils
 
     def __init__(self,
@@ -229,6 +232,35 @@ class BybitExchange(ExchangePyBase):
             return True
         return False
 
+    async def _place_cancels(self, orders: List[InFlightOrder]) -> List[Union[bool, Exception]]:
+        # The batch endpoint only cancels by exchange order id, the orders without it are cancelled one by one
+        orders_with_id = [order for order in orders if order.exchange_order_id]
+        results_by_order_id = {}
+        if len(orders_with_id) > 0:
+            cancel_result = await self._api_delete(
+                path_url=CONSTANTS.BATCH_CANCEL_ORDERS_BY_IDS_PATH_URL,
+                params={"orderIds": ",".join(order.exchange_order_id for order in orders_with_id)},
+                is_auth_required=True)
+            if cancel_result.get("ret_code") != 0:
+                raise IOError(f"Error cancelling orders: {cancel_result}")
+            # Only the orders that could not be cancelled are listed in the result, with their error code
+            failures = {str(failure["orderId"]): failure for failure in cancel_result.get("result") or []
+                        if failure.get("code") not in (None, 0)}
+            for order in orders_with_id:
+                failure = failures.get(order.exchange_order_id)
+                results_by_order_id[order.client_order_id] = (
+                    True if failure is None
+                    else IOError(f"Error cancelling order {order.client_order_id}: {failure}"))
+
+        orders_without_id = [order for order in orders if not order.exchange_order_id]
+        cancel_results = await safe_gather(
+            *[self._place_cancel(order.client_order_id, order) for order in orders_without_id],
+            return_exceptions=True)
+        results_by_order_id.update(
+            (order.client_order_id, result) for order, result in zip(orders_without_id, cancel_results))
+
+        return [results_by_order_id[order.client_order_id] for order in orders]
+
     async def _format_trading_rules(self, exchange_info_dict: Dict[str, Any]) -> List[TradingRule]:
         """
         Example:
@@ -1,6 +1,6 @@
 import asyncio
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from bidict import bidict
 
@@ -17,6 +17,7 @@ from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState,
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount, TradeFeeBase
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
+from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 
@@ -29,6 +30,8 @@ class GateIoExchange(ExchangePyBase):
 
     # Using 120 seconds here as Gate.io websocket is quiet
     TICK_INTERVAL_LIMIT = 120.0
+    BATCH_ORDER_CREATE_MAX_SIZE = CONSTANTS.MAX_ORDERS_PER_BATCH_CREATE
+    BATCH_ORDER_CANCEL_MAX_SIZE = CONSTANTS.MAX_ORDERS_PER_BATCH_CANCEL
 
     web_utils = web_utils
 
@@ -192,6 +195,68 @@ class GateIoExchange(ExchangePyBase):
                            order_type: OrderType,
                            price: Decimal,
                            **kwargs) -> Tuple[str, float]:
+        data = await self._order_creation_data(
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            trade_type=trade_type,
+            order_type=order_type,
+            price=price,
+        )
+
+        # RESTRequest does not support json, and if we pass a dict
+        # the underlying aiohttp will encode it to params
+        data = data
+        endpoint = CONSTANTS.ORDER_CREATE_PATH_URL
+        order_result = await self._api_post(
+            path_url=endpoint,
+            data=data,
+            is_auth_required=True,
+            limit_id=endpoint,
+        )
+        if order_result.get("status") in {"cancelled"}:
+            raise IOError({"label": "ORDER_REJECTED", "message": "Order rejected."})
+        exchange_order_id = str(order_result["id"])
+        return exchange_order_id, self.current_timestamp
+
+    async def _place_orders(self, orders: List[InFlightOrder]) -> List[Union[Tuple[str, float], Exception]]:
+        data = [
+            await self._order_creation_data(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                order_type=order.order_type,
+                price=order.price,
+            )
+            for order in orders
+        ]
+        endpoint = CONSTANTS.BATCH_ORDER_CREATE_PATH_URL
+        orders_results = await self._api_post(
+            path_url=endpoint,
+            data=data,
+            is_auth_required=True,
+            limit_id=endpoint,
+        )
+        results_by_order_id = {order_result.get("text"): order_result for order_result in orders_results}
+        results = []
+        for order in orders:
+            order_result = results_by_order_id.get(order.client_order_id, {})
+            if not order_result.get("succeeded", False):
+                results.append(IOError({"label": order_result.get("label"), "message": order_result.get("message")}))
+            elif order_result.get("status") in {"cancelled"}:
+                results.append(IOError({"label": "ORDER_REJECTED", "message": "Order rejected."}))
+            else:
+                results.append((str(order_result["id"]), self.current_timestamp))
+        return results
+
+    async def _order_creation_data(self,
+                                   order_id: str,
+                                   trading_pair: str,
+                                   amount: Decimal,
+                                   trade_type: TradeType,
+                                   order_type: OrderType,
+                                   price: Decimal) -> Dict[str, Any]:
         order_type_str = order_type.name.lower().split("_")[0]
         symbol = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
         # When type is market, it refers to different currency according to side
@@ -225,21 +290,7 @@ class GateIoExchange(ExchangePyBase):
                 data.update({
                     "amount": f"{price * amount:f}",
                 })
-
-        # RESTRequest does not support json, and if we pass a dict
-        # the underlying aiohttp will encode it to params
-        data = data
-        endpoint = CONSTANTS.ORDER_CREATE_PATH_URL
-        order_result = await self._api_post(
-            path_url=endpoint,
-            data=data,
-            is_auth_required=True,
-            limit_id=endpoint,
-        )
-        if order_result.get("status") in {"cancelled"}:
-            raise IOError({"label": "ORDER_REJECTED", "message": "Order rejected."})
-        exchange_order_id = str(order_result["id"])
-        return exchange_order_id, self.current_timestamp
+        return data
 
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
         """
@@ -260,6 +311,37 @@ class GateIoExchange(ExchangePyBase):
         canceled = resp.get("status") == "cancelled"
         return canceled
 
+    async def _place_cancels(self, orders: List[InFlightOrder]) -> List[Union[bool, Exception]]:
+        exchange_order_ids = await safe_gather(
+            *[order.get_exchange_order_id() for order in orders], return_exceptions=True)
+        symbol = await self.exchange_symbol_associated_to_pair(trading_pair=orders[0].trading_pair)
+        data = [
+            {"currency_pair": symbol, "id": exchange_order_id}
+            for exchange_order_id in exchange_order_ids
+            if not isinstance(exchange_order_id, Exception)
+        ]
+        cancel_results = []
+        if len(data) > 0:
+            cancel_results = await self._api_post(
+                path_url=CONSTANTS.BATCH_ORDER_CANCEL_PATH_URL,
+                data=data,
+                is_auth_required=True,
+                limit_id=CONSTANTS.BATCH_ORDER_CANCEL_PATH_URL,
+            )
+        results_by_exchange_order_id = {str(cancel_result["id"]): cancel_result for cancel_result in cancel_results}
+        results = []
+        for exchange_order_id in exchange_order_ids:
+            if isinstance(exchange_order_id, Exception):
+                results.append(exchange_order_id)
+            else:
+                cancel_result = results_by_exchange_order_id.get(exchange_order_id, {})
+                if cancel_result.get("succeeded", False):
+                    results.append(True)
+                else:
+                    results.append(IOError({"label": cancel_result.get("label"),
+                                            "message": cancel_result.get("message")}))
+        return results
+
     async def _update_balances(self):
         """
         Calls REST API to update total and available balances.
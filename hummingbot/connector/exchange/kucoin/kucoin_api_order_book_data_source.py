@@ -3,7 +3,11 @@ from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from hummingbot.connector.exchange.kucoin import kucoin_constants as CONSTANTS, kucoin_web_utils as web_utils
 from hummingbot.core.data_type.common import TradeType
-from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+    order_book_levels_to_array,
+)
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, WSJSONRequest
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
@@ -108,8 +112,8 @@ class KucoinAPIOrderBookDataSource(OrderBookTrackerDataSource):
             "trading_pair": trading_pair,
             "update_id": update_id,
             "first_update_id": diff_data["sequenceStart"],
-            "bids": diff_data["changes"]["bids"],
-            "asks": diff_data["changes"]["asks"],
+            "bids": order_book_levels_to_array(diff_data["changes"]["bids"]),
+            "asks": order_book_levels_to_array(diff_data["changes"]["asks"]),
         }
         diff_message: OrderBookMessage = OrderBookMessage(
             OrderBookMessageType.DIFF,
@@ -21,12 +21,16 @@ ACCOUNTS_PATH_URL = "/api/v1/accounts"
 SERVER_TIME_PATH_URL = "/api/v1/timestamp"
 SYMBOLS_PATH_URL = "/api/v2/symbols"
 ORDERS_PATH_URL = "/api/v1/orders"
+MULTIPLE_ORDERS_PATH_URL = "/api/v1/orders/multi"
 FEE_PATH_URL = "/api/v1/trade-fees"
 ALL_TICKERS_PATH_URL = "/api/v1/market/allTickers"
 FILLS_PATH_URL = "/api/v1/fills"
 LIMIT_FILLS_PATH_URL = "/api/v1/limit/fills"
 ORDER_CLIENT_ORDER_PATH_URL = "/api/v1/order/client-order"
 
+# The multiple orders endpoint only accepts limit orders of the same symbol
+MAX_ORDERS_PER_MULTIPLE_ORDERS_REQUEST = 5
+
 WS_CONNECTION_LIMIT_ID = "WSConnection"
 WS_CONNECTION_LIMIT = 30
 WS_CONNECTION_TIME_INTERVAL = 60
@@ -1,6 +1,6 @@
 import asyncio
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from bidict import bidict
 
@@ -21,6 +21,7 @@ from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState,
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount, TradeFeeBase
 from hummingbot.core.data_type.user_stream_tracker_data_source import UserStreamTrackerDataSource
+from hummingbot.core.utils.async_utils import safe_gather
 from hummingbot.core.utils.estimate_fee import build_trade_fee
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
@@ -30,6 +31,8 @@ if TYPE_CHECKING:
 
 
 class KucoinExchange(ExchangePyBase):
+    BATCH_ORDER_CREATE_MAX_SIZE = CONSTANTS.MAX_ORDERS_PER_MULTIPLE_ORDERS_REQUEST
+
     web_utils = web_utils
 
     def __init__(self,
@@ -194,13 +197,90 @@ class KucoinExchange(ExchangePyBase):
                            price: Decimal,
                            **kwargs) -> Tuple[str, float]:
         path_url = CONSTANTS.ORDERS_PATH_URL
+        data = self._order_creation_data(
+            order_id=order_id,
+            amount=amount,
+            trade_type=trade_type,
+            order_type=order_type,
+            price=price,
+        )
+        data["symbol"] = await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair)
+        exchange_order_id = await self._api_post(
+            path_url=path_url,
+            data=data,
+            is_auth_required=True,
+            limit_id=CONSTANTS.POST_ORDER_LIMIT_ID,
+        )
+        return str(exchange_order_id["data"]["orderId"]), self.current_timestamp
+
+    async def _place_orders(self, orders: List[InFlightOrder]) -> List[Union[Tuple[str, float], Exception]]:
+        # Market orders are not accepted by the multiple orders endpoint, they are placed one by one
+        limit_orders = [order for order in orders if order.order_type.is_limit_type()]
+        results_by_order_id = {}
+        if len(limit_orders) > 0:
+            data = {
+                "symbol": await self.exchange_symbol_associated_to_pair(trading_pair=limit_orders[0].trading_pair),
+                "orderList": [
+                    self._order_creation_data(
+                        order_id=order.client_order_id,
+                        amount=order.amount,
+                        trade_type=order.trade_type,
+                        order_type=order.order_type,
+                        price=order.price,
+                    )
+                    for order in limit_orders
+                ],
+            }
+            response = await self._api_post(
+                path_url=CONSTANTS.MULTIPLE_ORDERS_PATH_URL,
+                data=data,
+                is_auth_required=True,
+                limit_id=CONSTANTS.POST_ORDER_LIMIT_ID,
+            )
+            for order_result in response["data"]["data"]:
+                if order_result.get("status") == "success":
+                    result = (str(order_result["id"]), self.current_timestamp)
+                else:
+                    result = IOError(f"Error submitting order {order_result.get('clientOid')}: "
+                                     f"{order_result.get('failMsg')}")
+                results_by_order_id[order_result.get("clientOid")] = result
+
+        market_orders = [order for order in orders if not order.order_type.is_limit_type()]
+        market_orders_results = await safe_gather(
+            *[
+                self._place_order(
+                    order_id=order.client_order_id,
+                    trading_pair=order.trading_pair,
+                    amount=order.amount,
+                    trade_type=order.trade_type,
+                    order_type=order.order_type,
+                    price=order.price,
+                )
+                for order in market_orders
+            ],
+            return_exceptions=True)
+        results_by_order_id.update(
+            (order.client_order_id, result) for order, result in zip(market_orders, market_orders_results))
+
+        return [
+            results_by_order_id.get(
+                order.client_order_id,
+                IOError(f"Error submitting order {order.client_order_id}: not present in the response"))
+            for order in orders
+        ]
+
+    @staticmethod
+    def _order_creation_data(order_id: str,
+                             amount: Decimal,
+                             trade_type: TradeType,
+                             order_type: OrderType,
+                             price: Decimal) -> Dict[str, Any]:
         side = trade_type.name.lower()
         order_type_str = "market" if order_type == OrderType.MARKET else "limit"
         data = {
             "size": str(amount),
             "clientOid": order_id,
             "side": side,
-            "symbol": await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair),
             "type": order_type_str,
         }
         if order_type is OrderType.LIMIT:
@@ -208,13 +288,7 @@ class KucoinExchange(ExchangePyBase):
         elif order_type is OrderType.LIMIT_MAKER:
             data["price"] = str(price)
             data["postOnly"] = True
-        exchange_order_id = await self._api_post(
-            path_url=path_url,
-            data=data,
-            is_auth_required=True,
-            limit_id=CONSTANTS.POST_ORDER_LIMIT_ID,
-        )
-        return str(exchange_order_id["data"]["orderId"]), self.current_timestamp
+        return data
 
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
         """
@@ -1,6 +1,6 @@
 import asyncio
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
 
 from bidict import bidict
 
@@ -26,6 +26,8 @@ if TYPE_CHECKING:
 
 
 class OkxExchange(ExchangePyBase):
+    BATCH_ORDER_CREATE_MAX_SIZE = CONSTANTS.MAX_ORDERS_PER_BATCH_REQUEST
+    BATCH_ORDER_CANCEL_MAX_SIZE = CONSTANTS.MAX_ORDERS_PER_BATCH_REQUEST
 
     web_utils = web_utils
 
@@ -184,15 +186,13 @@ class OkxExchange(ExchangePyBase):
                            order_type: OrderType,
                            price: Decimal,
                            **kwargs) -> Tuple[str, float]:
-        data = {
-            "clOrdId": order_id,
-            "tdMode": "cash",
-            "ordType": "limit",
-            "side": trade_type.name.lower(),
-            "instId": await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair),
-            "sz": str(amount),
-            "px": str(price)
-        }
+        data = await self._order_creation_data(
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            trade_type=trade_type,
+            price=price,
+        )
 
         exchange_order_id = await self._api_request(
             path_url=CONSTANTS.OKX_PLACE_ORDER_PATH,
@@ -206,6 +206,53 @@ class OkxExchange(ExchangePyBase):
             raise IOError(f"Error submitting order {order_id}: {data['sMsg']}")
         return str(data["ordId"]), self.current_timestamp
 
+    async def _place_orders(self, orders: List[InFlightOrder]) -> List[Union[Tuple[str, float], Exception]]:
+        data = [
+            await self._order_creation_data(
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.amount,
+                trade_type=order.trade_type,
+                price=order.price,
+            )
+            for order in orders
+        ]
+
+        response = await self._api_request(
+            path_url=CONSTANTS.OKX_BATCH_ORDERS_PATH,
+            method=RESTMethod.POST,
+            data=data,
+            is_auth_required=True,
+            limit_id=CONSTANTS.OKX_BATCH_ORDERS_PATH,
+        )
+        results_by_order_id = {result["clOrdId"]: result for result in response["data"]}
+        results = []
+        for order in orders:
+            result = results_by_order_id.get(order.client_order_id)
+            if result is None:
+                results.append(IOError(f"Error submitting order {order.client_order_id}: {response.get('msg')}"))
+            elif result["sCode"] != "0":
+                results.append(IOError(f"Error submitting order {order.client_order_id}: {result['sMsg']}"))
+            else:
+                results.append((str(result["ordId"]), self.current_timestamp))
+        return results
+
+    async def _order_creation_data(self,
+                                   order_id: str,
+                                   trading_pair: str,
+                                   amount: Decimal,
+                                   trade_type: TradeType,
+                                   price: Decimal) -> Dict[str, Any]:
+        return {
+            "clOrdId": order_id,
+            "tdMode": "cash",
+            "ordType": "limit",
+            "side": trade_type.name.lower(),
+            "instId": await self.exchange_symbol_associated_to_pair(trading_pair=trading_pair),
+            "sz": str(amount),
+            "px": str(price)
+        }
+
     async def _place_cancel(self, order_id: str, tracked_order: InFlightOrder):
         """
         This implementation specific function is called by _cancel, and returns True if successful
@@ -219,16 +266,39 @@ class OkxExchange(ExchangePyBase):
             data=params,
             is_auth_required=True,
         )
-        if cancel_result["data"][0]["sCode"] == "0":
+        return self._is_order_cancelled(order_id=order_id, result=cancel_result["data"][0], response=cancel_result)
+
+    async def _place_cancels(self, orders: List[InFlightOrder]) -> List[Union[bool, Exception]]:
+        data = [{"clOrdId": order.client_order_id, "instId": order.trading_pair} for order in orders]
+        cancel_result = await self._api_post(
+            path_url=CONSTANTS.OKX_BATCH_ORDER_CANCEL_PATH,
+            data=data,
+            is_auth_required=True,
+        )
+        results_by_order_id = {result["clOrdId"]: result for result in cancel_result["data"]}
+        results = []
+        for order in orders:
+            try:
+                results.append(self._is_order_cancelled(
+                    order_id=order.client_order_id,
+                    result=results_by_order_id.get(order.client_order_id, {}),
+                    response=cancel_result))
+            except IOError as ex:
+                results.append(ex)
+        return results
+
+    @staticmethod
+    def _is_order_cancelled(order_id: str, result: Dict[str, Any], response: Dict[str, Any]) -> bool:
+        if result.get("sCode") == "0":
             final_result = True
-        elif cancel_result["data"][0]["sCode"] == "51400":
+        elif result.get("sCode") == "51400":
             # Cancelation failed because the order does not exist
             final_result = True
-        elif cancel_result["data"][0]["sCode"] == "51401":
+        elif result.get("sCode") == "51401":
             # Cancelation failed because order has been cancelled
             final_result = True
         else:
-            raise IOError(f"Error cancelling order {order_id}: {cancel_result}")
+            raise IOError(f"Error cancelling order {order_id}: {response}")
 
         return final_result
 
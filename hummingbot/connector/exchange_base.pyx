@@ -1,7 +1,8 @@
 import asyncio
 from decimal import Decimal
-from typing import Dict, List, Iterator, Mapping, Optional, TYPE_CHECKING
+from typing import Dict, List, Iterator, Mapping, Optional, Sequence, TYPE_CHECKING, Union
 
+import numpy as np
 from bidict import bidict
 
 from hummingbot.connector.budget_checker import BudgetChecker
@@ -271,6 +272,30 @@ cdef class ExchangeBase(ConnectorBase):
     def get_quote_volume_for_price(self, trading_pair: str, is_buy: bool, price: Decimal) -> ClientOrderBookQueryResult:
         return self.c_get_quote_volume_for_price(trading_pair, is_buy, price)
 
+    def get_price_for_volumes(self, trading_pair: str, is_buy: bool,
+                              volumes: Union[np.ndarray, Sequence[Decimal]]) -> np.ndarray:
+        """
+        Prices reached by each of the volumes, computed in a single pass over the order book. The result is a float
+        array aligned with `volumes`, with NaN where the order book is not deep enough.
+        """
+        return self.c_get_order_book(trading_pair).get_price_for_volumes(is_buy, np.asarray(volumes, dtype=float))
+
+    def get_vwap_for_volumes(self, trading_pair: str, is_buy: bool,
+                             volumes: Union[np.ndarray, Sequence[Decimal]]) -> np.ndarray:
+        """
+        VWAP for each of the volumes, computed in a single pass over the order book. The result is a float array
+        aligned with `volumes`, with NaN where the order book is not deep enough.
+        """
+        return self.c_get_order_book(trading_pair).get_vwap_for_volumes(is_buy, np.asarray(volumes, dtype=float))
+
+    def get_volume_for_prices(self, trading_pair: str, is_buy: bool,
+                              prices: Union[np.ndarray, Sequence[Decimal]]) -> np.ndarray:
+        """
+        Base volume available at each of the prices or better, computed in a single pass over the order book. The
+        result is a float array aligned with `prices`.
+        """
+        return self.c_get_order_book(trading_pair).get_volume_for_prices(is_buy, np.asarray(prices, dtype=float))
+
     def get_price(self, trading_pair: str, is_buy: bool) -> Decimal:
         return self.c_get_price(trading_pair, is_buy)
 
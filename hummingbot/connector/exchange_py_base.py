@@ -3,8 +3,9 @@ import copy
 import logging
 import math
 from abc import ABC, abstractmethod
+from collections import defaultdict
 from decimal import Decimal
-from typing import TYPE_CHECKING, Any, AsyncIterable, Callable, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, AsyncIterable, Awaitable, Callable, Dict, List, Optional, Tuple, Union
 
 from async_timeout import timeout
 
@@ -15,11 +16,14 @@ from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
-from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.async_throttler_base import request_priority
+from hummingbot.core.api_throttler.data_types import RateLimit, RequestPriority
+from hummingbot.core.data_type.array_order_book import ArrayOrderBook
 from hummingbot.core.data_type.cancellation_result import CancellationResult
-from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.common import OrderBookEngine, OrderType, PositionAction, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate, TradeUpdate
 from hummingbot.core.data_type.limit_order import LimitOrder
+from hummingbot.core.data_type.market_order import MarketOrder
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
@@ -45,6 +49,35 @@ class ExchangePyBase(ExchangeBase, ABC):
     TRADING_RULES_INTERVAL = 30 * MINUTE
     TRADING_FEES_INTERVAL = TWELVE_HOURS
     TICK_INTERVAL_LIMIT = 60.0
+    ORDER_BOOK_ENGINE = OrderBookEngine.SET
+    ORDER_BOOK_INIT_CONCURRENCY = 0
+    ORDER_BOOK_DIRECT_DISPATCH = False
+    THROTTLER_CLASS = AsyncThrottler
+    # Fraction of each rate limit (from 0 to 1) reserved for the HIGH and CRITICAL priority requests (order creation
+    # and cancels), so that the polling requests can not use all of it
+    THROTTLER_PRIORITY_RESERVE_PCT = 0.0
+    # Additional keyword arguments for the THROTTLER_CLASS, for example {"fifo_scheduling": True} for the
+    # SlidingWindowThrottler
+    THROTTLER_OPTIONS: Dict[str, Any] = {}
+    # Seconds between the requests keeping the pooled connections to the exchange open, so the orders do not pay the
+    # TLS handshake after an idle period. It should be shorter than the keep-alive timeout of the exchange, and 0
+    # disables the requests.
+    CONNECTIONS_KEEP_ALIVE_INTERVAL = 0.0
+    # Maximum number of order status and order fills requests sent at the same time by each polling pass. The requests
+    # are still paced by the throttler, and 0 sends them one order after another.
+    ORDER_UPDATES_CONCURRENCY = 0
+    # Declares that the connector implements `_request_open_orders_updates`, to get the status of all the open orders
+    # of a trading pair with a single request. Only the orders missing from the response are requested one by one.
+    BULK_ORDER_STATUS_UPDATES = False
+    # Declares that the connector implements `_all_trade_updates_for_trading_pair`, to get the fills of all the orders
+    # of a trading pair with a single request
+    BULK_TRADE_UPDATES = False
+    # Maximum number of orders of a trading pair the exchange creates with a single batch request. The connectors with
+    # a batch endpoint implement `_place_orders`, and 0 creates the orders of a batch concurrently, one request each.
+    BATCH_ORDER_CREATE_MAX_SIZE = 0
+    # Maximum number of orders of a trading pair the exchange cancels with a single batch request. The connectors with
+    # a batch endpoint implement `_place_cancels`, and 0 cancels the orders of a batch concurrently, one request each.
+    BATCH_ORDER_CANCEL_MAX_SIZE = 0
 
     def __init__(self, client_config_map: "ClientConfigAdapter"):
         super().__init__(client_config_map)
@@ -60,11 +93,14 @@ class ExchangePyBase(ExchangeBase, ABC):
         self._trading_rules_polling_task: Optional[asyncio.Task] = None
         self._trading_fees_polling_task: Optional[asyncio.Task] = None
         self._lost_orders_update_task: Optional[asyncio.Task] = None
+        self._connections_keep_alive_task: Optional[asyncio.Task] = None
 
         self._time_synchronizer = TimeSynchronizer()
-        self._throttler = AsyncThrottler(
+        self._throttler = self.THROTTLER_CLASS(
             rate_limits=self.rate_limits_rules,
-            limits_share_percentage=client_config_map.rate_limits_share_pct)
+            limits_share_percentage=client_config_map.rate_limits_share_pct,
+            priority_reserve_pct=self.THROTTLER_PRIORITY_RESERVE_PCT,
+            **self.THROTTLER_OPTIONS)
         self._poll_notifier = asyncio.Event()
 
         # init Auth and Api factory
@@ -73,10 +109,14 @@ class ExchangePyBase(ExchangeBase, ABC):
 
         # init OrderBook Data Source and Tracker
         self._orderbook_ds: OrderBookTrackerDataSource = self._create_order_book_data_source()
+        if self.ORDER_BOOK_ENGINE is OrderBookEngine.ARRAY:
+            self._orderbook_ds.order_book_create_function = lambda: ArrayOrderBook()
         self._set_order_book_tracker(OrderBookTracker(
             data_source=self._orderbook_ds,
             trading_pairs=self.trading_pairs,
-            domain=self.domain))
+            domain=self.domain,
+            init_concurrency=self.ORDER_BOOK_INIT_CONCURRENCY,
+            direct_dispatch=self.ORDER_BOOK_DIRECT_DISPATCH))
 
         # init UserStream Data Source and Tracker
         self._user_stream_tracker = self._create_user_stream_tracker()
@@ -320,6 +360,44 @@ class ExchangePyBase(ExchangeBase, ABC):
             **kwargs))
         return order_id
 
+    def batch_order_create(
+        self,
+        orders_to_create: List[Union[LimitOrder, MarketOrder]],
+        order_type: Optional[OrderType] = None,
+    ) -> List[Union[LimitOrder, MarketOrder]]:
+        """
+        Creates a promise to create all the orders. The orders of each trading pair are created with batch requests
+        when the exchange supports them, and concurrently with one request per order otherwise.
+
+        :param orders_to_create: the LimitOrder or MarketOrder objects representing the orders to create (the order
+            ids can be blank)
+        :param order_type: the type of all the orders (LIMIT, LIMIT_MAKER), the type of each order object by default
+
+        :return: the orders to create, with the ids assigned by the connector (the client ids)
+        """
+        orders_with_ids_to_create = []
+        for order in orders_to_create:
+            client_order_id = get_new_client_order_id(
+                is_buy=order.is_buy,
+                trading_pair=order.trading_pair,
+                hbot_order_id_prefix=self.client_order_id_prefix,
+                max_id_len=self.client_order_id_max_length,
+            )
+            orders_with_ids_to_create.append(order.copy_with_id(client_order_id=client_order_id))
+        safe_ensure_future(self._execute_batch_order_create(
+            orders_to_create=orders_with_ids_to_create,
+            order_type=order_type))
+        return orders_with_ids_to_create
+
+    def batch_order_cancel(self, orders_to_cancel: List[LimitOrder]):
+        """
+        Creates a promise to cancel all the orders. The orders of each trading pair are cancelled with batch requests
+        when the exchange supports them, and concurrently with one request per order otherwise.
+
+        :param orders_to_cancel: the orders to cancel
+        """
+        safe_ensure_future(self._execute_batch_cancel(orders_to_cancel=orders_to_cancel))
+
     def get_fee(self,
                 base_currency: str,
                 quote_currency: str,
@@ -407,6 +485,48 @@ class ExchangePyBase(ExchangeBase, ABC):
         :param order_type: the type of order to create (MARKET, LIMIT, LIMIT_MAKER)
         :param price: the order price
         """
+        order = await self._start_tracking_and_validate_order(
+            trade_type=trade_type,
+            order_id=order_id,
+            trading_pair=trading_pair,
+            amount=amount,
+            order_type=order_type,
+            price=price,
+            **kwargs,
+        )
+        if order is None:
+            return
+        try:
+            with request_priority(RequestPriority.HIGH):
+                await self._place_order_and_process_update(order=order, **kwargs,)
+
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            self._on_order_failure(
+                order_id=order_id,
+                trading_pair=trading_pair,
+                amount=order.amount,
+                trade_type=trade_type,
+                order_type=order_type,
+                price=order.price,
+                exception=ex,
+                **kwargs,
+            )
+
+    async def _start_tracking_and_validate_order(self,
+                                                 trade_type: TradeType,
+                                                 order_id: str,
+                                                 trading_pair: str,
+                                                 amount: Decimal,
+                                                 order_type: OrderType,
+                                                 price: Optional[Decimal] = None,
+                                                 **kwargs) -> Optional[InFlightOrder]:
+        """
+        Starts tracking the order with the amount and price quantized, and checks it complies with the trading rules
+
+        :return: the tracked order, or None when the order is not valid (it is then marked as failed)
+        """
         trading_rule = self._trading_rules[trading_pair]
 
         if order_type in [OrderType.LIMIT, OrderType.LIMIT_MAKER]:
@@ -433,37 +553,107 @@ class ExchangePyBase(ExchangeBase, ABC):
         if order_type not in self.supported_order_types():
             self.logger().error(f"{order_type} is not in the list of supported order types")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
-            return
+            order = None
 
         elif quantized_amount < trading_rule.min_order_size:
             self.logger().warning(f"{trade_type.name.title()} order amount {amount} is lower than the minimum order "
                                   f"size {trading_rule.min_order_size}. The order will not be created, increase the "
                                   f"amount to be higher than the minimum order size.")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
-            return
+            order = None
 
         elif notional_size < trading_rule.min_notional_size:
             self.logger().warning(f"{trade_type.name.title()} order notional {notional_size} is lower than the "
                                   f"minimum notional size {trading_rule.min_notional_size}. The order will not be "
                                   f"created. Increase the amount or the price to be higher than the minimum notional.")
             self._update_order_after_failure(order_id=order_id, trading_pair=trading_pair)
-            return
-        try:
-            await self._place_order_and_process_update(order=order, **kwargs,)
+            order = None
 
+        return order
+
+    async def _execute_batch_order_create(
+        self,
+        orders_to_create: List[Union[LimitOrder, MarketOrder]],
+        order_type: Optional[OrderType] = None,
+    ):
+        """
+        Creates the orders with batch requests of at most BATCH_ORDER_CREATE_MAX_SIZE orders of the same trading pair,
+        or concurrently with one request per order when the exchange does not support batch requests
+
+        :param orders_to_create: the orders to create, with the client ids already assigned
+        :param order_type: the type of all the orders, the type of each order object by default
+        """
+        orders_arguments = []
+        for order in orders_to_create:
+            order_arguments = dict(
+                trade_type=TradeType.BUY if order.is_buy else TradeType.SELL,
+                order_id=order.client_order_id,
+                trading_pair=order.trading_pair,
+                amount=order.quantity,
+                order_type=order_type or order.order_type(),
+                price=s_decimal_NaN if order.price is None else order.price,
+            )
+            # The position action is only passed for the orders of derivatives, the extra arguments of `_create_order`
+            # are forwarded to `_place_order`, and the spot connectors do not accept it
+            if order.position != PositionAction.NIL:
+                order_arguments["position_action"] = order.position
+            orders_arguments.append(order_arguments)
+        if self.BATCH_ORDER_CREATE_MAX_SIZE > 0:
+            valid_orders = []
+            for order_arguments in orders_arguments:
+                order = await self._start_tracking_and_validate_order(**order_arguments)
+                if order is not None:
+                    valid_orders.append(order)
+            await safe_gather(*[
+                self._place_orders_and_process_updates(orders=batch)
+                for batch in self._order_batches(orders=valid_orders, batch_size=self.BATCH_ORDER_CREATE_MAX_SIZE)
+            ])
+        else:
+            await safe_gather(*[self._create_order(**order_arguments) for order_arguments in orders_arguments])
+
+    async def _place_orders_and_process_updates(self, orders: List[InFlightOrder]):
+        try:
+            with request_priority(RequestPriority.HIGH):
+                results = await self._place_orders(orders=orders)
         except asyncio.CancelledError:
             raise
         except Exception as ex:
-            self._on_order_failure(
-                order_id=order_id,
-                trading_pair=trading_pair,
-                amount=quantized_amount,
-                trade_type=trade_type,
-                order_type=order_type,
-                price=price,
-                exception=ex,
-                **kwargs,
-            )
+            self.logger().network(f"Error submitting a batch of {len(orders)} orders to {self.name_cap}.",
+                                  exc_info=True)
+            results = [ex] * len(orders)
+
+        for order, result in zip(orders, results):
+            if isinstance(result, Exception):
+                self._on_order_failure(
+                    order_id=order.client_order_id,
+                    trading_pair=order.trading_pair,
+                    amount=order.amount,
+                    trade_type=order.trade_type,
+                    order_type=order.order_type,
+                    price=order.price,
+                    exception=result,
+                )
+            else:
+                exchange_order_id, update_timestamp = result
+                order_update: OrderUpdate = OrderUpdate(
+                    client_order_id=order.client_order_id,
+                    exchange_order_id=str(exchange_order_id),
+                    trading_pair=order.trading_pair,
+                    update_timestamp=update_timestamp,
+                    new_state=OrderState.OPEN,
+                )
+                self._order_tracker.process_order_update(order_update)
+
+    @staticmethod
+    def _order_batches(orders: List[InFlightOrder], batch_size: int) -> List[List[InFlightOrder]]:
+        """
+        Splits the orders in batches of at most batch_size orders of the same trading pair
+        """
+        return [
+            trading_pair_orders[index:index + batch_size]
+            for trading_pair_orders in ExchangePyBase._orders_by_trading_pair(orders).values()
+            for index in range(0, len(trading_pair_orders), batch_size)
+        ]
 
     async def _place_order_and_process_update(self, order: InFlightOrder, **kwargs) -> str:
         exchange_order_id, update_timestamp = await self._place_order(
@@ -517,42 +707,49 @@ class ExchangePyBase(ExchangeBase, ABC):
 
     async def _execute_order_cancel(self, order: InFlightOrder) -> str:
         try:
-            cancelled = await self._execute_order_cancel_and_process_update(order=order)
+            with request_priority(RequestPriority.CRITICAL):
+                cancelled = await self._execute_order_cancel_and_process_update(order=order)
             if cancelled:
                 return order.client_order_id
         except asyncio.CancelledError:
             raise
-        except asyncio.TimeoutError:
+        except Exception as ex:
+            await self._on_order_cancel_failure(order=order, exception=ex)
+
+    async def _on_order_cancel_failure(self, order: InFlightOrder, exception: Exception):
+        if isinstance(exception, asyncio.TimeoutError):
             # some exchanges do not allow cancels with the client/user order id
             # so log a warning and wait for the creation of the order to complete
             self.logger().warning(
                 f"Failed to cancel the order {order.client_order_id} because it does not have an exchange order id yet"
             )
             await self._order_tracker.process_order_not_found(order.client_order_id)
-        except Exception as ex:
-            if self._is_order_not_found_during_cancelation_error(cancelation_exception=ex):
-                self.logger().warning(f"Failed to cancel order {order.client_order_id} (order not found)")
-                await self._order_tracker.process_order_not_found(order.client_order_id)
-            else:
-                self.logger().error(f"Failed to cancel order {order.client_order_id}", exc_info=True)
+        elif self._is_order_not_found_during_cancelation_error(cancelation_exception=exception):
+            self.logger().warning(f"Failed to cancel order {order.client_order_id} (order not found)")
+            await self._order_tracker.process_order_not_found(order.client_order_id)
+        else:
+            self.logger().error(f"Failed to cancel order {order.client_order_id}", exc_info=True)
 
     async def _execute_order_cancel_and_process_update(self, order: InFlightOrder) -> bool:
         cancelled = await self._place_cancel(order.client_order_id, order)
         if cancelled:
-            update_timestamp = self.current_timestamp
-            if update_timestamp is None or math.isnan(update_timestamp):
-                update_timestamp = self._time()
-            order_update: OrderUpdate = OrderUpdate(
-                client_order_id=order.client_order_id,
-                trading_pair=order.trading_pair,
-                update_timestamp=update_timestamp,
-                new_state=(OrderState.CANCELED
-                           if self.is_cancel_request_in_exchange_synchronous
-                           else OrderState.PENDING_CANCEL),
-            )
-            self._order_tracker.process_order_update(order_update)
+            self._process_order_cancel_update(order=order)
         return cancelled
 
+    def _process_order_cancel_update(self, order: InFlightOrder):
+        update_timestamp = self.current_timestamp
+        if update_timestamp is None or math.isnan(update_timestamp):
+            update_timestamp = self._time()
+        order_update: OrderUpdate = OrderUpdate(
+            client_order_id=order.client_order_id,
+            trading_pair=order.trading_pair,
+            update_timestamp=update_timestamp,
+            new_state=(OrderState.CANCELED
+                       if self.is_cancel_request_in_exchange_synchronous
+                       else OrderState.PENDING_CANCEL),
+        )
+        self._order_tracker.process_order_update(order_update)
+
     async def _execute_cancel(self, trading_pair: str, order_id: str) -> str:
         """
         Requests the exchange to cancel an active order
@@ -567,6 +764,61 @@ class ExchangePyBase(ExchangeBase, ABC):
 
         return result
 
+    async def _execute_batch_cancel(self, orders_to_cancel: List[LimitOrder]) -> List[CancellationResult]:
+        """
+        Cancels the orders with batch requests of at most BATCH_ORDER_CANCEL_MAX_SIZE orders of the same trading pair,
+        or concurrently with one request per order when the exchange does not support batch requests
+
+        :param orders_to_cancel: the orders to cancel
+
+        :return: a CancellationResult for each of the orders to cancel
+        """
+        tracked_orders = []
+        results = []
+        for order in orders_to_cancel:
+            tracked_order = self._order_tracker.fetch_tracked_order(order.client_order_id)
+            if tracked_order is not None:
+                tracked_orders.append(tracked_order)
+            else:
+                results.append(CancellationResult(order_id=order.client_order_id, success=False))
+
+        if self.BATCH_ORDER_CANCEL_MAX_SIZE > 0:
+            batches = self._order_batches(orders=tracked_orders, batch_size=self.BATCH_ORDER_CANCEL_MAX_SIZE)
+            batches_results = await safe_gather(*[self._execute_orders_cancel(orders=batch) for batch in batches])
+            tracked_orders = [order for batch in batches for order in batch]
+            cancelled_order_ids = [order_id for batch_results in batches_results for order_id in batch_results]
+        else:
+            cancelled_order_ids = await safe_gather(*[
+                self._execute_order_cancel(order=order) for order in tracked_orders])
+
+        results.extend(
+            CancellationResult(order_id=order.client_order_id, success=cancelled_order_id is not None)
+            for order, cancelled_order_id in zip(tracked_orders, cancelled_order_ids)
+        )
+        return results
+
+    async def _execute_orders_cancel(self, orders: List[InFlightOrder]) -> List[Optional[str]]:
+        try:
+            with request_priority(RequestPriority.CRITICAL):
+                results = await self._place_cancels(orders=orders)
+        except asyncio.CancelledError:
+            raise
+        except Exception as ex:
+            self.logger().network(f"Error cancelling a batch of {len(orders)} orders in {self.name_cap}.",
+                                  exc_info=True)
+            results = [ex] * len(orders)
+
+        cancelled_order_ids = []
+        for order, result in zip(orders, results):
+            cancelled_order_id = None
+            if isinstance(result, Exception):
+                await self._on_order_cancel_failure(order=order, exception=result)
+            elif result:
+                self._process_order_cancel_update(order=order)
+                cancelled_order_id = order.client_order_id
+            cancelled_order_ids.append(cancelled_order_id)
+        return cancelled_order_ids
+
     # === Order Tracking ===
 
     def restore_tracking_states(self, saved_states: Dict[str, Any]):
@@ -640,6 +892,30 @@ class ExchangePyBase(ExchangeBase, ABC):
                            ) -> Tuple[str, float]:
         raise NotImplementedError
 
+    async def _place_orders(self, orders: List[InFlightOrder]) -> List[Union[Tuple[str, float], Exception]]:
+        """
+        Creates a batch of orders of the same trading pair with a single request. Required when
+        BATCH_ORDER_CREATE_MAX_SIZE is not 0.
+
+        :param orders: the orders to create, at most BATCH_ORDER_CREATE_MAX_SIZE
+
+        :return: for each order, a tuple with the exchange order id and the creation timestamp, or the exception with
+            the reason the exchange rejected the order
+        """
+        raise NotImplementedError
+
+    async def _place_cancels(self, orders: List[InFlightOrder]) -> List[Union[bool, Exception]]:
+        """
+        Cancels a batch of orders of the same trading pair with a single request. Required when
+        BATCH_ORDER_CANCEL_MAX_SIZE is not 0.
+
+        :param orders: the orders to cancel, at most BATCH_ORDER_CANCEL_MAX_SIZE
+
+        :return: for each order, True if it was cancelled, False if it was not, or the exception with the reason the
+            exchange could not cancel it
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def _get_fee(self,
                  base_currency: str,
@@ -674,6 +950,8 @@ class ExchangePyBase(ExchangeBase, ABC):
             self._user_stream_tracker_task = self._create_user_stream_tracker_task()
             self._user_stream_event_listener_task = safe_ensure_future(self._user_stream_event_listener())
             self._lost_orders_update_task = safe_ensure_future(self._lost_orders_update_polling_loop())
+            if self.CONNECTIONS_KEEP_ALIVE_INTERVAL > 0:
+                self._connections_keep_alive_task = safe_ensure_future(self._connections_keep_alive_loop())
 
     async def stop_network(self):
         """
@@ -719,6 +997,9 @@ class ExchangePyBase(ExchangeBase, ABC):
         if self._lost_orders_update_task is not None:
             self._lost_orders_update_task.cancel()
             self._lost_orders_update_task = None
+        if self._connections_keep_alive_task is not None:
+            self._connections_keep_alive_task.cancel()
+            self._connections_keep_alive_task = None
 
     # === loops and sync related methods ===
     #
@@ -729,7 +1010,9 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         while True:
             try:
-                await safe_gather(self._update_trading_rules())
+                with request_priority(RequestPriority.LOW):
+                    await safe_gather(self._update_trading_rules())
+                self._update_order_books_min_price_increment()
                 await self._sleep(self.TRADING_RULES_INTERVAL)
             except NotImplementedError:
                 raise
@@ -742,6 +1025,17 @@ class ExchangePyBase(ExchangeBase, ABC):
                                     " Check network connection.")
                 await self._sleep(0.5)
 
+    def _update_order_books_min_price_increment(self):
+        """
+        Lets the array based order books compare price levels by tick once the trading rules are known
+        """
+        for trading_pair, order_book in self.order_books.items():
+            trading_rule = self._trading_rules.get(trading_pair)
+            if isinstance(order_book, ArrayOrderBook) and trading_rule is not None:
+                min_price_increment = float(trading_rule.min_price_increment)
+                if order_book.min_price_increment != min_price_increment:
+                    order_book.min_price_increment = min_price_increment
+
     async def _trading_fees_polling_loop(self):
         """
         Only some exchanges provide a fee endpoint.
@@ -749,7 +1043,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         """
         while True:
             try:
-                await safe_gather(self._update_trading_fees())
+                with request_priority(RequestPriority.LOW):
+                    await safe_gather(self._update_trading_fees())
                 await self._sleep(self.TRADING_FEES_INTERVAL)
             except NotImplementedError:
                 raise
@@ -767,17 +1062,19 @@ class ExchangePyBase(ExchangeBase, ABC):
         Performs all required operation to keep the connector updated and synchronized with the exchange.
         It contains the backup logic to update status using API requests in case the main update source
         (the user stream data source websocket) fails.
-        It also updates the time synchronizer. This is necessary because the exchange requires
-        the time of the client to be the same as the time in the exchange.
+        It also updates the time synchronizer when its resync interval has elapsed. This is necessary because the
+        exchange requires the time of the client to be the same as the time in the exchange.
         Executes when the _poll_notifier event is enabled by the `tick` function.
         """
         while True:
             try:
                 await self._poll_notifier.wait()
-                await self._update_time_synchronizer()
+                with request_priority(RequestPriority.LOW):
+                    if self._time_synchronizer.is_resync_required():
+                        await self._update_time_synchronizer()
 
-                # the following method is implementation-specific
-                await self._status_polling_loop_fetch_updates()
+                    # the following method is implementation-specific
+                    await self._status_polling_loop_fetch_updates()
 
                 self._last_poll_timestamp = self.current_timestamp
                 self._poll_notifier = asyncio.Event()
@@ -816,7 +1113,8 @@ class ExchangePyBase(ExchangeBase, ABC):
         while True:
             try:
                 await self._cancel_lost_orders()
-                await self._update_lost_orders_status()
+                with request_priority(RequestPriority.LOW):
+                    await self._update_lost_orders_status()
                 await self._sleep(self.SHORT_POLL_INTERVAL)
             except NotImplementedError:
                 raise
@@ -826,6 +1124,21 @@ class ExchangePyBase(ExchangeBase, ABC):
                 self.logger().exception("Unexpected error while updating the time synchronizer")
                 await self._sleep(0.5)
 
+    async def _connections_keep_alive_loop(self):
+        """
+        Pre-warms the pooled connections when the network starts, and keeps them open with a lightweight request on
+        every keep-alive interval
+        """
+        while True:
+            try:
+                with request_priority(RequestPriority.LOW):
+                    await self._make_network_check_request()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                self.logger().network("Error keeping the connections with the exchange alive.", exc_info=True)
+            await self._sleep(self.CONNECTIONS_KEEP_ALIVE_INTERVAL)
+
     async def _iter_user_event_queue(self) -> AsyncIterable[Dict[str, any]]:
         """
         Called by _user_stream_event_listener.
@@ -949,18 +1262,48 @@ class ExchangePyBase(ExchangeBase, ABC):
             )
 
     async def _update_orders_fills(self, orders: List[InFlightOrder]):
-        for order in orders:
-            try:
-                trade_updates = await self._all_trade_updates_for_order(order=order)
-                for trade_update in trade_updates:
-                    self._order_tracker.process_trade_update(trade_update)
-            except asyncio.CancelledError:
-                raise
-            except Exception as request_error:
+        if self.BULK_TRADE_UPDATES:
+            orders = await self._update_orders_fills_by_trading_pair(orders)
+        await self._run_orders_updates(orders=orders, update=self._update_order_fills)
+
+    async def _update_order_fills(self, order: InFlightOrder):
+        try:
+            trade_updates = await self._all_trade_updates_for_order(order=order)
+            for trade_update in trade_updates:
+                self._order_tracker.process_trade_update(trade_update)
+        except asyncio.CancelledError:
+            raise
+        except Exception as request_error:
+            self.logger().warning(
+                f"Failed to fetch trade updates for order {order.client_order_id}. Error: {request_error}",
+                exc_info=request_error,
+            )
+
+    async def _update_orders_fills_by_trading_pair(self, orders: List[InFlightOrder]) -> List[InFlightOrder]:
+        """
+        Fetches the fills of the orders with one request per trading pair.
+
+        :return: the orders of the trading pairs whose request failed, to be updated one by one
+        """
+        orders_by_trading_pair = self._orders_by_trading_pair(orders)
+        results = await safe_gather(
+            *[self._all_trade_updates_for_trading_pair(trading_pair=trading_pair, orders=pair_orders)
+              for trading_pair, pair_orders in orders_by_trading_pair.items()],
+            return_exceptions=True)
+
+        pending_orders = []
+        for (trading_pair, pair_orders), result in zip(orders_by_trading_pair.items(), results):
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+            if isinstance(result, Exception):
                 self.logger().warning(
-                    f"Failed to fetch trade updates for order {order.client_order_id}. Error: {request_error}",
-                    exc_info=request_error,
-                )
+                    f"Failed to fetch the trade updates for {trading_pair}, requesting them for each order. "
+                    f"Error: {result}")
+                pending_orders.extend(pair_orders)
+                continue
+            for trade_update in result:
+                self._order_tracker.process_trade_update(trade_update)
+        return pending_orders
 
     async def _handle_update_error_for_active_order(self, order: InFlightOrder, error: Exception):
         try:
@@ -989,7 +1332,10 @@ class ExchangePyBase(ExchangeBase, ABC):
             self.logger().warning(f"Error fetching status update for the lost order {order.client_order_id}: {error}.")
 
     async def _update_orders_with_error_handler(self, orders: List[InFlightOrder], error_handler: Callable):
-        for order in orders:
+        if self.BULK_ORDER_STATUS_UPDATES:
+            orders = await self._update_orders_with_open_orders_status(orders)
+
+        async def update_order(order: InFlightOrder):
             try:
                 order_update = await self._request_order_status(tracked_order=order)
                 self._order_tracker.process_order_update(order_update)
@@ -998,6 +1344,62 @@ class ExchangePyBase(ExchangeBase, ABC):
             except Exception as request_error:
                 await error_handler(order, request_error)
 
+        await self._run_orders_updates(orders=orders, update=update_order)
+
+    async def _update_orders_with_open_orders_status(self, orders: List[InFlightOrder]) -> List[InFlightOrder]:
+        """
+        Updates the orders still open in the exchange with one request per trading pair.
+
+        :return: the orders missing from the open orders (they were filled, canceled or not created yet) and the
+        orders of the trading pairs whose request failed, to be updated one by one
+        """
+        orders_by_trading_pair = self._orders_by_trading_pair(orders)
+        results = await safe_gather(
+            *[self._request_open_orders_updates(trading_pair=trading_pair)
+              for trading_pair in orders_by_trading_pair],
+            return_exceptions=True)
+
+        pending_orders = []
+        for (trading_pair, pair_orders), result in zip(orders_by_trading_pair.items(), results):
+            if isinstance(result, asyncio.CancelledError):
+                raise result
+            if isinstance(result, Exception):
+                self.logger().warning(
+                    f"Failed to fetch the open orders for {trading_pair}, requesting the status of each order. "
+                    f"Error: {result}")
+                pending_orders.extend(pair_orders)
+                continue
+            updates_by_client_order_id = {order_update.client_order_id: order_update for order_update in result}
+            updates_by_exchange_order_id = {order_update.exchange_order_id: order_update for order_update in result}
+            for order in pair_orders:
+                order_update = (updates_by_client_order_id.get(order.client_order_id)
+                                or updates_by_exchange_order_id.get(order.exchange_order_id))
+                if order_update is None:
+                    pending_orders.append(order)
+                else:
+                    self._order_tracker.process_order_update(order_update)
+        return pending_orders
+
+    async def _run_orders_updates(self, orders: List[InFlightOrder], update: Callable[[InFlightOrder], Awaitable]):
+        if self.ORDER_UPDATES_CONCURRENCY > 0:
+            semaphore = asyncio.Semaphore(self.ORDER_UPDATES_CONCURRENCY)
+
+            async def bounded_update(order: InFlightOrder):
+                async with semaphore:
+                    await update(order)
+
+            await safe_gather(*[bounded_update(order) for order in orders])
+        else:
+            for order in orders:
+                await update(order)
+
+    @staticmethod
+    def _orders_by_trading_pair(orders: List[InFlightOrder]) -> Dict[str, List[InFlightOrder]]:
+        orders_by_trading_pair = defaultdict(list)
+        for order in orders:
+            orders_by_trading_pair[order.trading_pair].append(order)
+        return orders_by_trading_pair
+
     async def _update_orders(self):
         orders_to_update = self.in_flight_orders.copy()
         await self._update_orders_with_error_handler(
@@ -1048,6 +1450,28 @@ class ExchangePyBase(ExchangeBase, ABC):
     async def _request_order_status(self, tracked_order: InFlightOrder) -> OrderUpdate:
         raise NotImplementedError
 
+    async def _request_open_orders_updates(self, trading_pair: str) -> List[OrderUpdate]:
+        """
+        Requests all the open orders of the trading pair in the exchange. Required when BULK_ORDER_STATUS_UPDATES is
+        enabled.
+
+        :param trading_pair: the trading pair of the orders
+        :return: an order update for each open order, with its client order id or exchange order id
+        """
+        raise NotImplementedError
+
+    async def _all_trade_updates_for_trading_pair(self,
+                                                  trading_pair: str,
+                                                  orders: List[InFlightOrder]) -> List[TradeUpdate]:
+        """
+        Requests the fills of all the orders of the trading pair. Required when BULK_TRADE_UPDATES is enabled.
+
+        :param trading_pair: the trading pair of the orders
+        :param orders: the orders whose fills should be returned, the fills of other orders are ignored
+        :return: the trade updates of the orders
+        """
+        raise NotImplementedError
+
     @abstractmethod
     def _create_web_assistants_factory(self) -> WebAssistantsFactory:
         raise NotImplementedError
@@ -267,12 +267,15 @@ class GatewayCLOBSPOT(ExchangePyBase):
             **kwargs))
         return order_id
 
-    def batch_order_create(self, orders_to_create: List[LimitOrder]) -> List[LimitOrder]:
+    def batch_order_create(
+        self, orders_to_create: List[LimitOrder], order_type: Optional[OrderType] = None
+    ) -> List[LimitOrder]:
         """
         Issues a batch order creation as a single API request for exchanges that implement this feature. The default
         implementation of this method is to send the requests discretely (one by one).
         :param orders_to_create: A list of LimitOrder objects representing the orders to create. The order IDs
             can be blanc.
+        :param order_type: The type of all the orders (e.g. LIMIT_MAKER), the type of each order object by default.
         :returns: A tuple composed of LimitOrder objects representing the created orders, complete with the generated
             order IDs.
         """
@@ -298,7 +301,8 @@ class GatewayCLOBSPOT(ExchangePyBase):
                     status=order.status,
                 )
             )
-        safe_ensure_future(self._execute_batch_order_create(orders_to_create=orders_with_ids_to_create))
+        safe_ensure_future(self._execute_batch_order_create(
+            orders_to_create=orders_with_ids_to_create, order_type=order_type))
         return orders_with_ids_to_create
 
     def batch_order_cancel(self, orders_to_cancel: List[LimitOrder]):
@@ -309,7 +313,9 @@ class GatewayCLOBSPOT(ExchangePyBase):
         """
         safe_ensure_future(coro=self._execute_batch_cancel(orders_to_cancel=orders_to_cancel))
 
-    async def _execute_batch_order_create(self, orders_to_create: List[LimitOrder]):
+    async def _execute_batch_order_create(
+        self, orders_to_create: List[LimitOrder], order_type: Optional[OrderType] = None
+    ):
         in_flight_orders_to_create = []
         for order in orders_to_create:
             valid_order = await self._start_tracking_and_validate_order(
@@ -317,7 +323,7 @@ class GatewayCLOBSPOT(ExchangePyBase):
                 order_id=order.client_order_id,
                 trading_pair=order.trading_pair,
                 amount=order.quantity,
-                order_type=OrderType.LIMIT,
+                order_type=order_type or OrderType.LIMIT,
                 price=order.price,
             )
             if valid_order is not None:
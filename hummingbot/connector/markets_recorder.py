@@ -7,6 +7,7 @@ from decimal import Decimal
 from shutil import move
 from typing import Dict, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 from sqlalchemy.orm import Query, Session
 
@@ -130,6 +131,7 @@ class MarketsRecorder:
                                     best_ask = market.get_price_by_type(trading_pair, PriceType.BestAsk)
                                     order_book = market.get_order_book(trading_pair)
                                     depth = self._market_data_collection_config.market_data_collection_depth + 1
+                                    bids_array, asks_array = order_book.to_numpy(depth)
                                     market_data = MarketData(
                                         timestamp=self.db_timestamp,
                                         exchange=exchange,
@@ -138,8 +140,8 @@ class MarketsRecorder:
                                         best_bid=best_bid,
                                         best_ask=best_ask,
                                         order_book={
-                                            "bid": list(order_book.bid_entries())[:depth],
-                                            "ask": list(order_book.ask_entries())[:depth]}
+                                            "bid": self._order_book_levels_to_json(bids_array),
+                                            "ask": self._order_book_levels_to_json(asks_array)}
                                     )
                                     session.add(market_data)
             except asyncio.CancelledError:
@@ -149,6 +151,11 @@ class MarketsRecorder:
             finally:
                 await self._sleep(self._market_data_collection_config.market_data_collection_interval)
 
+    @staticmethod
+    def _order_book_levels_to_json(levels: np.ndarray) -> List[List[Union[float, int]]]:
+        # Keeps the [price, amount, update_id] layout of the recorded order book rows, with integer update ids
+        return [[price, amount, int(update_id)] for price, amount, update_id in levels.tolist()]
+
     @property
     def sql_manager(self) -> SQLConnectionManager:
         return self._sql_manager
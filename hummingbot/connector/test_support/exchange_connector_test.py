@@ -611,6 +611,20 @@ class AbstractExchangeConnectorTests:
 
             self.assertRaises(asyncio.CancelledError, self.async_run_with_timeout, self.exchange.check_network())
 
+        @aioresponses()
+        def test_connections_keep_alive_loop_sends_network_check_request(self, mock_api):
+            url = self.network_status_url
+            response = self.network_status_request_successful_mock_response
+            request_sent_event = asyncio.Event()
+            mock_api.get(url, body=json.dumps(response), callback=lambda *args, **kwargs: request_sent_event.set())
+            self.exchange.CONNECTIONS_KEEP_ALIVE_INTERVAL = 10
+
+            keep_alive_task = asyncio.get_event_loop().create_task(self.exchange._connections_keep_alive_loop())
+            self.async_run_with_timeout(request_sent_event.wait())
+            keep_alive_task.cancel()
+
+            self.assertTrue(request_sent_event.is_set())
+
         def test_initial_status_dict(self):
             self.exchange._set_trading_pair_symbol_map(None)
 
@@ -2,7 +2,7 @@ import asyncio
 import logging
 import time
 from collections import deque
-from typing import Awaitable, Deque
+from typing import Awaitable, Deque, Optional
 
 import numpy
 
@@ -15,13 +15,22 @@ class TimeSynchronizer:
     This class is useful when timestamp-based signatures are required by the exchange for authentication.
     Upon receiving a timestamped message from the server, use `update_server_time_offset_with_time_provider`
     to synchronize local time with the server's time.
+    The offset is only recalculated when the samples change. The resync interval doubles (up to
+    RESYNC_MAX_INTERVAL) while new samples stay within RESYNC_DRIFT_TOLERANCE_MS of the current offset, and goes back
+    to RESYNC_MIN_INTERVAL as soon as the local clock drifts.
     """
 
     NaN = float("nan")
+    RESYNC_MIN_INTERVAL = 10.0
+    RESYNC_MAX_INTERVAL = 600.0
+    RESYNC_DRIFT_TOLERANCE_MS = 50.0
     _logger = None
 
     def __init__(self):
         self._time_offset_ms: Deque[float] = deque(maxlen=5)
+        self._cached_time_offset_ms: Optional[float] = None
+        self._resync_interval: float = self.RESYNC_MIN_INTERVAL
+        self._next_resync_counter: float = 0
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -34,17 +43,34 @@ class TimeSynchronizer:
         if not self._time_offset_ms:
             offset = (self._time() - self._current_seconds_counter()) * 1e3
         else:
-            median = numpy.median(self._time_offset_ms)
-            weighted_average = numpy.average(self._time_offset_ms, weights=range(1, len(self._time_offset_ms) * 2 + 1, 2))
-            offset = numpy.mean([median, weighted_average])
+            if self._cached_time_offset_ms is None:
+                median = numpy.median(self._time_offset_ms)
+                weighted_average = numpy.average(
+                    self._time_offset_ms, weights=range(1, len(self._time_offset_ms) * 2 + 1, 2))
+                self._cached_time_offset_ms = float(numpy.mean([median, weighted_average]))
+            offset = self._cached_time_offset_ms
 
         return offset
 
+    @property
+    def resync_interval(self) -> float:
+        return self._resync_interval
+
     def add_time_offset_ms_sample(self, offset: float):
         self._time_offset_ms.append(offset)
+        self._cached_time_offset_ms = None
 
     def clear_time_offset_ms_samples(self):
         self._time_offset_ms.clear()
+        self._cached_time_offset_ms = None
+        self._resync_interval = self.RESYNC_MIN_INTERVAL
+        self._next_resync_counter = 0
+
+    def is_resync_required(self) -> bool:
+        """
+        :return: True if there are no samples yet or the resync interval has elapsed since the last sample
+        """
+        return not self._time_offset_ms or self._current_seconds_counter() >= self._next_resync_counter
 
     def time(self) -> float:
         """
@@ -66,6 +92,7 @@ class TimeSynchronizer:
             local_after_ms: float = self._current_seconds_counter() * 1e3
             local_server_time_pre_image_ms: float = (local_before_ms + local_after_ms) / 2.0
             time_offset_ms: float = server_time_ms - local_server_time_pre_image_ms
+            self._schedule_resync(time_offset_ms=time_offset_ms, local_time_ms=local_after_ms)
             self.add_time_offset_ms_sample(time_offset_ms)
         except asyncio.CancelledError:
             raise
@@ -86,6 +113,15 @@ class TimeSynchronizer:
             # This is done to avoid the warning message from asyncio framework saying a coroutine was not awaited
             time_provider.close()
 
+    def _schedule_resync(self, time_offset_ms: float, local_time_ms: float):
+        if self._time_offset_ms:
+            drift_ms = abs(time_offset_ms - self.time_offset_ms)
+            if drift_ms <= self.RESYNC_DRIFT_TOLERANCE_MS:
+                self._resync_interval = min(self._resync_interval * 2, self.RESYNC_MAX_INTERVAL)
+            else:
+                self._resync_interval = self.RESYNC_MIN_INTERVAL
+        self._next_resync_counter = local_time_ms * 1e-3 + self._resync_interval
+
     def _current_seconds_counter(self):
         return time.perf_counter()
 
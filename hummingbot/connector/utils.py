@@ -10,7 +10,8 @@ from hummingbot.connector.time_synchronizer import TimeSynchronizer
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.utils.tracking_nonce import NonceCreator, get_tracking_nonce
-from hummingbot.core.web_assistant.connections.data_types import RESTRequest, WSResponse
+from hummingbot.core.web_assistant.connections.data_types import RESTRequest, RESTResponse, WSResponse
+from hummingbot.core.web_assistant.rest_post_processors import RESTPostProcessorBase
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_post_processors import WSPostProcessorBase
@@ -107,6 +108,30 @@ class TimeSynchronizerRESTPreProcessor(RESTPreProcessorBase):
         return request
 
 
+class RateLimitHeadersRESTPostProcessor(RESTPostProcessorBase):
+    """
+    This post processor is intended to be used in those connectors whose exchange informs the rate limit usage in the
+    response headers. It reconciles the capacity used in the throttler with the usage reported by the server.
+    The connectors declare the mapping from header name to limit_id in their constants module.
+    """
+
+    def __init__(self, throttler: AsyncThrottlerBase, headers_to_limit_ids: Dict[str, str]):
+        super().__init__()
+        self._throttler = throttler
+        self._headers_to_limit_ids = headers_to_limit_ids
+
+    async def post_process(self, response: RESTResponse) -> RESTResponse:
+        headers = response.headers or {}
+        for header, limit_id in self._headers_to_limit_ids.items():
+            capacity_used = headers.get(header)
+            if capacity_used is not None:
+                try:
+                    self._throttler.reconcile_capacity_used(limit_id=limit_id, capacity_used=int(capacity_used))
+                except ValueError:
+                    continue
+        return response
+
+
 class GZipCompressionWSPostProcessor(WSPostProcessorBase):
     """
     Performs the necessary response processing from both public and private websocket streams.
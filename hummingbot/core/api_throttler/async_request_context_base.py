@@ -1,11 +1,19 @@
 import asyncio
 import logging
+import math
 import time
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from decimal import Decimal
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
-from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.api_throttler.data_types import (
+    RateLimit,
+    RequestPriority,
+    TaskLog,
+    WaitingRequests,
+    WaitTimeHistogram,
+)
 from hummingbot.logger.logger import HummingbotLogger
 
 arc_logger = None
@@ -34,6 +42,10 @@ class AsyncRequestContextBase(ABC):
                  lock: asyncio.Lock,
                  safety_margin_pct: float,
                  retry_interval: float = 0.1,
+                 priority: RequestPriority = RequestPriority.NORMAL,
+                 priority_reserve_pct: float = 0.0,
+                 wait_time_histogram: Optional[WaitTimeHistogram] = None,
+                 waiting_requests: Optional[WaitingRequests] = None,
                  ):
         """
         Asynchronous context associated with each API request.
@@ -42,6 +54,11 @@ class AsyncRequestContextBase(ABC):
         :param related_limits: List of linked rate limits with its corresponding weight associated with this API Request
         :param lock: A shared asyncio.Lock used between all instances of APIRequestContextBase
         :param retry_interval: Time between each limit check
+        :param priority: The priority of this API Request
+        :param priority_reserve_pct: Fraction of each limit only available to HIGH and CRITICAL priority requests
+        :param wait_time_histogram: Optional histogram to record the time waited for capacity
+        :param waiting_requests: Optional shared count of the requests waiting for capacity, to let the requests with
+            higher priority go first
         """
         self._task_logs: List[TaskLog] = task_logs
         self._rate_limit: RateLimit = rate_limit
@@ -49,6 +66,31 @@ class AsyncRequestContextBase(ABC):
         self._lock: asyncio.Lock = lock
         self._safety_margin_pct: float = safety_margin_pct
         self._retry_interval: float = retry_interval
+        self._priority: RequestPriority = priority
+        self._priority_reserve_pct: float = priority_reserve_pct
+        self._wait_time_histogram: Optional[WaitTimeHistogram] = wait_time_histogram
+        self._waiting_requests: Optional[WaitingRequests] = waiting_requests
+
+    @property
+    def priority(self) -> RequestPriority:
+        return self._priority
+
+    @property
+    def limit_ids(self) -> List[str]:
+        if self._rate_limit is None:
+            return []
+        return [self._rate_limit.limit_id] + [limit.limit_id for limit, _ in self._related_limits]
+
+    def available_capacity(self, rate_limit: RateLimit, weight: int) -> int:
+        """
+        Capacity of the rate limit this request can use. The reserved part of the limit is left for the HIGH and
+        CRITICAL priority requests, unless the weight of the request does not fit in the rest of the limit, in which
+        case it could never be executed.
+        """
+        if self._priority <= RequestPriority.HIGH or self._priority_reserve_pct <= 0:
+            return rate_limit.limit
+        capacity = math.floor(rate_limit.limit * (1 - self._priority_reserve_pct))
+        return capacity if weight <= capacity else rate_limit.limit
 
     def flush(self):
         """
@@ -66,14 +108,37 @@ class AsyncRequestContextBase(ABC):
     def within_capacity(self) -> bool:
         raise NotImplementedError
 
+    def higher_priority_waiting(self) -> bool:
+        """
+        Checks if a request with higher priority is waiting for capacity on one of the limits of this request
+        """
+        return (self._waiting_requests is not None
+                and self._waiting_requests.higher_priority_waiting(self.limit_ids, self._priority))
+
+    @contextmanager
+    def waiting_for_capacity(self):
+        """
+        Registers the request as waiting for capacity, for the requests with lower priority to yield to it
+        """
+        if self._waiting_requests is None:
+            yield
+            return
+        limit_ids = self.limit_ids
+        self._waiting_requests.add(limit_ids, self._priority)
+        try:
+            yield
+        finally:
+            self._waiting_requests.remove(limit_ids, self._priority)
+
     async def acquire(self):
-        while True:
-            async with self._lock:
-                self.flush()
+        with self.waiting_for_capacity():
+            while True:
+                async with self._lock:
+                    self.flush()
 
-                if self.within_capacity():
-                    break
-            await asyncio.sleep(self._retry_interval)
+                    if not self.higher_priority_waiting() and self.within_capacity():
+                        break
+                await asyncio.sleep(self._retry_interval)
         async with self._lock:
             now = time.time()
             # Each related limit is represented as it own individual TaskLog
@@ -88,7 +153,10 @@ class AsyncRequestContextBase(ABC):
                 self._task_logs.append(TaskLog(timestamp=now, rate_limit=limit, weight=weight))
 
     async def __aenter__(self):
+        start: float = time.perf_counter()
         await self.acquire()
+        if self._wait_time_histogram is not None:
+            self._wait_time_histogram.add(time.perf_counter() - start)
 
     async def __aexit__(self, exc_type, exc, tb):
         pass
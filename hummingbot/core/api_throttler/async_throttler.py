@@ -1,13 +1,13 @@
 import time
 from decimal import Decimal
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from hummingbot.core.api_throttler.async_request_context_base import (
     MAX_CAPACITY_REACHED_WARNING_INTERVAL,
     AsyncRequestContextBase,
 )
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
-from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.data_types import RateLimit, RequestPriority, TaskLog
 
 
 class AsyncRequestContext(AsyncRequestContextBase):
@@ -32,7 +32,7 @@ class AsyncRequestContext(AsyncRequestContextBase):
                                           if rate_limit.limit_id == task.rate_limit.limit_id and
                                           Decimal(str(now)) - Decimal(str(task.timestamp)) - Decimal(str(task.rate_limit.time_interval * self._safety_margin_pct)) <= task.rate_limit.time_interval])
 
-                if capacity_used + weight > rate_limit.limit:
+                if capacity_used + weight > self.available_capacity(rate_limit, weight):
                     if self._last_max_cap_warning_ts < now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
                         msg = f"API rate limit on {rate_limit.limit_id} ({rate_limit.limit} calls per " \
                               f"{rate_limit.time_interval}s) has almost reached. Limits used " \
@@ -52,6 +52,7 @@ class AsyncThrottler(AsyncThrottlerBase):
     Handles call rate limits by providing async context (async with), it delays as needed to make sure calls stay
     within defined limits.
     A task can have multiple call rates (weight), though tasks are still ordered in sequence as they come (FIFO).
+    The tasks waiting for capacity yield to the waiting tasks with higher priority sharing one of their limits.
     (i.e)
         Pool 0 - rate limit is 100 calls per second
         Pool 1 - rate limit is 10 calls per second
@@ -59,14 +60,34 @@ class AsyncThrottler(AsyncThrottlerBase):
         this (whether it belongs to Pool 0 or Pool 1) will have to wait for new capacity (some of the Task A flushed out).
     """
 
-    def execute_task(self, limit_id: str) -> AsyncRequestContext:
+    def reconcile_capacity_used(self, limit_id: str, capacity_used: int):
+        """
+        Logs the capacity used by the server beyond the local task logs as an additional task. A lower usage reported
+        by the server is ignored, since it does not include the requests still in flight.
+        """
+        rate_limit: Optional[RateLimit] = self._id_to_limit_map.get(limit_id)
+        if rate_limit is None:
+            return
+        now: float = time.time()
+        expiration_interval: float = rate_limit.time_interval * (1 + self._safety_margin_pct)
+        local_capacity_used: int = sum(task.weight for task in self._task_logs
+                                       if task.rate_limit.limit_id == limit_id
+                                       and now - task.timestamp <= expiration_interval)
+
+        if capacity_used > local_capacity_used:
+            self._task_logs.append(TaskLog(timestamp=now, rate_limit=rate_limit,
+                                           weight=capacity_used - local_capacity_used))
+
+    def execute_task(self, limit_id: str, priority: Optional[RequestPriority] = None) -> AsyncRequestContext:
         """
         Creates an async context where code within the context (a task) can be run only when all rate
         limits have capacity for the new task.
         :param limit_id: the limit_id associated with the APi request
+        :param priority: the priority of the API request, by default the one set with `request_priority`
         :return: An async context (used with async with syntax)
         """
         rate_limit, related_rate_limits = self.get_related_limits(limit_id=limit_id)
+        priority = self._request_priority(priority)
         return AsyncRequestContext(
             task_logs=self._task_logs,
             rate_limit=rate_limit,
@@ -74,4 +95,8 @@ class AsyncThrottler(AsyncThrottlerBase):
             lock=self._lock,
             safety_margin_pct=self._safety_margin_pct,
             retry_interval=self._retry_interval,
+            priority=priority,
+            priority_reserve_pct=self._priority_reserve_pct,
+            wait_time_histogram=self._wait_time_histograms[priority],
+            waiting_requests=self._waiting_requests,
         )
@@ -3,13 +3,38 @@ import copy
 import logging
 import math
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from contextvars import ContextVar
 from decimal import Decimal
 from typing import Dict, List, Optional, Tuple
 
 from hummingbot.core.api_throttler.async_request_context_base import AsyncRequestContextBase
-from hummingbot.core.api_throttler.data_types import RateLimit, TaskLog
+from hummingbot.core.api_throttler.data_types import (
+    RateLimit,
+    RequestPriority,
+    TaskLog,
+    WaitingRequests,
+    WaitTimeHistogram,
+)
 from hummingbot.logger.logger import HummingbotLogger
 
+# Priority of the requests executed without an explicit priority, set with `request_priority`
+current_request_priority: ContextVar[RequestPriority] = ContextVar(
+    "current_request_priority", default=RequestPriority.NORMAL)
+
+
+@contextmanager
+def request_priority(priority: RequestPriority):
+    """
+    Sets the priority of the throttled requests executed within the context, including those of the tasks created in
+    it, when the caller does not pass a priority to `execute_task`.
+    """
+    token = current_request_priority.set(priority)
+    try:
+        yield
+    finally:
+        current_request_priority.reset(token)
+
 
 class AsyncThrottlerBase(ABC):
     """
@@ -30,7 +55,8 @@ class AsyncThrottlerBase(ABC):
                  rate_limits: List[RateLimit],
                  retry_interval: float = 0.1,
                  safety_margin_pct: Optional[float] = 0.05,  # An extra safety margin, in percentage.
-                 limits_share_percentage: Optional[Decimal] = None
+                 limits_share_percentage: Optional[Decimal] = None,
+                 priority_reserve_pct: float = 0.0,
                  ):
         """
         :param rate_limits: List of RateLimit(s).
@@ -39,20 +65,30 @@ class AsyncThrottlerBase(ABC):
             calls are within the limit.
         :param limits_share_percentage: Percentage of the limits to be used by this instance (important when multiple
             bots operate with the same account)
+        :param priority_reserve_pct: Fraction of each limit (from 0 to 1, excluded) reserved for the HIGH and
+            CRITICAL priority requests.
         """
         # If configured, users can define the percentage of rate limits to allocate to the throttler.
         share_percentage = limits_share_percentage or Decimal("100")
         self.limits_pct: Decimal = share_percentage / 100
 
+        # Throttler Parameters
+        self._retry_interval: float = retry_interval
+        self._safety_margin_pct: float = safety_margin_pct
+        if not 0 <= priority_reserve_pct < 1:
+            raise ValueError(f"The priority reserve must be a fraction of the limits between 0 and 1 (excluded), "
+                             f"got {priority_reserve_pct}.")
+        self._priority_reserve_pct: float = priority_reserve_pct
+        self._wait_time_histograms: Dict[RequestPriority, WaitTimeHistogram] = {
+            priority: WaitTimeHistogram() for priority in RequestPriority}
+        # Requests waiting for capacity, the requests with lower priority yield to them
+        self._waiting_requests: WaitingRequests = WaitingRequests()
+
         self.set_rate_limits(rate_limits)
 
         # List of TaskLog used to determine the API requests within a set time window.
         self._task_logs: List[TaskLog] = []
 
-        # Throttler Parameters
-        self._retry_interval: float = retry_interval
-        self._safety_margin_pct: float = safety_margin_pct
-
         # Shared asyncio.Lock instance to prevent multiple async ContextManager from accessing the _task_logs variable
         self._lock = asyncio.Lock()
 
@@ -66,6 +102,16 @@ class AsyncThrottlerBase(ABC):
         # Dictionary of path_url to RateLimit
         self._id_to_limit_map: Dict[str, RateLimit] = {limit.limit_id: limit for limit in self._rate_limits}
 
+    @property
+    def wait_time_histograms(self) -> Dict[RequestPriority, WaitTimeHistogram]:
+        """
+        Time waited for capacity by the requests of each priority
+        """
+        return self._wait_time_histograms
+
+    def _request_priority(self, priority: Optional[RequestPriority]) -> RequestPriority:
+        return current_request_priority.get() if priority is None else priority
+
     def _client_config_map(self):
         from hummingbot.client.hummingbot_application import HummingbotApplication  # avoids circular import
 
@@ -85,6 +131,16 @@ class AsyncThrottlerBase(ABC):
 #
         return rate_limit, related_limits
 
+    def reconcile_capacity_used(self, limit_id: str, capacity_used: int):
+        """
+        Raises the capacity used locally for the limit to the usage reported by the server (for example in the
+        response headers), which also includes the requests of other clients sharing the limit. The capacity used is
+        never lowered: the server usage does not include the requests still in flight, which keep using the limit.
+        :param limit_id: the limit_id of the RateLimit the usage was reported for
+        :param capacity_used: the capacity of the limit used within its time interval, according to the server
+        """
+        raise NotImplementedError
+
     @abstractmethod
-    def execute_task(self, limit_id: str) -> AsyncRequestContextBase:
+    def execute_task(self, limit_id: str, priority: Optional[RequestPriority] = None) -> AsyncRequestContextBase:
         raise NotImplementedError
@@ -0,0 +1,236 @@
+import fcntl
+import hashlib
+import mmap
+import os
+import struct
+import tempfile
+from typing import Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.sliding_window_throttler import SlidingWindowThrottler
+
+SHARED_BUDGET_FILE_PREFIX = "hummingbot_rate_limits_"
+# Layout hash (8 bytes) and number of limits (8 bytes)
+HEADER_FORMAT = "8sq"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+# start index, number of requests and capacity used of each ring buffer
+META_SIZE = 3
+
+
+def default_shared_budget_dir() -> str:
+    return "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+
+
+class SharedBudgetFileLock:
+    """
+    Reentrant exclusive lock on the shared budget file, held by one process at a time. The lock is taken for the
+    duration of a capacity check and the logging of the request, which never yield to the event loop.
+    """
+
+    def __init__(self, fd: int):
+        self._fd: int = fd
+        self._depth: int = 0
+
+    def __enter__(self):
+        if self._depth == 0:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+        self._depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self._depth -= 1
+        if self._depth == 0:
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+
+class SharedRateLimitWindow:
+    """
+    Sliding window of the requests logged for a single RateLimit by all the processes sharing the budget file. Same
+    interface as the RateLimitWindow, backed by a ring buffer in the shared memory. When the ring buffer is full the
+    weight is added to the newest request, which is moved to the new timestamp.
+    """
+
+    __slots__ = ("rate_limit", "expiration_interval", "_meta", "_timestamps", "_weights", "_size")
+
+    def __init__(self,
+                 rate_limit: RateLimit,
+                 safety_margin_pct: float,
+                 meta: np.ndarray,
+                 timestamps: np.ndarray,
+                 weights: np.ndarray):
+        self.rate_limit: RateLimit = rate_limit
+        self.expiration_interval: float = rate_limit.time_interval * (1 + safety_margin_pct)
+        self._meta: np.ndarray = meta
+        self._timestamps: np.ndarray = timestamps
+        self._weights: np.ndarray = weights
+        self._size: int = len(timestamps)
+
+    def __len__(self) -> int:
+        return int(self._meta[1])
+
+    @property
+    def capacity_used(self) -> int:
+        return int(self._meta[2])
+
+    @property
+    def timestamps(self) -> List[float]:
+        return [timestamp for timestamp, _ in self._entries()]
+
+    @property
+    def weights(self) -> List[int]:
+        return [weight for _, weight in self._entries()]
+
+    def _entries(self) -> Iterator[Tuple[float, int]]:
+        start, count = int(self._meta[0]), int(self._meta[1])
+        for offset in range(count):
+            index = (start + offset) % self._size
+            yield float(self._timestamps[index]), int(self._weights[index])
+
+    def _pop_oldest(self) -> int:
+        start = int(self._meta[0])
+        weight = int(self._weights[start])
+        self._meta[0] = (start + 1) % self._size
+        self._meta[1] -= 1
+        self._meta[2] -= weight
+        return weight
+
+    def expire(self, now: float):
+        """
+        Removes the requests that have passed the rate limit period (plus the safety margin)
+        """
+        while self._meta[1] > 0 and now - self._timestamps[self._meta[0]] > self.expiration_interval:
+            self._pop_oldest()
+
+    def append(self, timestamp: float, weight: int):
+        start, count = int(self._meta[0]), int(self._meta[1])
+        if count == self._size:
+            index = (start + count - 1) % self._size
+            self._weights[index] += weight
+        else:
+            index = (start + count) % self._size
+            self._weights[index] = weight
+            self._meta[1] = count + 1
+        self._timestamps[index] = timestamp
+        self._meta[2] += weight
+
+    def reconcile(self, capacity_used: int, now: float):
+        """
+        Raises the capacity used in the window to the one reported by the server, logging the extra capacity at `now`.
+        A lower usage reported by the server is ignored, since it does not include the requests still in flight.
+        """
+        self.expire(now)
+        if capacity_used > self.capacity_used:
+            self.append(now, capacity_used - self.capacity_used)
+
+    def time_until_capacity(self, weight: int, now: float, capacity: Optional[int] = None) -> float:
+        """
+        Seconds until enough of the logged requests expire to fit a new request with the weight, within the capacity
+        (the whole limit by default). Expects the window to be already expired at `now`.
+        """
+        capacity = self.rate_limit.limit if capacity is None else capacity
+        capacity_to_free = self.capacity_used + weight - capacity
+        if capacity_to_free <= 0:
+            return 0
+        capacity_freed = 0
+        timestamp = now
+        for timestamp, logged_weight in self._entries():
+            capacity_freed += logged_weight
+            if capacity_freed >= capacity_to_free:
+                break
+        return max(0.0, timestamp + self.expiration_interval - now)
+
+
+class CrossProcessThrottler(SlidingWindowThrottler):
+    """
+    Sliding window throttler whose windows are shared by all the processes of the host using the same budget, so that
+    several bots operating with the same API key (or IP) stay together within the rate limits. The windows are kept in
+    a memory mapped file (in /dev/shm when available) guarded by a file lock, no external service is needed.
+
+    The budget name defaults to a hash of the rate limits, so the bots of the same connector share the budget. Since
+    the shared windows already account for all the bots, the limits share percentage should be left at 100%.
+    """
+
+    def __init__(self,
+                 *args,
+                 shared_budget_name: Optional[str] = None,
+                 shared_budget_dir: Optional[str] = None,
+                 **kwargs):
+        """
+        :param shared_budget_name: name of the budget shared by the processes, by default a hash of the rate limits
+        :param shared_budget_dir: directory of the shared budget file, by default /dev/shm or the temp directory
+        """
+        self._shared_budget_name: Optional[str] = shared_budget_name
+        self._shared_budget_dir: str = shared_budget_dir or default_shared_budget_dir()
+        self._shared_budget_path: Optional[str] = None
+        self._fd: Optional[int] = None
+        self._mmap: Optional[mmap.mmap] = None
+        super().__init__(*args, **kwargs)
+        self._windows_lock: SharedBudgetFileLock = SharedBudgetFileLock(self._fd)
+
+    @property
+    def shared_budget_path(self) -> str:
+        return self._shared_budget_path
+
+    def set_rate_limits(self, rate_limits: List[RateLimit]):
+        # Skip the windows of the SlidingWindowThrottler, the previous requests are kept in the shared budget file
+        super(SlidingWindowThrottler, self).set_rate_limits(rate_limits)
+        # The ring buffers are sized for the full limits, independent of the share percentage of each bot
+        layout: List[Tuple[str, float, int]] = sorted(
+            (rate_limit.limit_id, float(rate_limit.time_interval), max(1, int(rate_limit.limit)))
+            for rate_limit in rate_limits)
+        layout_hash: bytes = hashlib.sha1(repr(layout).encode()).digest()[:8]
+        name = self._shared_budget_name or layout_hash.hex()
+        self._open_shared_budget(os.path.join(self._shared_budget_dir, f"{SHARED_BUDGET_FILE_PREFIX}{name}"),
+                                 layout, layout_hash)
+
+    def _open_shared_budget(self, path: str, layout: List[Tuple[str, float, int]], layout_hash: bytes):
+        file_size = HEADER_SIZE + sum((META_SIZE + 2 * size) * 8 for _, _, size in layout)
+        fd = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        file_lock = SharedBudgetFileLock(fd)
+        try:
+            with file_lock:
+                current_size = os.fstat(fd).st_size
+                if current_size == 0:
+                    os.ftruncate(fd, file_size)
+                    os.pwrite(fd, struct.pack(HEADER_FORMAT, layout_hash, len(layout)), 0)
+                else:
+                    header = os.pread(fd, HEADER_SIZE, 0)
+                    if current_size != file_size or struct.unpack(HEADER_FORMAT, header)[0] != layout_hash:
+                        raise ValueError(f"The shared rate limits budget {path} is in use with different rate limits.")
+            shared_memory = mmap.mmap(fd, file_size)
+        except Exception:
+            os.close(fd)
+            raise
+        self.close()
+        self._shared_budget_path = path
+        self._fd = fd
+        self._mmap = shared_memory
+        self._windows_lock = file_lock
+
+        self._windows: Dict[str, SharedRateLimitWindow] = {}
+        offset = HEADER_SIZE
+        for limit_id, _, size in layout:
+            meta = np.ndarray((META_SIZE,), dtype=np.int64, buffer=shared_memory, offset=offset)
+            offset += META_SIZE * 8
+            timestamps = np.ndarray((size,), dtype=np.float64, buffer=shared_memory, offset=offset)
+            offset += size * 8
+            weights = np.ndarray((size,), dtype=np.int64, buffer=shared_memory, offset=offset)
+            offset += size * 8
+            self._windows[limit_id] = SharedRateLimitWindow(rate_limit=self._id_to_limit_map[limit_id],
+                                                            safety_margin_pct=self._safety_margin_pct,
+                                                            meta=meta,
+                                                            timestamps=timestamps,
+                                                            weights=weights)
+
+    def close(self):
+        """
+        Releases the shared budget file. The requests logged stay in the shared budget for the other processes.
+        """
+        # The numpy views of the windows keep the memory map alive until they are released
+        self._windows = {}
+        self._mmap = None
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
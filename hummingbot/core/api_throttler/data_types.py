@@ -1,8 +1,7 @@
+from bisect import bisect_left
 from dataclasses import dataclass
-from typing import (
-    List,
-    Optional,
-)
+from enum import IntEnum
+from typing import Dict, List, Optional
 
 DEFAULT_PATH = ""
 DEFAULT_WEIGHT = 1
@@ -54,3 +53,69 @@ class TaskLog:
     timestamp: float
     rate_limit: RateLimit
     weight: int
+
+
+class RequestPriority(IntEnum):
+    """
+    Priority of the requests waiting for rate limit capacity. Lower values go first.
+    """
+    CRITICAL = 0    # Order cancels
+    HIGH = 1        # Order creation
+    NORMAL = 2
+    LOW = 3         # Polling of balances, order status, trading rules and fees
+
+
+class WaitTimeHistogram:
+    """
+    Histogram of the time the requests waited for rate limit capacity, in seconds
+    """
+    BUCKET_BOUNDS: List[Seconds] = [0.001, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, float("inf")]
+
+    def __init__(self):
+        self.bucket_counts: List[int] = [0] * len(self.BUCKET_BOUNDS)
+        self.count: int = 0
+        self.total_wait_time: Seconds = 0.0
+        self.max_wait_time: Seconds = 0.0
+
+    @property
+    def mean_wait_time(self) -> Seconds:
+        return self.total_wait_time / self.count if self.count > 0 else 0.0
+
+    def add(self, wait_time: Seconds):
+        self.bucket_counts[bisect_left(self.BUCKET_BOUNDS, wait_time)] += 1
+        self.count += 1
+        self.total_wait_time += wait_time
+        self.max_wait_time = max(self.max_wait_time, wait_time)
+
+    def __repr__(self):
+        buckets = ", ".join(f"<={bound}s: {count}" for bound, count in zip(self.BUCKET_BOUNDS, self.bucket_counts))
+        return f"count: {self.count}, mean: {self.mean_wait_time:.4f}s, max: {self.max_wait_time:.4f}s, " \
+               f"buckets: [{buckets}]"
+
+
+class WaitingRequests:
+    """
+    Number of requests waiting for rate limit capacity, by limit_id and priority. The requests polling for capacity
+    yield to the waiting requests with higher priority that share one of their limits.
+    """
+
+    def __init__(self):
+        self._counts: Dict[str, List[int]] = {}
+
+    def add(self, limit_ids: List[str], priority: RequestPriority):
+        for limit_id in limit_ids:
+            counts = self._counts.get(limit_id)
+            if counts is None:
+                counts = self._counts[limit_id] = [0] * len(RequestPriority)
+            counts[priority] += 1
+
+    def remove(self, limit_ids: List[str], priority: RequestPriority):
+        for limit_id in limit_ids:
+            self._counts[limit_id][priority] -= 1
+
+    def higher_priority_waiting(self, limit_ids: List[str], priority: RequestPriority) -> bool:
+        for limit_id in limit_ids:
+            counts = self._counts.get(limit_id)
+            if counts is not None and any(counts[higher_priority] > 0 for higher_priority in range(priority)):
+                return True
+        return False
@@ -0,0 +1,327 @@
+import asyncio
+import time
+from collections import deque
+from contextlib import nullcontext
+from typing import ContextManager, Deque, Dict, List, Optional, Tuple
+
+from hummingbot.core.api_throttler.async_request_context_base import (
+    MAX_CAPACITY_REACHED_WARNING_INTERVAL,
+    AsyncRequestContextBase,
+)
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import RateLimit, RequestPriority, WaitingRequests, WaitTimeHistogram
+
+
+class RateLimitWindow:
+    """
+    Sliding window of the requests logged for a single RateLimit. The timestamps are kept in arrival order together
+    with the running sum of their weights, so expiring the old requests and checking the capacity are O(1) amortized.
+    """
+
+    __slots__ = ("rate_limit", "expiration_interval", "timestamps", "weights", "capacity_used")
+
+    def __init__(self, rate_limit: RateLimit, safety_margin_pct: float):
+        self.rate_limit: RateLimit = rate_limit
+        self.expiration_interval: float = rate_limit.time_interval * (1 + safety_margin_pct)
+        self.timestamps: Deque[float] = deque()
+        self.weights: Deque[int] = deque()
+        self.capacity_used: int = 0
+
+    def __len__(self) -> int:
+        return len(self.timestamps)
+
+    def expire(self, now: float):
+        """
+        Removes the requests that have passed the rate limit period (plus the safety margin)
+        """
+        timestamps = self.timestamps
+        while len(timestamps) > 0 and now - timestamps[0] > self.expiration_interval:
+            timestamps.popleft()
+            self.capacity_used -= self.weights.popleft()
+
+    def append(self, timestamp: float, weight: int):
+        self.timestamps.append(timestamp)
+        self.weights.append(weight)
+        self.capacity_used += weight
+
+    def reconcile(self, capacity_used: int, now: float):
+        """
+        Raises the capacity used in the window to the one reported by the server, logging the extra capacity at `now`.
+        A lower usage reported by the server is ignored, since it does not include the requests still in flight.
+        """
+        self.expire(now)
+        if capacity_used > self.capacity_used:
+            self.append(now, capacity_used - self.capacity_used)
+
+    def time_until_capacity(self, weight: int, now: float, capacity: Optional[int] = None) -> float:
+        """
+        Seconds until enough of the logged requests expire to fit a new request with the weight, within the capacity
+        (the whole limit by default). Expects the window to be already expired at `now`.
+        """
+        capacity = self.rate_limit.limit if capacity is None else capacity
+        capacity_to_free = self.capacity_used + weight - capacity
+        if capacity_to_free <= 0:
+            return 0
+        capacity_freed = 0
+        timestamp = now
+        for timestamp, logged_weight in zip(self.timestamps, self.weights):
+            capacity_freed += logged_weight
+            if capacity_freed >= capacity_to_free:
+                break
+        return max(0.0, timestamp + self.expiration_interval - now)
+
+
+class FIFORequestScheduler:
+    """
+    Wakes up the requests waiting for rate limit capacity in FIFO order, at the exact time the logged requests blocking
+    them expire, instead of polling the capacity every retry interval. A waiting request only holds back the later
+    requests sharing one of its limits, the requests for other limits are not delayed.
+    The requests with higher priority are placed before the waiting requests with lower priority.
+    """
+
+    def __init__(self):
+        self._waiters: Deque[Tuple["SlidingWindowRequestContext", asyncio.Future]] = deque()
+        self._wakeup_handle: Optional[asyncio.TimerHandle] = None
+
+    @property
+    def waiting_requests_count(self) -> int:
+        return len(self._waiters)
+
+    async def acquire(self, context: "SlidingWindowRequestContext"):
+        future = asyncio.get_event_loop().create_future()
+        index = len(self._waiters)
+        while index > 0 and self._waiters[index - 1][0].priority > context.priority:
+            index -= 1
+        self._waiters.insert(index, (context, future))
+        self._schedule()
+        try:
+            await future
+        except asyncio.CancelledError:
+            if not future.done() or future.cancelled():
+                self._remove_waiter(future)
+                # The request might have been holding back other requests
+                self._schedule()
+            raise
+
+    def reschedule(self):
+        """
+        Checks the waiting requests again, after the capacity used was changed outside of the requests
+        """
+        self._schedule()
+
+    def _remove_waiter(self, future: asyncio.Future):
+        for index, (_, waiter_future) in enumerate(self._waiters):
+            if waiter_future is future:
+                del self._waiters[index]
+                break
+
+    def _schedule(self):
+        if self._wakeup_handle is not None:
+            self._wakeup_handle.cancel()
+            self._wakeup_handle = None
+
+        blocked_limit_ids = set()
+        next_wakeup_delay: Optional[float] = None
+        for context, future in list(self._waiters):
+            if future.done():
+                self._remove_waiter(future)
+                continue
+            limit_ids = context.limit_ids
+            if blocked_limit_ids.isdisjoint(limit_ids):
+                delay = context.time_until_capacity()
+                if delay <= 0 and context.try_acquire():
+                    self._remove_waiter(future)
+                    future.set_result(None)
+                    continue
+                next_wakeup_delay = delay if next_wakeup_delay is None else min(next_wakeup_delay, delay)
+            blocked_limit_ids.update(limit_ids)
+
+        if next_wakeup_delay is not None:
+            self._wakeup_handle = asyncio.get_event_loop().call_later(next_wakeup_delay, self._schedule)
+
+
+class SlidingWindowRequestContext(AsyncRequestContextBase):
+    """
+    An async context class ('async with' syntax) that checks the rate limits against the sliding windows of the
+    throttler, instead of scanning the shared task logs.
+    """
+
+    def __init__(self,
+                 windows: Dict[str, RateLimitWindow],
+                 rate_limit: Optional[RateLimit],
+                 related_limits: List[Tuple[RateLimit, int]],
+                 lock: asyncio.Lock,
+                 safety_margin_pct: float,
+                 retry_interval: float = 0.1,
+                 priority: RequestPriority = RequestPriority.NORMAL,
+                 priority_reserve_pct: float = 0.0,
+                 wait_time_histogram: Optional[WaitTimeHistogram] = None,
+                 waiting_requests: Optional[WaitingRequests] = None,
+                 scheduler: Optional[FIFORequestScheduler] = None,
+                 windows_lock: Optional[ContextManager] = None,
+                 ):
+        """
+        :param windows: The sliding windows of the throttler, by limit_id
+        :param scheduler: Optional scheduler to wait for capacity in FIFO order instead of polling
+        :param windows_lock: Optional reentrant lock for windows shared with other processes
+        """
+        super().__init__(task_logs=[],
+                         rate_limit=rate_limit,
+                         related_limits=related_limits,
+                         lock=lock,
+                         safety_margin_pct=safety_margin_pct,
+                         retry_interval=retry_interval,
+                         priority=priority,
+                         priority_reserve_pct=priority_reserve_pct,
+                         wait_time_histogram=wait_time_histogram,
+                         waiting_requests=waiting_requests)
+        self._windows: Dict[str, RateLimitWindow] = windows
+        self._scheduler: Optional[FIFORequestScheduler] = scheduler
+        self._windows_lock: ContextManager = windows_lock or nullcontext()
+        self._limits_with_weights: List[Tuple[RateLimitWindow, int]] = []
+        if rate_limit is not None:
+            self._limits_with_weights = [(windows[rate_limit.limit_id], rate_limit.weight)] + [
+                (windows[limit.limit_id], weight) for limit, weight in related_limits]
+
+    @property
+    def limit_ids(self) -> List[str]:
+        return [window.rate_limit.limit_id for window, _ in self._limits_with_weights]
+
+    def flush(self):
+        """
+        Remove the logged requests that have passed the rate limit periods, only for the limits of this request
+        """
+        now: float = self._time()
+        with self._windows_lock:
+            for window, _ in self._limits_with_weights:
+                window.expire(now)
+
+    def within_capacity(self) -> bool:
+        """
+        Checks if an additional task is within the defined RateLimit(s). Logs a warning message if the limit is about
+        to be reached.
+        :return: True if it is within capacity to add a new task
+        """
+        now: float = self._time()
+        with self._windows_lock:
+            for window, weight in self._limits_with_weights:
+                window.expire(now)
+                rate_limit: RateLimit = window.rate_limit
+                if window.capacity_used + weight > self.available_capacity(rate_limit, weight):
+                    if self._last_max_cap_warning_ts < now - MAX_CAPACITY_REACHED_WARNING_INTERVAL:
+                        msg = f"API rate limit on {rate_limit.limit_id} ({rate_limit.limit} calls per " \
+                              f"{rate_limit.time_interval}s) has almost reached. Limits used " \
+                              f"is {window.capacity_used} in the last " \
+                              f"{rate_limit.time_interval} seconds"
+                        self.logger().notify(msg)
+                        AsyncRequestContextBase._last_max_cap_warning_ts = now
+                    return False
+        return True
+
+    def time_until_capacity(self) -> float:
+        """
+        Seconds until all the limits of this request have capacity for it
+        """
+        now: float = self._time()
+        delay: float = 0
+        with self._windows_lock:
+            for window, weight in self._limits_with_weights:
+                window.expire(now)
+                delay = max(delay, window.time_until_capacity(weight, now, self.available_capacity(window.rate_limit, weight)))
+        return delay
+
+    def try_acquire(self) -> bool:
+        """
+        Logs the request if all its limits have capacity for it.
+        The check and the logging of the request happen without yielding to the event loop, so no other request can
+        take the capacity in between and the shared asyncio lock is not needed.
+        :return: True if the request was logged
+        """
+        with self._windows_lock:
+            if not self.within_capacity():
+                return False
+            self._log_task()
+        return True
+
+    def _log_task(self):
+        now: float = self._time()
+        with self._windows_lock:
+            for window, weight in self._limits_with_weights:
+                window.append(now, weight)
+
+    async def acquire(self):
+        if self._scheduler is not None:
+            await self._scheduler.acquire(self)
+            return
+        if not self.higher_priority_waiting() and self.try_acquire():
+            return
+        with self.waiting_for_capacity():
+            while self.higher_priority_waiting() or not self.try_acquire():
+                await asyncio.sleep(self._retry_interval)
+
+    def _time(self):
+        return time.time()
+
+
+class SlidingWindowThrottler(AsyncThrottlerBase):
+    """
+    Alternative to the AsyncThrottler for connectors with many requests within the rate limit periods. Instead of a
+    shared list of task logs scanned for every limit on every check, it keeps a sliding window with the running weight
+    per limit_id, so acquiring capacity does not depend on the number of requests logged.
+    """
+
+    def __init__(self, *args, fifo_scheduling: bool = False, **kwargs):
+        """
+        :param fifo_scheduling: if True the requests waiting for capacity are woken up in FIFO order when the logged
+            requests expire, instead of polling the capacity every retry interval.
+        """
+        super().__init__(*args, **kwargs)
+        self._scheduler: Optional[FIFORequestScheduler] = FIFORequestScheduler() if fifo_scheduling else None
+        self._windows_lock: ContextManager = nullcontext()
+
+    def set_rate_limits(self, rate_limits: List[RateLimit]):
+        super().set_rate_limits(rate_limits)
+        previous_windows: Dict[str, RateLimitWindow] = getattr(self, "_windows", {})
+        self._windows: Dict[str, RateLimitWindow] = {}
+        for rate_limit in self._rate_limits:
+            window = RateLimitWindow(rate_limit=rate_limit, safety_margin_pct=self._safety_margin_pct)
+            previous_window: Optional[RateLimitWindow] = previous_windows.get(rate_limit.limit_id)
+            if previous_window is not None:
+                # Keep the requests already logged for the limit
+                for timestamp, weight in zip(previous_window.timestamps, previous_window.weights):
+                    window.append(timestamp, weight)
+            self._windows[rate_limit.limit_id] = window
+
+    def reconcile_capacity_used(self, limit_id: str, capacity_used: int):
+        window: Optional[RateLimitWindow] = self._windows.get(limit_id)
+        if window is None:
+            return
+        with self._windows_lock:
+            window.reconcile(capacity_used, time.time())
+        if self._scheduler is not None:
+            self._scheduler.reschedule()
+
+    def execute_task(self, limit_id: str, priority: Optional[RequestPriority] = None) -> SlidingWindowRequestContext:
+        """
+        Creates an async context where code within the context (a task) can be run only when all rate
+        limits have capacity for the new task.
+        :param limit_id: the limit_id associated with the APi request
+        :param priority: the priority of the API request, by default the one set with `request_priority`
+        :return: An async context (used with async with syntax)
+        """
+        rate_limit, related_rate_limits = self.get_related_limits(limit_id=limit_id)
+        priority = self._request_priority(priority)
+        return SlidingWindowRequestContext(
+            windows=self._windows,
+            rate_limit=rate_limit,
+            related_limits=related_rate_limits,
+            lock=self._lock,
+            safety_margin_pct=self._safety_margin_pct,
+            retry_interval=self._retry_interval,
+            priority=priority,
+            priority_reserve_pct=self._priority_reserve_pct,
+            wait_time_histogram=self._wait_time_histograms[priority],
+            waiting_requests=self._waiting_requests,
+            scheduler=self._scheduler,
+            windows_lock=self._windows_lock,
+        )
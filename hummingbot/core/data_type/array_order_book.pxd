@@ -0,0 +1,23 @@
+# distutils: language=c++
+
+from libcpp.vector cimport vector
+
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.data_type.order_book cimport OrderBook
+
+
+cdef class ArrayOrderBook(OrderBook):
+    cdef:
+        # Bids are kept in ascending price order and asks in descending price order, so the top of book is always the
+        # last element of each array and the levels that change most often are the cheapest ones to insert or erase.
+        vector[OrderBookEntry] _bid_levels
+        vector[OrderBookEntry] _ask_levels
+        double _min_price_increment
+
+    cdef double c_price_key(self, double price)
+    cdef size_t c_find_level_index(self, vector[OrderBookEntry] *levels, double price, bint descending)
+    cdef c_apply_level(self, vector[OrderBookEntry] *levels, OrderBookEntry entry, bint descending)
+    cdef c_load_levels(self, vector[OrderBookEntry] *levels, vector[OrderBookEntry] entries, bint descending)
+    cdef c_merge_levels(self, vector[OrderBookEntry] *levels)
+    cdef c_truncate_overlap_entries(self)
+    cdef c_update_best_prices(self)
@@ -0,0 +1,267 @@
+# distutils: language=c++
+# distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
+from typing import Iterator
+
+import numpy as np
+
+cimport numpy as np
+from libc.math cimport llround
+from libc.stdint cimport int64_t
+from libcpp.algorithm cimport reverse, stable_sort
+from libcpp.vector cimport vector
+
+from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
+from hummingbot.core.data_type.order_book_depth_index cimport OrderBookDepthIndex
+
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+
+cdef class ArrayOrderBook(OrderBook):
+    """
+    Order book engine that keeps each side of the book in a contiguous, price sorted array instead of the red-black
+    tree used by `OrderBook`. It exposes exactly the same API, so it can be used anywhere an `OrderBook` is expected.
+
+    Levels are located with a galloping search that starts at the top of book, where most diffs land. When the
+    trading pair minimum price increment is known, prices are compared as integer tick indexes instead of raw floats,
+    so levels published with slightly different float representations are still matched.
+    """
+
+    def __init__(self, dex=False, min_price_increment: float = 0.0):
+        super().__init__(dex=dex)
+        self._min_price_increment = min_price_increment if min_price_increment > 0 else 0.0
+
+    @property
+    def min_price_increment(self) -> float:
+        return self._min_price_increment
+
+    @min_price_increment.setter
+    def min_price_increment(self, value: float):
+        self._min_price_increment = value if value > 0 else 0.0
+        self.c_merge_levels(&self._bid_levels)
+        self.c_merge_levels(&self._ask_levels)
+        self.c_update_best_prices()
+        self.c_invalidate_depth_indexes(NULL, NULL)
+
+    cdef double c_price_key(self, double price):
+        if self._min_price_increment > 0:
+            return <double>llround(price / self._min_price_increment)
+        return price
+
+    cdef size_t c_find_level_index(self, vector[OrderBookEntry] *levels, double price, bint descending):
+        """
+        Returns the position of the first level that is not better placed than `price` in the array order
+        (ascending for bids, descending for asks). The search gallops from the end of the array, which is the top
+        of book, so updates close to the best price only need a few comparisons.
+        """
+        cdef:
+            double key = self.c_price_key(price)
+            double level_key
+            size_t low = 0
+            size_t high = levels.size()
+            size_t step = 1
+            size_t probe
+            size_t middle
+
+        while step < high:
+            probe = high - step
+            level_key = self.c_price_key(levels[0][probe].getPrice())
+            if (level_key > key) if descending else (level_key < key):
+                low = probe + 1
+                break
+            high = probe
+            step <<= 1
+
+        while low < high:
+            middle = (low + high) >> 1
+            level_key = self.c_price_key(levels[0][middle].getPrice())
+            if (level_key > key) if descending else (level_key < key):
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    cdef c_apply_level(self, vector[OrderBookEntry] *levels, OrderBookEntry entry, bint descending):
+        cdef:
+            size_t index = self.c_find_level_index(levels, entry.getPrice(), descending)
+            bint found = (index < levels.size()
+                          and self.c_price_key(levels[0][index].getPrice()) == self.c_price_key(entry.getPrice()))
+
+        # Diffs with 0 amounts mean deletion.
+        if found:
+            if entry.getAmount() > 0:
+                levels[0][index] = entry
+            else:
+                levels.erase(levels.begin() + index)
+        elif entry.getAmount() > 0:
+            levels.insert(levels.begin() + index, entry)
+
+    cdef c_load_levels(self, vector[OrderBookEntry] *levels, vector[OrderBookEntry] entries, bint descending):
+        cdef:
+            OrderBookEntry entry
+
+        stable_sort(entries.begin(), entries.end())
+        levels.clear()
+        levels.reserve(entries.size())
+        # Like the set based book, when a snapshot repeats a price level the first entry wins.
+        for entry in entries:
+            if levels.size() > 0 and self.c_price_key(levels.back().getPrice()) == self.c_price_key(entry.getPrice()):
+                continue
+            levels.push_back(entry)
+        if descending:
+            reverse(levels.begin(), levels.end())
+
+    cdef c_merge_levels(self, vector[OrderBookEntry] *levels):
+        """
+        Merges the levels that fall in the same tick after a change of the minimum price increment, keeping the most
+        recent one.
+        """
+        cdef:
+            vector[OrderBookEntry] merged
+            OrderBookEntry entry
+
+        merged.reserve(levels.size())
+        for entry in levels[0]:
+            if merged.size() > 0 and self.c_price_key(merged.back().getPrice()) == self.c_price_key(entry.getPrice()):
+                if entry.getUpdateId() >= merged.back().getUpdateId():
+                    merged[merged.size() - 1] = entry
+            else:
+                merged.push_back(entry)
+        levels.swap(merged)
+
+    cdef c_truncate_overlap_entries(self):
+        cdef:
+            OrderBookEntry top_bid
+            OrderBookEntry top_ask
+
+        while self._bid_levels.size() > 0 and self._ask_levels.size() > 0:
+            top_bid = self._bid_levels.back()
+            top_ask = self._ask_levels.back()
+            if top_bid.getPrice() < top_ask.getPrice():
+                break
+            if self._dex:
+                if top_bid.getAmount() * top_bid.getPrice() > top_ask.getAmount() * top_ask.getPrice():
+                    self._ask_levels.pop_back()
+                else:
+                    self._bid_levels.pop_back()
+            else:
+                if top_bid.getUpdateId() > top_ask.getUpdateId():
+                    self._ask_levels.pop_back()
+                else:
+                    self._bid_levels.pop_back()
+
+    cdef c_update_best_prices(self):
+        if self._bid_levels.size() > 0:
+            self._best_bid = self._bid_levels.back().getPrice()
+        if self._ask_levels.size() > 0:
+            self._best_ask = self._ask_levels.back().getPrice()
+
+    cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        cdef:
+            OrderBookEntry entry
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
+
+        for entry in bids:
+            self.c_apply_level(&self._bid_levels, entry, False)
+        for entry in asks:
+            self.c_apply_level(&self._ask_levels, entry, True)
+
+        # If any overlapping entries between the bid and ask books, centralised: newer entries win, dex: larger wins
+        self.c_truncate_overlap_entries()
+
+        # Record the current best prices, for faster c_get_price() calls.
+        self.c_update_best_prices()
+
+        self.c_invalidate_depth_indexes(&bids, &asks)
+
+        # Remember the last diff update ID.
+        self._last_diff_uid = update_id
+
+        if self._change_events_enabled:
+            self.c_notify_diffs(previous_best_bid, previous_best_ask, &bids, &asks, update_id)
+
+    cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
+        cdef:
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
+            object previous_levels = self.c_get_watched_levels()
+
+        self.c_load_levels(&self._bid_levels, bids, False)
+        self.c_load_levels(&self._ask_levels, asks, True)
+
+        if self._dex:
+            self.c_truncate_overlap_entries()
+
+        self._best_bid = self._best_ask = float("NaN")
+        self.c_update_best_prices()
+
+        self.c_invalidate_depth_indexes(NULL, NULL)
+
+        # Remember the last snapshot update ID.
+        self._snapshot_uid = update_id
+
+        if self._change_events_enabled:
+            self.c_notify_snapshot(previous_best_bid, previous_best_ask, previous_levels, update_id)
+
+    cdef c_rebuild_depth_index(self, OrderBookDepthIndex depth_index):
+        cdef:
+            vector[OrderBookEntry] *levels = &self._bid_levels if depth_index._is_bid else &self._ask_levels
+            size_t position = 0
+            OrderBookEntry entry
+
+        depth_index.c_clear()
+        while position < levels.size() and position < depth_index._max_levels:
+            entry = levels[0][levels.size() - 1 - position]
+            depth_index.c_add_level(entry.getPrice(), entry.getAmount())
+            position += 1
+        depth_index._complete = position == levels.size()
+
+    cdef double c_get_price_at_depth(self, bint is_bid, Py_ssize_t depth):
+        cdef:
+            vector[OrderBookEntry] *levels = &self._bid_levels if is_bid else &self._ask_levels
+        if depth < 1 or depth > <Py_ssize_t>levels.size():
+            return float("NaN")
+        return levels[0][levels.size() - depth].getPrice()
+
+    cdef np.ndarray c_side_to_numpy(self, bint is_bid, Py_ssize_t depth):
+        cdef:
+            vector[OrderBookEntry] *levels = &self._bid_levels if is_bid else &self._ask_levels
+            Py_ssize_t size = levels.size()
+            Py_ssize_t position
+            OrderBookEntry entry
+            np.ndarray[np.float64_t, ndim=2] result
+
+        if 0 <= depth < size:
+            size = depth
+        result = np.empty((size, 3), dtype=np.float64)
+        for position in range(size):
+            entry = levels[0][levels.size() - 1 - position]
+            result[position, 0] = entry.getPrice()
+            result[position, 1] = entry.getAmount()
+            result[position, 2] = entry.getUpdateId()
+        return result
+
+    def bid_entries(self) -> Iterator[OrderBookRow]:
+        cdef:
+            size_t position = 0
+            OrderBookEntry entry
+        while position < self._bid_levels.size():
+            entry = self._bid_levels[self._bid_levels.size() - 1 - position]
+            yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
+            position += 1
+
+    def ask_entries(self) -> Iterator[OrderBookRow]:
+        cdef:
+            size_t position = 0
+            OrderBookEntry entry
+        while position < self._ask_levels.size():
+            entry = self._ask_levels[self._ask_levels.size() - 1 - position]
+            yield OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId())
+            position += 1
+
+    cdef double c_get_price(self, bint is_buy) except? -1:
+        cdef:
+            vector[OrderBookEntry] *levels = &self._ask_levels if is_buy else &self._bid_levels
+        if levels.size() < 1:
+            raise EnvironmentError("Order book is empty - no price quote is possible.")
+        return self._best_ask if is_buy else self._best_bid
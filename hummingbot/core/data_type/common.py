@@ -64,3 +64,8 @@ class LPType(Enum):
     ADD = 1
     REMOVE = 2
     COLLECT = 3
+
+
+class OrderBookEngine(Enum):
+    SET = 1
+    ARRAY = 2
@@ -1,8 +1,12 @@
 # distutils: language=c++
 # distutils: sources=hummingbot/core/cpp/OrderBookEntry.cpp
 
+from itertools import islice
 from typing import Iterator
 
+import numpy as np
+
+cimport numpy as np
 from cython.operator cimport address as ref, dereference as deref, postincrement as inc
 from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
 from libcpp.set cimport set
@@ -21,6 +25,10 @@ cdef class CompositeOrderBook(OrderBook):
         super().__init__()
         self._traded_order_book = OrderBook()
 
+    def enable_depth_index(self, levels: int):
+        # The depth index is built from the exchange order book only, it would ignore the traded order book entries
+        raise NotImplementedError("The depth index is not supported by the composite order book.")
+
     @property
     def traded_order_book(self) -> OrderBook:
         return self._traded_order_book
@@ -175,6 +183,11 @@ cdef class CompositeOrderBook(OrderBook):
 
         self._traded_order_book.c_apply_diffs(cpp_bids_changes, cpp_asks_changes, self._last_diff_uid)
 
+    cdef np.ndarray c_side_to_numpy(self, bint is_bid, Py_ssize_t depth):
+        entries = self.bid_entries() if is_bid else self.ask_entries()
+        levels = np.array(list(islice(entries, depth if depth >= 0 else None)), dtype=np.float64)
+        return levels.reshape((-1, 3))
+
     cdef double c_get_price(self, bint is_buy) except? -1:
         cdef:
             set[OrderBookEntry] *book = ref(self._ask_book) if is_buy else ref(self._bid_book)
@@ -5,6 +5,7 @@ from libcpp.set cimport set
 from libcpp.vector cimport vector
 from hummingbot.core.data_type.OrderBookEntry cimport OrderBookEntry
 from hummingbot.core.pubsub cimport PubSub
+from .order_book_depth_index cimport OrderBookDepthIndex
 from .order_book_query_result cimport OrderBookQueryResult
 cimport numpy as np
 
@@ -20,6 +21,10 @@ cdef class OrderBook(PubSub):
     cdef double _last_applied_trade
     cdef double _last_trade_price_rest_updated
     cdef bint _dex
+    cdef OrderBookDepthIndex _bid_depth_index
+    cdef OrderBookDepthIndex _ask_depth_index
+    cdef bint _change_events_enabled
+    cdef Py_ssize_t _watched_depth
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id)
@@ -30,6 +35,23 @@ cdef class OrderBook(PubSub):
     cdef c_apply_numpy_snapshot(self,
                                 np.ndarray[np.float64_t, ndim=2] bids_array,
                                 np.ndarray[np.float64_t, ndim=2] asks_array)
+    cdef c_invalidate_depth_indexes(self, vector[OrderBookEntry] *bids, vector[OrderBookEntry] *asks)
+    cdef c_rebuild_depth_index(self, OrderBookDepthIndex depth_index)
+    cdef OrderBookDepthIndex c_get_depth_index(self, bint is_buy)
+    cdef np.ndarray c_side_to_numpy(self, bint is_bid, Py_ssize_t depth)
+    cdef double c_get_price_at_depth(self, bint is_bid, Py_ssize_t depth)
+    cdef object c_get_watched_levels(self)
+    cdef c_notify_diffs(self,
+                        double previous_best_bid,
+                        double previous_best_ask,
+                        vector[OrderBookEntry] *bids,
+                        vector[OrderBookEntry] *asks,
+                        int64_t update_id)
+    cdef c_notify_snapshot(self,
+                           double previous_best_bid,
+                           double previous_best_ask,
+                           object previous_levels,
+                           int64_t update_id)
     cdef double c_get_price(self, bint is_buy) except? -1
     cdef OrderBookQueryResult c_get_price_for_volume(self, bint is_buy, double volume)
     cdef OrderBookQueryResult c_get_price_for_quote_volume(self, bint is_buy, double quote_volume)
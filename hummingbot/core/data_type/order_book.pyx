@@ -14,12 +14,15 @@ from typing import (
 import numpy as np
 import pandas as pd
 
+cimport cython
+from libc.math cimport isnan
 from cython.operator cimport(
     address as ref,
     dereference as deref,
     postincrement as inc,
 )
 
+from hummingbot.core.data_type.order_book_depth_index import OrderBookDepthIndex
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
 from hummingbot.core.data_type.order_book_row import OrderBookRow
@@ -27,6 +30,8 @@ from hummingbot.core.data_type.OrderBookEntry cimport truncateOverlapEntries
 from hummingbot.logger import HummingbotLogger
 from hummingbot.core.event.events import (
     OrderBookEvent,
+    OrderBookLevelsChangedEvent,
+    OrderBookTopOfBookChangedEvent,
     OrderBookTradeEvent
 )
 
@@ -36,8 +41,118 @@ ob_logger = None
 NaN = float("nan")
 
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef vector[OrderBookEntry] c_entries_from_levels(const double[:, :] levels, int64_t update_id):
+    """
+    Builds the order book entries from a 2D array of levels, reading the price from the first column and the amount
+    from the second one. Any extra column is ignored.
+    """
+    cdef:
+        vector[OrderBookEntry] entries
+        Py_ssize_t index
+
+    if levels.shape[0] > 0 and levels.shape[1] < 2:
+        raise ValueError("The levels array must have at least two columns (price and amount).")
+    entries.reserve(levels.shape[0])
+    for index in range(levels.shape[0]):
+        entries.push_back(OrderBookEntry(levels[index, 0], levels[index, 1], update_id))
+    return entries
+
+
+cdef list c_rows_from_levels(object levels):
+    return [OrderBookRow(price, amount, int(update_id)) for price, amount, update_id in levels.tolist()]
+
+
+cdef inline bint c_price_changed(double previous_price, double price):
+    return previous_price != price and not (isnan(previous_price) and isnan(price))
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef object c_walk_for_volumes(object entries, object volumes, bint vwap):
+    """
+    Walks the order book entries (best price first) once, answering every volume in `volumes` in ascending order.
+    Returns an array aligned with `volumes`, holding the price reached by each volume (or the VWAP up to it), and NaN
+    where the book is not deep enough.
+    """
+    cdef:
+        const double[:] query_volumes = np.ascontiguousarray(volumes, dtype=np.float64).ravel()
+        const int64_t[:] order = np.argsort(query_volumes, kind="stable").astype(np.int64)
+        Py_ssize_t count = query_volumes.shape[0]
+        Py_ssize_t position = 0
+        object results = np.full(count, NaN)
+        double[:] result_values = results
+        double cumulative_volume = 0
+        double cumulative_cost = 0
+        double query_volume
+        double price
+        double amount
+
+    for row in entries:
+        if position >= count:
+            break
+        price = row.price
+        amount = row.amount
+        while position < count:
+            query_volume = query_volumes[order[position]]
+            # NaN volumes are sorted last and never reached
+            if not query_volume <= cumulative_volume + amount:
+                break
+            if not vwap:
+                result_values[order[position]] = price
+            elif query_volume <= 0:
+                result_values[order[position]] = price
+            else:
+                result_values[order[position]] = (
+                    (cumulative_cost + (query_volume - cumulative_volume) * price) /
+                    (cumulative_volume + (query_volume - cumulative_volume)))
+            position += 1
+        cumulative_volume += amount
+        cumulative_cost += amount * price
+    return results
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef object c_walk_for_prices(object entries, object prices, bint is_buy):
+    """
+    Walks the order book entries (best price first) once, returning for every price in `prices` the cumulative volume
+    available at that price or better.
+    """
+    cdef:
+        const double[:] query_prices = np.ascontiguousarray(prices, dtype=np.float64).ravel()
+        const int64_t[:] order = np.argsort(
+            query_prices if is_buy else np.negative(query_prices), kind="stable").astype(np.int64)
+        Py_ssize_t count = query_prices.shape[0]
+        Py_ssize_t position = 0
+        object results = np.empty(count)
+        double[:] result_values = results
+        double cumulative_volume = 0
+        double query_price
+        double price
+
+    for row in entries:
+        price = row.price
+        while position < count:
+            query_price = query_prices[order[position]]
+            if not ((query_price < price) if is_buy else (query_price > price)):
+                break
+            result_values[order[position]] = cumulative_volume
+            position += 1
+        if position >= count:
+            break
+        cumulative_volume += row.amount
+    while position < count:
+        result_values[order[position]] = cumulative_volume
+        position += 1
+    return results
+
+
 cdef class OrderBook(PubSub):
     ORDER_BOOK_TRADE_EVENT_TAG = OrderBookEvent.TradeEvent.value
+    ORDER_BOOK_TOP_OF_BOOK_CHANGED_EVENT_TAG = OrderBookEvent.TopOfBookChanged.value
+    ORDER_BOOK_LEVELS_CHANGED_EVENT_TAG = OrderBookEvent.LevelsChanged.value
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -55,6 +170,10 @@ cdef class OrderBook(PubSub):
         self._last_applied_trade = -1000.0
         self._last_trade_price_rest_updated = -1000
         self._dex = dex
+        self._bid_depth_index = None
+        self._ask_depth_index = None
+        self._change_events_enabled = False
+        self._watched_depth = 0
 
     cdef c_apply_diffs(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
@@ -65,6 +184,8 @@ cdef class OrderBook(PubSub):
             set[OrderBookEntry].iterator result
             OrderBookEntry top_bid
             OrderBookEntry top_ask
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
 
         # Apply the diffs. Diffs with 0 amounts mean deletion.
         for bid in bids:
@@ -93,13 +214,21 @@ cdef class OrderBook(PubSub):
             top_ask = deref(ask_iterator)
             self._best_ask = top_ask.getPrice()
 
+        self.c_invalidate_depth_indexes(&bids, &asks)
+
         # Remember the last diff update ID.
         self._last_diff_uid = update_id
 
+        if self._change_events_enabled:
+            self.c_notify_diffs(previous_best_bid, previous_best_ask, &bids, &asks, update_id)
+
     cdef c_apply_snapshot(self, vector[OrderBookEntry] bids, vector[OrderBookEntry] asks, int64_t update_id):
         cdef:
             double best_bid_price = float("NaN")
             double best_ask_price = float("NaN")
+            double previous_best_bid = self._best_bid
+            double previous_best_ask = self._best_ask
+            object previous_levels = self.c_get_watched_levels()
             set[OrderBookEntry].reverse_iterator bid_iterator
             set[OrderBookEntry].iterator ask_iterator
             OrderBookEntry top_bid
@@ -133,14 +262,219 @@ cdef class OrderBook(PubSub):
         self._best_bid = best_bid_price
         self._best_ask = best_ask_price
 
+        self.c_invalidate_depth_indexes(NULL, NULL)
+
         # Remember the last snapshot update ID.
         self._snapshot_uid = update_id
 
+        if self._change_events_enabled:
+            self.c_notify_snapshot(previous_best_bid, previous_best_ask, previous_levels, update_id)
+
     cdef c_apply_trade(self, object trade_event):
         self._last_trade_price = trade_event.price
         self._last_applied_trade = time.perf_counter()
         self.c_trigger_event(self.ORDER_BOOK_TRADE_EVENT_TAG, trade_event)
 
+    cdef c_invalidate_depth_indexes(self, vector[OrderBookEntry] *bids, vector[OrderBookEntry] *asks):
+        """
+        Marks the depth indexes as dirty when the updated levels can change the indexed part of the book. Passing NULL
+        for the levels invalidates both indexes (used when the whole book is replaced).
+        """
+        cdef:
+            OrderBookEntry entry
+
+        if self._bid_depth_index is None:
+            return
+        if bids == NULL or asks == NULL:
+            self._bid_depth_index.c_invalidate()
+            self._ask_depth_index.c_invalidate()
+            return
+        for entry in bids[0]:
+            self._bid_depth_index.c_invalidate_for_price(entry.getPrice())
+            self._ask_depth_index.c_invalidate_for_crossing_price(entry.getPrice())
+        for entry in asks[0]:
+            self._ask_depth_index.c_invalidate_for_price(entry.getPrice())
+            self._bid_depth_index.c_invalidate_for_crossing_price(entry.getPrice())
+
+    cdef c_rebuild_depth_index(self, OrderBookDepthIndex depth_index):
+        cdef:
+            set[OrderBookEntry].reverse_iterator bid_it
+            set[OrderBookEntry].iterator ask_it
+            OrderBookEntry entry
+
+        depth_index.c_clear()
+        if depth_index._is_bid:
+            bid_it = self._bid_book.rbegin()
+            while bid_it != self._bid_book.rend() and depth_index._prices.size() < depth_index._max_levels:
+                entry = deref(bid_it)
+                depth_index.c_add_level(entry.getPrice(), entry.getAmount())
+                inc(bid_it)
+            depth_index._complete = bid_it == self._bid_book.rend()
+        else:
+            ask_it = self._ask_book.begin()
+            while ask_it != self._ask_book.end() and depth_index._prices.size() < depth_index._max_levels:
+                entry = deref(ask_it)
+                depth_index.c_add_level(entry.getPrice(), entry.getAmount())
+                inc(ask_it)
+            depth_index._complete = ask_it == self._ask_book.end()
+
+    cdef OrderBookDepthIndex c_get_depth_index(self, bint is_buy):
+        cdef:
+            OrderBookDepthIndex depth_index = self._ask_depth_index if is_buy else self._bid_depth_index
+        if depth_index is not None and depth_index._dirty:
+            self.c_rebuild_depth_index(depth_index)
+        return depth_index
+
+    cdef np.ndarray c_side_to_numpy(self, bint is_bid, Py_ssize_t depth):
+        """
+        Writes the levels of one side, best price first, into a (levels, 3) float64 array with the price, amount and
+        update id columns. A negative depth exports the whole side.
+        """
+        cdef:
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            Py_ssize_t size = self._bid_book.size() if is_bid else self._ask_book.size()
+            Py_ssize_t position
+            OrderBookEntry entry
+            np.ndarray[np.float64_t, ndim=2] levels
+
+        if 0 <= depth < size:
+            size = depth
+        levels = np.empty((size, 3), dtype=np.float64)
+        for position in range(size):
+            if is_bid:
+                entry = deref(bid_it)
+                inc(bid_it)
+            else:
+                entry = deref(ask_it)
+                inc(ask_it)
+            levels[position, 0] = entry.getPrice()
+            levels[position, 1] = entry.getAmount()
+            levels[position, 2] = entry.getUpdateId()
+        return levels
+
+    cdef double c_get_price_at_depth(self, bint is_bid, Py_ssize_t depth):
+        """
+        Price of the level at the given (1 based) depth of one side, NaN when the side is not that deep.
+        """
+        cdef:
+            set[OrderBookEntry].reverse_iterator bid_it = self._bid_book.rbegin()
+            set[OrderBookEntry].iterator ask_it = self._ask_book.begin()
+            Py_ssize_t size = self._bid_book.size() if is_bid else self._ask_book.size()
+            Py_ssize_t position
+            OrderBookEntry entry
+
+        if depth < 1 or depth > size:
+            return NaN
+        if is_bid:
+            for position in range(depth - 1):
+                inc(bid_it)
+            entry = deref(bid_it)
+        else:
+            for position in range(depth - 1):
+                inc(ask_it)
+            entry = deref(ask_it)
+        return entry.getPrice()
+
+    cdef object c_get_watched_levels(self):
+        if not self._change_events_enabled or self._watched_depth == 0:
+            return None
+        return self.c_side_to_numpy(True, self._watched_depth), self.c_side_to_numpy(False, self._watched_depth)
+
+    cdef c_notify_diffs(self,
+                        double previous_best_bid,
+                        double previous_best_ask,
+                        vector[OrderBookEntry] *bids,
+                        vector[OrderBookEntry] *asks,
+                        int64_t update_id):
+        """
+        Triggers the change events for an applied diff. A diff level is within the watched depth when its price is at
+        least as good as the price of the last watched level after the update (or when the side is not that deep), so
+        levels removed from the top of the book are reported as well.
+        """
+        cdef:
+            double bid_boundary
+            double ask_boundary
+            OrderBookEntry entry
+            list changed_bids = []
+            list changed_asks = []
+
+        if c_price_changed(previous_best_bid, self._best_bid) or c_price_changed(previous_best_ask, self._best_ask):
+            self.c_trigger_event(self.ORDER_BOOK_TOP_OF_BOOK_CHANGED_EVENT_TAG,
+                                 OrderBookTopOfBookChangedEvent(update_id, self._best_bid, self._best_ask))
+        if self._watched_depth == 0:
+            return
+
+        bid_boundary = self.c_get_price_at_depth(True, self._watched_depth)
+        ask_boundary = self.c_get_price_at_depth(False, self._watched_depth)
+        for entry in bids[0]:
+            if isnan(bid_boundary) or entry.getPrice() >= bid_boundary:
+                changed_bids.append(OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId()))
+        for entry in asks[0]:
+            if isnan(ask_boundary) or entry.getPrice() <= ask_boundary:
+                changed_asks.append(OrderBookRow(entry.getPrice(), entry.getAmount(), entry.getUpdateId()))
+        if len(changed_bids) > 0 or len(changed_asks) > 0:
+            self.c_trigger_event(self.ORDER_BOOK_LEVELS_CHANGED_EVENT_TAG,
+                                 OrderBookLevelsChangedEvent(update_id, changed_bids, changed_asks))
+
+    cdef c_notify_snapshot(self,
+                           double previous_best_bid,
+                           double previous_best_ask,
+                           object previous_levels,
+                           int64_t update_id):
+        """
+        Triggers the change events for an applied snapshot, comparing the price and amount of the watched levels
+        before and after it.
+        """
+        if c_price_changed(previous_best_bid, self._best_bid) or c_price_changed(previous_best_ask, self._best_ask):
+            self.c_trigger_event(self.ORDER_BOOK_TOP_OF_BOOK_CHANGED_EVENT_TAG,
+                                 OrderBookTopOfBookChangedEvent(update_id, self._best_bid, self._best_ask))
+        if previous_levels is None:
+            return
+
+        previous_bids, previous_asks = previous_levels
+        bids_array, asks_array = self.c_get_watched_levels()
+        if (np.array_equal(previous_bids[:, :2], bids_array[:, :2])
+                and np.array_equal(previous_asks[:, :2], asks_array[:, :2])):
+            return
+        self.c_trigger_event(self.ORDER_BOOK_LEVELS_CHANGED_EVENT_TAG,
+                             OrderBookLevelsChangedEvent(update_id,
+                                                         c_rows_from_levels(bids_array),
+                                                         c_rows_from_levels(asks_array),
+                                                         True))
+
+    def enable_change_events(self, watched_depth: int = 0):
+        """
+        Opts in to the TopOfBookChanged events, triggered when a diff or snapshot moves the best bid or ask, and, when
+        watched_depth is positive, to the LevelsChanged events for updates within the first watched_depth levels of
+        each side.
+        """
+        if watched_depth < 0:
+            raise ValueError("The watched depth can't be negative.")
+        self._change_events_enabled = True
+        self._watched_depth = watched_depth
+
+    def disable_change_events(self):
+        self._change_events_enabled = False
+        self._watched_depth = 0
+
+    def enable_depth_index(self, levels: int):
+        """
+        Maintains the cumulative base and quote volumes of the first `levels` levels of each side, so that
+        get_price_for_volume, get_vwap_for_volume and get_price_for_quote_volume are answered with a binary search
+        when the requested volume is within those levels.
+        """
+        self._bid_depth_index = OrderBookDepthIndex(levels, True)
+        self._ask_depth_index = OrderBookDepthIndex(levels, False)
+
+    def disable_depth_index(self):
+        self._bid_depth_index = None
+        self._ask_depth_index = None
+
+    @property
+    def depth_index_levels(self) -> int:
+        return 0 if self._bid_depth_index is None else self._bid_depth_index.max_levels
+
     @property
     def last_trade_price(self) -> float:
         return self._last_trade_price
@@ -171,12 +505,21 @@ cdef class OrderBook(PubSub):
 
     @property
     def snapshot(self) -> Tuple[pd.DataFrame, pd.DataFrame]:
-        bids_rows = list(self.bid_entries())
-        asks_rows = list(self.ask_entries())
-        bids_df = pd.DataFrame(data=bids_rows, columns=OrderBookRow._fields, dtype="float64")
-        asks_df = pd.DataFrame(data=asks_rows, columns=OrderBookRow._fields, dtype="float64")
+        bids_array, asks_array = self.to_numpy()
+        bids_df = pd.DataFrame(data=bids_array, columns=OrderBookRow._fields, dtype="float64")
+        asks_df = pd.DataFrame(data=asks_array, columns=OrderBookRow._fields, dtype="float64")
         return bids_df, asks_df
 
+    def to_numpy(self, depth: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Exports the bids and the asks, best price first, as (levels, 3) float64 arrays with the price, amount and
+        update id columns. When a depth is given only the first `depth` levels of each side are exported.
+        """
+        if depth is not None and depth < 0:
+            raise ValueError("The depth can't be negative.")
+        cdef Py_ssize_t c_depth = -1 if depth is None else depth
+        return self.c_side_to_numpy(True, c_depth), self.c_side_to_numpy(False, c_depth)
+
     def apply_diffs(self, bids: List[OrderBookRow], asks: List[OrderBookRow], update_id: int):
         cdef:
             vector[OrderBookEntry] cpp_bids
@@ -197,6 +540,33 @@ cdef class OrderBook(PubSub):
             cpp_asks.push_back(OrderBookEntry(row.price, row.amount, row.update_id))
         self.c_apply_snapshot(cpp_bids, cpp_asks, update_id)
 
+    def apply_diffs_arrays(self, bids: np.ndarray, asks: np.ndarray, update_id: int):
+        """
+        Applies diffs received as 2D float64 arrays (or any buffer of doubles) with the price in the first column and
+        the amount in the second one, as they come in the exchange payloads. The arrays are read directly, without
+        creating a Python object per level.
+        """
+        self.c_apply_diffs(c_entries_from_levels(bids, update_id), c_entries_from_levels(asks, update_id), update_id)
+
+    def apply_snapshot_arrays(self, bids: np.ndarray, asks: np.ndarray, update_id: int):
+        """
+        Applies a snapshot received as 2D float64 arrays (or any buffer of doubles) with the price in the first column
+        and the amount in the second one.
+        """
+        self.c_apply_snapshot(c_entries_from_levels(bids, update_id), c_entries_from_levels(asks, update_id), update_id)
+
+    def apply_diffs_message(self, message: OrderBookMessage):
+        if message.has_level_arrays:
+            self.apply_diffs_arrays(message.bids_array, message.asks_array, message.update_id)
+        else:
+            self.apply_diffs(message.bids, message.asks, message.update_id)
+
+    def apply_snapshot_message(self, message: OrderBookMessage):
+        if message.has_level_arrays:
+            self.apply_snapshot_arrays(message.bids_array, message.asks_array, message.update_id)
+        else:
+            self.apply_snapshot(message.bids, message.asks, message.update_id)
+
     def apply_trade(self, trade: OrderBookTradeEvent):
         self.c_apply_trade(trade)
 
@@ -226,13 +596,16 @@ cdef class OrderBook(PubSub):
             vector[OrderBookEntry] cpp_bids
             vector[OrderBookEntry] cpp_asks
             int64_t last_update_id = 0
-
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
+            Py_ssize_t index
+
+        cpp_bids.reserve(bids_array.shape[0])
+        for index in range(bids_array.shape[0]):
+            cpp_bids.push_back(OrderBookEntry(bids_array[index, 0], bids_array[index, 1], <int64_t>bids_array[index, 2]))
+            last_update_id = max(last_update_id, <int64_t>bids_array[index, 2])
+        cpp_asks.reserve(asks_array.shape[0])
+        for index in range(asks_array.shape[0]):
+            cpp_asks.push_back(OrderBookEntry(asks_array[index, 0], asks_array[index, 1], <int64_t>asks_array[index, 2]))
+            last_update_id = max(last_update_id, <int64_t>asks_array[index, 2])
         self.c_apply_diffs(cpp_bids, cpp_asks, last_update_id)
 
     def apply_numpy_snapshot(self, bids_array: np.ndarray, asks_array: np.ndarray):
@@ -253,13 +626,16 @@ cdef class OrderBook(PubSub):
             vector[OrderBookEntry] cpp_bids
             vector[OrderBookEntry] cpp_asks
             int64_t last_update_id = 0
-
-        for row in bids_array:
-            cpp_bids.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
-        for row in asks_array:
-            cpp_asks.push_back(OrderBookEntry(row[0], row[1], <int64_t>(row[2])))
-            last_update_id = max(last_update_id, <int64_t>row[2])
+            Py_ssize_t index
+
+        cpp_bids.reserve(bids_array.shape[0])
+        for index in range(bids_array.shape[0]):
+            cpp_bids.push_back(OrderBookEntry(bids_array[index, 0], bids_array[index, 1], <int64_t>bids_array[index, 2]))
+            last_update_id = max(last_update_id, <int64_t>bids_array[index, 2])
+        cpp_asks.reserve(asks_array.shape[0])
+        for index in range(asks_array.shape[0]):
+            cpp_asks.push_back(OrderBookEntry(asks_array[index, 0], asks_array[index, 1], <int64_t>asks_array[index, 2]))
+            last_update_id = max(last_update_id, <int64_t>asks_array[index, 2])
         self.c_apply_snapshot(cpp_bids, cpp_asks, last_update_id)
 
     def bid_entries(self) -> Iterator[OrderBookRow]:
@@ -322,6 +698,10 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
+            OrderBookDepthIndex depth_index = self.c_get_depth_index(is_buy)
+
+        if depth_index is not None and depth_index.c_covers_base_volume(volume):
+            return depth_index.c_get_price_for_volume(volume)
 
         if is_buy:
             for order_book_row in self.ask_entries():
@@ -343,6 +723,11 @@ cdef class OrderBook(PubSub):
             double total_cost = 0
             double total_volume = 0
             double result_vwap = NaN
+            OrderBookDepthIndex depth_index = self.c_get_depth_index(is_buy)
+
+        if depth_index is not None and depth_index.c_covers_base_volume(volume):
+            return depth_index.c_get_vwap_for_volume(volume)
+
         if is_buy:
             for order_book_row in self.ask_entries():
                 total_cost += order_book_row.amount * order_book_row.price
@@ -353,7 +738,8 @@ cdef class OrderBook(PubSub):
                     incremental_amount = volume - total_volume
                     total_cost += incremental_amount * order_book_row.price
                     total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
+                    # A zero volume is answered with the best price, as get_vwap_for_volumes does
+                    result_vwap = total_cost / total_volume if total_volume > 0 else order_book_row.price
                     break
         else:
             for order_book_row in self.bid_entries():
@@ -365,7 +751,8 @@ cdef class OrderBook(PubSub):
                     incremental_amount = volume - total_volume
                     total_cost += incremental_amount * order_book_row.price
                     total_volume += incremental_amount
-                    result_vwap = total_cost / total_volume
+                    # A zero volume is answered with the best price, as get_vwap_for_volumes does
+                    result_vwap = total_cost / total_volume if total_volume > 0 else order_book_row.price
                     break
 
         return OrderBookQueryResult(NaN, volume, result_vwap, min(total_volume, volume))
@@ -374,6 +761,10 @@ cdef class OrderBook(PubSub):
         cdef:
             double cumulative_volume = 0
             double result_price = NaN
+            OrderBookDepthIndex depth_index = self.c_get_depth_index(is_buy)
+
+        if depth_index is not None and depth_index.c_covers_quote_volume(quote_volume):
+            return depth_index.c_get_price_for_quote_volume(quote_volume)
 
         if is_buy:
             for order_book_row in self.ask_entries():
@@ -475,9 +866,30 @@ cdef class OrderBook(PubSub):
     def get_quote_volume_for_price(self, is_buy: bool, price: float) -> OrderBookQueryResult:
         return self.c_get_quote_volume_for_price(is_buy, price)
 
+    def get_price_for_volumes(self, is_buy: bool, volumes: np.ndarray) -> np.ndarray:
+        """
+        Batch version of get_price_for_volume, answering all the volumes in a single pass over the book.
+        Returns the result prices aligned with `volumes`, NaN where the book is not deep enough.
+        """
+        return c_walk_for_volumes(self.ask_entries() if is_buy else self.bid_entries(), volumes, False)
+
+    def get_vwap_for_volumes(self, is_buy: bool, volumes: np.ndarray) -> np.ndarray:
+        """
+        Batch version of get_vwap_for_volume, answering all the volumes in a single pass over the book.
+        Returns the VWAPs aligned with `volumes`, NaN where the book is not deep enough.
+        """
+        return c_walk_for_volumes(self.ask_entries() if is_buy else self.bid_entries(), volumes, True)
+
+    def get_volume_for_prices(self, is_buy: bool, prices: np.ndarray) -> np.ndarray:
+        """
+        Batch version of get_volume_for_price, answering all the prices in a single pass over the book.
+        Returns the cumulative base volumes aligned with `prices`.
+        """
+        return c_walk_for_prices(self.ask_entries() if is_buy else self.bid_entries(), prices, is_buy)
+
     def restore_from_snapshot_and_diffs(self, snapshot: OrderBookMessage, diffs: List[OrderBookMessage]):
         replay_position = bisect.bisect_right(diffs, snapshot)
         replay_diffs = diffs[replay_position:]
-        self.apply_snapshot(snapshot.bids, snapshot.asks, snapshot.update_id)
+        self.apply_snapshot_message(snapshot)
         for diff in replay_diffs:
-            self.apply_diffs(diff.bids, diff.asks, diff.update_id)
+            self.apply_diffs_message(diff)
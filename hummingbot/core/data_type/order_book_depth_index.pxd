@@ -0,0 +1,28 @@
+# distutils: language=c++
+
+from libcpp.vector cimport vector
+
+from .order_book_query_result cimport OrderBookQueryResult
+
+
+cdef class OrderBookDepthIndex:
+    cdef:
+        size_t _max_levels
+        bint _is_bid
+        bint _dirty
+        bint _complete
+        vector[double] _prices
+        vector[double] _cumulative_base_volumes
+        vector[double] _cumulative_quote_volumes
+
+    cdef c_clear(self)
+    cdef c_add_level(self, double price, double amount)
+    cdef c_invalidate(self)
+    cdef c_invalidate_for_price(self, double price)
+    cdef c_invalidate_for_crossing_price(self, double price)
+    cdef size_t c_first_index_reaching(self, vector[double] *cumulative_volumes, double volume)
+    cdef bint c_covers_base_volume(self, double volume)
+    cdef bint c_covers_quote_volume(self, double quote_volume)
+    cdef OrderBookQueryResult c_get_price_for_volume(self, double volume)
+    cdef OrderBookQueryResult c_get_vwap_for_volume(self, double volume)
+    cdef OrderBookQueryResult c_get_price_for_quote_volume(self, double quote_volume)
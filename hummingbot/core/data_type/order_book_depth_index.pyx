@@ -0,0 +1,140 @@
+# distutils: language=c++
+
+from hummingbot.core.data_type.order_book_query_result import OrderBookQueryResult
+
+NaN = float("nan")
+
+
+cdef class OrderBookDepthIndex:
+    """
+    Cumulative base and quote volumes over the first levels of one side of an order book, best price first.
+
+    The order book marks the index as dirty only when a diff touches the indexed levels (or crosses them), and
+    rebuilds it on the next query. Volume queries that fall inside the indexed levels are then answered with a binary
+    search over the cumulative volumes, instead of walking the book from the top.
+    """
+
+    def __init__(self, max_levels: int, is_bid: bool):
+        if max_levels < 1:
+            raise ValueError("The depth index must include at least one level.")
+        self._max_levels = max_levels
+        self._is_bid = is_bid
+        self._dirty = True
+        self._complete = False
+
+    @property
+    def max_levels(self) -> int:
+        return self._max_levels
+
+    @property
+    def dirty(self) -> bool:
+        return self._dirty
+
+    @property
+    def levels(self) -> int:
+        return self._prices.size()
+
+    cdef c_clear(self):
+        self._prices.clear()
+        self._cumulative_base_volumes.clear()
+        self._cumulative_quote_volumes.clear()
+        self._dirty = False
+        self._complete = False
+
+    cdef c_add_level(self, double price, double amount):
+        cdef:
+            double previous_base = 0
+            double previous_quote = 0
+        if self._prices.size() > 0:
+            previous_base = self._cumulative_base_volumes.back()
+            previous_quote = self._cumulative_quote_volumes.back()
+        self._prices.push_back(price)
+        self._cumulative_base_volumes.push_back(previous_base + amount)
+        self._cumulative_quote_volumes.push_back(previous_quote + amount * price)
+
+    cdef c_invalidate(self):
+        self._dirty = True
+
+    cdef c_invalidate_for_price(self, double price):
+        """
+        Called for each level updated on the indexed side of the book
+        """
+        if self._dirty:
+            return
+        if self._prices.size() < self._max_levels:
+            # The index holds the whole side, any change is relevant
+            self._dirty = True
+        elif self._is_bid:
+            self._dirty = price >= self._prices.back()
+        else:
+            self._dirty = price <= self._prices.back()
+
+    cdef c_invalidate_for_crossing_price(self, double price):
+        """
+        Called for each level updated on the opposite side of the book. A level crossing the indexed best price can
+        truncate the indexed side.
+        """
+        if self._dirty or self._prices.size() == 0:
+            return
+        if self._is_bid:
+            self._dirty = price <= self._prices[0]
+        else:
+            self._dirty = price >= self._prices[0]
+
+    cdef size_t c_first_index_reaching(self, vector[double] *cumulative_volumes, double volume):
+        cdef:
+            size_t low = 0
+            size_t high = cumulative_volumes.size()
+            size_t middle
+        while low < high:
+            middle = (low + high) >> 1
+            if cumulative_volumes[0][middle] >= volume:
+                high = middle
+            else:
+                low = middle + 1
+        return low
+
+    cdef bint c_covers_base_volume(self, double volume):
+        return self._complete or (self._prices.size() > 0 and self._cumulative_base_volumes.back() >= volume)
+
+    cdef bint c_covers_quote_volume(self, double quote_volume):
+        return self._complete or (self._prices.size() > 0 and self._cumulative_quote_volumes.back() >= quote_volume)
+
+    cdef OrderBookQueryResult c_get_price_for_volume(self, double volume):
+        cdef:
+            size_t index = self.c_first_index_reaching(&self._cumulative_base_volumes, volume)
+            double total_volume = self._cumulative_base_volumes.back() if self._prices.size() > 0 else 0
+
+        if index < self._prices.size():
+            return OrderBookQueryResult(NaN, volume, self._prices[index], volume)
+        return OrderBookQueryResult(NaN, volume, NaN, min(total_volume, volume))
+
+    cdef OrderBookQueryResult c_get_vwap_for_volume(self, double volume):
+        cdef:
+            size_t index = self.c_first_index_reaching(&self._cumulative_base_volumes, volume)
+            double previous_base = 0
+            double previous_quote = 0
+            double total_volume
+
+        if index < self._prices.size():
+            if index > 0:
+                previous_base = self._cumulative_base_volumes[index - 1]
+                previous_quote = self._cumulative_quote_volumes[index - 1]
+            total_volume = previous_base + (volume - previous_base)
+            return OrderBookQueryResult(
+                NaN,
+                volume,
+                ((previous_quote + (volume - previous_base) * self._prices[index]) / total_volume
+                 if total_volume > 0 else self._prices[index]),
+                min(total_volume, volume))
+        total_volume = self._cumulative_base_volumes.back() if self._prices.size() > 0 else 0
+        return OrderBookQueryResult(NaN, volume, NaN, min(total_volume, volume))
+
+    cdef OrderBookQueryResult c_get_price_for_quote_volume(self, double quote_volume):
+        cdef:
+            size_t index = self.c_first_index_reaching(&self._cumulative_quote_volumes, quote_volume)
+            double total_quote_volume = self._cumulative_quote_volumes.back() if self._prices.size() > 0 else 0
+
+        if index < self._prices.size():
+            return OrderBookQueryResult(NaN, quote_volume, self._prices[index], quote_volume)
+        return OrderBookQueryResult(NaN, quote_volume, NaN, min(total_quote_volume, quote_volume))
@@ -3,9 +3,21 @@ from enum import Enum
 from functools import total_ordering
 from typing import Dict, List, Optional
 
+import numpy as np
+
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
 
+def order_book_levels_to_array(levels: List[List[any]]) -> np.ndarray:
+    """
+    Converts the raw levels of an exchange payload ([price, amount, ...] with numbers or numeric strings) into a 2D
+    float64 array in a single NumPy call, to be applied with `OrderBook.apply_diffs_arrays`
+    """
+    if len(levels) == 0:
+        return np.empty((0, 2), dtype=np.float64)
+    return np.asarray(levels, dtype=np.float64)
+
+
 class OrderBookMessageType(Enum):
     SNAPSHOT = 1
     DIFF = 2
@@ -64,6 +76,22 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
             OrderBookRow(float(price), float(amount), self.update_id) for price, amount, *trash in self.content["bids"]
         ]
 
+    @property
+    def has_level_arrays(self) -> bool:
+        """
+        Indicates if the bids and asks were stored as float64 NumPy arrays by the data source parser, so they can be
+        applied to the order book without building the `OrderBookRow` lists
+        """
+        return isinstance(self.content.get("bids"), np.ndarray) and isinstance(self.content.get("asks"), np.ndarray)
+
+    @property
+    def asks_array(self) -> np.ndarray:
+        return order_book_levels_to_array(self.content["asks"])
+
+    @property
+    def bids_array(self) -> np.ndarray:
+        return order_book_levels_to_array(self.content["bids"])
+
     @property
     def has_update_id(self) -> bool:
         return self.type in {OrderBookMessageType.DIFF, OrderBookMessageType.SNAPSHOT}
@@ -95,3 +123,147 @@ class OrderBookMessage(namedtuple("_OrderBookMessage", "type, content, timestamp
             )
         )
         return eq
+
+
+_NOT_PARSED = object()
+
+
+@total_ordering
+class CompactOrderBookMessage:
+    """
+    Slotted alternative to `OrderBookMessage`, built with the same constructor arguments and exposing the same
+    properties. The values read from the content are parsed the first time they are requested and cached, so the
+    router and the tracker can read them several times per message without repeating the dictionary lookups or
+    rebuilding the levels lists.
+    The content must not be modified once the message has been created.
+    """
+    __slots__ = (
+        "type",
+        "content",
+        "timestamp",
+        "_update_id",
+        "_first_update_id",
+        "_trade_id",
+        "_trading_pair",
+        "_asks",
+        "_bids",
+        "_asks_array",
+        "_bids_array",
+    )
+
+    def __init__(
+        self,
+        message_type: OrderBookMessageType,
+        content: Dict[str, any],
+        timestamp: Optional[float] = None,
+    ):
+        self.type: OrderBookMessageType = message_type
+        self.content: Dict[str, any] = content
+        self.timestamp: Optional[float] = timestamp
+        self._update_id = _NOT_PARSED
+        self._first_update_id = _NOT_PARSED
+        self._trade_id = _NOT_PARSED
+        self._trading_pair = _NOT_PARSED
+        self._asks = None
+        self._bids = None
+        self._asks_array = None
+        self._bids_array = None
+
+    def __iter__(self):
+        return iter((self.type, self.content, self.timestamp))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(type={self.type}, content={self.content}, timestamp={self.timestamp})"
+
+    @property
+    def update_id(self) -> int:
+        if self._update_id is _NOT_PARSED:
+            self._update_id = self.content["update_id"] if self.has_update_id else -1
+        return self._update_id
+
+    @property
+    def first_update_id(self) -> int:
+        if self._first_update_id is _NOT_PARSED:
+            if self.type is OrderBookMessageType.DIFF:
+                self._first_update_id = self.content.get("first_update_id", self.update_id)
+            else:
+                self._first_update_id = -1
+        return self._first_update_id
+
+    @property
+    def trade_id(self) -> int:
+        if self._trade_id is _NOT_PARSED:
+            self._trade_id = self.content["trade_id"] if self.type is OrderBookMessageType.TRADE else -1
+        return self._trade_id
+
+    @property
+    def trading_pair(self) -> str:
+        if self._trading_pair is _NOT_PARSED:
+            self._trading_pair = self.content["trading_pair"]
+        return self._trading_pair
+
+    @property
+    def asks_array(self) -> np.ndarray:
+        if self._asks_array is None:
+            self._asks_array = order_book_levels_to_array(self.content["asks"])
+        return self._asks_array
+
+    @property
+    def bids_array(self) -> np.ndarray:
+        if self._bids_array is None:
+            self._bids_array = order_book_levels_to_array(self.content["bids"])
+        return self._bids_array
+
+    @property
+    def asks(self) -> List[OrderBookRow]:
+        if self._asks is None:
+            update_id = self.update_id
+            self._asks = [
+                OrderBookRow(price, amount, update_id) for price, amount, *trash in self.asks_array.tolist()
+            ]
+        return self._asks
+
+    @property
+    def bids(self) -> List[OrderBookRow]:
+        if self._bids is None:
+            update_id = self.update_id
+            self._bids = [
+                OrderBookRow(price, amount, update_id) for price, amount, *trash in self.bids_array.tolist()
+            ]
+        return self._bids
+
+    @property
+    def has_level_arrays(self) -> bool:
+        return self.has_update_id
+
+    @property
+    def has_update_id(self) -> bool:
+        return self.type is OrderBookMessageType.DIFF or self.type is OrderBookMessageType.SNAPSHOT
+
+    @property
+    def has_trade_id(self) -> bool:
+        return self.type is OrderBookMessageType.TRADE
+
+    def __eq__(self, other: "OrderBookMessage") -> bool:
+        eq = (
+            (self.type == other.type)
+            and (
+                (self.has_update_id and (self.update_id == other.update_id))
+                or (self.trade_id == other.trade_id)
+            )
+        )
+        return eq
+
+    def __hash__(self):
+        return hash((self.type, self.update_id, self.trade_id))
+
+    def __lt__(self, other: "OrderBookMessage") -> bool:
+        lt = (
+            (self.has_update_id and other.has_update_id and self.update_id < other.update_id)
+            or (self.has_trade_id and other.has_trade_id and self.trade_id < other.trade_id)
+            or (
+                ((self.timestamp != other.timestamp) and self.timestamp < other.timestamp)
+                or self.has_update_id  # if same timestamp, order book messages < trade messages.
+            )
+        )
+        return lt
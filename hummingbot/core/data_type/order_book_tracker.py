@@ -3,7 +3,7 @@ import logging
 import time
 from collections import defaultdict, deque
 from enum import Enum
-from typing import Deque, Dict, List, Optional, Tuple
+from typing import Callable, Deque, Dict, List, Optional, Set, Tuple
 
 import pandas as pd
 
@@ -12,7 +12,7 @@ from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
 from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
 from hummingbot.core.event.events import OrderBookTradeEvent
-from hummingbot.core.utils.async_utils import safe_ensure_future
+from hummingbot.core.utils.async_utils import safe_ensure_future, safe_gather
 from hummingbot.logger import HummingbotLogger
 
 
@@ -21,8 +21,25 @@ class OrderBookTrackerDataSourceType(Enum):
     EXCHANGE_API = 3
 
 
+class OrderBookDiffDispatcher:
+    """
+    Queue-like output handed to the data source diff listener in direct dispatch mode. The messages the data source
+    parsers put are dispatched right away to their order book, without going through an intermediate queue.
+    """
+
+    def __init__(self, dispatch_function: Callable[[OrderBookMessage], None]):
+        self._dispatch_function = dispatch_function
+
+    def put_nowait(self, message: OrderBookMessage):
+        self._dispatch_function(message)
+
+    async def put(self, message: OrderBookMessage):
+        self._dispatch_function(message)
+
+
 class OrderBookTracker:
     PAST_DIFF_WINDOW_SIZE: int = 32
+    RESYNC_RETRY_DELAY: float = 1.0
     _obt_logger: Optional[HummingbotLogger] = None
 
     @classmethod
@@ -31,11 +48,24 @@ class OrderBookTracker:
             cls._obt_logger = logging.getLogger(__name__)
         return cls._obt_logger
 
-    def __init__(self, data_source: OrderBookTrackerDataSource, trading_pairs: List[str], domain: Optional[str] = None):
+    def __init__(self,
+                 data_source: OrderBookTrackerDataSource,
+                 trading_pairs: List[str],
+                 domain: Optional[str] = None,
+                 init_concurrency: int = 0,
+                 direct_dispatch: bool = False):
+        """
+        :param init_concurrency: maximum number of order book snapshots requested at the same time during the
+            initialization. With 0 (the default) the order books are initialized one at a time.
+        :param direct_dispatch: if True the diff messages parsed by the data source are applied straight to their
+            order book, skipping the shared diff stream and the diff router. The default is to route them.
+        """
         self._domain: Optional[str] = domain
         self._data_source: OrderBookTrackerDataSource = data_source
         self._trading_pairs: List[str] = trading_pairs
         self._order_books_initialized: asyncio.Event = asyncio.Event()
+        self._init_concurrency: int = init_concurrency
+        self._order_book_ready_events: Dict[str, asyncio.Event] = defaultdict(asyncio.Event)
         self._tracking_tasks: Dict[str, asyncio.Task] = {}
         self._order_books: Dict[str, OrderBook] = {}
         self._tracking_message_queues: Dict[str, asyncio.Queue] = {}
@@ -45,6 +75,10 @@ class OrderBookTracker:
         self._order_book_trade_stream: asyncio.Queue = asyncio.Queue()
         self._ev_loop: asyncio.BaseEventLoop = asyncio.get_event_loop()
         self._saved_message_queues: Dict[str, Deque[OrderBookMessage]] = defaultdict(lambda: deque(maxlen=1000))
+        self._sequence_gap_counts: Dict[str, int] = defaultdict(int)
+        self._resync_counts: Dict[str, int] = defaultdict(int)
+        self._direct_dispatch: bool = direct_dispatch
+        self._busy_trading_pairs: Set[str] = set()
 
         self._emit_trade_event_task: Optional[asyncio.Task] = None
         self._init_order_books_task: Optional[asyncio.Task] = None
@@ -68,6 +102,20 @@ class OrderBookTracker:
     def ready(self) -> bool:
         return self._order_books_initialized.is_set()
 
+    @property
+    def sequence_gap_counts(self) -> Dict[str, int]:
+        """
+        Number of gaps detected in the diff messages sequence of each trading pair
+        """
+        return dict(self._sequence_gap_counts)
+
+    @property
+    def resync_counts(self) -> Dict[str, int]:
+        """
+        Number of times the order book of each trading pair was resynchronized with a new snapshot after a gap
+        """
+        return dict(self._resync_counts)
+
     @property
     def snapshot(self) -> Dict[str, Tuple[pd.DataFrame, pd.DataFrame]]:
         return {
@@ -83,8 +131,15 @@ class OrderBookTracker:
         self._emit_trade_event_task = safe_ensure_future(
             self._emit_trade_event_loop()
         )
+        if self._direct_dispatch:
+            diff_output = OrderBookDiffDispatcher(self._dispatch_diff_message)
+        else:
+            diff_output = self._order_book_diff_stream
+            self._order_book_diff_router_task = safe_ensure_future(
+                self._order_book_diff_router()
+            )
         self._order_book_diff_listener_task = safe_ensure_future(
-            self._data_source.listen_for_order_book_diffs(self._ev_loop, self._order_book_diff_stream)
+            self._data_source.listen_for_order_book_diffs(self._ev_loop, diff_output)
         )
         self._order_book_trade_listener_task = safe_ensure_future(
             self._data_source.listen_for_trades(self._ev_loop, self._order_book_trade_stream)
@@ -95,9 +150,6 @@ class OrderBookTracker:
         self._order_book_stream_listener_task = safe_ensure_future(
             self._data_source.listen_for_subscriptions()
         )
-        self._order_book_diff_router_task = safe_ensure_future(
-            self._order_book_diff_router()
-        )
         self._order_book_snapshot_router_task = safe_ensure_future(
             self._order_book_snapshot_router()
         )
@@ -137,11 +189,23 @@ class OrderBookTracker:
             for _, task in self._tracking_tasks.items():
                 task.cancel()
             self._tracking_tasks.clear()
+        self._busy_trading_pairs.clear()
         self._order_books_initialized.clear()
+        for ready_event in self._order_book_ready_events.values():
+            ready_event.clear()
 
     async def wait_ready(self):
         await self._order_books_initialized.wait()
 
+    def is_order_book_ready(self, trading_pair: str) -> bool:
+        return self._order_book_ready_events[trading_pair].is_set()
+
+    async def wait_order_book_ready(self, trading_pair: str):
+        """
+        Waits until the order book of the trading pair is initialized, without waiting for the rest of the pairs
+        """
+        await self._order_book_ready_events[trading_pair].wait()
+
     async def _update_last_trade_prices_loop(self):
         '''
         Updates last trade price for all order books through REST API, it is to initiate last_trade_price and as
@@ -176,15 +240,56 @@ class OrderBookTracker:
         """
         Initialize order books
         """
-        for index, trading_pair in enumerate(self._trading_pairs):
-            self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
-            self._tracking_message_queues[trading_pair] = asyncio.Queue()
-            self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
-            self.logger().info(f"Initialized order book for {trading_pair}. "
-                               f"{index + 1}/{len(self._trading_pairs)} completed.")
-            await self._sleep(delay=1)
+        if self._init_concurrency > 0:
+            await self._init_order_books_concurrently()
+        else:
+            for index, trading_pair in enumerate(self._trading_pairs):
+                await self._init_order_book(trading_pair)
+                self.logger().info(f"Initialized order book for {trading_pair}. "
+                                   f"{index + 1}/{len(self._trading_pairs)} completed.")
+                await self._sleep(delay=1)
         self._order_books_initialized.set()
 
+    async def _init_order_book(self, trading_pair: str):
+        self._order_books[trading_pair] = await self._initial_order_book_for_trading_pair(trading_pair)
+        self._tracking_message_queues[trading_pair] = asyncio.Queue()
+        self._tracking_tasks[trading_pair] = safe_ensure_future(self._track_single_book(trading_pair))
+        self._order_book_ready_events[trading_pair].set()
+
+    async def _init_order_books_concurrently(self):
+        """
+        Requests the snapshots of up to init_concurrency trading pairs at the same time. The requests are still
+        subject to the rate limits of the data source throttler. Each order book is ready as soon as its snapshot
+        arrives, and the pairs that fail are retried after the rest are initialized.
+        """
+        semaphore = asyncio.Semaphore(self._init_concurrency)
+        initialized_count = 0
+
+        async def init_order_book(trading_pair: str):
+            nonlocal initialized_count
+            async with semaphore:
+                await self._init_order_book(trading_pair)
+            initialized_count += 1
+            self.logger().info(f"Initialized order book for {trading_pair}. "
+                               f"{initialized_count}/{len(self._trading_pairs)} completed.")
+
+        pending_trading_pairs = list(self._trading_pairs)
+        while len(pending_trading_pairs) > 0:
+            results = await safe_gather(
+                *[init_order_book(trading_pair) for trading_pair in pending_trading_pairs],
+                return_exceptions=True)
+            failed_trading_pairs = []
+            for trading_pair, result in zip(pending_trading_pairs, results):
+                if isinstance(result, Exception):
+                    failed_trading_pairs.append(trading_pair)
+                    self.logger().network(
+                        f"Unexpected error initializing the order book for {trading_pair}.",
+                        exc_info=result,
+                        app_warning_msg=f"Could not initialize the order book for {trading_pair}. Retrying.")
+            if len(failed_trading_pairs) > 0:
+                await self._sleep(delay=5)
+            pending_trading_pairs = failed_trading_pairs
+
     async def _order_book_diff_router(self):
         """
         Routes the real-time order book diff messages to the correct order book.
@@ -234,6 +339,37 @@ class OrderBookTracker:
                 )
                 await asyncio.sleep(5.0)
 
+    def _dispatch_diff_message(self, message: OrderBookMessage):
+        """
+        Direct dispatch alternative to the diff router. The diff is applied to the order book right away if nothing
+        else is pending for its trading pair. Otherwise (snapshots or diffs still queued, a resync in progress, or a
+        gap to handle) it goes to the pair's tracking queue to keep the updates in order.
+        """
+        trading_pair: str = message.trading_pair
+        message_queue: Optional[asyncio.Queue] = self._tracking_message_queues.get(trading_pair)
+        if message_queue is None:
+            # Save diff messages received before snapshots are ready
+            self._saved_message_queues[trading_pair].append(message)
+            return
+        order_book: OrderBook = self._order_books[trading_pair]
+        if order_book.snapshot_uid > message.update_id:
+            return
+
+        if (trading_pair in self._busy_trading_pairs
+                or not message_queue.empty()
+                or len(self._saved_message_queues[trading_pair]) > 0):
+            message_queue.put_nowait(message)
+            return
+        if self._is_sequenced_diff(message):
+            if message.update_id <= order_book.snapshot_uid:
+                return
+            if self._is_sequence_gap(order_book, message):
+                # The tracking task detects the gap again and resynchronizes the order book
+                message_queue.put_nowait(message)
+                return
+        order_book.apply_diffs_message(message)
+        self._past_diffs_windows[trading_pair].append(message)
+
     async def _order_book_snapshot_router(self):
         """
         Route the real-time order book snapshot messages to the correct order book.
@@ -269,10 +405,24 @@ class OrderBookTracker:
                 if len(saved_messages) > 0:
                     message = saved_messages.popleft()
                 else:
+                    self._busy_trading_pairs.discard(trading_pair)
                     message = await message_queue.get()
+                self._busy_trading_pairs.add(trading_pair)
 
                 if message.type is OrderBookMessageType.DIFF:
-                    order_book.apply_diffs(message.bids, message.asks, message.update_id)
+                    if self._is_sequenced_diff(message):
+                        if message.update_id <= order_book.snapshot_uid:
+                            # Already included in the current snapshot
+                            continue
+                        if self._is_sequence_gap(order_book, message):
+                            self._sequence_gap_counts[trading_pair] += 1
+                            self.logger().warning(
+                                f"Gap detected in the order book diffs for {trading_pair} (expected update "
+                                f"{max(order_book.snapshot_uid, order_book.last_diff_uid) + 1}, received "
+                                f"{message.first_update_id}). Resynchronizing the order book.")
+                            await self._resync_order_book(trading_pair, order_book, message)
+                            continue
+                    order_book.apply_diffs_message(message)
                     past_diffs_window.append(message)
                     diff_messages_accepted += 1
 
@@ -295,6 +445,38 @@ class OrderBookTracker:
                 )
                 await asyncio.sleep(5.0)
 
+    @staticmethod
+    def _is_sequenced_diff(message: OrderBookMessage) -> bool:
+        """
+        Only the diffs that inform the first update ID they include (U to u style update IDs) can be validated, the
+        update IDs of the rest of the exchanges are not guaranteed to be consecutive.
+        """
+        return message.content.get("first_update_id") is not None
+
+    @staticmethod
+    def _is_sequence_gap(order_book: OrderBook, message: OrderBookMessage) -> bool:
+        last_applied_update_id = max(order_book.snapshot_uid, order_book.last_diff_uid)
+        return message.first_update_id > last_applied_update_id + 1
+
+    async def _resync_order_book(self, trading_pair: str, order_book: OrderBook, gap_message: OrderBookMessage):
+        """
+        Fetches a new snapshot for the trading pair only, and restores the order book from it and the diffs received
+        so far. The diffs that arrive while the snapshot is requested are buffered in the pair's tracking queue.
+        """
+        past_diffs_window = self._past_diffs_windows[trading_pair]
+        past_diffs_window.append(gap_message)
+        snapshot: OrderBookMessage = await self._data_source._order_book_snapshot(trading_pair=trading_pair)
+        while snapshot.update_id + 1 < gap_message.first_update_id:
+            # The snapshot does not include the missing updates yet
+            await self._sleep(delay=self.RESYNC_RETRY_DELAY)
+            snapshot = await self._data_source._order_book_snapshot(trading_pair=trading_pair)
+        order_book.apply_snapshot_message(snapshot)
+        for diff_message in list(past_diffs_window):
+            if diff_message.update_id > snapshot.update_id:
+                order_book.apply_diffs_message(diff_message)
+        self._resync_counts[trading_pair] += 1
+        self.logger().info(f"Resynchronized the order book for {trading_pair} with snapshot {snapshot.update_id}.")
+
     async def _emit_trade_event_loop(self):
         last_message_timestamp: float = time.time()
         messages_accepted: int = 0
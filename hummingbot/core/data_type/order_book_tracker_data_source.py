@@ -8,11 +8,15 @@ from typing import Any, Callable, Dict, List, Optional
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.core.web_assistant.ws_assistants_pool import WSAssistantsPool, WSShardingRules
 from hummingbot.logger import HummingbotLogger
 
 
 class OrderBookTrackerDataSource(metaclass=ABCMeta):
     FULL_ORDER_BOOK_RESET_DELTA_SECONDS = 60 * 60
+    # Rules to shard the trading pairs subscriptions across several websocket connections. When the rules require more
+    # than one connection, the data source has to implement `_subscribe_trading_pairs_channels`
+    WS_SHARDING_RULES: Optional[WSShardingRules] = None
 
     _logger: Optional[HummingbotLogger] = None
 
@@ -24,6 +28,7 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         self._trading_pairs: List[str] = trading_pairs
         self._order_book_create_function = lambda: OrderBook()
         self._message_queue: Dict[str, asyncio.Queue] = defaultdict(asyncio.Queue)
+        self._ws_assistants_pool: Optional[WSAssistantsPool] = None
 
     @classmethod
     def logger(cls) -> HummingbotLogger:
@@ -64,7 +69,7 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         """
         snapshot_msg: OrderBookMessage = await self._order_book_snapshot(trading_pair=trading_pair)
         order_book: OrderBook = self.order_book_create_function()
-        order_book.apply_snapshot(snapshot_msg.bids, snapshot_msg.asks, snapshot_msg.update_id)
+        order_book.apply_snapshot_message(snapshot_msg)
         return order_book
 
     async def listen_for_subscriptions(self):
@@ -72,6 +77,9 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         Connects to the trade events and order diffs websocket endpoints and listens to the messages sent by the
         exchange. Each message is stored in its own queue.
         """
+        if self.WS_SHARDING_RULES is not None and self.WS_SHARDING_RULES.number_of_shards(len(self._trading_pairs)) > 1:
+            await self._listen_for_sharded_subscriptions()
+            return
         ws: Optional[WSAssistant] = None
         while True:
             try:
@@ -90,6 +98,20 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
             finally:
                 await self._on_order_stream_interruption(websocket_assistant=ws)
 
+    async def _listen_for_sharded_subscriptions(self):
+        """
+        Distributes the trading pairs across several websocket connections following the sharding rules. Each
+        connection is reconnected independently, subscribing again only to its own trading pairs.
+        """
+        self._ws_assistants_pool = WSAssistantsPool(
+            connect=self._connected_websocket_assistant,
+            subscribe=self._subscribe_trading_pairs_channels,
+            process_messages=self._process_websocket_messages,
+            sharding_rules=self.WS_SHARDING_RULES,
+            on_interruption=self._on_shard_stream_interruption,
+        )
+        await self._ws_assistants_pool.run(self._trading_pairs)
+
     async def listen_for_order_book_diffs(self, ev_loop: asyncio.AbstractEventLoop, output: asyncio.Queue):
         """
         Reads the order diffs events queue. For each event creates a diff message instance and adds it to the
@@ -207,6 +229,16 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         """
         raise NotImplementedError
 
+    async def _subscribe_trading_pairs_channels(self, ws: WSAssistant, trading_pairs: List[str]):
+        """
+        Subscribes to the trade events and diff orders events of the trading pairs through the provided websocket
+        connection. Required to shard the subscriptions across several connections.
+
+        :param ws: the websocket assistant used to connect to the exchange
+        :param trading_pairs: the trading pairs to subscribe to
+        """
+        raise NotImplementedError
+
     def _channel_originating_message(self, event_message: Dict[str, Any]) -> str:
         """
         Identifies the channel for a particular event message. Used to find the correct queue to add the message in
@@ -230,17 +262,19 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
         pass
 
     async def _process_websocket_messages(self, websocket_assistant: WSAssistant):
-        async for ws_response in websocket_assistant.iter_messages():
-            data: Dict[str, Any] = ws_response.data
-            if data is not None:  # data will be None when the websocket is disconnected
-                channel: str = self._channel_originating_message(event_message=data)
-                valid_channels = self._get_messages_queue_keys()
-                if channel in valid_channels:
-                    self._message_queue[channel].put_nowait(data)
-                else:
-                    await self._process_message_for_unknown_channel(
-                        event_message=data, websocket_assistant=websocket_assistant
-                    )
+        valid_channels = self._get_messages_queue_keys()
+        # All the messages already received are enqueued together, without yielding to the event loop between them
+        async for ws_responses in websocket_assistant.iter_messages_batches():
+            for ws_response in ws_responses:
+                data: Dict[str, Any] = ws_response.data
+                if data is not None:  # data will be None when the websocket is disconnected
+                    channel: str = self._channel_originating_message(event_message=data)
+                    if channel in valid_channels:
+                        self._message_queue[channel].put_nowait(data)
+                    else:
+                        await self._process_message_for_unknown_channel(
+                            event_message=data, websocket_assistant=websocket_assistant
+                        )
 
     def _get_messages_queue_keys(self) -> List[str]:
         return [self._snapshot_messages_queue_key, self._diff_messages_queue_key, self._trade_messages_queue_key]
@@ -248,6 +282,13 @@ class OrderBookTrackerDataSource(metaclass=ABCMeta):
     async def _on_order_stream_interruption(self, websocket_assistant: Optional[WSAssistant] = None):
         websocket_assistant and await websocket_assistant.disconnect()
 
+    async def _on_shard_stream_interruption(self, websocket_assistant: Optional[WSAssistant], trading_pairs: List[str]):
+        """
+        Cleans up after the interruption of one of the sharded connections. Only the state of its trading pairs should
+        be affected, the other connections keep running.
+        """
+        websocket_assistant and await websocket_assistant.disconnect()
+
     async def _sleep(self, delay):
         """
         Function added only to facilitate patching the sleep in unit tests without affecting the asyncio module
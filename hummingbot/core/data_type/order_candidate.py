@@ -2,7 +2,7 @@ import typing
 from collections import defaultdict
 from dataclasses import dataclass, field
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from hummingbot.connector.utils import combine_to_hb_trading_pair, split_hb_trading_pair
 from hummingbot.core.data_type.common import OrderType, PositionAction, TradeType
@@ -70,9 +70,22 @@ class OrderCandidate:
     def set_to_zero(self):
         self._scale_order(scaler=Decimal("0"))
 
-    def populate_collateral_entries(self, exchange: 'ExchangeBase'):
+    def populate_collateral_entries(
+        self, exchange: 'ExchangeBase', fees: Optional[Dict[Tuple, TradeFeeBase]] = None
+    ):
+        """
+        :param exchange: The exchange the order is intended for.
+        :param fees: The fees built for other candidates of the same batch. The fee of this candidate is taken from
+            it when already present, and added to it otherwise.
+        """
         self._populate_order_collateral_entry(exchange)
-        fee = self._get_fee(exchange)
+        if fees is None:
+            fee = self._get_fee(exchange)
+        else:
+            fee_key = self._get_fee_key()
+            fee = fees.get(fee_key)
+            if fee is None:
+                fee = fees[fee_key] = self._get_fee(exchange)
         self._populate_percent_fee_collateral_entry(exchange, fee)
         self._populate_fixed_fee_collateral_entries(fee)
         self._populate_potential_returns_entry(exchange)
@@ -248,6 +261,10 @@ class OrderCandidate:
 
         return fee
 
+    def _get_fee_key(self) -> Tuple:
+        # The fee does not depend on the order amount and price, all the candidates with the same key share it
+        return self.trading_pair, self.is_maker, self.order_type, self.order_side
+
     def _scale_order(self, scaler: Decimal):
         self.amount *= scaler
         if self.order_collateral is not None:
@@ -363,3 +380,6 @@ class PerpetualOrderCandidate(OrderCandidate):
         )
 
         return fee
+
+    def _get_fee_key(self) -> Tuple:
+        return super()._get_fee_key() + (self.position_close,)
@@ -37,6 +37,8 @@ class MarketEvent(Enum):
 
 class OrderBookEvent(int, Enum):
     TradeEvent = 901
+    TopOfBookChanged = 902
+    LevelsChanged = 903
     OrderBookDataSourceUpdateEvent = 904
 
 
@@ -152,6 +154,23 @@ class OrderBookTradeEvent(NamedTuple):
     is_taker: bool = True  # CEXs deliver trade events from the taker's perspective
 
 
+class OrderBookTopOfBookChangedEvent(NamedTuple):
+    update_id: int
+    best_bid: float
+    best_ask: float
+
+
+class OrderBookLevelsChangedEvent(NamedTuple):
+    """
+    Levels updated within the watched depth of an order book, with zero amounts for the removed levels. For snapshots
+    the bids and asks are the new levels within the watched depth.
+    """
+    update_id: int
+    bids: List[OrderBookRow]
+    asks: List[OrderBookRow]
+    is_snapshot: bool = False
+
+
 class OrderFilledEvent(NamedTuple):
     timestamp: float
     order_id: str
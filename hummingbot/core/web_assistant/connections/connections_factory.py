@@ -1,11 +1,100 @@
+from dataclasses import dataclass
 from typing import Optional
 
 import aiohttp
+from aiohttp.tcp_helpers import tcp_nodelay
 
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 
 
+@dataclass
+class ConnectionsPoolConfig:
+    """
+    Configuration of the pool of HTTP connections shared by the REST and WebSocket connections of a factory.
+    - limit: maximum number of connections open
+    - limit_per_host: maximum number of connections open to the same host (0 for no limit)
+    - ttl_dns_cache: seconds the resolved addresses are cached
+    - keepalive_timeout: seconds an idle connection is kept open to be reused
+    - tcp_nodelay: disables Nagle's algorithm, so the small requests are sent without delay
+    """
+    limit: int = 100
+    limit_per_host: int = 50
+    ttl_dns_cache: int = 60
+    keepalive_timeout: float = 60
+    tcp_nodelay: bool = True
+
+
+@dataclass
+class ConnectionsPoolMetrics:
+    """
+    - open: connections open, in use or idle (None if the installed aiohttp does not expose the pool)
+    - idle: connections open waiting to be reused (None if the installed aiohttp does not expose the pool)
+    - waits: requests that had to wait for a connection because of the limits
+    - connections_created: new connections opened, each with its TCP and TLS handshakes
+    """
+    open: Optional[int]
+    idle: Optional[int]
+    waits: int
+    connections_created: int
+
+
+class PooledTCPConnector(aiohttp.TCPConnector):
+    """
+    TCP connector configured with a `ConnectionsPoolConfig`, that keeps the metrics of the pool.
+    The waits and the new connections are counted with the public tracing signals of aiohttp, through the
+    `trace_config` that has to be passed to the client session using the connector.
+    """
+
+    def __init__(self, pool_config: ConnectionsPoolConfig):
+        super().__init__(
+            limit=pool_config.limit,
+            limit_per_host=pool_config.limit_per_host,
+            ttl_dns_cache=pool_config.ttl_dns_cache,
+            keepalive_timeout=pool_config.keepalive_timeout,
+        )
+        self._tcp_nodelay = pool_config.tcp_nodelay
+        self._waits = 0
+        self._connections_created = 0
+        self._trace_config = aiohttp.TraceConfig()
+        self._trace_config.on_connection_queued_start.append(self._on_connection_queued_start)
+        self._trace_config.on_connection_create_end.append(self._on_connection_create_end)
+
+    @property
+    def trace_config(self) -> aiohttp.TraceConfig:
+        return self._trace_config
+
+    @property
+    def metrics(self) -> ConnectionsPoolMetrics:
+        try:
+            # Internals of the aiohttp pool, only used for the metrics
+            idle = sum(len(connections) for connections in self._conns.values())
+            open_connections = len(self._acquired) + idle
+        except (AttributeError, TypeError):
+            open_connections = idle = None
+        return ConnectionsPoolMetrics(
+            open=open_connections,
+            idle=idle,
+            waits=self._waits,
+            connections_created=self._connections_created,
+        )
+
+    async def _on_connection_queued_start(self, session, trace_config_ctx, params):
+        self._waits += 1
+
+    async def _on_connection_create_end(self, session, trace_config_ctx, params):
+        self._connections_created += 1
+
+    async def _create_connection(self, *args, **kwargs):
+        protocol = await super()._create_connection(*args, **kwargs)
+        # aiohttp already enables TCP_NODELAY on every connection, it is only changed when disabled in the config
+        if not self._tcp_nodelay:
+            transport = getattr(protocol, "transport", None)
+            if transport is not None:
+                tcp_nodelay(transport, False)
+        return protocol
+
+
 class ConnectionsFactory:
     """This class is a thin wrapper around the underlying REST and WebSocket third-party library.
 
@@ -16,14 +105,26 @@ class ConnectionsFactory:
     `WebAssistantsFactory` to accommodate cases such as Bittrex that uses a specific WebSocket technology requiring
     a separate third-party library. In that case, a factory can be created that returns `RESTConnection`s using
     `aiohttp` and `WSConnection`s using `signalr_aio`.
+
+    All the connections share a session with a pool of keep-alive connections, configured with the
+    `ConnectionsPoolConfig`.
     """
 
-    def __init__(self):
+    def __init__(self, pool_config: Optional[ConnectionsPoolConfig] = None):
         # _ws_independent_session is intended to be used only in unit tests
         self._ws_independent_session: Optional[aiohttp.ClientSession] = None
 
+        self._pool_config: ConnectionsPoolConfig = pool_config or ConnectionsPoolConfig()
+        self._connector: Optional[PooledTCPConnector] = None
         self._shared_client: Optional[aiohttp.ClientSession] = None
 
+    @property
+    def pool_metrics(self) -> Optional[ConnectionsPoolMetrics]:
+        """
+        Metrics of the connections pool, None before the first connection is requested
+        """
+        return self._connector.metrics if self._connector is not None else None
+
     async def get_rest_connection(self) -> RESTConnection:
         shared_client = await self._get_shared_client()
         connection = RESTConnection(aiohttp_client_session=shared_client)
@@ -35,5 +136,8 @@ class ConnectionsFactory:
         return connection
 
     async def _get_shared_client(self) -> aiohttp.ClientSession:
-        self._shared_client = self._shared_client or aiohttp.ClientSession()
+        if self._shared_client is None:
+            self._connector = PooledTCPConnector(pool_config=self._pool_config)
+            self._shared_client = aiohttp.ClientSession(connector=self._connector,
+                                                        trace_configs=[self._connector.trace_config])
         return self._shared_client
@@ -9,6 +9,14 @@ import ujson
 if TYPE_CHECKING:
     from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 
+# ujson is used for the request bodies and the responses, it is several times faster than the stdlib encoder/decoder
+json_loads = ujson.loads
+
+
+def json_dumps(obj: Any) -> str:
+    # Same output as the stdlib encoder for the slashes, which ujson escapes by default
+    return ujson.dumps(obj, escape_forward_slashes=False)
+
 
 class RESTMethod(Enum):
     GET = "GET"
@@ -73,7 +81,7 @@ class EndpointRESTRequest(RESTRequest, ABC):
     def _ensure_data(self):
         if self.method == RESTMethod.POST:
             if self.data is not None:
-                self.data = ujson.dumps(self.data)
+                self.data = json_dumps(self.data)
         elif self.data is not None:
             raise ValueError(
                 "The `data` field should be used only for POST requests. Use `params` instead."
@@ -111,7 +119,7 @@ class RESTResponse:
         return headers_
 
     async def json(self) -> Any:
-        json_ = await self._aiohttp_response.json()
+        json_ = await self._aiohttp_response.json(loads=json_loads)
         return json_
 
     async def text(self) -> str:
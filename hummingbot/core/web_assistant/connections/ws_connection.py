@@ -1,20 +1,32 @@
 import asyncio
+import logging
 import time
-from json import JSONDecodeError
-from typing import Any, Dict, Mapping, Optional
+from typing import Any, Dict, List, Mapping, Optional
 
 import aiohttp
 
-from hummingbot.core.web_assistant.connections.data_types import WSRequest, WSResponse
+from hummingbot.core.web_assistant.connections.data_types import WSRequest, WSResponse, json_dumps, json_loads
+from hummingbot.logger import HummingbotLogger
 
 
 class WSConnection:
+    _logger: Optional[HummingbotLogger] = None
+    _buffer_unavailable_logged: bool = False
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(HummingbotLogger.logger_name_for_class(cls))
+        return cls._logger
+
     def __init__(self, aiohttp_client_session: aiohttp.ClientSession):
         self._client_session = aiohttp_client_session
         self._connection: Optional[aiohttp.ClientWebSocketResponse] = None
         self._connected = False
         self._message_timeout: Optional[float] = None
         self._last_recv_time = 0
+        # Close or error message that ended the last batch, processed at the start of the next receive
+        self._pending_message: Optional[aiohttp.WSMessage] = None
 
     @property
     def last_recv_time(self) -> float:
@@ -46,6 +58,7 @@ class WSConnection:
             await self._connection.close()
         self._connection = None
         self._connected = False
+        self._pending_message = None
 
     async def send(self, request: WSRequest):
         self._ensure_connected()
@@ -65,6 +78,58 @@ class WSConnection:
                 break
         return response
 
+    async def receive_batch(self, max_batch_size: int = 1000) -> List[WSResponse]:
+        """
+        Waits for the next message, and returns it together with the messages already buffered by the connection,
+        up to `max_batch_size`. The data and binary messages are decoded without awaiting the chain of message type
+        checks, which only runs for the control messages.
+        A close or error message following data messages ends the batch, and is processed at the start of the next
+        call, so that the messages received before the close are still delivered.
+        Returns an empty list if `disconnect()` is called while waiting for a message.
+        """
+        self._ensure_connected()
+        responses: List[WSResponse] = []
+        while self._connected and len(responses) == 0:
+            msg = await self._read_message()
+            while True:
+                if msg.type == aiohttp.WSMsgType.TEXT:
+                    responses.append(WSResponse(self._decode_text(msg.data)))
+                elif msg.type == aiohttp.WSMsgType.BINARY:
+                    responses.append(WSResponse(msg.data))
+                elif len(responses) > 0 and msg.type not in (aiohttp.WSMsgType.PING, aiohttp.WSMsgType.PONG):
+                    self._pending_message = msg
+                    break
+                else:
+                    msg = await self._process_message(msg)
+                    if msg is not None:
+                        responses.append(self._build_resp(msg))
+                if not self._connected or len(responses) >= max_batch_size or self._buffered_messages_count() == 0:
+                    break
+                msg = await self._connection.receive()
+            if msg is not None:
+                self._update_last_recv_time(msg)
+        return responses
+
+    def _buffered_messages_count(self) -> int:
+        # Messages already read from the socket and parsed by aiohttp, waiting in the queue of the websocket reader
+        reader = getattr(self._connection, "_reader", None)
+        buffer = getattr(reader, "_buffer", None)
+        if buffer is None:
+            if not WSConnection._buffer_unavailable_logged:
+                WSConnection._buffer_unavailable_logged = True
+                self.logger().warning(
+                    f"The websocket messages buffer is not available in aiohttp {aiohttp.__version__}, the messages "
+                    f"will be received one at a time instead of in batches.")
+            return 0
+        return len(buffer)
+
+    @staticmethod
+    def _decode_text(text: str) -> Any:
+        try:
+            return json_loads(text)
+        except ValueError:
+            return text
+
     def _ensure_not_connected(self):
         if self._connected:
             raise RuntimeError("WS is connected.")
@@ -74,6 +139,9 @@ class WSConnection:
             raise RuntimeError("WS is not connected.")
 
     async def _read_message(self) -> aiohttp.WSMessage:
+        if self._pending_message is not None:
+            msg, self._pending_message = self._pending_message, None
+            return msg
         try:
             msg = await self._connection.receive(self._message_timeout)
         except asyncio.TimeoutError:
@@ -117,7 +185,7 @@ class WSConnection:
         self._last_recv_time = time.time()
 
     async def _send_json(self, payload: Mapping[str, Any]):
-        await self._connection.send_json(payload)
+        await self._connection.send_json(payload, dumps=json_dumps)
 
     async def _send_plain_text(self, payload: str):
         await self._connection.send_str(payload)
@@ -128,8 +196,8 @@ class WSConnection:
             data = msg.data
         else:
             try:
-                data = msg.json()
-            except JSONDecodeError:
+                data = msg.json(loads=json_loads)
+            except ValueError:
                 data = msg.data
         response = WSResponse(data)
         return response
@@ -1,14 +1,15 @@
-import json
 from asyncio import wait_for
-from copy import deepcopy
+from copy import copy
+from functools import partial
 from typing import Any, Dict, List, Optional, Union
 
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.web_assistant.auth import AuthBase
-from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse
+from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse, json_dumps
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 from hummingbot.core.web_assistant.rest_post_processors import RESTPostProcessorBase
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
+from hummingbot.core.web_assistant.rest_response_cache import RESTResponseCache
 
 
 class RESTAssistant:
@@ -17,6 +18,9 @@ class RESTAssistant:
     The class can be injected with additional functionality by passing a list of objects inheriting from
     the `RESTPreProcessorBase` and `RESTPostProcessorBase` classes. The pre-processors are applied to a request
     before it is sent out, while the post-processors are applied to a response before it is returned to the caller.
+
+    When a `RESTResponseCache` is provided, the identical public GET requests executed with `execute_request` are
+    coalesced and their responses cached.
     """
     def __init__(
         self,
@@ -25,12 +29,14 @@ class RESTAssistant:
         rest_pre_processors: Optional[List[RESTPreProcessorBase]] = None,
         rest_post_processors: Optional[List[RESTPostProcessorBase]] = None,
         auth: Optional[AuthBase] = None,
+        response_cache: Optional[RESTResponseCache] = None,
     ):
         self._connection = connection
         self._rest_pre_processors = rest_pre_processors or []
         self._rest_post_processors = rest_post_processors or []
         self._auth = auth
         self._throttler = throttler
+        self._response_cache = response_cache
 
     async def execute_request(
         self,
@@ -43,6 +49,39 @@ class RESTAssistant:
         return_err: bool = False,
         timeout: Optional[float] = None,
         headers: Optional[Dict[str, Any]] = None,
+    ) -> Union[str, Dict[str, Any]]:
+        fetch = partial(
+            self._execute_request,
+            url=url,
+            throttler_limit_id=throttler_limit_id,
+            params=params,
+            data=data,
+            method=method,
+            is_auth_required=is_auth_required,
+            return_err=return_err,
+            timeout=timeout,
+            headers=headers,
+        )
+        if self._response_cache is not None and self._response_cache.is_cacheable(
+                method=method, is_auth_required=is_auth_required, return_err=return_err):
+            return await self._response_cache.get_or_fetch(
+                key=self._response_cache.cache_key(
+                    url=url, throttler_limit_id=throttler_limit_id, params=params, headers=headers),
+                throttler_limit_id=throttler_limit_id,
+                fetch=fetch)
+        return await fetch()
+
+    async def _execute_request(
+        self,
+        url: str,
+        throttler_limit_id: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        method: RESTMethod = RESTMethod.GET,
+        is_auth_required: bool = False,
+        return_err: bool = False,
+        timeout: Optional[float] = None,
+        headers: Optional[Dict[str, Any]] = None,
     ) -> Union[str, Dict[str, Any]]:
         response = await self.execute_request_and_get_response(
             url=url,
@@ -77,12 +116,13 @@ class RESTAssistant:
             "Content-Type": ("application/json" if method != RESTMethod.GET else "application/x-www-form-urlencoded")}
         local_headers.update(headers)
 
-        data = json.dumps(data) if data is not None else data
+        data = json_dumps(data) if data is not None else data
 
+        # The request is owned by the assistant, only the params of the caller are copied before authenticating it
         request = RESTRequest(
             method=method,
             url=url,
-            params=params,
+            params=dict(params) if params is not None else None,
             data=data,
             headers=local_headers,
             is_auth_required=is_auth_required,
@@ -90,7 +130,7 @@ class RESTAssistant:
         )
 
         async with self._throttler.execute_task(limit_id=throttler_limit_id):
-            response = await self.call(request=request, timeout=timeout)
+            response = await self._call(request=request, timeout=timeout)
 
             if 400 <= response.status:
                 if not return_err:
@@ -101,7 +141,24 @@ class RESTAssistant:
             return response
 
     async def call(self, request: RESTRequest, timeout: Optional[float] = None) -> RESTResponse:
-        request = deepcopy(request)
+        return await self._call(request=self._copy_request(request), timeout=timeout)
+
+    @staticmethod
+    def _copy_request(request: RESTRequest) -> RESTRequest:
+        """
+        Copies the request and the containers the pre-processors and the authenticators modify, so the request of the
+        caller is not changed. The body is usually already encoded, and the values are not modified.
+        """
+        request = copy(request)
+        if request.params is not None:
+            request.params = dict(request.params)
+        if request.headers is not None:
+            request.headers = dict(request.headers)
+        if isinstance(request.data, dict):
+            request.data = dict(request.data)
+        return request
+
+    async def _call(self, request: RESTRequest, timeout: Optional[float] = None) -> RESTResponse:
         request = await self._pre_process_request(request)
         request = await self._authenticate(request)
         resp = await wait_for(self._connection.call(request), timeout)
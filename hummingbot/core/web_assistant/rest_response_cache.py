@@ -0,0 +1,178 @@
+import asyncio
+import copy
+import json
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from hummingbot.core.web_assistant.connections.data_types import RESTMethod, json_dumps, json_loads
+
+CacheKey = Tuple[str, str, Optional[str], Optional[str]]
+
+
+class EncodedResponse(str):
+    """
+    JSON response kept encoded by the cache, to tell it apart from the plain text responses
+    """
+
+
+class RESTResponseCacheMetrics:
+    """
+    Counters of the cacheable requests for a single throttler limit_id.
+    - hits: requests answered with a cached response
+    - coalesced: requests that joined an identical request already in flight
+    - misses: requests sent to the server
+    """
+
+    __slots__ = ("hits", "coalesced", "misses")
+
+    def __init__(self):
+        self.hits: int = 0
+        self.coalesced: int = 0
+        self.misses: int = 0
+
+    @property
+    def requests(self) -> int:
+        return self.hits + self.coalesced + self.misses
+
+    @property
+    def hit_ratio(self) -> float:
+        """
+        Fraction of the requests that did not reach the server
+        """
+        requests = self.requests
+        return (self.hits + self.coalesced) / requests if requests > 0 else 0.0
+
+    def __repr__(self) -> str:
+        return f"RESTResponseCacheMetrics(hits={self.hits}, coalesced={self.coalesced}, misses={self.misses})"
+
+
+class RESTResponseCache:
+    """
+    Opt-in layer of the `RESTAssistant` for the public GET requests. Concurrent identical requests are merged into a
+    single call to the server (single-flight), and the responses are kept for a short time to live, configured per
+    throttler limit_id. With a time to live of 0 the requests are only coalesced.
+
+    The responses are kept encoded, and each caller gets its own decoded copy, so the callers can modify them (as
+    many connectors do when adding metadata to the messages built from the responses).
+    Only the successful responses are cached, the errors are raised to all the coalesced requests.
+    """
+
+    def __init__(self,
+                 ttl: float = 1.0,
+                 ttl_by_limit_id: Optional[Dict[str, float]] = None,
+                 max_entries: int = 1000):
+        """
+        :param ttl: seconds the responses are cached, for the limit_ids without a specific time to live
+        :param ttl_by_limit_id: seconds the responses are cached, by throttler limit_id
+        :param max_entries: maximum number of responses cached, the oldest ones are evicted first
+        """
+        self._ttl: float = ttl
+        self._ttl_by_limit_id: Dict[str, float] = ttl_by_limit_id or {}
+        self._max_entries: int = max_entries
+        self._entries: Dict[CacheKey, Tuple[float, Any]] = {}
+        self._in_flight: Dict[CacheKey, asyncio.Task] = {}
+        self._metrics: Dict[str, RESTResponseCacheMetrics] = {}
+
+    @property
+    def metrics(self) -> Dict[str, RESTResponseCacheMetrics]:
+        """
+        Hit and miss counters by throttler limit_id
+        """
+        return self._metrics
+
+    def ttl(self, throttler_limit_id: str) -> float:
+        return self._ttl_by_limit_id.get(throttler_limit_id, self._ttl)
+
+    @staticmethod
+    def is_cacheable(method: RESTMethod, is_auth_required: bool, return_err: bool) -> bool:
+        return method == RESTMethod.GET and not is_auth_required and not return_err
+
+    @staticmethod
+    def cache_key(url: str,
+                  throttler_limit_id: str,
+                  params: Optional[Dict[str, Any]],
+                  headers: Optional[Dict[str, Any]]) -> CacheKey:
+        return (
+            url,
+            throttler_limit_id,
+            json.dumps(params, sort_keys=True, default=str) if params else None,
+            json.dumps(headers, sort_keys=True, default=str) if headers else None,
+        )
+
+    def clear(self):
+        self._entries.clear()
+
+    async def get_or_fetch(self, key: CacheKey, throttler_limit_id: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Returns the cached response for the request, or the one of the identical request in flight. Otherwise the
+        request is sent with `fetch` and its response is cached.
+        """
+        metrics = self._metrics.get(throttler_limit_id)
+        if metrics is None:
+            metrics = self._metrics[throttler_limit_id] = RESTResponseCacheMetrics()
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            if entry[0] > self._time():
+                metrics.hits += 1
+                return self._decode(entry[1])
+            del self._entries[key]
+
+        task = self._in_flight.get(key)
+        if task is None:
+            metrics.misses += 1
+            task = asyncio.ensure_future(self._fetch(key, throttler_limit_id, fetch))
+            task.add_done_callback(self._retrieve_exception)
+            self._in_flight[key] = task
+        else:
+            metrics.coalesced += 1
+        # The request in flight is not cancelled when one of its callers is cancelled
+        return self._decode(await asyncio.shield(task))
+
+    async def _fetch(self, key: CacheKey, throttler_limit_id: str, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        try:
+            encoded_response = self._encode(await fetch())
+            self._store(key, throttler_limit_id, encoded_response)
+            return encoded_response
+        finally:
+            del self._in_flight[key]
+
+    @staticmethod
+    def _encode(response: Any) -> Any:
+        """
+        Encodes the JSON responses, decoding them again is faster than a deep copy
+        """
+        if isinstance(response, (dict, list)):
+            try:
+                return EncodedResponse(json_dumps(response))
+            except (TypeError, OverflowError):
+                return response
+        return response
+
+    @staticmethod
+    def _decode(response: Any) -> Any:
+        if isinstance(response, EncodedResponse):
+            return json_loads(response)
+        if isinstance(response, (dict, list)):
+            return copy.deepcopy(response)
+        return response
+
+    @staticmethod
+    def _retrieve_exception(task: asyncio.Task):
+        # Avoids the warning for the errors of the requests whose callers were all cancelled
+        if not task.cancelled():
+            task.exception()
+
+    def _store(self, key: CacheKey, throttler_limit_id: str, response: Any):
+        ttl = self.ttl(throttler_limit_id)
+        if ttl <= 0:
+            return
+        now = self._time()
+        if len(self._entries) >= self._max_entries:
+            self._entries = {entry_key: entry for entry_key, entry in self._entries.items() if entry[0] > now}
+            while len(self._entries) >= self._max_entries:
+                del self._entries[next(iter(self._entries))]
+        self._entries[key] = (now + ttl, response)
+
+    def _time(self) -> float:
+        return time.monotonic()
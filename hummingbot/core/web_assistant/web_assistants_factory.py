@@ -2,10 +2,15 @@ from typing import List, Optional
 
 from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
 from hummingbot.core.web_assistant.auth import AuthBase
-from hummingbot.core.web_assistant.connections.connections_factory import ConnectionsFactory
+from hummingbot.core.web_assistant.connections.connections_factory import (
+    ConnectionsFactory,
+    ConnectionsPoolConfig,
+    ConnectionsPoolMetrics,
+)
 from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
 from hummingbot.core.web_assistant.rest_post_processors import RESTPostProcessorBase
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
+from hummingbot.core.web_assistant.rest_response_cache import RESTResponseCache
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
 from hummingbot.core.web_assistant.ws_post_processors import WSPostProcessorBase
 from hummingbot.core.web_assistant.ws_pre_processors import WSPreProcessorBase
@@ -19,6 +24,8 @@ class WebAssistantsFactory:
     lists. Consult the documentation of the relevant assistant and/or pre-/post-processor class for
     additional information.
 
+    The optional `RESTResponseCache` is shared by all the REST assistants created by the factory.
+
     todo: integrate AsyncThrottler
     """
     def __init__(
@@ -29,14 +36,17 @@ class WebAssistantsFactory:
         ws_pre_processors: Optional[List[WSPreProcessorBase]] = None,
         ws_post_processors: Optional[List[WSPostProcessorBase]] = None,
         auth: Optional[AuthBase] = None,
+        rest_response_cache: Optional[RESTResponseCache] = None,
+        connections_pool_config: Optional[ConnectionsPoolConfig] = None,
     ):
-        self._connections_factory = ConnectionsFactory()
+        self._connections_factory = ConnectionsFactory(pool_config=connections_pool_config)
         self._rest_pre_processors = rest_pre_processors or []
         self._rest_post_processors = rest_post_processors or []
         self._ws_pre_processors = ws_pre_processors or []
         self._ws_post_processors = ws_post_processors or []
         self._auth = auth
         self._throttler = throttler
+        self._rest_response_cache = rest_response_cache
 
     @property
     def throttler(self) -> AsyncThrottlerBase:
@@ -46,6 +56,14 @@ class WebAssistantsFactory:
     def auth(self) -> Optional[AuthBase]:
         return self._auth
 
+    @property
+    def connections_pool_metrics(self) -> Optional[ConnectionsPoolMetrics]:
+        return self._connections_factory.pool_metrics
+
+    @property
+    def rest_response_cache(self) -> Optional[RESTResponseCache]:
+        return self._rest_response_cache
+
     async def get_rest_assistant(self) -> RESTAssistant:
         connection = await self._connections_factory.get_rest_connection()
         assistant = RESTAssistant(
@@ -53,7 +71,8 @@ class WebAssistantsFactory:
             throttler=self._throttler,
             rest_pre_processors=self._rest_pre_processors,
             rest_post_processors=self._rest_post_processors,
-            auth=self._auth
+            auth=self._auth,
+            response_cache=self._rest_response_cache,
         )
         return assistant
 
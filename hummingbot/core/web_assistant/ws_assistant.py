@@ -1,8 +1,8 @@
-from copy import deepcopy
+from copy import copy
 from typing import AsyncGenerator, Dict, List, Optional
 
 from hummingbot.core.web_assistant.auth import AuthBase
-from hummingbot.core.web_assistant.connections.data_types import WSRequest, WSResponse
+from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest, WSRequest, WSResponse
 from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 from hummingbot.core.web_assistant.ws_post_processors import WSPostProcessorBase
 from hummingbot.core.web_assistant.ws_pre_processors import WSPreProcessorBase
@@ -50,11 +50,22 @@ class WSAssistant:
         await self.send(request)
 
     async def send(self, request: WSRequest):
-        request = deepcopy(request)
+        request = self._copy_request(request)
         request = await self._pre_process_request(request)
         request = await self._authenticate(request)
         await self._connection.send(request)
 
+    @staticmethod
+    def _copy_request(request: WSRequest) -> WSRequest:
+        """
+        Copies the request and its JSON payload, which the authenticators extend with the signature, so the request
+        of the caller is not changed.
+        """
+        request = copy(request)
+        if isinstance(request, WSJSONRequest):
+            request.payload = dict(request.payload)
+        return request
+
     async def ping(self):
         await self._connection.ping()
 
@@ -66,6 +77,26 @@ class WSAssistant:
                 response = await self._post_process_response(response)
                 yield response
 
+    async def iter_messages_batches(self) -> AsyncGenerator[List[WSResponse], None]:
+        """
+        Yields the messages in batches, with all the messages already buffered by the connection. Stops if
+        `WSDelegate.disconnect()` is called while waiting for a response.
+        """
+        while self._connection.connected:
+            responses = await self.receive_batch()
+            if len(responses) > 0:
+                yield responses
+
+    async def receive_batch(self) -> List[WSResponse]:
+        """
+        Waits for the next message, and returns it with the messages already buffered by the connection. This method
+        will return an empty list if `WSDelegate.disconnect()` is called while waiting for a response.
+        """
+        responses = await self._connection.receive_batch()
+        if len(self._ws_post_processors) > 0:
+            responses = [await self._post_process_response(response) for response in responses]
+        return responses
+
     async def receive(self) -> Optional[WSResponse]:
         """This method will return `None` if `WSDelegate.disconnect()` is called while waiting for a response."""
         response = await self._connection.receive()
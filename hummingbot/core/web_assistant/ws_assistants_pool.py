@@ -0,0 +1,146 @@
+import asyncio
+import logging
+import math
+from dataclasses import dataclass
+from typing import Awaitable, Callable, List, Optional
+
+from hummingbot.core.web_assistant.ws_assistant import WSAssistant
+from hummingbot.logger import HummingbotLogger
+
+
+@dataclass(frozen=True)
+class WSShardingRules:
+    """
+    Rules to distribute the subscriptions (usually trading pairs) across several websocket connections.
+    - max_subscriptions_per_connection: maximum subscriptions of a single connection, None for no limit
+    - min_connections: number of connections used when there are enough subscriptions to fill them
+    - max_connections: maximum number of connections, None for no limit
+    """
+    max_subscriptions_per_connection: Optional[int] = None
+    min_connections: int = 1
+    max_connections: Optional[int] = None
+
+    def number_of_shards(self, subscriptions: int) -> int:
+        shards = self.min_connections
+        if self.max_subscriptions_per_connection is not None:
+            shards = max(shards, math.ceil(subscriptions / self.max_subscriptions_per_connection))
+        if self.max_connections is not None and shards > self.max_connections:
+            if (self.max_subscriptions_per_connection is not None
+                    and subscriptions > self.max_connections * self.max_subscriptions_per_connection):
+                raise ValueError(
+                    f"{subscriptions} subscriptions do not fit in {self.max_connections} connections of "
+                    f"{self.max_subscriptions_per_connection} subscriptions.")
+            shards = self.max_connections
+        return max(1, min(shards, subscriptions))
+
+    def shard(self, subscriptions: List[str]) -> List[List[str]]:
+        """
+        Splits the subscriptions in balanced shards, one per connection
+        """
+        shards = self.number_of_shards(len(subscriptions))
+        return [subscriptions[index::shards] for index in range(shards)]
+
+
+class WSShard:
+    """
+    A websocket connection of the pool and the subscriptions it is responsible for
+    """
+
+    def __init__(self, shard_id: int, subscriptions: List[str]):
+        self.shard_id: int = shard_id
+        self.subscriptions: List[str] = subscriptions
+        self.ws_assistant: Optional[WSAssistant] = None
+        self.interruptions: int = 0
+
+    @property
+    def last_recv_time(self) -> float:
+        return self.ws_assistant.last_recv_time if self.ws_assistant is not None else 0
+
+
+class WSAssistantsPool:
+    """
+    Shards the subscriptions across several websocket connections, following the sharding rules. Each shard connects,
+    subscribes and processes its messages independently: when a connection is interrupted only that shard reconnects
+    and subscribes again to its own subscriptions, while the other shards keep receiving messages.
+    """
+
+    _logger: Optional[HummingbotLogger] = None
+
+    def __init__(
+        self,
+        connect: Callable[[], Awaitable[WSAssistant]],
+        subscribe: Callable[[WSAssistant, List[str]], Awaitable[None]],
+        process_messages: Callable[[WSAssistant], Awaitable[None]],
+        sharding_rules: WSShardingRules,
+        on_interruption: Optional[Callable[[Optional[WSAssistant], List[str]], Awaitable[None]]] = None,
+        reconnect_delay: float = 1.0,
+    ):
+        """
+        :param connect: creates a new connected websocket assistant
+        :param subscribe: subscribes the websocket assistant to the shard subscriptions
+        :param process_messages: processes the messages received by the websocket assistant until it is disconnected
+        :param sharding_rules: rules to distribute the subscriptions across the connections
+        :param on_interruption: cleans up after the interruption of a shard, disconnects the websocket by default
+        :param reconnect_delay: seconds to wait before reconnecting a shard after an unexpected error
+        """
+        self._connect = connect
+        self._subscribe = subscribe
+        self._process_messages = process_messages
+        self._sharding_rules = sharding_rules
+        self._on_interruption = on_interruption or self._disconnect
+        self._reconnect_delay = reconnect_delay
+        self._shards: List[WSShard] = []
+
+    @classmethod
+    def logger(cls) -> HummingbotLogger:
+        if cls._logger is None:
+            cls._logger = logging.getLogger(HummingbotLogger.logger_name_for_class(cls))
+        return cls._logger
+
+    @property
+    def shards(self) -> List[WSShard]:
+        return self._shards
+
+    @property
+    def last_recv_time(self) -> float:
+        return max((shard.last_recv_time for shard in self._shards), default=0)
+
+    async def run(self, subscriptions: List[str]):
+        """
+        Shards the subscriptions and keeps all the shards connected until cancelled
+        """
+        self._shards = [
+            WSShard(shard_id=shard_id, subscriptions=shard_subscriptions)
+            for shard_id, shard_subscriptions in enumerate(self._sharding_rules.shard(subscriptions))
+        ]
+        self.logger().info(f"Distributing {len(subscriptions)} subscriptions across {len(self._shards)} "
+                           f"websocket connections.")
+        await asyncio.gather(*[self._run_shard(shard) for shard in self._shards])
+
+    async def _run_shard(self, shard: WSShard):
+        while True:
+            try:
+                shard.ws_assistant = await self._connect()
+                await self._subscribe(shard.ws_assistant, shard.subscriptions)
+                await self._process_messages(shard.ws_assistant)
+            except asyncio.CancelledError:
+                raise
+            except ConnectionError as connection_exception:
+                self.logger().warning(
+                    f"The websocket connection of shard {shard.shard_id} was closed ({connection_exception})")
+            except Exception:
+                self.logger().exception(
+                    f"Unexpected error in the websocket connection of shard {shard.shard_id}. Reconnecting only "
+                    f"its {len(shard.subscriptions)} subscriptions...")
+                await self._sleep(self._reconnect_delay)
+            finally:
+                await self._on_interruption(shard.ws_assistant, shard.subscriptions)
+                shard.ws_assistant = None
+            shard.interruptions += 1
+
+    @staticmethod
+    async def _disconnect(websocket_assistant: Optional[WSAssistant], subscriptions: List[str]):
+        websocket_assistant and await websocket_assistant.disconnect()
+
+    async def _sleep(self, delay: float):
+        await asyncio.sleep(delay)
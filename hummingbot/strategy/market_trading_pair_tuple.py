@@ -1,7 +1,10 @@
 from decimal import Decimal
 from typing import (
-    NamedTuple, Iterator
+    NamedTuple, Iterator, Sequence
 )
+
+import numpy as np
+
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_query_result import ClientOrderBookQueryResult
 from hummingbot.core.data_type.order_book_row import ClientOrderBookRow
@@ -45,6 +48,12 @@ class MarketTradingPairTuple(NamedTuple):
     def get_price_for_volume(self, is_buy: bool, volume: Decimal) -> ClientOrderBookQueryResult:
         return self.market.get_price_for_volume(self.trading_pair, is_buy, volume)
 
+    def get_vwap_for_volumes(self, is_buy: bool, volumes: Sequence[Decimal]) -> np.ndarray:
+        return self.market.get_vwap_for_volumes(self.trading_pair, is_buy, volumes)
+
+    def get_price_for_volumes(self, is_buy: bool, volumes: Sequence[Decimal]) -> np.ndarray:
+        return self.market.get_price_for_volumes(self.trading_pair, is_buy, volumes)
+
     def order_book_bid_entries(self) -> Iterator[ClientOrderBookRow]:
         return self.market.order_book_bid_entries(self.trading_pair)
 
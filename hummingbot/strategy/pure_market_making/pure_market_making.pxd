@@ -79,5 +79,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
     cdef c_cancel_active_orders_on_max_age_limit(self)
     cdef bint c_to_create_orders(self, object proposal)
     cdef c_execute_orders_proposal(self, object proposal)
+    cdef object c_proposal_limit_order(self, object price_size, bint is_buy)
+    cdef c_cancel_orders(self, list orders)
     cdef set_timers(self)
     cdef c_apply_moving_price_band(self, object proposal)
@@ -1181,8 +1181,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             list active_orders = self.active_non_hanging_orders
 
         if active_orders and any(order_age(o, self._current_timestamp) > self._max_order_age for o in active_orders):
-            for order in active_orders:
-                self.c_cancel_order(self._market_info, order.client_order_id)
+            self.c_cancel_orders(active_orders)
 
     cdef c_cancel_active_orders(self, object proposal):
         """
@@ -1212,10 +1211,9 @@ cdef class PureMarketMakingStrategy(StrategyBase):
 
         if not to_defer_canceling:
             self._hanging_orders_tracker.update_strategy_orders_with_equivalent_orders()
-            for order in self.active_non_hanging_orders:
-                # If is about to be added to hanging_orders then don't cancel
-                if not self._hanging_orders_tracker.is_potential_hanging_order(order):
-                    self.c_cancel_order(self._market_info, order.client_order_id)
+            # If is about to be added to hanging_orders then don't cancel
+            self.c_cancel_orders([order for order in self.active_non_hanging_orders
+                                  if not self._hanging_orders_tracker.is_potential_hanging_order(order)])
         # else:
         #     self.set_timers()
 
@@ -1248,6 +1246,7 @@ cdef class PureMarketMakingStrategy(StrategyBase):
             double expiration_seconds = NaN
             str bid_order_id, ask_order_id
             bint orders_created = False
+            list bid_order_ids, ask_order_ids, created_orders
         # Number of pair of orders to track for hanging orders
         number_of_pairs = min((len(proposal.buys), len(proposal.sells))) if self._hanging_orders_enabled else 0
 
@@ -1260,20 +1259,6 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                     f"({self.trading_pair}) Creating {len(proposal.buys)} bid orders "
                     f"at (Size, Price): {price_quote_str}"
                 )
-            for idx, buy in enumerate(proposal.buys):
-                bid_order_id = self.c_buy_with_specific_market(
-                    self._market_info,
-                    buy.size,
-                    order_type=self._limit_order_type,
-                    price=buy.price,
-                    expiration_seconds=expiration_seconds
-                )
-                orders_created = True
-                if idx < number_of_pairs:
-                    order = next((o for o in self.active_orders if o.client_order_id == bid_order_id))
-                    if order:
-                        self._hanging_orders_tracker.add_current_pairs_of_proposal_orders_executed_by_strategy(
-                            CreatedPairOfOrders(order, None))
         if len(proposal.sells) > 0:
             if self._logging_options & self.OPTION_LOG_CREATE_ORDER:
                 price_quote_str = [f"{sell.size.normalize()} {self.base_asset}, "
@@ -1283,22 +1268,74 @@ cdef class PureMarketMakingStrategy(StrategyBase):
                     f"({self.trading_pair}) Creating {len(proposal.sells)} ask "
                     f"orders at (Size, Price): {price_quote_str}"
                 )
-            for idx, sell in enumerate(proposal.sells):
-                ask_order_id = self.c_sell_with_specific_market(
+
+        if len(proposal.buys) + len(proposal.sells) > 1:
+            # All the levels are sent with a single batch, the market uses the batch requests of the exchange if any
+            created_orders = self.c_batch_order_create_with_specific_market(
+                self._market_info,
+                [self.c_proposal_limit_order(buy, True) for buy in proposal.buys]
+                + [self.c_proposal_limit_order(sell, False) for sell in proposal.sells],
+                order_type=self._limit_order_type
+            )
+            bid_order_ids = [order.client_order_id for order in created_orders[:len(proposal.buys)]]
+            ask_order_ids = [order.client_order_id for order in created_orders[len(proposal.buys):]]
+        else:
+            bid_order_ids = [
+                self.c_buy_with_specific_market(
+                    self._market_info,
+                    buy.size,
+                    order_type=self._limit_order_type,
+                    price=buy.price,
+                    expiration_seconds=expiration_seconds
+                )
+                for buy in proposal.buys
+            ]
+            ask_order_ids = [
+                self.c_sell_with_specific_market(
                     self._market_info,
                     sell.size,
                     order_type=self._limit_order_type,
                     price=sell.price,
                     expiration_seconds=expiration_seconds
                 )
-                orders_created = True
-                if idx < number_of_pairs:
-                    order = next((o for o in self.active_orders if o.client_order_id == ask_order_id))
-                    if order:
-                        self._hanging_orders_tracker.current_created_pairs_of_orders[idx].sell_order = order
+                for sell in proposal.sells
+            ]
+
+        for idx, bid_order_id in enumerate(bid_order_ids):
+            orders_created = True
+            if idx < number_of_pairs:
+                order = next((o for o in self.active_orders if o.client_order_id == bid_order_id))
+                if order:
+                    self._hanging_orders_tracker.add_current_pairs_of_proposal_orders_executed_by_strategy(
+                        CreatedPairOfOrders(order, None))
+        for idx, ask_order_id in enumerate(ask_order_ids):
+            orders_created = True
+            if idx < number_of_pairs:
+                order = next((o for o in self.active_orders if o.client_order_id == ask_order_id))
+                if order:
+                    self._hanging_orders_tracker.current_created_pairs_of_orders[idx].sell_order = order
         if orders_created:
             self.set_timers()
 
+    cdef object c_proposal_limit_order(self, object price_size, bint is_buy):
+        return LimitOrder(client_order_id="",
+                          trading_pair=self.trading_pair,
+                          is_buy=is_buy,
+                          base_currency=self.base_asset,
+                          quote_currency=self.quote_asset,
+                          price=price_size.price,
+                          quantity=price_size.size)
+
+    cdef c_cancel_orders(self, list orders):
+        """
+        Cancels the orders, with a single batch when there are several of them
+        """
+        if len(orders) > 1:
+            self.c_batch_order_cancel_with_specific_market(self._market_info, orders)
+        else:
+            for order in orders:
+                self.c_cancel_order(self._market_info, order.client_order_id)
+
     cdef set_timers(self):
         cdef double next_cycle = self._current_timestamp + self._order_refresh_time
         if self._create_timestamp <= self._current_timestamp:
@@ -1,4 +1,5 @@
 import logging
+from collections import defaultdict
 from decimal import Decimal
 from typing import Any, Dict, List, Set
 
@@ -8,7 +9,8 @@ import pandas as pd
 from hummingbot.connector.connector_base import ConnectorBase
 from hummingbot.connector.utils import split_hb_trading_pair
 from hummingbot.core.data_type.limit_order import LimitOrder
-from hummingbot.core.event.events import OrderType, PositionAction
+from hummingbot.core.data_type.order_candidate import OrderCandidate
+from hummingbot.core.event.events import OrderType, PositionAction, TradeType
 from hummingbot.logger import HummingbotLogger
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.strategy_py_base import StrategyPyBase
@@ -129,6 +131,62 @@ class ScriptStrategyBase(StrategyPyBase):
         market_pair = self._market_trading_pair_tuple(connector_name, trading_pair)
         self.cancel_order(market_trading_pair_tuple=market_pair, order_id=order_id)
 
+    def batch_order_create(self,
+                           connector_name: str,
+                           orders: List[OrderCandidate]) -> List[str]:
+        """
+        Creates the limit orders with a single call to the connector for each trading pair and order type, so that
+        the connector sends them in batch requests when the exchange supports them. Use it instead of buy and sell to
+        refresh many levels at once.
+
+        :param connector_name: The name of the connector
+        :param orders: The candidates of the limit orders to create
+
+        :return: The client assigned ids for the new orders, in the same order as the candidates
+        """
+        candidates_by_market = defaultdict(list)
+        for index, order in enumerate(orders):
+            if not order.order_type.is_limit_type():
+                raise ValueError(f"Only limit orders can be created in batch ({order.order_type} order requested).")
+            candidates_by_market[(order.trading_pair, order.order_type)].append((index, order))
+
+        order_ids = [None] * len(orders)
+        for (trading_pair, order_type), candidates in candidates_by_market.items():
+            market_pair = self._market_trading_pair_tuple(connector_name, trading_pair)
+            self.logger().info(f"Creating {len(candidates)} {trading_pair} orders: "
+                               f"{[(order.order_side.name.lower(), order.price, order.amount) for _, order in candidates]}.")
+            orders_to_create = [
+                LimitOrder(client_order_id="",
+                           trading_pair=trading_pair,
+                           is_buy=order.order_side == TradeType.BUY,
+                           base_currency=market_pair.base_asset,
+                           quote_currency=market_pair.quote_asset,
+                           price=order.price,
+                           quantity=order.amount)
+                for _, order in candidates
+            ]
+            created_orders = self.batch_order_create_with_specific_market(market_pair, orders_to_create, order_type)
+            for (index, _), created_order in zip(candidates, created_orders):
+                order_ids[index] = created_order.client_order_id
+        return order_ids
+
+    def batch_order_cancel(self,
+                           connector_name: str,
+                           orders: List[LimitOrder]):
+        """
+        Cancels the orders with a single call to the connector for each trading pair, so that the connector sends
+        them in batch requests when the exchange supports them.
+
+        :param connector_name: The name of the connector
+        :param orders: The orders to be cancelled
+        """
+        orders_by_trading_pair = defaultdict(list)
+        for order in orders:
+            orders_by_trading_pair[order.trading_pair].append(order)
+        for trading_pair, trading_pair_orders in orders_by_trading_pair.items():
+            market_pair = self._market_trading_pair_tuple(connector_name, trading_pair)
+            self.batch_order_cancel_with_specific_market(market_pair, trading_pair_orders)
+
     def get_active_orders(self, connector_name: str) -> List[LimitOrder]:
         """
         Returns a list of active orders for a connector.
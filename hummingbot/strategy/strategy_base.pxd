@@ -59,6 +59,9 @@ cdef class StrategyBase(TimeIterator):
     cdef str c_sell_with_specific_market(self, object market_trading_pair_tuple, object amount, object order_type = *,
                                          object price = *, double expiration_seconds = *, position_action = *, )
     cdef c_cancel_order(self, object market_pair, str order_id)
+    cdef list c_batch_order_create_with_specific_market(self, object market_trading_pair_tuple,
+                                                        list orders_to_create, object order_type = *)
+    cdef c_batch_order_cancel_with_specific_market(self, object market_trading_pair_tuple, list orders_to_cancel)
 
     cdef c_start_tracking_limit_order(self, object market_pair, str order_id, bint is_buy, object price,
                                       object quantity)
@@ -597,6 +597,58 @@ cdef class StrategyBase(TimeIterator):
 
     def cancel_order(self, market_trading_pair_tuple: MarketTradingPairTuple, order_id: str):
         self.c_cancel_order(market_trading_pair_tuple, order_id)
+
+    def batch_order_create_with_specific_market(self, market_trading_pair_tuple, orders_to_create,
+                                                order_type=OrderType.LIMIT):
+        return self.c_batch_order_create_with_specific_market(market_trading_pair_tuple, orders_to_create, order_type)
+
+    cdef list c_batch_order_create_with_specific_market(self, object market_trading_pair_tuple,
+                                                        list orders_to_create, object order_type=OrderType.LIMIT):
+        """
+        Creates all the limit orders with a single call to the market, which sends them in batch requests when the
+        exchange supports them. The order ids of the LimitOrder objects can be blank.
+
+        :return: the orders to create with the ids assigned by the market
+        """
+        if self._sb_delegate_lock:
+            raise RuntimeError("Delegates are not allowed to execute orders directly.")
+
+        cdef:
+            ConnectorBase market = market_trading_pair_tuple.market
+            list created_orders
+
+        if market not in self._sb_markets:
+            raise ValueError(f"Market object for batch order creation is not in the whitelisted markets set.")
+
+        created_orders = market.batch_order_create(orders_to_create=orders_to_create, order_type=order_type)
+
+        # Start order tracking
+        for order in created_orders:
+            self.c_start_tracking_limit_order(market_trading_pair_tuple, order.client_order_id, order.is_buy,
+                                              order.price, order.quantity)
+
+        return created_orders
+
+    def batch_order_cancel_with_specific_market(self, market_trading_pair_tuple, orders_to_cancel):
+        self.c_batch_order_cancel_with_specific_market(market_trading_pair_tuple, orders_to_cancel)
+
+    cdef c_batch_order_cancel_with_specific_market(self, object market_trading_pair_tuple, list orders_to_cancel):
+        """
+        Cancels all the limit orders with a single call to the market, which sends them in batch requests when the
+        exchange supports them. The orders with a cancel already in flight are skipped.
+        """
+        cdef:
+            ConnectorBase market = market_trading_pair_tuple.market
+            list orders_to_track_cancel = [order for order in orders_to_cancel
+                                           if self._sb_order_tracker.c_check_and_track_cancel(order.client_order_id)]
+
+        if len(orders_to_track_cancel) > 0:
+            self.log_with_clock(
+                logging.INFO,
+                f"({market_trading_pair_tuple.trading_pair}) Canceling the limit orders "
+                f"{[order.client_order_id for order in orders_to_track_cancel]}."
+            )
+            market.batch_order_cancel(orders_to_cancel=orders_to_track_cancel)
     # ----------------------------------------------------------------------------------------------------------
     # </editor-fold>
 
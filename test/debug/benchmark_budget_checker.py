@@ -0,0 +1,98 @@
+#!/usr/bin/env python
+"""
+Measures the time the BudgetChecker of the Binance connector takes to check the order candidates of a multi level
+strategy cycle. The legacy mode adjusts and locks the collateral of the candidates one at a time, reading the balances
+and building the fee of every candidate, as `adjust_candidates` did before checking them as a batch.
+
+    PYTHONPATH=. python test/debug/benchmark_budget_checker.py [--candidates 200] [--cycles 50]
+"""
+import argparse
+import gc
+import time
+from decimal import Decimal
+from typing import List
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.budget_checker import BudgetChecker
+from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchange
+from hummingbot.connector.trading_rule import TradingRule
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.order_candidate import OrderCandidate
+
+TRADING_PAIR = "BTC-USDT"
+
+
+def create_exchange() -> BinanceExchange:
+    exchange = BinanceExchange(
+        client_config_map=ClientConfigAdapter(ClientConfigMap()),
+        binance_api_key="apiKey",
+        binance_api_secret="apiSecret",
+        trading_pairs=[TRADING_PAIR],
+    )
+    exchange._trading_rules = {TRADING_PAIR: TradingRule(
+        TRADING_PAIR,
+        min_order_size=Decimal("0.0001"),
+        min_price_increment=Decimal("0.01"),
+        min_base_amount_increment=Decimal("0.00001"))}
+    exchange._account_available_balances = {"BTC": Decimal("1"), "USDT": Decimal("30000")}
+    exchange._account_balances = dict(exchange._account_available_balances)
+    return exchange
+
+
+def order_candidates(candidates: int) -> List[OrderCandidate]:
+    return [
+        OrderCandidate(
+            trading_pair=TRADING_PAIR,
+            is_maker=True,
+            order_type=OrderType.LIMIT,
+            order_side=TradeType.BUY if index % 2 == 0 else TradeType.SELL,
+            amount=Decimal("0.013"),
+            price=Decimal(30000 - index if index % 2 == 0 else 30000 + index),
+        )
+        for index in range(candidates)
+    ]
+
+
+def legacy_adjust_candidates(budget_checker: BudgetChecker, candidates: List[OrderCandidate]) -> List[OrderCandidate]:
+    budget_checker.reset_locked_collateral()
+    adjusted_candidates = [
+        budget_checker.adjust_candidate_and_lock_available_collateral(order_candidate, all_or_none=False)
+        for order_candidate in candidates
+    ]
+    budget_checker.reset_locked_collateral()
+    return adjusted_candidates
+
+
+def batch_adjust_candidates(budget_checker: BudgetChecker, candidates: List[OrderCandidate]) -> List[OrderCandidate]:
+    return budget_checker.adjust_candidates(candidates, all_or_none=False)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--candidates", type=int, default=200)
+    parser.add_argument("--cycles", type=int, default=50)
+    args = parser.parse_args()
+
+    budget_checker = create_exchange().budget_checker
+    print(f"Checking {args.candidates} order candidates in {args.cycles} cycles")
+    results = {}
+    adjusted = {}
+    for mode, adjust in (("legacy", legacy_adjust_candidates), ("batch", batch_adjust_candidates)):
+        adjusted[mode] = adjust(budget_checker, order_candidates(args.candidates))
+        elapsed = 0
+        for _ in range(args.cycles):
+            candidates = order_candidates(args.candidates)
+            gc.collect()
+            start = time.perf_counter()
+            adjust(budget_checker, candidates)
+            elapsed += time.perf_counter() - start
+        results[mode] = elapsed / args.cycles
+        print(f"  {mode:>8}: {results[mode] * 1e3:,.2f} ms/cycle  ({results[mode] / args.candidates * 1e6:,.1f} "
+              f"us/candidate)")
+    print(f"Same adjusted candidates: {adjusted['legacy'] == adjusted['batch']}")
+    print(f"Speedup: {results['legacy'] / results['batch']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+"""
+Measures the throughput of fill events processed by the ClientOrderTracker with thousands of live orders, as in grid
+strategies. Each event looks up the order by exchange order id and processes the trade update, the same way the
+connectors handle their user stream events. The legacy mode emulates the tracker that rebuilt the orders maps on every
+lookup.
+
+    PYTHONPATH=. python test/debug/benchmark_fill_event_throughput.py [--orders 5000] [--events 20000]
+"""
+import argparse
+import gc
+import time
+from decimal import Decimal
+from itertools import chain
+from typing import Dict, Optional
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.client_order_tracker import ClientOrderTracker
+from hummingbot.connector.exchange_base import ExchangeBase
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, TradeUpdate
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee
+
+
+class BenchmarkExchange(ExchangeBase):
+    @property
+    def order_books(self) -> Dict[str, OrderBook]:
+        return {}
+
+    def trigger_event(self, event_tag, message):
+        pass
+
+
+class LegacyClientOrderTracker(ClientOrderTracker):
+    @property
+    def all_fillable_orders(self) -> Dict[str, InFlightOrder]:
+        return {**self.active_orders, **self.cached_orders, **self.lost_orders}
+
+    @property
+    def all_fillable_orders_by_exchange_order_id(self) -> Dict[str, InFlightOrder]:
+        return {
+            order.exchange_order_id: order
+            for order in chain(self.active_orders.values(), self.cached_orders.values(), self.lost_orders.values())
+        }
+
+    def fetch_order(self, client_order_id: Optional[str] = None,
+                    exchange_order_id: Optional[str] = None) -> Optional[InFlightOrder]:
+        found_order = None
+        if client_order_id in self.all_orders:
+            found_order = self.all_orders[client_order_id]
+        elif exchange_order_id is not None:
+            found_order = next(
+                (order for order in self.all_orders.values() if order.exchange_order_id == exchange_order_id), None)
+        return found_order
+
+
+def run_events(tracker_class, orders: int, events: int) -> float:
+    connector = BenchmarkExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+    tracker = tracker_class(connector=connector)
+    for index in range(orders):
+        tracker.start_tracking_order(InFlightOrder(
+            client_order_id=f"OID{index}",
+            exchange_order_id=f"EOID{index}",
+            trading_pair="BTC-USDT",
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY if index % 2 == 0 else TradeType.SELL,
+            amount=Decimal("1000"),
+            price=Decimal("100"),
+            creation_timestamp=1640001112.0,
+            initial_state=OrderState.OPEN,
+        ))
+    fee = AddedToCostTradeFee()
+
+    gc.collect()
+    start = time.perf_counter()
+    for index in range(events):
+        exchange_order_id = f"EOID{index % orders}"
+        tracked_order = tracker.all_fillable_orders_by_exchange_order_id.get(exchange_order_id)
+        tracker.process_trade_update(TradeUpdate(
+            trade_id=f"TID{index}",
+            client_order_id=tracked_order.client_order_id,
+            exchange_order_id=exchange_order_id,
+            trading_pair=tracked_order.trading_pair,
+            fill_timestamp=1640001113.0,
+            fill_price=Decimal("100"),
+            fill_base_amount=Decimal("0.001"),
+            fill_quote_amount=Decimal("0.1"),
+            fee=fee,
+        ))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--orders", type=int, default=5_000)
+    parser.add_argument("--events", type=int, default=20_000)
+    args = parser.parse_args()
+
+    print(f"Processing {args.events} fill events with {args.orders} live orders")
+    results = {}
+    for mode, tracker_class in (("legacy", LegacyClientOrderTracker), ("indexed", ClientOrderTracker)):
+        elapsed = run_events(tracker_class, args.orders, args.events)
+        results[mode] = elapsed
+        print(f"  {mode:>8}: {args.events / elapsed:,.0f} events/s  ({elapsed / args.events * 1e6:,.1f} us/event)")
+    print(f"Throughput gain: {results['legacy'] / results['indexed']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
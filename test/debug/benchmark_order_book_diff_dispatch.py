@@ -0,0 +1,97 @@
+#!/usr/bin/env python
+"""
+Measures the latency of the order book diffs from the websocket receive (the raw message is put in the data source
+message queue) to the diff applied to the order book, with the diff router and with the direct dispatch mode of the
+order book tracker.
+
+    PYTHONPATH=. python test/debug/benchmark_order_book_diff_dispatch.py [--pairs 200] [--messages 200000] [--burst 20]
+"""
+import argparse
+import asyncio
+import gc
+import time
+from test.debug.benchmark_order_book_message_routing import BenchmarkDataSource, generate_contents
+from typing import Any, Dict, List
+
+import numpy as np
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookDiffDispatcher, OrderBookTracker
+from hummingbot.core.utils.async_utils import safe_ensure_future
+
+
+class LatencyOrderBook(OrderBook):
+    def __init__(self, latencies: List[float]):
+        super().__init__()
+        self.latencies = latencies
+
+    def apply_diffs_message(self, message: OrderBookMessage):
+        super().apply_diffs_message(message)
+        self.latencies.append(time.perf_counter() - message.content["received_timestamp"])
+
+
+class ParsingDataSource(BenchmarkDataSource):
+    async def _parse_order_book_diff_message(self, raw_message: Dict[str, Any], message_queue: asyncio.Queue):
+        message_queue.put_nowait(OrderBookMessage(OrderBookMessageType.DIFF, raw_message, timestamp=1.0))
+
+
+async def run_tracker(pairs: List[str], contents: List[Dict[str, Any]], burst: int, direct_dispatch: bool):
+    data_source = ParsingDataSource(trading_pairs=pairs)
+    tracker = OrderBookTracker(data_source=data_source, trading_pairs=pairs, direct_dispatch=direct_dispatch)
+    latencies: List[float] = []
+    for trading_pair in pairs:
+        tracker._order_books[trading_pair] = LatencyOrderBook(latencies)
+        tracker._tracking_message_queues[trading_pair] = asyncio.Queue()
+        tracker._tracking_tasks[trading_pair] = safe_ensure_future(tracker._track_single_book(trading_pair))
+    if direct_dispatch:
+        diff_output = OrderBookDiffDispatcher(tracker._dispatch_diff_message)
+        tasks = []
+    else:
+        diff_output = tracker._order_book_diff_stream
+        tasks = [safe_ensure_future(tracker._order_book_diff_router())]
+    tasks.append(safe_ensure_future(data_source.listen_for_order_book_diffs(asyncio.get_event_loop(), diff_output)))
+
+    # Each burst emulates the messages read from the websocket before yielding to the event loop
+    raw_messages_queue = data_source._message_queue[data_source._diff_messages_queue_key]
+    start = time.perf_counter()
+    for index in range(0, len(contents), burst):
+        for content in contents[index:index + burst]:
+            raw_messages_queue.put_nowait(dict(content, received_timestamp=time.perf_counter()))
+        await asyncio.sleep(0)
+    while len(latencies) < len(contents):
+        await asyncio.sleep(0)
+    elapsed = time.perf_counter() - start
+
+    for task in tasks:
+        task.cancel()
+    tracker.stop()
+    return elapsed, np.array(latencies) * 1e6
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pairs", type=int, default=200)
+    parser.add_argument("--messages", type=int, default=200_000)
+    parser.add_argument("--levels", type=int, default=10)
+    parser.add_argument("--burst", type=int, default=20, help="messages received per websocket read")
+    args = parser.parse_args()
+
+    pairs = [f"COIN{index}-USDT" for index in range(args.pairs)]
+    contents = generate_contents(pairs, args.messages, args.levels)
+    print(f"Dispatching {args.messages} diffs with {args.levels} levels per side across {args.pairs} pairs, "
+          f"{args.burst} messages per read")
+
+    results = {}
+    for mode, direct_dispatch in (("router", False), ("direct dispatch", True)):
+        gc.collect()
+        elapsed, latencies = await run_tracker(pairs, contents, args.burst, direct_dispatch)
+        results[mode] = np.percentile(latencies, 50)
+        print(f"  {mode:>16}: {args.messages / elapsed:,.0f} messages/s  latency (us) "
+              f"p50 {np.percentile(latencies, 50):,.1f}  p99 {np.percentile(latencies, 99):,.1f}  "
+              f"max {latencies.max():,.1f}")
+    print(f"p50 latency reduction: {results['router'] / results['direct dispatch']:.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+"""
+Compares the set based `OrderBook` with the array based `ArrayOrderBook` replaying the same diff stream.
+
+The stream can be a recording with one JSON object per line, in the format of the `OrderBookMessage` content of
+snapshot and diff messages:
+
+    {"type": "snapshot", "update_id": 1, "bids": [["99.5", "1.2"], ...], "asks": [["100.5", "3"], ...]}
+    {"type": "diff", "update_id": 2, "bids": [["99.4", "0"]], "asks": []}
+
+When no recording is given a random walk stream is generated.
+
+    python test/debug/benchmark_order_book_engines.py [--recording diffs.jsonl] [--min-price-increment 0.01]
+"""
+import argparse
+import json
+import random
+import time
+from typing import Dict, List, Tuple
+
+from hummingbot.core.data_type.array_order_book import ArrayOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+Message = Tuple[str, List[OrderBookRow], List[OrderBookRow], int]
+
+
+def load_recording(path: str) -> List[Message]:
+    messages = []
+    with open(path) as recording:
+        for line in recording:
+            if not line.strip():
+                continue
+            content: Dict[str, any] = json.loads(line)
+            update_id = int(content["update_id"])
+            bids = [OrderBookRow(float(price), float(amount), update_id) for price, amount, *_ in content["bids"]]
+            asks = [OrderBookRow(float(price), float(amount), update_id) for price, amount, *_ in content["asks"]]
+            messages.append((content.get("type", "diff"), bids, asks, update_id))
+    return messages
+
+
+def generate_stream(depth: int, diffs: int, levels_per_diff: int, seed: int = 42) -> List[Message]:
+    rng = random.Random(seed)
+    mid = 1_000_000
+    bids = [OrderBookRow((mid - i) / 100, 1.0, 1) for i in range(1, depth + 1)]
+    asks = [OrderBookRow((mid + i) / 100, 1.0, 1) for i in range(1, depth + 1)]
+    messages = [("snapshot", bids, asks, 1)]
+    for update_id in range(2, diffs + 2):
+        mid += rng.randint(-2, 2)
+        diff_bids = []
+        diff_asks = []
+        for _ in range(levels_per_diff):
+            # Most of the activity happens close to the top of the book
+            offset = 1 + int(rng.expovariate(1 / 10)) % depth
+            amount = 0.0 if rng.random() < 0.3 else round(rng.uniform(0.1, 10), 3)
+            if rng.random() < 0.5:
+                diff_bids.append(OrderBookRow((mid - offset) / 100, amount, update_id))
+            else:
+                diff_asks.append(OrderBookRow((mid + offset) / 100, amount, update_id))
+        messages.append(("diff", diff_bids, diff_asks, update_id))
+    return messages
+
+
+def replay(order_book: OrderBook, messages: List[Message]) -> float:
+    start = time.perf_counter()
+    for message_type, bids, asks, update_id in messages:
+        if message_type == "snapshot":
+            order_book.apply_snapshot(bids, asks, update_id)
+        else:
+            order_book.apply_diffs(bids, asks, update_id)
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--recording", help="JSON lines file with the recorded snapshot and diff messages")
+    parser.add_argument("--depth", type=int, default=1000)
+    parser.add_argument("--diffs", type=int, default=200_000)
+    parser.add_argument("--levels-per-diff", type=int, default=10)
+    parser.add_argument("--min-price-increment", type=float, default=0.0)
+    parser.add_argument("--rounds", type=int, default=3)
+    args = parser.parse_args()
+
+    if args.recording:
+        messages = load_recording(args.recording)
+    else:
+        messages = generate_stream(args.depth, args.diffs, args.levels_per_diff)
+    levels = sum(len(bids) + len(asks) for _, bids, asks, _ in messages)
+    print(f"Replaying {len(messages)} messages with {levels} levels, best of {args.rounds} rounds")
+
+    engines = {
+        "set": lambda: OrderBook(),
+        "array": lambda: ArrayOrderBook(min_price_increment=args.min_price_increment),
+    }
+    results = {}
+    for name, create_function in engines.items():
+        results[name] = min(replay(create_function(), messages) for _ in range(args.rounds))
+        print(f"  {name:>6}: {results[name]:.3f}s  {len(messages) / results[name]:,.0f} messages/s  "
+              f"{levels / results[name]:,.0f} levels/s")
+    print(f"Speedup array vs set: {results['set'] / results['array']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
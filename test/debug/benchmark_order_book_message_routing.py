@@ -0,0 +1,88 @@
+#!/usr/bin/env python
+"""
+Measures the throughput of the order book tracker diff router plus the per pair tracking tasks, in messages per
+second, for `OrderBookMessage` and `CompactOrderBookMessage`.
+
+    python test/debug/benchmark_order_book_message_routing.py [--pairs 200] [--messages 200000] [--levels 10]
+"""
+import argparse
+import asyncio
+import random
+import time
+from typing import Dict, List, Optional
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import CompactOrderBookMessage, OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_tracker import OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+from hummingbot.core.utils.async_utils import safe_ensure_future
+
+
+class BenchmarkDataSource(OrderBookTrackerDataSource):
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        return {}
+
+
+def generate_contents(pairs: List[str], messages: int, levels: int, seed: int = 42) -> List[Dict[str, any]]:
+    rng = random.Random(seed)
+    contents = []
+    last_update_ids = {trading_pair: 0 for trading_pair in pairs}
+    for _ in range(messages):
+        trading_pair = rng.choice(pairs)
+        # Consecutive update IDs per pair, so that the tracker does not detect sequence gaps
+        update_id = last_update_ids[trading_pair] + 1
+        last_update_ids[trading_pair] = update_id
+        contents.append({
+            "trading_pair": trading_pair,
+            "first_update_id": update_id,
+            "update_id": update_id,
+            "bids": [[f"{100 - rng.randint(1, 50) * 0.01:.2f}", f"{rng.uniform(0, 10):.3f}"] for _ in range(levels)],
+            "asks": [[f"{100 + rng.randint(1, 50) * 0.01:.2f}", f"{rng.uniform(0, 10):.3f}"] for _ in range(levels)],
+        })
+    return contents
+
+
+async def run_tracker(pairs: List[str], contents: List[Dict[str, any]], message_class) -> float:
+    tracker = OrderBookTracker(data_source=BenchmarkDataSource(trading_pairs=pairs), trading_pairs=pairs)
+    for trading_pair in pairs:
+        tracker._order_books[trading_pair] = OrderBook()
+        tracker._tracking_message_queues[trading_pair] = asyncio.Queue()
+        tracker._tracking_tasks[trading_pair] = safe_ensure_future(tracker._track_single_book(trading_pair))
+    router_task = safe_ensure_future(tracker._order_book_diff_router())
+    last_update_ids = {}
+    for content in contents:
+        last_update_ids[content["trading_pair"]] = content["update_id"]
+
+    start = time.perf_counter()
+    for content in contents:
+        tracker._order_book_diff_stream.put_nowait(message_class(OrderBookMessageType.DIFF, content, timestamp=1.0))
+    while any(tracker._order_books[pair].last_diff_uid != update_id for pair, update_id in last_update_ids.items()):
+        await asyncio.sleep(0)
+    elapsed = time.perf_counter() - start
+
+    router_task.cancel()
+    tracker.stop()
+    return elapsed
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pairs", type=int, default=200)
+    parser.add_argument("--messages", type=int, default=200_000)
+    parser.add_argument("--levels", type=int, default=10)
+    args = parser.parse_args()
+
+    pairs = [f"COIN{index}-USDT" for index in range(args.pairs)]
+    contents = generate_contents(pairs, args.messages, args.levels)
+    print(f"Routing {args.messages} diffs with {args.levels} levels per side across {args.pairs} pairs")
+
+    results = {}
+    for message_class in (OrderBookMessage, CompactOrderBookMessage):
+        elapsed = await run_tracker(pairs, contents, message_class)
+        results[message_class.__name__] = elapsed
+        print(f"  {message_class.__name__:>24}: {elapsed:.3f}s  {args.messages / elapsed:,.0f} messages/s")
+    print(f"Speedup: {results['OrderBookMessage'] / results['CompactOrderBookMessage']:.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
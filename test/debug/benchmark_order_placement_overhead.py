@@ -0,0 +1,131 @@
+#!/usr/bin/env python
+"""
+Measures the client side overhead of placing an order, from the call to `_place_order` of the Binance connector to
+the write of the request to the socket (the REST connection call), and up to the parsed response returned to
+`_place_order`. The legacy mode emulates the REST assistant that deep copied every request and encoded and decoded
+the JSON with the stdlib module.
+
+    PYTHONPATH=. python test/debug/benchmark_order_placement_overhead.py [--orders 20000]
+"""
+import argparse
+import asyncio
+import copy
+import gc
+import json
+import time
+from decimal import Decimal
+from typing import List
+from unittest.mock import patch
+
+import numpy as np
+from bidict import bidict
+
+from hummingbot.client.config.client_config_map import ClientConfigMap
+from hummingbot.client.config.config_helpers import ClientConfigAdapter
+from hummingbot.connector.exchange.binance import binance_constants as CONSTANTS
+from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchange
+from hummingbot.core.api_throttler.data_types import RateLimit
+from hummingbot.core.api_throttler.sliding_window_throttler import SlidingWindowThrottler
+from hummingbot.core.data_type.common import OrderType, TradeType
+from hummingbot.core.web_assistant.connections.data_types import RESTRequest, RESTResponse, json_loads
+from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
+from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
+
+ORDER_RESPONSE = json.dumps({
+    "symbol": "BTCUSDT", "orderId": 28, "orderListId": -1, "clientOrderId": "6gCrw2kRUAF9CvJDGP16IP",
+    "transactTime": 1507725176595, "price": "0.00000000", "origQty": "10.00000000", "executedQty": "10.00000000",
+    "cummulativeQuoteQty": "10.00000000", "status": "NEW", "timeInForce": "GTC", "type": "LIMIT", "side": "SELL",
+})
+
+
+class BenchmarkResponse(RESTResponse):
+    status = 200
+    headers = {}
+
+    def __init__(self, loads):
+        self._loads = loads
+
+    async def json(self):
+        return self._loads(ORDER_RESPONSE)
+
+
+class SocketWriteConnection(RESTConnection):
+    """Records the time each request reaches the connection, instead of writing it to the socket"""
+
+    def __init__(self, loads):
+        self.write_timestamps: List[float] = []
+        self._loads = loads
+
+    async def call(self, request: RESTRequest) -> RESTResponse:
+        self.write_timestamps.append(time.perf_counter())
+        return BenchmarkResponse(self._loads)
+
+
+class LegacyRESTAssistant(RESTAssistant):
+    async def _call(self, request: RESTRequest, timeout=None) -> RESTResponse:
+        return await super()._call(request=copy.deepcopy(request), timeout=timeout)
+
+
+def create_exchange(connection: SocketWriteConnection) -> BinanceExchange:
+    exchange = BinanceExchange(
+        client_config_map=ClientConfigAdapter(ClientConfigMap()),
+        binance_api_key="apiKey",
+        binance_api_secret="apiSecret",
+        trading_pairs=["BTC-USDT"],
+    )
+    exchange._set_trading_pair_symbol_map(bidict({"BTCUSDT": "BTC-USDT"}))
+    exchange._time_synchronizer.add_time_offset_ms_sample(0)
+    # Limits high enough to never wait, so that only the overhead of the request is measured
+    factory = exchange._web_assistants_factory
+    factory._throttler = SlidingWindowThrottler(rate_limits=[
+        RateLimit(limit_id=rate_limit.limit_id, limit=10 ** 9, time_interval=rate_limit.time_interval,
+                  linked_limits=rate_limit.linked_limits)
+        for rate_limit in CONSTANTS.RATE_LIMITS])
+    factory._rest_post_processors = []
+
+    async def get_rest_connection():
+        return connection
+
+    factory._connections_factory.get_rest_connection = get_rest_connection
+    return exchange
+
+
+async def run_orders(orders: int, legacy: bool):
+    connection = SocketWriteConnection(json.loads if legacy else json_loads)
+    exchange = create_exchange(connection)
+    to_write: List[float] = []
+    total: List[float] = []
+    for index in range(orders):
+        start = time.perf_counter()
+        await exchange._place_order(order_id=f"order_{index}", trading_pair="BTC-USDT", amount=Decimal("1.01"),
+                                    trade_type=TradeType.BUY, order_type=OrderType.LIMIT, price=Decimal("30000.5"))
+        end = time.perf_counter()
+        to_write.append(connection.write_timestamps[-1] - start)
+        total.append(end - start)
+    return np.array(to_write) * 1e6, np.array(total) * 1e6
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--orders", type=int, default=20_000)
+    args = parser.parse_args()
+
+    print(f"Placing {args.orders} limit orders")
+    results = {}
+    for mode, legacy in (("legacy", True), ("current", False)):
+        gc.collect()
+        if legacy:
+            with patch("hummingbot.core.web_assistant.web_assistants_factory.RESTAssistant", LegacyRESTAssistant), \
+                    patch("hummingbot.core.web_assistant.rest_assistant.json_dumps", json.dumps):
+                to_write, total = await run_orders(args.orders, legacy)
+        else:
+            to_write, total = await run_orders(args.orders, legacy)
+        results[mode] = np.mean(total)
+        print(f"  {mode:>8}: to socket write (us) mean {to_write.mean():,.1f} p50 {np.percentile(to_write, 50):,.1f} "
+              f"p99 {np.percentile(to_write, 99):,.1f}  |  total (us) mean {total.mean():,.1f} "
+              f"p99 {np.percentile(total, 99):,.1f}")
+    print(f"Mean overhead reduction: {results['legacy'] / results['current']:.2f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,70 @@
+#!/usr/bin/env python
+"""
+Measures the cost of acquiring rate limit capacity with many concurrent requests and a large number of requests
+logged within the limit periods, for the AsyncThrottler and the SlidingWindowThrottler.
+
+    PYTHONPATH=. python test/debug/benchmark_throttler_contention.py [--requests 1000] [--concurrency 50] [--logged 1000]
+"""
+import argparse
+import asyncio
+import time
+from typing import List
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.async_throttler_base import AsyncThrottlerBase
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit
+from hummingbot.core.api_throttler.sliding_window_throttler import SlidingWindowThrottler
+
+REQUEST_WEIGHT = "REQUEST_WEIGHT"
+ORDERS = "ORDERS"
+ENDPOINTS = [f"/endpoint_{index}" for index in range(10)]
+
+
+def rate_limits(requests: int) -> List[RateLimit]:
+    # Limits high enough to never wait, so that only the cost of the capacity checks is measured
+    limits = [
+        RateLimit(limit_id=REQUEST_WEIGHT, limit=requests * 100, time_interval=60),
+        RateLimit(limit_id=ORDERS, limit=requests * 100, time_interval=10),
+    ]
+    for endpoint in ENDPOINTS:
+        limits.append(RateLimit(limit_id=endpoint, limit=requests * 100, time_interval=60,
+                                linked_limits=[LinkedLimitWeightPair(REQUEST_WEIGHT, 2), LinkedLimitWeightPair(ORDERS)]))
+    return limits
+
+
+async def run_requests(throttler: AsyncThrottlerBase, requests: int, concurrency: int, logged: int) -> float:
+    for index in range(logged):
+        async with throttler.execute_task(ENDPOINTS[index % len(ENDPOINTS)]):
+            pass
+
+    async def worker(worker_index: int):
+        for index in range(worker_index, requests, concurrency):
+            async with throttler.execute_task(ENDPOINTS[index % len(ENDPOINTS)]):
+                await asyncio.sleep(0)
+
+    start = time.perf_counter()
+    await asyncio.gather(*[worker(worker_index) for worker_index in range(concurrency)])
+    return time.perf_counter() - start
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--logged", type=int, default=1000, help="requests logged before the measurement")
+    args = parser.parse_args()
+
+    print(f"Acquiring {args.requests} requests from {args.concurrency} concurrent tasks, "
+          f"{args.logged} requests already logged")
+    results = {}
+    for throttler_class in (AsyncThrottler, SlidingWindowThrottler):
+        throttler = throttler_class(rate_limits=rate_limits(args.requests + args.logged))
+        elapsed = await run_requests(throttler, args.requests, args.concurrency, args.logged)
+        results[throttler_class.__name__] = elapsed
+        print(f"  {throttler_class.__name__:>22}: {elapsed:.3f}s  {args.requests / elapsed:,.0f} requests/s  "
+              f"{elapsed / args.requests * 1e6:,.1f} us per request")
+    print(f"Speedup: {results['AsyncThrottler'] / results['SlidingWindowThrottler']:.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -16,6 +16,7 @@ from hummingbot.connector.exchange.binance.binance_exchange import BinanceExchan
 from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_message import OrderBookMessage
+from hummingbot.core.web_assistant.ws_assistants_pool import WSShardingRules
 
 
 class BinanceAPIOrderBookDataSourceUnitTests(unittest.TestCase):
@@ -215,6 +216,29 @@ class BinanceAPIOrderBookDataSourceUnitTests(unittest.TestCase):
             "Subscribed to public order book and trade channels..."
         ))
 
+    @patch("aiohttp.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_listen_for_subscriptions_shards_trading_pairs_across_connections(self, ws_connect_mock):
+        other_trading_pair = f"WETH-{self.quote_asset}"
+        self.connector._set_trading_pair_symbol_map(bidict({self.ex_trading_pair: self.trading_pair,
+                                                            f"WETH{self.quote_asset}": other_trading_pair}))
+        self.data_source._trading_pairs = [self.trading_pair, other_trading_pair]
+        self.data_source.WS_SHARDING_RULES = WSShardingRules(max_subscriptions_per_connection=1)
+        ws_mocks = [self.mocking_assistant.create_websocket_mock(), self.mocking_assistant.create_websocket_mock()]
+        ws_connect_mock.side_effect = ws_mocks
+        for ws_mock in ws_mocks:
+            self.mocking_assistant.add_websocket_aiohttp_message(websocket_mock=ws_mock,
+                                                                 message=json.dumps({"result": None, "id": 1}))
+
+        self.listening_task = self.ev_loop.create_task(self.data_source.listen_for_subscriptions())
+        for ws_mock in ws_mocks:
+            self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_mock)
+
+        self.assertEqual(2, len(self.data_source._ws_assistants_pool.shards))
+        for ws_mock, ex_trading_pair in zip(ws_mocks, [self.ex_trading_pair, f"WETH{self.quote_asset}"]):
+            sent_subscription_messages = self.mocking_assistant.json_messages_sent_through_websocket(ws_mock)
+            self.assertEqual([f"{ex_trading_pair.lower()}@trade"], sent_subscription_messages[0]["params"])
+            self.assertEqual([f"{ex_trading_pair.lower()}@depth@100ms"], sent_subscription_messages[1]["params"])
+
     @patch("hummingbot.core.data_type.order_book_tracker_data_source.OrderBookTrackerDataSource._sleep")
     @patch("aiohttp.ClientSession.ws_connect")
     def test_listen_for_subscriptions_raises_cancel_exception(self, mock_ws, _: AsyncMock):
@@ -16,7 +16,8 @@ from hummingbot.connector.test_support.exchange_connector_test import AbstractEx
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.data_type.common import OrderType, TradeType
-from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
+from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, OrderUpdate
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.trade_fee import DeductedFromReturnsTradeFee, TokenAmount, TradeFeeBase
 from hummingbot.core.event.events import MarketOrderFailureEvent, OrderFilledEvent
 
@@ -731,6 +732,29 @@ class BinanceExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
             asyncio.CancelledError,
             self.async_run_with_timeout, self.exchange._update_time_synchronizer())
 
+    def test_status_polling_loop_updates_time_synchronizer_only_when_resync_is_required(self):
+        self.exchange._update_time_synchronizer = AsyncMock()
+        self.exchange._status_polling_loop_fetch_updates = AsyncMock()
+        self.exchange._time_synchronizer.is_resync_required = lambda: resync_required
+
+        async def run_poll():
+            polls = self.exchange._status_polling_loop_fetch_updates.call_count
+            self.exchange._poll_notifier.set()
+            while self.exchange._status_polling_loop_fetch_updates.call_count == polls:
+                await asyncio.sleep(0)
+
+        polling_task = asyncio.get_event_loop().create_task(self.exchange._status_polling_loop())
+        try:
+            resync_required = True
+            self.async_run_with_timeout(run_poll())
+            resync_required = False
+            self.async_run_with_timeout(run_poll())
+        finally:
+            polling_task.cancel()
+
+        self.assertEqual(2, self.exchange._status_polling_loop_fetch_updates.call_count)
+        self.assertEqual(1, self.exchange._update_time_synchronizer.call_count)
+
     @aioresponses()
     def test_update_order_fills_from_trades_triggers_filled_event(self, mock_api):
         self.exchange._set_current_timestamp(1640780000)
@@ -981,6 +1005,81 @@ class BinanceExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
                 "misc_updates=None)")
         )
 
+    @aioresponses()
+    def test_update_order_status_with_open_orders_requests_only_orders_not_open(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        for order_id, exchange_order_id in (("OID1", "100234"), ("OID2", "100235")):
+            self.exchange.start_tracking_order(
+                order_id=order_id,
+                exchange_order_id=exchange_order_id,
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+            )
+        open_order = self.exchange.in_flight_orders["OID1"]
+        open_order.current_state = OrderState.OPEN
+        canceled_order = self.exchange.in_flight_orders["OID2"]
+        canceled_order.completely_filled_event.set()
+
+        open_orders_url = web_utils.private_rest_url(CONSTANTS.OPEN_ORDERS_PATH_URL)
+        open_order_status = self._order_status_request_partially_filled_mock_response(order=open_order)
+        mock_api.get(re.compile(f"^{open_orders_url}".replace(".", r"\.").replace("?", r"\?")),
+                     body=json.dumps([open_order_status]))
+        order_url = web_utils.private_rest_url(CONSTANTS.ORDER_PATH_URL)
+        mock_api.get(re.compile(f"^{order_url}".replace(".", r"\.").replace("?", r"\?")),
+                     body=json.dumps(self._order_status_request_canceled_mock_response(order=canceled_order)))
+
+        self.async_run_with_timeout(self.exchange._update_orders())
+        self.async_run_with_timeout(asyncio.sleep(0))
+
+        open_orders_request = self._all_executed_requests(mock_api, open_orders_url)[0]
+        self.validate_auth_credentials_present(open_orders_request)
+        self.assertEqual(self.exchange_symbol_for_tokens(self.base_asset, self.quote_asset),
+                         open_orders_request.kwargs["params"]["symbol"])
+        order_requests = self._all_executed_requests(mock_api, order_url)
+        self.assertEqual(1, len(order_requests))
+        self.assertEqual(canceled_order.client_order_id, order_requests[0].kwargs["params"]["origClientOrderId"])
+        self.assertEqual(OrderState.PARTIALLY_FILLED, open_order.current_state)
+        self.assertTrue(canceled_order.is_cancelled)
+        self.assertNotIn(canceled_order.client_order_id, self.exchange.in_flight_orders)
+
+    def test_update_orders_status_requests_are_concurrency_bounded(self):
+        self.exchange.BULK_ORDER_STATUS_UPDATES = False
+        self.exchange.ORDER_UPDATES_CONCURRENCY = 3
+        for index in range(10):
+            self.exchange.start_tracking_order(
+                order_id=f"OID{index}",
+                exchange_order_id=str(index),
+                trading_pair=self.trading_pair,
+                order_type=OrderType.LIMIT,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("1"),
+            )
+        requests_in_flight = 0
+        max_requests_in_flight = 0
+        updated_orders = []
+
+        async def request_order_status(tracked_order: InFlightOrder) -> OrderUpdate:
+            nonlocal requests_in_flight, max_requests_in_flight
+            requests_in_flight += 1
+            max_requests_in_flight = max(max_requests_in_flight, requests_in_flight)
+            await asyncio.sleep(0.01)
+            requests_in_flight -= 1
+            updated_orders.append(tracked_order.client_order_id)
+            return OrderUpdate(client_order_id=tracked_order.client_order_id,
+                               trading_pair=tracked_order.trading_pair,
+                               update_timestamp=1640780000,
+                               new_state=OrderState.OPEN)
+
+        self.exchange._request_order_status = request_order_status
+        self.async_run_with_timeout(self.exchange._update_orders())
+
+        self.assertEqual(3, max_requests_in_flight)
+        self.assertEqual(sorted(f"OID{index}" for index in range(10)), sorted(updated_orders))
+
     def test_user_stream_update_for_order_failure(self):
         self.exchange._set_current_timestamp(1640780000)
         self.exchange.start_tracking_order(
@@ -1360,6 +1459,53 @@ class BinanceExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests
             }
         ]
 
+    @aioresponses()
+    def test_batch_order_create_places_each_order_without_batch_endpoint(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        url = self.order_creation_url
+        for _ in range(2):
+            mock_api.post(url, body=json.dumps(self.order_creation_request_successful_mock_response))
+        orders_to_create = [
+            LimitOrder(client_order_id=order_id, trading_pair=self.trading_pair, is_buy=is_buy,
+                       base_currency=self.base_asset, quote_currency=self.quote_asset,
+                       price=Decimal("10000"), quantity=Decimal("100"))
+            for order_id, is_buy in (("OID1", True), ("OID2", False))
+        ]
+
+        self.async_run_with_timeout(self.exchange._execute_batch_order_create(orders_to_create=orders_to_create,
+                                                                              order_type=OrderType.LIMIT_MAKER))
+
+        order_requests = self._all_executed_requests(mock_api, url)
+        self.assertEqual(2, len(order_requests))
+        self.assertEqual(["LIMIT_MAKER", "LIMIT_MAKER"], [request.kwargs["data"]["type"] for request in order_requests])
+        for order_id in ("OID1", "OID2"):
+            self.assertIn(order_id, self.exchange.in_flight_orders)
+            self.assertEqual(OrderType.LIMIT_MAKER, self.exchange.in_flight_orders[order_id].order_type)
+
+    def test_batch_order_create_without_batch_endpoint_does_not_pass_position_action(self):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+
+        async def place_order(order_id: str, trading_pair: str, amount: Decimal, trade_type: TradeType,
+                              order_type: OrderType, price: Decimal):
+            # Same signature as the spot connectors without extra arguments
+            return f"E{order_id}", 1640780000
+
+        orders_to_create = [
+            LimitOrder(client_order_id=order_id, trading_pair=self.trading_pair, is_buy=is_buy,
+                       base_currency=self.base_asset, quote_currency=self.quote_asset,
+                       price=Decimal("10000"), quantity=Decimal("100"))
+            for order_id, is_buy in (("OID1", True), ("OID2", False))
+        ]
+
+        with patch.object(self.exchange, "_place_order", AsyncMock(side_effect=place_order)):
+            self.async_run_with_timeout(self.exchange._execute_batch_order_create(orders_to_create=orders_to_create))
+
+        for order_id in ("OID1", "OID2"):
+            self.assertEqual(f"E{order_id}", self.exchange.in_flight_orders[order_id].exchange_order_id)
+        self.assertEqual(0, len(self.order_failure_logger.event_log))
+
     def _order_fills_request_full_fill_mock_response(self, order: InFlightOrder):
         return [
             {
@@ -1,7 +1,10 @@
+import asyncio
 import unittest
+from unittest.mock import MagicMock
 
 import hummingbot.connector.exchange.binance.binance_constants as CONSTANTS
 from hummingbot.connector.exchange.binance import binance_web_utils as web_utils
+from hummingbot.connector.utils import RateLimitHeadersRESTPostProcessor
 
 
 class BinanceUtilTestCases(unittest.TestCase):
@@ -17,3 +20,14 @@ class BinanceUtilTestCases(unittest.TestCase):
         domain = "com"
         expected_url = CONSTANTS.REST_URL.format(domain) + CONSTANTS.PRIVATE_API_VERSION + path_url
         self.assertEqual(expected_url, web_utils.private_rest_url(path_url, domain))
+
+    def test_daily_order_count_header_is_not_reconciled(self):
+        throttler = web_utils.create_throttler()
+        post_processor = RateLimitHeadersRESTPostProcessor(
+            throttler=throttler, headers_to_limit_ids=CONSTANTS.RATE_LIMIT_HEADERS)
+        response = MagicMock()
+        response.headers = {"X-MBX-ORDER-COUNT-10S": "3", "X-MBX-ORDER-COUNT-1D": "150000"}
+
+        asyncio.get_event_loop().run_until_complete(post_processor.post_process(response))
+
+        self.assertEqual([CONSTANTS.ORDERS], [log.rate_limit.limit_id for log in throttler._task_logs])
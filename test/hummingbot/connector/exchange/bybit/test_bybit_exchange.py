@@ -19,6 +19,7 @@ from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.trade_fee import TokenAmount
 from hummingbot.core.event.event_logger import EventLogger
 from hummingbot.core.event.events import (
@@ -741,6 +742,50 @@ class TestBybitExchange(unittest.TestCase):
             )
         )
 
+    @aioresponses()
+    def test_batch_cancel_cancels_orders_in_single_request(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        orders_to_cancel = []
+        for client_order_id, exchange_order_id in (("OID1", "4"), ("OID2", "5")):
+            self.exchange.start_tracking_order(
+                order_id=client_order_id,
+                exchange_order_id=exchange_order_id,
+                trading_pair=self.trading_pair,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("100"),
+                order_type=OrderType.LIMIT,
+            )
+            orders_to_cancel.append(LimitOrder(
+                client_order_id=client_order_id, trading_pair=self.trading_pair, is_buy=True,
+                base_currency=self.base_asset, quote_currency=self.quote_asset,
+                price=Decimal("10000"), quantity=Decimal("100")))
+
+        url = web_utils.rest_url(CONSTANTS.BATCH_CANCEL_ORDERS_BY_IDS_PATH_URL)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        response = {
+            "ret_code": 0,
+            "ret_msg": "",
+            "ext_code": None,
+            "ext_info": None,
+            "result": [
+                {"orderId": "5", "code": 12139}
+            ]
+        }
+        mock_api.delete(regex_url, body=json.dumps(response))
+
+        results = self.async_run_with_timeout(self.exchange._execute_batch_cancel(orders_to_cancel=orders_to_cancel))
+
+        cancel_request = next(((key, value) for key, value in mock_api.requests.items()
+                               if key[1].human_repr().startswith(url)))
+        self._validate_auth_credentials_present(cancel_request[1][0])
+        self.assertEqual("4,5", cancel_request[1][0].kwargs["params"]["orderIds"])
+
+        self.assertEqual([CancellationResult("OID1", True), CancellationResult("OID2", False)], results)
+        self.assertEqual(1, len(self.order_cancelled_logger.event_log))
+        self.assertEqual("OID1", self.order_cancelled_logger.event_log[0].order_id)
+        self.assertIn("OID2", self.exchange.in_flight_orders)
+
     @aioresponses()
     def test_cancel_order_raises_failure_event_when_request_fails(self, mock_api):
         request_sent_event = asyncio.Event()
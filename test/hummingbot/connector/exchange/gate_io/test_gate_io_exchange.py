@@ -19,6 +19,7 @@ from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, PositionAction, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.order_book import OrderBook
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 from hummingbot.core.data_type.trade_fee import TokenAmount
@@ -826,6 +827,82 @@ class TestGateIoExchange(unittest.TestCase):
             )
         )
 
+    @aioresponses()
+    def test_execute_batch_order_create(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        url = f"{CONSTANTS.REST_URL}/{CONSTANTS.BATCH_ORDER_CREATE_PATH_URL}"
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        successful_order = self.get_order_create_response_mock(exchange_order_id="someExchId1")
+        successful_order.update({"text": "someId1", "succeeded": True})
+        failed_order = {"text": "someId2", "succeeded": False, "label": "BALANCE_NOT_ENOUGH", "message": "Not enough"}
+        mock_api.post(regex_url, body=json.dumps([successful_order, failed_order]))
+        orders_to_create = [
+            LimitOrder(client_order_id=order_id, trading_pair=self.trading_pair, is_buy=True,
+                       base_currency=self.base_asset, quote_currency=self.quote_asset,
+                       price=Decimal("5.1"), quantity=Decimal("1"))
+            for order_id in ("someId1", "someId2")
+        ]
+
+        self.async_run_with_timeout(self.exchange._execute_batch_order_create(orders_to_create=orders_to_create))
+
+        order_request = next(((key, value) for key, value in mock_api.requests.items()
+                              if key[1].human_repr().startswith(url)))
+        self.assertEqual(1, len(order_request[1]))
+        request_data = json.loads(order_request[1][0].kwargs["data"])
+        self.assertEqual(["someId1", "someId2"], [order_data["text"] for order_data in request_data])
+        self.assertEqual([self.ex_trading_pair] * 2, [order_data["currency_pair"] for order_data in request_data])
+
+        self.assertIn("someId1", self.exchange.in_flight_orders)
+        self.assertEqual("someExchId1", self.exchange.in_flight_orders["someId1"].exchange_order_id)
+        self.assertEqual(1, len(self.buy_order_created_logger.event_log))
+        self.assertNotIn("someId2", self.exchange.in_flight_orders)
+        self.assertEqual("someId2", self.order_failure_logger.event_log[0].order_id)
+
+    @aioresponses()
+    def test_execute_batch_cancel(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        orders_to_cancel = []
+        for client_order_id, exchange_order_id in (("someId1", "someExchId1"), ("someId2", "someExchId2")):
+            self.exchange.start_tracking_order(
+                order_id=client_order_id,
+                exchange_order_id=exchange_order_id,
+                trading_pair=self.trading_pair,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("100"),
+                order_type=OrderType.LIMIT,
+            )
+            orders_to_cancel.append(LimitOrder(
+                client_order_id=client_order_id, trading_pair=self.trading_pair, is_buy=True,
+                base_currency=self.base_asset, quote_currency=self.quote_asset,
+                price=Decimal("10000"), quantity=Decimal("100")))
+
+        url = f"{CONSTANTS.REST_URL}/{CONSTANTS.BATCH_ORDER_CANCEL_PATH_URL}"
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+        resp = [
+            {"currency_pair": self.ex_trading_pair, "id": "someExchId1", "succeeded": True},
+            {"currency_pair": self.ex_trading_pair, "id": "someExchId2", "succeeded": False,
+             "label": "ORDER_NOT_FOUND", "message": "Order not found"},
+        ]
+        mock_api.post(regex_url, body=json.dumps(resp))
+
+        results = self.async_run_with_timeout(self.exchange._execute_batch_cancel(orders_to_cancel=orders_to_cancel))
+
+        cancel_request = next(((key, value) for key, value in mock_api.requests.items()
+                               if key[1].human_repr().startswith(url)))
+        request_data = json.loads(cancel_request[1][0].kwargs["data"])
+        self.assertEqual(
+            [{"currency_pair": self.ex_trading_pair, "id": "someExchId1"},
+             {"currency_pair": self.ex_trading_pair, "id": "someExchId2"}],
+            request_data)
+
+        self.assertEqual([CancellationResult("someId1", True), CancellationResult("someId2", False)], results)
+        self.assertEqual(1, len(self.order_cancelled_logger.event_log))
+        self.assertEqual("someId1", self.order_cancelled_logger.event_log[0].order_id)
+        self.assertIn("someId2", self.exchange.in_flight_orders)
+
     @aioresponses()
     def test_cancel_order_raises_failure_event_when_request_fails(self, mock_api):
         request_sent_event = asyncio.Event()
@@ -19,6 +19,7 @@ from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.data_type.cancellation_result import CancellationResult
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.in_flight_order import InFlightOrder, OrderState, TradeUpdate
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.trade_fee import TokenAmount, TradeFeeBase, TradeFeeSchema
 from hummingbot.core.event.event_logger import EventLogger
 from hummingbot.core.event.events import (
@@ -567,6 +568,54 @@ class KucoinExchangeTests(unittest.TestCase):
             )
         )
 
+    @aioresponses()
+    def test_batch_order_create_places_limit_orders_in_single_request(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        url = web_utils.private_rest_url(CONSTANTS.MULTIPLE_ORDERS_PATH_URL)
+        regex_url = re.compile(f"^{url}".replace(".", r"\.").replace("?", r"\?"))
+
+        creation_response = {
+            "code": "200000",
+            "data": {
+                "data": [
+                    {"symbol": self.exchange_trading_pair, "side": "buy", "type": "limit", "price": "10000",
+                     "size": "100", "clientOid": "OID1", "id": "5bd6e9286d99522a52e458de", "status": "success",
+                     "failMsg": None},
+                    {"symbol": self.exchange_trading_pair, "side": "sell", "type": "limit", "price": "11000",
+                     "size": "100", "clientOid": "OID2", "id": None, "status": "fail",
+                     "failMsg": "Balance insufficient!"},
+                ]
+            }
+        }
+        mock_api.post(regex_url, body=json.dumps(creation_response))
+        orders_to_create = [
+            LimitOrder(client_order_id="OID1", trading_pair=self.trading_pair, is_buy=True,
+                       base_currency=self.base_asset, quote_currency=self.quote_asset,
+                       price=Decimal("10000"), quantity=Decimal("100")),
+            LimitOrder(client_order_id="OID2", trading_pair=self.trading_pair, is_buy=False,
+                       base_currency=self.base_asset, quote_currency=self.quote_asset,
+                       price=Decimal("11000"), quantity=Decimal("100")),
+        ]
+
+        self.async_run_with_timeout(self.exchange._execute_batch_order_create(orders_to_create=orders_to_create,
+                                                                              order_type=OrderType.LIMIT_MAKER))
+
+        order_request = next(((key, value) for key, value in mock_api.requests.items()
+                              if key[1].human_repr().startswith(url)))
+        self.assertEqual(1, len(order_request[1]))
+        self._validate_auth_credentials_present(order_request[1][0])
+        request_data = json.loads(order_request[1][0].kwargs["data"])
+        self.assertEqual(self.exchange_trading_pair, request_data["symbol"])
+        self.assertEqual(["OID1", "OID2"], [order_data["clientOid"] for order_data in request_data["orderList"]])
+        self.assertTrue(all(order_data["postOnly"] for order_data in request_data["orderList"]))
+
+        self.assertIn("OID1", self.exchange.in_flight_orders)
+        self.assertEqual("5bd6e9286d99522a52e458de", self.exchange.in_flight_orders["OID1"].exchange_order_id)
+        self.assertEqual("OID1", self.buy_order_created_logger.event_log[0].order_id)
+        self.assertNotIn("OID2", self.exchange.in_flight_orders)
+        self.assertEqual("OID2", self.order_failure_logger.event_log[0].order_id)
+
     @aioresponses()
     def test_create_limit_maker_order_successfully(self, mock_api):
         self._simulate_trading_rules_initialized()
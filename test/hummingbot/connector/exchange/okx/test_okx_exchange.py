@@ -16,6 +16,7 @@ from hummingbot.connector.test_support.exchange_connector_test import AbstractEx
 from hummingbot.connector.trading_rule import TradingRule
 from hummingbot.connector.utils import get_new_client_order_id
 from hummingbot.core.data_type.in_flight_order import InFlightOrder
+from hummingbot.core.data_type.limit_order import LimitOrder
 from hummingbot.core.data_type.trade_fee import AddedToCostTradeFee, TokenAmount, TradeFeeBase
 from hummingbot.core.event.events import OrderCancelledEvent, OrderType, TradeType
 
@@ -1182,3 +1183,87 @@ class OkxExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
             else:
                 self.assertIn(order.client_order_id, self.exchange.in_flight_orders)
                 self.assertTrue(order.is_pending_cancel_confirmation)
+
+    @aioresponses()
+    def test_batch_order_create_places_orders_in_single_request(self, mock_api):
+        self._simulate_trading_rules_initialized()
+        self.exchange._set_current_timestamp(1640780000)
+        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_BATCH_ORDERS_PATH)
+        orders_to_create = [
+            LimitOrder(client_order_id="OID1", trading_pair=self.trading_pair, is_buy=True,
+                       base_currency=self.base_asset, quote_currency=self.quote_asset,
+                       price=Decimal("10000"), quantity=Decimal("100")),
+            LimitOrder(client_order_id="OID2", trading_pair=self.trading_pair, is_buy=False,
+                       base_currency=self.base_asset, quote_currency=self.quote_asset,
+                       price=Decimal("11000"), quantity=Decimal("100")),
+        ]
+        response = {
+            "code": "1",
+            "msg": "",
+            "data": [
+                {"clOrdId": "OID1", "ordId": "EOID1", "tag": "", "sCode": "0", "sMsg": ""},
+                {"clOrdId": "OID2", "ordId": "", "tag": "", "sCode": "51008", "sMsg": "Insufficient balance"},
+            ]
+        }
+        mock_api.post(url, body=json.dumps(response))
+
+        self.async_run_with_timeout(self.exchange._execute_batch_order_create(orders_to_create=orders_to_create))
+
+        order_requests = self._all_executed_requests(mock_api, url)
+        self.assertEqual(1, len(order_requests))
+        request_data = json.loads(order_requests[0].kwargs["data"])
+        self.assertEqual(["OID1", "OID2"], [order_data["clOrdId"] for order_data in request_data])
+        self.assertEqual(["buy", "sell"], [order_data["side"] for order_data in request_data])
+        self.assertEqual(["10000.0000", "11000.0000"], [order_data["px"] for order_data in request_data])
+
+        self.assertIn("OID1", self.exchange.in_flight_orders)
+        self.assertEqual("EOID1", self.exchange.in_flight_orders["OID1"].exchange_order_id)
+        self.assertEqual("OID1", self.buy_order_created_logger.event_log[0].order_id)
+        self.assertNotIn("OID2", self.exchange.in_flight_orders)
+        self.assertEqual("OID2", self.order_failure_logger.event_log[0].order_id)
+
+    @aioresponses()
+    def test_batch_order_cancel_cancels_orders_in_single_request(self, mock_api):
+        self.exchange._set_current_timestamp(1640780000)
+        url = web_utils.private_rest_url(path_url=CONSTANTS.OKX_BATCH_ORDER_CANCEL_PATH)
+        orders_to_cancel = []
+        for order_id, exchange_order_id in (("OID1", "EOID1"), ("OID2", "EOID2")):
+            self.exchange.start_tracking_order(
+                order_id=order_id,
+                exchange_order_id=exchange_order_id,
+                trading_pair=self.trading_pair,
+                trade_type=TradeType.BUY,
+                price=Decimal("10000"),
+                amount=Decimal("100"),
+                order_type=OrderType.LIMIT,
+            )
+            orders_to_cancel.append(LimitOrder(
+                client_order_id=order_id, trading_pair=self.trading_pair, is_buy=True,
+                base_currency=self.base_asset, quote_currency=self.quote_asset,
+                price=Decimal("10000"), quantity=Decimal("100")))
+        orders_to_cancel.append(LimitOrder(
+            client_order_id="OID3", trading_pair=self.trading_pair, is_buy=True,
+            base_currency=self.base_asset, quote_currency=self.quote_asset,
+            price=Decimal("10000"), quantity=Decimal("100")))
+        response = {
+            "code": "2",
+            "msg": "",
+            "data": [
+                {"clOrdId": "OID1", "ordId": "EOID1", "sCode": "0", "sMsg": ""},
+                {"clOrdId": "OID2", "ordId": "EOID2", "sCode": "51410", "sMsg": "Cancellation failed"},
+            ]
+        }
+        mock_api.post(url, body=json.dumps(response))
+
+        results = self.async_run_with_timeout(self.exchange._execute_batch_cancel(orders_to_cancel=orders_to_cancel))
+
+        cancel_requests = self._all_executed_requests(mock_api, url)
+        self.assertEqual(1, len(cancel_requests))
+        request_data = json.loads(cancel_requests[0].kwargs["data"])
+        self.assertEqual(["OID1", "OID2"], [order_data["clOrdId"] for order_data in request_data])
+
+        self.assertEqual(
+            {"OID1": True, "OID2": False, "OID3": False},
+            {result.order_id: result.success for result in results})
+        self.assertTrue(self.exchange.in_flight_orders["OID1"].is_pending_cancel_confirmation)
+        self.assertFalse(self.exchange.in_flight_orders["OID2"].is_pending_cancel_confirmation)
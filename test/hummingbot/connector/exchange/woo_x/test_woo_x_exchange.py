@@ -724,6 +724,11 @@ class WooXExchangeTests(AbstractExchangeConnectorTests.ExchangeConnectorTests):
         # Disabling this test because Woo X does not have an endpoint to check health.
         pass
 
+    @aioresponses()
+    def test_connections_keep_alive_loop_sends_network_check_request(self, mock_api):
+        # Disabling this test because Woo X does not have an endpoint to check health.
+        pass
+
     @aioresponses()
     def test_update_order_status_when_filled_correctly_processed_even_when_trade_fill_update_fails(self, mock_api):
         pass
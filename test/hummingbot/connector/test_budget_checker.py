@@ -1,5 +1,6 @@
 import unittest
 from decimal import Decimal
+from unittest.mock import patch
 
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
@@ -10,6 +11,17 @@ from hummingbot.connector.utils import combine_to_hb_trading_pair
 from hummingbot.core.data_type.common import OrderType, TradeType
 from hummingbot.core.data_type.order_candidate import OrderCandidate
 from hummingbot.core.data_type.trade_fee import TokenAmount, TradeFeeSchema
+from hummingbot.core.utils.estimate_fee import build_trade_fee
+
+
+class BalanceCountingMockPaperExchange(MockPaperExchange):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.balance_requests = []
+
+    def get_available_balance(self, currency: str) -> Decimal:
+        self.balance_requests.append(currency)
+        return super().get_available_balance(currency)
 
 
 class BudgetCheckerTest(unittest.TestCase):
@@ -580,3 +592,71 @@ class BudgetCheckerTest(unittest.TestCase):
 
         self.assertEqual(Decimal("7"), first_adjusted_candidate.amount)
         self.assertEqual(Decimal("5"), second_adjusted_candidate.amount)
+
+    def _multi_level_order_candidates(self):
+        order_candidates = []
+        for level in range(10):
+            for order_side, price in ((TradeType.BUY, Decimal("2") - level * Decimal("0.05")),
+                                      (TradeType.SELL, Decimal("2") + level * Decimal("0.05"))):
+                order_candidates.append(OrderCandidate(
+                    trading_pair=self.trading_pair,
+                    is_maker=level % 3 != 0,
+                    order_type=OrderType.LIMIT,
+                    order_side=order_side,
+                    amount=Decimal("1.2345678") + level,
+                    price=price,
+                ))
+        return order_candidates
+
+    def test_adjust_candidates_matches_successive_candidate_adjustments(self):
+        trade_fee_schema = TradeFeeSchema(
+            maker_percent_fee_decimal=Decimal("0.01"),
+            taker_percent_fee_decimal=Decimal("0.02"),
+            taker_fixed_fees=[TokenAmount(self.quote_asset, Decimal("0.5"))],
+        )
+        exchange = MockPaperExchange(
+            client_config_map=ClientConfigAdapter(ClientConfigMap()),
+            trade_fee_schema=trade_fee_schema)
+        exchange.set_quantization_param(QuantizationParams(self.trading_pair, 6, 3, 6, 3))
+        exchange.set_balance(self.base_asset, Decimal("30"))
+        exchange.set_balance(self.quote_asset, Decimal("60"))
+        budget_checker: BudgetChecker = exchange.budget_checker
+
+        for all_or_none in (True, False):
+            budget_checker.reset_locked_collateral()
+            expected_candidates = [
+                budget_checker.adjust_candidate_and_lock_available_collateral(order_candidate, all_or_none)
+                for order_candidate in self._multi_level_order_candidates()
+            ]
+            budget_checker.reset_locked_collateral()
+
+            adjusted_candidates = budget_checker.adjust_candidates(
+                self._multi_level_order_candidates(), all_or_none=all_or_none)
+
+            self.assertEqual(expected_candidates, adjusted_candidates)
+            self.assertTrue(any(candidate.is_zero_order for candidate in adjusted_candidates))
+            self.assertTrue(any(not candidate.is_zero_order for candidate in adjusted_candidates))
+
+    def test_adjust_candidates_reads_balances_once_per_asset(self):
+        exchange = BalanceCountingMockPaperExchange(client_config_map=ClientConfigAdapter(ClientConfigMap()))
+        exchange.set_balance(self.base_asset, Decimal("100"))
+        exchange.set_balance(self.quote_asset, Decimal("100"))
+        budget_checker: BudgetChecker = exchange.budget_checker
+
+        budget_checker.adjust_candidates(self._multi_level_order_candidates(), all_or_none=False)
+
+        self.assertEqual(sorted([self.base_asset, self.quote_asset]), sorted(exchange.balance_requests))
+
+        exchange.balance_requests.clear()
+        budget_checker.adjust_candidate(self._multi_level_order_candidates()[0])
+        self.assertEqual([self.quote_asset], exchange.balance_requests)
+
+    @patch("hummingbot.core.data_type.order_candidate.build_trade_fee", wraps=build_trade_fee)
+    def test_adjust_candidates_builds_fee_once_per_fee_profile(self, build_trade_fee_mock):
+        self.exchange.set_balance(self.base_asset, Decimal("100"))
+        self.exchange.set_balance(self.quote_asset, Decimal("100"))
+
+        self.budget_checker.adjust_candidates(self._multi_level_order_candidates(), all_or_none=True)
+
+        # buy and sell, maker and taker
+        self.assertEqual(4, build_trade_fee_mock.call_count)
@@ -1091,3 +1091,115 @@ class ClientOrderTrackerUnitTest(unittest.TestCase):
         self.tracker.lost_order_count_limit = 2
 
         self.assertEqual(2, self.tracker.lost_order_count_limit)
+
+    def _create_order(self, client_order_id: str, exchange_order_id: str = None, trading_pair: str = None):
+        return InFlightOrder(
+            client_order_id=client_order_id,
+            exchange_order_id=exchange_order_id,
+            trading_pair=trading_pair or self.trading_pair,
+            order_type=OrderType.LIMIT,
+            trade_type=TradeType.BUY,
+            amount=Decimal("1000.0"),
+            creation_timestamp=1640001112.0,
+            price=Decimal("1.0"),
+        )
+
+    def test_indexes_follow_order_lifecycle(self):
+        order = self._create_order("OID1")
+        other_order = self._create_order("OID2", exchange_order_id="EOID2", trading_pair="WETH-HBOT")
+        self.tracker.start_tracking_order(order)
+        self.tracker.start_tracking_order(other_order)
+
+        self.assertEqual({"EOID2": other_order}, dict(self.tracker.all_fillable_orders_by_exchange_order_id))
+        self.assertEqual({"OID1": order}, dict(self.tracker.active_orders_by_trading_pair(self.trading_pair)))
+        self.assertEqual({"OID1": order, "OID2": other_order},
+                         dict(self.tracker.active_orders_by_state(OrderState.PENDING_CREATE)))
+
+        order_update = OrderUpdate(client_order_id="OID1", exchange_order_id="EOID1", trading_pair=self.trading_pair,
+                                   update_timestamp=1, new_state=OrderState.OPEN)
+        self.async_run_with_timeout(self.tracker.process_order_update(order_update))
+
+        self.assertIs(order, self.tracker.all_updatable_orders_by_exchange_order_id["EOID1"])
+        self.assertEqual({"OID1": order}, dict(self.tracker.active_orders_by_state(OrderState.OPEN)))
+        self.assertEqual({"OID2": other_order}, dict(self.tracker.active_orders_by_state(OrderState.PENDING_CREATE)))
+
+        order_update = OrderUpdate(client_order_id="OID1", trading_pair=self.trading_pair,
+                                   update_timestamp=2, new_state=OrderState.CANCELED)
+        self.async_run_with_timeout(self.tracker.process_order_update(order_update))
+
+        self.assertIs(order, self.tracker.all_fillable_orders["OID1"])
+        self.assertIs(order, self.tracker.all_fillable_orders_by_exchange_order_id["EOID1"])
+        self.assertNotIn("OID1", self.tracker.all_updatable_orders)
+        self.assertNotIn("EOID1", self.tracker.all_updatable_orders_by_exchange_order_id)
+        self.assertEqual({}, dict(self.tracker.active_orders_by_trading_pair(self.trading_pair)))
+        self.assertEqual({}, dict(self.tracker.active_orders_by_state(OrderState.CANCELED)))
+
+    def test_exchange_order_id_assigned_directly_to_the_order_is_indexed(self):
+        order = self._create_order("OID1")
+        self.tracker.start_tracking_order(order)
+        self.assertNotIn("EOID1", self.tracker.all_fillable_orders_by_exchange_order_id)
+
+        order.update_exchange_order_id("EOID1")
+
+        self.assertIs(order, self.tracker.all_fillable_orders_by_exchange_order_id["EOID1"])
+        self.assertIs(order, self.tracker.fetch_order(exchange_order_id="EOID1"))
+
+    def test_exchange_order_id_reassigned_directly_to_the_order_is_indexed(self):
+        order = self._create_order("OID1", exchange_order_id="EOID1")
+        self.tracker.start_tracking_order(order)
+        self.assertIs(order, self.tracker.all_fillable_orders_by_exchange_order_id.get("EOID1"))
+
+        order.exchange_order_id = "EOID2"
+
+        self.assertIs(order, self.tracker.all_fillable_orders_by_exchange_order_id.get("EOID2"))
+        self.assertIsNone(self.tracker.all_fillable_orders_by_exchange_order_id.get("EOID1"))
+        self.assertIs(order, self.tracker.all_updatable_orders_by_exchange_order_id.get("EOID2"))
+        self.assertIsNone(self.tracker.all_updatable_orders_by_exchange_order_id.get("EOID1"))
+        self.assertIs(order, self.tracker.fetch_order(exchange_order_id="EOID2"))
+
+        order.exchange_order_id = None
+
+        self.assertEqual({}, dict(self.tracker.all_fillable_orders_by_exchange_order_id))
+        self.assertNotIn("EOID2", self.tracker.all_updatable_orders_by_exchange_order_id)
+
+    def test_state_changed_directly_in_the_order_is_indexed(self):
+        order = self._create_order("OID1")
+        self.tracker.start_tracking_order(order)
+        self.assertEqual({"OID1": order}, dict(self.tracker.active_orders_by_state(OrderState.PENDING_CREATE)))
+
+        order.current_state = OrderState.OPEN
+
+        self.assertEqual({}, dict(self.tracker.active_orders_by_state(OrderState.PENDING_CREATE)))
+        self.assertEqual({"OID1": order}, dict(self.tracker.active_orders_by_state(OrderState.OPEN)))
+
+    def test_lost_orders_are_indexed_by_exchange_order_id(self):
+        self.tracker = ClientOrderTracker(connector=self.connector, lost_order_count_limit=0)
+        order = self._create_order("OID1", exchange_order_id="EOID1")
+        self.tracker.start_tracking_order(order)
+
+        self.async_run_with_timeout(self.tracker.process_order_not_found(order.client_order_id))
+
+        self.assertIs(order, self.tracker.all_updatable_orders_by_exchange_order_id["EOID1"])
+        self.assertIs(order, self.tracker.fetch_lost_order(exchange_order_id="EOID1"))
+        self.assertIsNone(self.tracker.fetch_order(exchange_order_id="EOID1"))
+        self.assertEqual({}, dict(self.tracker.active_orders_by_trading_pair(self.trading_pair)))
+
+    @patch("hummingbot.connector.client_order_tracker.ClientOrderTracker.CACHED_ORDER_TTL", 0.1)
+    def test_expired_cached_orders_are_removed_from_indexes(self):
+        tracker = ClientOrderTracker(self.connector)
+        order = self._create_order("OID1", exchange_order_id="EOID1")
+        tracker.start_tracking_order(order)
+        tracker.stop_tracking_order(order.client_order_id)
+        self.assertIn(order.client_order_id, tracker.all_fillable_orders)
+
+        self.ev_loop.run_until_complete(asyncio.sleep(0.2))
+
+        self.assertNotIn(order.client_order_id, tracker.all_fillable_orders)
+        self.assertNotIn("EOID1", tracker.all_fillable_orders_by_exchange_order_id)
+
+    def test_orders_added_directly_to_the_active_orders_are_indexed(self):
+        order = self._create_order("OID1", exchange_order_id="EOID1")
+        self.tracker.active_orders[order.client_order_id] = order
+
+        self.assertIs(order, self.tracker.all_updatable_orders_by_exchange_order_id["EOID1"])
+        self.assertIs(order, self.tracker.all_fillable_orders["OID1"])
@@ -416,3 +416,5 @@ class MarketsRecorderTests(TestCase):
         self.assertEqual(market_data[0].best_ask, Decimal("101"))
         self.assertEqual(market_data[0].best_bid, Decimal("99"))
         self.assertEqual(market_data[0].mid_price, Decimal("100"))
+        self.assertEqual([[3, 1, 3], [2, 1, 2], [1, 1, 1]], market_data[0].order_book["bid"])
+        self.assertEqual([[4, 1, 1], [5, 1, 2], [6, 1, 3], [7, 1, 4]], market_data[0].order_book["ask"])
@@ -75,3 +75,61 @@ class TimeSynchronizerTests(TestCase):
         calculated_offset = numpy.mean([calculated_median, calculated_weighted_average])
 
         self.assertEqual(calculated_offset + seconds_difference_when_calculating_current_time, synchronized_time)
+
+    @patch("hummingbot.connector.time_synchronizer.numpy.median", wraps=numpy.median)
+    def test_time_offset_is_calculated_only_when_samples_change(self, median_mock):
+        time_provider = TimeSynchronizer()
+        time_provider.add_time_offset_ms_sample(10)
+        time_provider.add_time_offset_ms_sample(20)
+
+        first_offset = time_provider.time_offset_ms
+        self.assertEqual(first_offset, time_provider.time_offset_ms)
+        self.assertEqual(1, median_mock.call_count)
+
+        time_provider.add_time_offset_ms_sample(30)
+        self.assertNotEqual(first_offset, time_provider.time_offset_ms)
+        self.assertEqual(2, median_mock.call_count)
+
+        time_provider.clear_time_offset_ms_samples()
+        time_provider.add_time_offset_ms_sample(40)
+        self.assertEqual(40, time_provider.time_offset_ms)
+        self.assertEqual(3, median_mock.call_count)
+
+    @patch("hummingbot.connector.time_synchronizer.TimeSynchronizer._current_seconds_counter")
+    def test_resync_interval_grows_while_offset_is_stable_and_resets_on_drift(self, seconds_counter_mock):
+        time_provider = TimeSynchronizer()
+        seconds_counter_mock.return_value = 0
+        self.assertTrue(time_provider.is_resync_required())
+
+        # The server clock is 1 second ahead, and stays stable for the first three samples
+        for server_time, expected_interval in ((1000, 10), (1000, 20), (1000, 40)):
+            self.async_run_with_timeout(
+                time_provider.update_server_time_offset_with_time_provider(
+                    time_provider=self.configurable_timestamp_provider(server_time)
+                ))
+            self.assertEqual(expected_interval, time_provider.resync_interval)
+
+        seconds_counter_mock.return_value = 39
+        self.assertFalse(time_provider.is_resync_required())
+        seconds_counter_mock.return_value = 40
+        self.assertTrue(time_provider.is_resync_required())
+
+        self.async_run_with_timeout(
+            time_provider.update_server_time_offset_with_time_provider(
+                time_provider=self.configurable_timestamp_provider(40000 + 1000 + 500)
+            ))
+        self.assertEqual(TimeSynchronizer.RESYNC_MIN_INTERVAL, time_provider.resync_interval)
+        self.assertFalse(time_provider.is_resync_required())
+
+        time_provider.clear_time_offset_ms_samples()
+        self.assertTrue(time_provider.is_resync_required())
+
+    def test_resync_interval_is_capped(self):
+        time_provider = TimeSynchronizer()
+        for _ in range(20):
+            self.async_run_with_timeout(
+                time_provider.update_server_time_offset_with_time_provider(
+                    time_provider=self.configurable_timestamp_provider(time_provider.time() * 1e3)
+                ))
+
+        self.assertEqual(TimeSynchronizer.RESYNC_MAX_INTERVAL, time_provider.resync_interval)
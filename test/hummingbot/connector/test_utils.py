@@ -1,3 +1,4 @@
+import asyncio
 import importlib
 import os
 import platform
@@ -6,7 +7,7 @@ from hashlib import md5
 from os import DirEntry, scandir
 from os.path import exists, join
 from typing import cast
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from pydantic import SecretStr
 
@@ -14,7 +15,9 @@ from hummingbot import root_path
 from hummingbot.client.config.config_data_types import BaseConnectorConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.client.settings import CONNECTOR_SUBMODULES_THAT_ARE_NOT_CEX_TYPES
-from hummingbot.connector.utils import get_new_client_order_id
+from hummingbot.connector.utils import RateLimitHeadersRESTPostProcessor, get_new_client_order_id
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import RateLimit
 
 
 class UtilsTest(unittest.TestCase):
@@ -71,6 +74,22 @@ class UtilsTest(unittest.TestCase):
         self.assertEqual(expected_shortened_id, shortened_id)
         self.assertEqual(expected_extra_reduced_id, extra_reduced_id)
 
+    def test_rate_limit_headers_post_processor_reconciles_throttler(self):
+        throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id="WEIGHT", limit=100, time_interval=60),
+                                                RateLimit(limit_id="ORDERS", limit=10, time_interval=10)])
+        post_processor = RateLimitHeadersRESTPostProcessor(
+            throttler=throttler,
+            headers_to_limit_ids={"X-USED-WEIGHT": "WEIGHT", "X-ORDER-COUNT": "ORDERS", "X-OTHER": "UNKNOWN"})
+        response = MagicMock()
+        response.headers = {"X-USED-WEIGHT": "42", "X-ORDER-COUNT": "not a number", "X-OTHER": "3"}
+
+        result = asyncio.get_event_loop().run_until_complete(post_processor.post_process(response))
+
+        self.assertIs(response, result)
+        self.assertEqual(1, len(throttler._task_logs))
+        self.assertEqual("WEIGHT", throttler._task_logs[0].rate_limit.limit_id)
+        self.assertEqual(42, throttler._task_logs[0].weight)
+
     def test_connector_config_maps(self):
         connector_exceptions = ["mock_paper_exchange", "mock_pure_python_paper_exchange", "paper_trade", "amm", "clob"]
 
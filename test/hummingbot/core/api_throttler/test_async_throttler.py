@@ -11,7 +11,8 @@ from unittest.mock import patch
 from hummingbot.client.config.client_config_map import ClientConfigMap
 from hummingbot.client.config.config_helpers import ClientConfigAdapter
 from hummingbot.core.api_throttler.async_throttler import AsyncRequestContext, AsyncThrottler
-from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, TaskLog
+from hummingbot.core.api_throttler.async_throttler_base import request_priority
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, RequestPriority, TaskLog
 from hummingbot.logger.struct_logger import METRICS_LOG_LEVEL
 
 TEST_PATH_URL = "/hummingbot"
@@ -275,3 +276,115 @@ class AsyncThrottlerUnitTests(unittest.TestCase):
         time_mock.return_value = 1640000000.2100
         result = context.within_capacity()
         self.assertTrue(result)
+
+    def test_priority_reserve_is_only_available_to_high_priority_requests(self):
+        throttler = AsyncThrottler(rate_limits=self.rate_limits, priority_reserve_pct=0.2)
+        for _ in range(8):
+            self.ev_loop.run_until_complete(throttler.execute_task(TEST_WEIGHTED_TASK_2_ID).acquire())
+
+        self.assertFalse(throttler.execute_task(TEST_WEIGHTED_TASK_2_ID).within_capacity())
+        self.assertFalse(throttler.execute_task(TEST_WEIGHTED_TASK_2_ID, RequestPriority.LOW).within_capacity())
+        self.assertTrue(throttler.execute_task(TEST_WEIGHTED_TASK_2_ID, RequestPriority.HIGH).within_capacity())
+        self.assertTrue(throttler.execute_task(TEST_WEIGHTED_TASK_2_ID, RequestPriority.CRITICAL).within_capacity())
+
+    def test_priority_reserve_out_of_range_raises_error(self):
+        for priority_reserve_pct in (-0.1, 1, 10):
+            with self.assertRaises(ValueError):
+                AsyncThrottler(rate_limits=self.rate_limits, priority_reserve_pct=priority_reserve_pct)
+
+    def test_request_heavier_than_the_unreserved_capacity_uses_the_whole_limit(self):
+        throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id=TEST_POOL_ID, limit=10, time_interval=5.0,
+                                                          weight=2)],
+                                   priority_reserve_pct=0.9)
+
+        self.ev_loop.run_until_complete(
+            asyncio.wait_for(throttler.execute_task(TEST_POOL_ID, RequestPriority.LOW).acquire(), 0.5))
+
+    def test_critical_request_goes_before_waiting_low_priority_request(self):
+        throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=10)],
+                                   retry_interval=0.01)
+        completed: List[RequestPriority] = []
+
+        async def request(priority: RequestPriority):
+            async with throttler.execute_task(TEST_POOL_ID, priority):
+                completed.append(priority)
+
+        async def run_requests():
+            await request(RequestPriority.NORMAL)
+            low_priority_tasks = [asyncio.ensure_future(request(RequestPriority.LOW)) for _ in range(2)]
+            await asyncio.sleep(0.005)
+            critical_task = asyncio.ensure_future(request(RequestPriority.CRITICAL))
+            await asyncio.sleep(0)
+            # The capacity frees up while all the requests are waiting, the low priority requests poll it first
+            throttler._task_logs.clear()
+            await critical_task
+            for task in low_priority_tasks:
+                task.cancel()
+
+        self.ev_loop.run_until_complete(asyncio.wait_for(run_requests(), 1))
+
+        self.assertEqual([RequestPriority.NORMAL, RequestPriority.CRITICAL], completed)
+
+    def test_priority_from_request_priority_context(self):
+        self.assertEqual(RequestPriority.NORMAL, self.throttler.execute_task(TEST_POOL_ID).priority)
+
+        with request_priority(RequestPriority.CRITICAL):
+            self.assertEqual(RequestPriority.CRITICAL, self.throttler.execute_task(TEST_POOL_ID).priority)
+            self.assertEqual(RequestPriority.LOW,
+                             self.throttler.execute_task(TEST_POOL_ID, RequestPriority.LOW).priority)
+
+        self.assertEqual(RequestPriority.NORMAL, self.throttler.execute_task(TEST_POOL_ID).priority)
+
+    def test_wait_time_histograms_per_priority(self):
+        self.ev_loop.run_until_complete(self.execute_requests(2, TEST_WEIGHTED_TASK_2_ID, self.throttler))
+        with request_priority(RequestPriority.HIGH):
+            self.ev_loop.run_until_complete(self.execute_requests(1, TEST_WEIGHTED_TASK_2_ID, self.throttler))
+
+        histograms = self.throttler.wait_time_histograms
+        self.assertEqual(2, histograms[RequestPriority.NORMAL].count)
+        self.assertEqual(1, histograms[RequestPriority.HIGH].count)
+        self.assertEqual(0, histograms[RequestPriority.LOW].count)
+        self.assertEqual(1, sum(histograms[RequestPriority.HIGH].bucket_counts))
+
+    def test_reconcile_capacity_used_with_server_usage(self):
+        rate_limit = self.throttler._id_to_limit_map[TEST_WEIGHTED_POOL_ID]
+        self.ev_loop.run_until_complete(self.execute_requests(1, TEST_WEIGHTED_TASK_1_ID, self.throttler))
+        self.assertTrue(self.throttler.execute_task(TEST_WEIGHTED_TASK_2_ID).within_capacity())
+
+        # Other clients sharing the limit used more of it
+        self.throttler.reconcile_capacity_used(TEST_WEIGHTED_POOL_ID, 10)
+        self.assertFalse(self.throttler.execute_task(TEST_WEIGHTED_TASK_2_ID).within_capacity())
+
+        # A lower usage reported by the server does not free capacity
+        self.throttler.reconcile_capacity_used(TEST_WEIGHTED_POOL_ID, 6)
+        self.assertEqual(10, sum(task.weight for task in self.throttler._task_logs if task.rate_limit is rate_limit))
+        self.assertFalse(self.throttler.execute_task(TEST_WEIGHTED_TASK_2_ID).within_capacity())
+
+        self.throttler.reconcile_capacity_used("unknown_limit_id", 6)
+
+    def test_reconcile_capacity_used_keeps_requests_in_flight(self):
+        throttler = AsyncThrottler(rate_limits=[RateLimit(limit_id="ORDERS", limit=10, time_interval=10)])
+        sent_requests: List[int] = []
+        in_flight = asyncio.Event()
+
+        async def place_order(index: int):
+            async with throttler.execute_task("ORDERS"):
+                sent_requests.append(index)
+                await in_flight.wait()
+
+        async def run_orders():
+            tasks = [asyncio.ensure_future(place_order(index)) for index in range(10)]
+            while len(sent_requests) < 10:
+                await asyncio.sleep(0)
+            # The first response only counts the first request received by the server
+            throttler.reconcile_capacity_used("ORDERS", 1)
+            extra_task = asyncio.ensure_future(place_order(10))
+            await asyncio.sleep(0.3)
+            in_flight.set()
+            await asyncio.gather(*tasks)
+            extra_task.cancel()
+
+        self.ev_loop.run_until_complete(run_orders())
+
+        self.assertEqual(list(range(10)), sent_requests)
+        self.assertFalse(throttler.execute_task("ORDERS").within_capacity())
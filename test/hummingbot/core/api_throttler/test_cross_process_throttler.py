@@ -0,0 +1,170 @@
+import asyncio
+import multiprocessing
+import os
+import tempfile
+import unittest
+from decimal import Decimal
+from typing import List
+
+import numpy as np
+
+from hummingbot.core.api_throttler.cross_process_throttler import (
+    SHARED_BUDGET_FILE_PREFIX,
+    CrossProcessThrottler,
+    SharedRateLimitWindow,
+)
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit
+
+TEST_POOL_ID = "TEST_POOL"
+TEST_PATH_URL = "/hummingbot"
+TEST_WEIGHTED_TASK_ID = "/weighted_task"
+
+
+def acquire_in_process(budget_dir: str, rate_limits: List[RateLimit], requests: int):
+    throttler = CrossProcessThrottler(rate_limits=rate_limits, safety_margin_pct=0, shared_budget_dir=budget_dir)
+
+    async def acquire_all():
+        for _ in range(requests):
+            async with throttler.execute_task(TEST_PATH_URL):
+                pass
+
+    asyncio.new_event_loop().run_until_complete(acquire_all())
+    throttler.close()
+
+
+class CrossProcessThrottlerUnitTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        cls.rate_limits: List[RateLimit] = [
+            RateLimit(limit_id=TEST_POOL_ID, limit=10, time_interval=1.0),
+            RateLimit(limit_id=TEST_PATH_URL, limit=3, time_interval=0.2,
+                      linked_limits=[LinkedLimitWeightPair(TEST_POOL_ID)]),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_ID, limit=1000, time_interval=1.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_POOL_ID, 4)]),
+        ]
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.budget_dir = tempfile.TemporaryDirectory()
+        self.throttlers: List[CrossProcessThrottler] = []
+
+    def tearDown(self) -> None:
+        for throttler in self.throttlers:
+            throttler.close()
+        self.budget_dir.cleanup()
+        super().tearDown()
+
+    def create_throttler(self, rate_limits: List[RateLimit] = None, **kwargs) -> CrossProcessThrottler:
+        throttler = CrossProcessThrottler(rate_limits=rate_limits or self.rate_limits,
+                                          safety_margin_pct=0,
+                                          shared_budget_dir=self.budget_dir.name,
+                                          **kwargs)
+        self.throttlers.append(throttler)
+        return throttler
+
+    def test_shared_window_ring_buffer(self):
+        window = SharedRateLimitWindow(rate_limit=self.rate_limits[1],
+                                       safety_margin_pct=0,
+                                       meta=np.zeros(3, dtype=np.int64),
+                                       timestamps=np.zeros(3, dtype=np.float64),
+                                       weights=np.zeros(3, dtype=np.int64))
+        window.append(10.0, 1)
+        window.append(10.1, 2)
+        window.append(10.15, 1)
+        window.expire(10.25)
+        self.assertEqual([10.1, 10.15], window.timestamps)
+        self.assertEqual(3, window.capacity_used)
+
+        # The ring buffer wraps around, and the weight is added to the newest request once it is full
+        window.append(10.3, 1)
+        window.append(10.35, 2)
+        self.assertEqual([10.1, 10.15, 10.35], window.timestamps)
+        self.assertEqual([2, 1, 3], window.weights)
+        self.assertEqual(6, window.capacity_used)
+
+        self.assertAlmostEqual(0.1, window.time_until_capacity(1, 10.2, capacity=5))
+        self.assertAlmostEqual(0.15, window.time_until_capacity(1, 10.2, capacity=4))
+        window.reconcile(2, 10.35)
+        self.assertEqual([10.15, 10.35], window.timestamps)
+        self.assertEqual([1, 3], window.weights)
+        window.reconcile(6, 10.35)
+        self.assertEqual([10.15, 10.35, 10.35], window.timestamps)
+        self.assertEqual([1, 3, 2], window.weights)
+
+    def test_throttlers_with_same_rate_limits_share_the_budget(self):
+        throttler = self.create_throttler()
+        other_throttler = self.create_throttler()
+        self.assertEqual(throttler.shared_budget_path, other_throttler.shared_budget_path)
+        self.assertTrue(os.path.basename(throttler.shared_budget_path).startswith(SHARED_BUDGET_FILE_PREFIX))
+
+        for _ in range(2):
+            self.ev_loop.run_until_complete(throttler.execute_task(TEST_PATH_URL).acquire())
+        self.ev_loop.run_until_complete(other_throttler.execute_task(TEST_PATH_URL).acquire())
+
+        self.assertFalse(throttler.execute_task(TEST_PATH_URL).within_capacity())
+        self.assertFalse(other_throttler.execute_task(TEST_PATH_URL).within_capacity())
+        self.assertEqual(3, throttler._windows[TEST_POOL_ID].capacity_used)
+
+        self.ev_loop.run_until_complete(other_throttler.execute_task(TEST_WEIGHTED_TASK_ID).acquire())
+        self.assertEqual(7, throttler._windows[TEST_POOL_ID].capacity_used)
+        self.assertFalse(throttler.execute_task(TEST_WEIGHTED_TASK_ID).within_capacity())
+
+    def test_budgets_with_different_names_are_independent(self):
+        throttler = self.create_throttler(shared_budget_name="bot_1")
+        other_throttler = self.create_throttler(shared_budget_name="bot_2")
+
+        for _ in range(3):
+            self.ev_loop.run_until_complete(throttler.execute_task(TEST_PATH_URL).acquire())
+
+        self.assertFalse(throttler.execute_task(TEST_PATH_URL).within_capacity())
+        self.assertTrue(other_throttler.execute_task(TEST_PATH_URL).within_capacity())
+
+    def test_budget_in_use_with_different_rate_limits_raises_error(self):
+        self.create_throttler(shared_budget_name="bot")
+
+        with self.assertRaises(ValueError):
+            self.create_throttler(rate_limits=self.rate_limits[:1], shared_budget_name="bot")
+
+    def test_acquire_awaits_capacity_used_by_other_throttler(self):
+        throttler = self.create_throttler(fifo_scheduling=True)
+        other_throttler = self.create_throttler()
+        for _ in range(3):
+            self.ev_loop.run_until_complete(other_throttler.execute_task(TEST_PATH_URL).acquire())
+
+        with self.assertRaises(asyncio.TimeoutError):
+            self.ev_loop.run_until_complete(
+                asyncio.wait_for(throttler.execute_task(TEST_PATH_URL).acquire(), 0.1))
+        self.ev_loop.run_until_complete(
+            asyncio.wait_for(throttler.execute_task(TEST_PATH_URL).acquire(), 0.5))
+
+    def test_reconcile_capacity_used_is_seen_by_other_throttler(self):
+        throttler = self.create_throttler()
+        other_throttler = self.create_throttler()
+
+        throttler.reconcile_capacity_used(TEST_POOL_ID, 8)
+
+        self.assertEqual(8, other_throttler._windows[TEST_POOL_ID].capacity_used)
+        self.assertFalse(other_throttler.execute_task(TEST_WEIGHTED_TASK_ID).within_capacity())
+
+    def test_limits_share_percentage_does_not_change_the_budget(self):
+        throttler = self.create_throttler()
+        other_throttler = self.create_throttler(limits_share_percentage=Decimal("50"))
+
+        self.assertEqual(throttler.shared_budget_path, other_throttler.shared_budget_path)
+        self.assertEqual(5, other_throttler._windows[TEST_POOL_ID].rate_limit.limit)
+
+    def test_requests_from_other_processes_are_logged_in_the_budget(self):
+        rate_limits = [RateLimit(limit_id=TEST_PATH_URL, limit=1000, time_interval=60.0)]
+        throttler = self.create_throttler(rate_limits=rate_limits)
+        processes = [multiprocessing.Process(target=acquire_in_process, args=(self.budget_dir.name, rate_limits, 50))
+                     for _ in range(3)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(10)
+
+        self.assertEqual([0, 0, 0], [process.exitcode for process in processes])
+        self.assertEqual(150, throttler._windows[TEST_PATH_URL].capacity_used)
+        self.assertEqual(150, len(throttler._windows[TEST_PATH_URL]))
@@ -0,0 +1,290 @@
+import asyncio
+import random
+import time
+import unittest
+from typing import List
+from unittest.mock import patch
+
+from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import LinkedLimitWeightPair, RateLimit, RequestPriority, TaskLog
+from hummingbot.core.api_throttler.sliding_window_throttler import RateLimitWindow, SlidingWindowThrottler
+
+TEST_POOL_ID = "TEST_POOL"
+TEST_PATH_URL = "/hummingbot"
+TEST_WEIGHTED_TASK_ID = "/weighted_task"
+
+
+class SlidingWindowThrottlerUnitTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        cls.rate_limits: List[RateLimit] = [
+            RateLimit(limit_id=TEST_POOL_ID, limit=10, time_interval=1.0),
+            RateLimit(limit_id=TEST_PATH_URL, limit=3, time_interval=0.2,
+                      linked_limits=[LinkedLimitWeightPair(TEST_POOL_ID)]),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_ID, limit=1000, time_interval=1.0,
+                      linked_limits=[LinkedLimitWeightPair(TEST_POOL_ID, 4)]),
+        ]
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.throttler = SlidingWindowThrottler(rate_limits=self.rate_limits, safety_margin_pct=0)
+
+    def test_window_expires_old_requests_and_keeps_running_weight(self):
+        window = RateLimitWindow(rate_limit=self.rate_limits[0], safety_margin_pct=0.5)
+        window.append(10.0, 1)
+        window.append(10.5, 2)
+        window.append(11.0, 3)
+
+        window.expire(11.5)
+        self.assertEqual(3, len(window))
+        self.assertEqual(6, window.capacity_used)
+
+        window.expire(11.6)
+        self.assertEqual(2, len(window))
+        self.assertEqual(5, window.capacity_used)
+
+    @patch("hummingbot.core.api_throttler.sliding_window_throttler.SlidingWindowRequestContext._time")
+    def test_within_capacity_with_linked_limits(self, time_mock):
+        time_mock.return_value = 1000.0
+        for _ in range(3):
+            self.ev_loop.run_until_complete(self.throttler.execute_task(TEST_PATH_URL).acquire())
+
+        self.assertFalse(self.throttler.execute_task(TEST_PATH_URL).within_capacity())
+        # The weighted task only shares the pool, which has 7 of 10 units left
+        self.assertTrue(self.throttler.execute_task(TEST_WEIGHTED_TASK_ID).within_capacity())
+        self.assertEqual(3, self.throttler._windows[TEST_POOL_ID].capacity_used)
+
+        self.ev_loop.run_until_complete(self.throttler.execute_task(TEST_WEIGHTED_TASK_ID).acquire())
+        self.assertEqual(7, self.throttler._windows[TEST_POOL_ID].capacity_used)
+        self.assertFalse(self.throttler.execute_task(TEST_WEIGHTED_TASK_ID).within_capacity())
+
+        time_mock.return_value = 1000.21
+        self.assertTrue(self.throttler.execute_task(TEST_PATH_URL).within_capacity())
+
+    def test_within_capacity_for_unknown_limit_id(self):
+        context = self.throttler.execute_task(limit_id="unknown_limit_id")
+
+        self.assertTrue(context.within_capacity())
+        self.ev_loop.run_until_complete(context.acquire())
+
+    def test_acquire_awaits_when_exceed_capacity(self):
+        for _ in range(3):
+            self.ev_loop.run_until_complete(self.throttler.execute_task(TEST_PATH_URL).acquire())
+
+        with self.assertRaises(asyncio.TimeoutError):
+            self.ev_loop.run_until_complete(
+                asyncio.wait_for(self.throttler.execute_task(TEST_PATH_URL).acquire(), 0.1))
+        self.ev_loop.run_until_complete(
+            asyncio.wait_for(self.throttler.execute_task(TEST_PATH_URL).acquire(), 0.5))
+
+    def test_polling_critical_request_goes_before_waiting_low_priority_request(self):
+        throttler = SlidingWindowThrottler(rate_limits=[RateLimit(limit_id=TEST_POOL_ID, limit=1, time_interval=10)],
+                                           retry_interval=0.01, safety_margin_pct=0)
+        completed: List[RequestPriority] = []
+
+        async def request(priority: RequestPriority):
+            async with throttler.execute_task(TEST_POOL_ID, priority):
+                completed.append(priority)
+
+        async def run_requests():
+            await request(RequestPriority.NORMAL)
+            low_priority_tasks = [asyncio.ensure_future(request(RequestPriority.LOW)) for _ in range(2)]
+            await asyncio.sleep(0.005)
+            critical_task = asyncio.ensure_future(request(RequestPriority.CRITICAL))
+            await asyncio.sleep(0)
+            # The capacity frees up while all the requests are waiting, the low priority requests poll it first
+            throttler._windows[TEST_POOL_ID].expire(float("inf"))
+            await critical_task
+            for task in low_priority_tasks:
+                task.cancel()
+
+        self.ev_loop.run_until_complete(asyncio.wait_for(run_requests(), 1))
+
+        self.assertEqual([RequestPriority.NORMAL, RequestPriority.CRITICAL], completed)
+
+    def test_set_rate_limits_keeps_logged_requests(self):
+        self.ev_loop.run_until_complete(self.throttler.execute_task(TEST_PATH_URL).acquire())
+
+        self.throttler.set_rate_limits(self.rate_limits)
+
+        self.assertEqual(1, self.throttler._windows[TEST_PATH_URL].capacity_used)
+        self.assertEqual(1, self.throttler._windows[TEST_POOL_ID].capacity_used)
+
+    def test_matches_async_throttler_capacity_checks(self):
+        rng = random.Random(3)
+        limit_ids = [TEST_POOL_ID, TEST_PATH_URL, TEST_WEIGHTED_TASK_ID]
+        throttler = AsyncThrottler(rate_limits=self.rate_limits, safety_margin_pct=0.05)
+        sliding_throttler = SlidingWindowThrottler(rate_limits=self.rate_limits, safety_margin_pct=0.05)
+        now = 1640000000.0
+
+        with patch("hummingbot.core.api_throttler.async_throttler.AsyncRequestContext._time") as time_mock, \
+                patch("hummingbot.core.api_throttler.sliding_window_throttler.SlidingWindowRequestContext._time") \
+                as sliding_time_mock:
+            for _ in range(500):
+                now += rng.choice([0.0, 0.01, 0.05, 0.1])
+                time_mock.return_value = now
+                sliding_time_mock.return_value = now
+                limit_id = rng.choice(limit_ids)
+                context = throttler.execute_task(limit_id)
+                sliding_context = sliding_throttler.execute_task(limit_id)
+
+                within_capacity = context.within_capacity()
+                self.assertEqual(within_capacity, sliding_context.within_capacity())
+                if within_capacity:
+                    rate_limit, related_limits = throttler.get_related_limits(limit_id)
+                    throttler._task_logs.append(TaskLog(timestamp=now, rate_limit=rate_limit, weight=rate_limit.weight))
+                    for limit, weight in related_limits:
+                        throttler._task_logs.append(TaskLog(timestamp=now, rate_limit=limit, weight=weight))
+                    sliding_context._log_task()
+
+    def test_window_reconcile_with_server_usage(self):
+        window = RateLimitWindow(rate_limit=self.rate_limits[0], safety_margin_pct=0)
+        window.append(10.0, 2)
+        window.append(10.5, 3)
+
+        window.reconcile(8, 10.6)
+        self.assertEqual(8, window.capacity_used)
+        self.assertEqual([10.0, 10.5, 10.6], list(window.timestamps))
+
+        # The server usage does not include the requests in flight, a lower usage does not free capacity
+        window.reconcile(4, 10.7)
+        self.assertEqual(8, window.capacity_used)
+        self.assertEqual([2, 3, 3], list(window.weights))
+
+        window.reconcile(3, 11.55)
+        self.assertEqual([10.6], list(window.timestamps))
+        self.assertEqual(3, window.capacity_used)
+
+    def test_time_until_capacity(self):
+        window = RateLimitWindow(rate_limit=self.rate_limits[1], safety_margin_pct=0)
+        window.append(10.0, 1)
+        window.append(10.05, 1)
+        window.append(10.1, 1)
+
+        self.assertAlmostEqual(0.1, window.time_until_capacity(1, 10.1))
+        self.assertAlmostEqual(0.15, window.time_until_capacity(2, 10.1))
+        window.expire(10.21)
+        self.assertEqual(0, window.time_until_capacity(1, 10.21))
+
+
+class FIFOSchedulingThrottlerUnitTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop: asyncio.AbstractEventLoop = asyncio.get_event_loop()
+        cls.rate_limits: List[RateLimit] = [
+            RateLimit(limit_id=TEST_POOL_ID, limit=2, time_interval=0.2),
+            RateLimit(limit_id=TEST_PATH_URL, limit=1000, time_interval=0.2,
+                      linked_limits=[LinkedLimitWeightPair(TEST_POOL_ID)]),
+            RateLimit(limit_id=TEST_WEIGHTED_TASK_ID, limit=1, time_interval=0.2),
+        ]
+
+    def setUp(self) -> None:
+        super().setUp()
+        # A retry interval long enough to make the tests time out if the capacity was polled
+        self.throttler = SlidingWindowThrottler(
+            rate_limits=self.rate_limits, retry_interval=10, safety_margin_pct=0, fifo_scheduling=True)
+        self.completed: List[int] = []
+
+    async def _request(self, limit_id: str, index: int, priority: RequestPriority = RequestPriority.NORMAL):
+        async with self.throttler.execute_task(limit_id, priority):
+            self.completed.append(index)
+
+    def test_waiters_are_woken_up_in_fifo_order_when_capacity_frees(self):
+        async def run_requests():
+            start = time.perf_counter()
+            await asyncio.gather(*[self._request(TEST_PATH_URL, index) for index in range(5)])
+            return time.perf_counter() - start
+
+        elapsed = self.ev_loop.run_until_complete(asyncio.wait_for(run_requests(), 1))
+
+        self.assertEqual([0, 1, 2, 3, 4], self.completed)
+        # Two requests per 0.2 seconds
+        self.assertGreaterEqual(elapsed, 0.4)
+        self.assertLess(elapsed, 0.55)
+        self.assertEqual(0, self.throttler._scheduler.waiting_requests_count)
+
+    def test_waiters_do_not_delay_requests_for_other_limits(self):
+        async def run_requests():
+            tasks = [asyncio.ensure_future(self._request(TEST_PATH_URL, index)) for index in range(3)]
+            await asyncio.sleep(0.01)
+            await asyncio.wait_for(self._request(TEST_WEIGHTED_TASK_ID, 10), 0.05)
+            await asyncio.gather(*tasks)
+
+        self.ev_loop.run_until_complete(asyncio.wait_for(run_requests(), 1))
+
+        self.assertEqual([0, 1, 10, 2], self.completed)
+
+    def test_cancelled_waiter_releases_its_turn(self):
+        async def run_requests():
+            await self._request(TEST_PATH_URL, 0)
+            await self._request(TEST_PATH_URL, 1)
+            cancelled_task = asyncio.ensure_future(self._request(TEST_PATH_URL, 2))
+            waiting_task = asyncio.ensure_future(self._request(TEST_PATH_URL, 3))
+            await asyncio.sleep(0.01)
+            cancelled_task.cancel()
+            await waiting_task
+
+        self.ev_loop.run_until_complete(asyncio.wait_for(run_requests(), 1))
+
+        self.assertEqual([0, 1, 3], self.completed)
+        self.assertEqual(0, self.throttler._scheduler.waiting_requests_count)
+
+    def test_higher_priority_waiters_go_first(self):
+        async def run_requests():
+            await self._request(TEST_PATH_URL, 0)
+            await self._request(TEST_PATH_URL, 1)
+            tasks = [asyncio.ensure_future(self._request(TEST_PATH_URL, 2, RequestPriority.LOW)),
+                     asyncio.ensure_future(self._request(TEST_PATH_URL, 3, RequestPriority.LOW)),
+                     asyncio.ensure_future(self._request(TEST_PATH_URL, 4, RequestPriority.CRITICAL)),
+                     asyncio.ensure_future(self._request(TEST_PATH_URL, 5, RequestPriority.HIGH))]
+            await asyncio.gather(*tasks)
+
+        self.ev_loop.run_until_complete(asyncio.wait_for(run_requests(), 1))
+
+        self.assertEqual([0, 1, 4, 5, 2, 3], self.completed)
+        self.assertEqual(2, self.throttler.wait_time_histograms[RequestPriority.LOW].count)
+        self.assertGreater(self.throttler.wait_time_histograms[RequestPriority.LOW].max_wait_time,
+                           self.throttler.wait_time_histograms[RequestPriority.CRITICAL].max_wait_time)
+
+    def test_reserved_capacity_waits_for_low_priority_requests(self):
+        throttler = SlidingWindowThrottler(rate_limits=[RateLimit(limit_id=TEST_POOL_ID, limit=5, time_interval=0.2)],
+                                           safety_margin_pct=0, priority_reserve_pct=0.4, fifo_scheduling=True)
+        for _ in range(3):
+            self.ev_loop.run_until_complete(throttler.execute_task(TEST_POOL_ID, RequestPriority.LOW).acquire())
+
+        with self.assertRaises(asyncio.TimeoutError):
+            self.ev_loop.run_until_complete(
+                asyncio.wait_for(throttler.execute_task(TEST_POOL_ID, RequestPriority.LOW).acquire(), 0.05))
+        self.ev_loop.run_until_complete(
+            asyncio.wait_for(throttler.execute_task(TEST_POOL_ID, RequestPriority.CRITICAL).acquire(), 0.01))
+
+    def test_heavy_low_priority_request_does_not_block_the_fifo_queue(self):
+        throttler = SlidingWindowThrottler(
+            rate_limits=[RateLimit(limit_id=TEST_POOL_ID, limit=10, time_interval=0.2, weight=2)],
+            safety_margin_pct=0, priority_reserve_pct=0.9, fifo_scheduling=True)
+
+        async def run_requests():
+            await throttler.execute_task(TEST_POOL_ID, RequestPriority.LOW).acquire()
+            await throttler.execute_task(TEST_POOL_ID, RequestPriority.NORMAL).acquire()
+
+        self.ev_loop.run_until_complete(asyncio.wait_for(run_requests(), 0.5))
+
+    def test_reconcile_capacity_used_keeps_requests_in_flight(self):
+        async def run_requests():
+            await self._request(TEST_PATH_URL, 0)
+            await self._request(TEST_PATH_URL, 1)
+            waiting_task = asyncio.ensure_future(self._request(TEST_PATH_URL, 2))
+            await asyncio.sleep(0.01)
+            # Only the first request reached the server, the second one is still in flight
+            self.throttler.reconcile_capacity_used(TEST_POOL_ID, 1)
+            await asyncio.sleep(0.05)
+            self.assertEqual([0, 1], self.completed)
+            self.throttler.reconcile_capacity_used(TEST_POOL_ID, 3)
+            await asyncio.wait_for(waiting_task, 1)
+
+        self.ev_loop.run_until_complete(asyncio.wait_for(run_requests(), 2))
+
+        self.assertEqual([0, 1, 2], self.completed)
@@ -0,0 +1,101 @@
+import random
+import unittest
+
+import numpy as np
+
+from hummingbot.core.data_type.array_order_book import ArrayOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+
+class ArrayOrderBookTest(unittest.TestCase):
+
+    def _random_levels(self, rng: random.Random, mid: int, is_bid: bool, count: int, update_id: int):
+        rows = []
+        for _ in range(count):
+            offset = rng.randint(1, 60)
+            price = (mid - offset if is_bid else mid + offset) / 100
+            amount = 0.0 if rng.random() < 0.3 else round(rng.uniform(0.1, 10), 3)
+            rows.append(OrderBookRow(price, amount, update_id))
+        return rows
+
+    def assert_same_book(self, expected: OrderBook, actual: OrderBook):
+        self.assertEqual(list(expected.bid_entries()), list(actual.bid_entries()))
+        self.assertEqual(list(expected.ask_entries()), list(actual.ask_entries()))
+        self.assertEqual(expected.snapshot_uid, actual.snapshot_uid)
+        self.assertEqual(expected.last_diff_uid, actual.last_diff_uid)
+        for expected_array, actual_array in zip(expected.to_numpy(5), actual.to_numpy(5)):
+            self.assertEqual(expected_array.tolist(), actual_array.tolist())
+        for is_buy in (True, False):
+            self.assertEqual(expected.get_price(is_buy), actual.get_price(is_buy))
+            self.assertEqual(expected.get_vwap_for_volume(is_buy, 2).result_price,
+                             actual.get_vwap_for_volume(is_buy, 2).result_price)
+
+    def test_random_diff_stream_matches_set_engine(self):
+        rng = random.Random(42)
+        for dex in (False, True):
+            set_book = OrderBook(dex=dex)
+            array_book = ArrayOrderBook(dex=dex)
+            bids = [OrderBookRow(price / 100, 1.0, 1) for price in range(9900, 9990)]
+            asks = [OrderBookRow(price / 100, 1.0, 1) for price in range(10010, 10100)]
+            set_book.apply_snapshot(bids, asks, 1)
+            array_book.apply_snapshot(bids, asks, 1)
+            self.assert_same_book(set_book, array_book)
+
+            mid = 10000
+            for update_id in range(2, 2000):
+                mid += rng.randint(-2, 2)
+                diff_bids = self._random_levels(rng, mid, True, rng.randint(0, 5), update_id)
+                diff_asks = self._random_levels(rng, mid, False, rng.randint(0, 5), update_id)
+                set_book.apply_diffs(diff_bids, diff_asks, update_id)
+                array_book.apply_diffs(diff_bids, diff_asks, update_id)
+            self.assert_same_book(set_book, array_book)
+
+    def test_snapshot_with_unsorted_and_repeated_levels(self):
+        set_book = OrderBook()
+        array_book = ArrayOrderBook()
+        bids = [OrderBookRow(1.0, 1, 1), OrderBookRow(3.0, 1, 1), OrderBookRow(2.0, 1, 1), OrderBookRow(3.0, 5, 1)]
+        asks = [OrderBookRow(5.0, 1, 1), OrderBookRow(4.0, 2, 1), OrderBookRow(4.0, 3, 1)]
+        set_book.apply_snapshot(bids, asks, 10)
+        array_book.apply_snapshot(bids, asks, 10)
+
+        self.assert_same_book(set_book, array_book)
+        self.assertEqual([3.0, 2.0, 1.0], [row.price for row in array_book.bid_entries()])
+        self.assertEqual([4.0, 5.0], [row.price for row in array_book.ask_entries()])
+
+    def test_truncate_overlap_entries_cex(self):
+        order_book = ArrayOrderBook(dex=False)
+        bids_array = np.array([[1, 1, 1], [2, 1, 2], [3, 1, 3]], dtype=np.float64)
+        asks_array = np.array([[4, 1, 1], [5, 1, 2], [6, 1, 3], [7, 1, 4]], dtype=np.float64)
+        order_book.apply_numpy_snapshot(bids_array, asks_array)
+
+        order_book.apply_numpy_diffs(np.array([[50, 0.01, 6]]), np.array([[2, 0.1, 5]]))
+        bids, asks = order_book.snapshot
+
+        self.assertEqual([50., 0.01, 6.], bids.iloc[0].tolist())
+        self.assertEqual(0, len(asks))
+
+    def test_empty_book_raises_on_get_price(self):
+        order_book = ArrayOrderBook()
+
+        with self.assertRaises(EnvironmentError):
+            order_book.get_price(True)
+
+    def test_levels_matched_by_tick_when_min_price_increment_set(self):
+        order_book = ArrayOrderBook(min_price_increment=0.01)
+        order_book.apply_snapshot([OrderBookRow(0.3, 1, 1)], [OrderBookRow(0.5, 1, 1)], 1)
+
+        # 0.1 + 0.2 is not exactly 0.3 as a float, but it is the same tick
+        order_book.apply_diffs([OrderBookRow(0.1 + 0.2, 0, 2)], [], 2)
+
+        self.assertEqual([], list(order_book.bid_entries()))
+
+    def test_setting_min_price_increment_merges_levels_in_same_tick(self):
+        order_book = ArrayOrderBook()
+        order_book.apply_snapshot([OrderBookRow(0.3, 1, 1), OrderBookRow(0.1 + 0.2, 2, 2)], [], 1)
+        self.assertEqual(2, len(list(order_book.bid_entries())))
+
+        order_book.min_price_increment = 0.01
+
+        self.assertEqual([OrderBookRow(0.1 + 0.2, 2, 2)], list(order_book.bid_entries()))
+        self.assertEqual(0.01, order_book.min_price_increment)
@@ -3,6 +3,12 @@
 import logging
 import unittest
 from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import (
+    OrderBookMessage,
+    OrderBookMessageType,
+    order_book_levels_to_array,
+)
+from hummingbot.core.data_type.order_book_row import OrderBookRow
 import numpy as np
 
 
@@ -50,6 +56,147 @@ class OrderBookUnitTest(unittest.TestCase):
         self.assertEqual(best_bid, [50., 0.01, 6.])
         self.assertEqual(best_ask, 0)
 
+    def test_apply_diffs_arrays_matches_row_based_diffs(self):
+        row_book = OrderBook()
+        array_book = OrderBook()
+        bids = [OrderBookRow(1.0, 1, 1), OrderBookRow(2.0, 1, 1), OrderBookRow(3.0, 1, 1)]
+        asks = [OrderBookRow(4.0, 1, 1), OrderBookRow(5.0, 1, 1)]
+        row_book.apply_snapshot(bids, asks, 1)
+        array_book.apply_snapshot_arrays(np.array([[1, 1], [2, 1], [3, 1]], dtype=np.float64),
+                                         np.array([[4, 1], [5, 1]], dtype=np.float64),
+                                         1)
+
+        row_book.apply_diffs([OrderBookRow(3.0, 0, 2), OrderBookRow(2.5, 7, 2)], [OrderBookRow(4.5, 2, 2)], 2)
+        raw_bids = order_book_levels_to_array([["3.0", "0"], ["2.5", "7"]])
+        raw_asks = order_book_levels_to_array([["4.5", "2", "12345"]])
+        array_book.apply_diffs_arrays(raw_bids, raw_asks, 2)
+
+        self.assertEqual(list(row_book.bid_entries()), list(array_book.bid_entries()))
+        self.assertEqual(list(row_book.ask_entries()), list(array_book.ask_entries()))
+        self.assertEqual(2.5, array_book.get_price(False))
+        self.assertEqual(2, array_book.last_diff_uid)
+
+    def test_apply_diffs_arrays_with_empty_side(self):
+        order_book = OrderBook()
+        order_book.apply_snapshot_arrays(order_book_levels_to_array([["1", "1"]]), order_book_levels_to_array([]), 1)
+
+        order_book.apply_diffs_arrays(order_book_levels_to_array([]), order_book_levels_to_array([["2", "3"]]), 2)
+
+        self.assertEqual([OrderBookRow(1.0, 1.0, 1)], list(order_book.bid_entries()))
+        self.assertEqual([OrderBookRow(2.0, 3.0, 2)], list(order_book.ask_entries()))
+
+    def test_restore_from_snapshot_and_diffs_with_level_arrays(self):
+        order_book = OrderBook()
+        snapshot = OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": "COINALPHA-HBOT",
+            "update_id": 2,
+            "bids": order_book_levels_to_array([["1", "1"]]),
+            "asks": order_book_levels_to_array([["3", "1"]]),
+        }, timestamp=1)
+        diffs = [
+            OrderBookMessage(OrderBookMessageType.DIFF, {
+                "trading_pair": "COINALPHA-HBOT",
+                "update_id": update_id,
+                "bids": order_book_levels_to_array([["2", str(update_id)]]),
+                "asks": order_book_levels_to_array([]),
+            }, timestamp=update_id)
+            for update_id in (1, 2, 3)
+        ]
+
+        order_book.restore_from_snapshot_and_diffs(snapshot, diffs)
+
+        self.assertEqual([OrderBookRow(2.0, 3.0, 3), OrderBookRow(1.0, 1.0, 2)], list(order_book.bid_entries()))
+
+    def _sample_order_book(self) -> OrderBook:
+        order_book = OrderBook()
+        order_book.apply_snapshot(
+            [OrderBookRow(99, 1, 1), OrderBookRow(98, 2, 1), OrderBookRow(97.5, 0.5, 1), OrderBookRow(95, 4, 1)],
+            [OrderBookRow(101, 1.5, 1), OrderBookRow(102, 0.25, 1), OrderBookRow(104, 3, 1)],
+            1)
+        return order_book
+
+    def test_batch_volume_queries_match_single_queries(self):
+        order_book = self._sample_order_book()
+        volumes = np.array([3, 0.5, 1, 7.5, 1.5, 100, 1.75, 0.25, 3])
+
+        for is_buy in (True, False):
+            vwaps = order_book.get_vwap_for_volumes(is_buy, volumes)
+            prices = order_book.get_price_for_volumes(is_buy, volumes)
+
+            self.assertEqual(volumes.shape, vwaps.shape)
+            for volume, vwap, price in zip(volumes, vwaps, prices):
+                expected_vwap = order_book.get_vwap_for_volume(is_buy, volume).result_price
+                expected_price = order_book.get_price_for_volume(is_buy, volume).result_price
+                if np.isnan(expected_vwap):
+                    self.assertTrue(np.isnan(vwap))
+                    self.assertTrue(np.isnan(price))
+                else:
+                    self.assertAlmostEqual(expected_vwap, vwap)
+                    self.assertEqual(expected_price, price)
+
+    def test_batch_volume_queries_with_zero_and_nan_volumes(self):
+        order_book = self._sample_order_book()
+
+        vwaps = order_book.get_vwap_for_volumes(True, [0, float("nan"), 1])
+
+        self.assertEqual(101, vwaps[0])
+        self.assertTrue(np.isnan(vwaps[1]))
+        self.assertEqual(101, vwaps[2])
+
+    def test_zero_volume_vwap_is_the_best_price(self):
+        order_book = self._sample_order_book()
+        indexed_order_book = self._sample_order_book()
+        indexed_order_book.enable_depth_index(2)
+
+        for book in (order_book, indexed_order_book):
+            for is_buy, best_price in ((True, 101), (False, 99)):
+                self.assertEqual(best_price, book.get_vwap_for_volume(is_buy, 0).result_price)
+                self.assertEqual(best_price, book.get_vwap_for_volumes(is_buy, [0])[0])
+
+    def test_batch_price_queries_match_single_queries(self):
+        order_book = self._sample_order_book()
+        prices = np.array([96, 101, 99, 103, 105, 90, 97.5, 100])
+
+        for is_buy in (True, False):
+            volumes = order_book.get_volume_for_prices(is_buy, prices)
+
+            expected = [order_book.get_volume_for_price(is_buy, price).result_volume for price in prices]
+            self.assertEqual(expected, volumes.tolist())
+
+    def test_batch_queries_on_empty_order_book(self):
+        order_book = OrderBook()
+
+        self.assertTrue(np.isnan(order_book.get_vwap_for_volumes(True, np.array([1.0]))).all())
+        self.assertEqual([0.0], order_book.get_volume_for_prices(False, np.array([1.0])).tolist())
+        self.assertEqual(0, len(order_book.get_price_for_volumes(False, np.array([]))))
+
+    def test_to_numpy_exports_levels_best_price_first(self):
+        order_book = self._sample_order_book()
+
+        bids_array, asks_array = order_book.to_numpy()
+
+        self.assertEqual([list(row) for row in order_book.bid_entries()], bids_array.tolist())
+        self.assertEqual([list(row) for row in order_book.ask_entries()], asks_array.tolist())
+        self.assertEqual(np.float64, bids_array.dtype)
+
+    def test_to_numpy_with_depth(self):
+        order_book = self._sample_order_book()
+
+        bids_array, asks_array = order_book.to_numpy(2)
+
+        self.assertEqual([[99, 1, 1], [98, 2, 1]], bids_array.tolist())
+        self.assertEqual([[101, 1.5, 1], [102, 0.25, 1]], asks_array.tolist())
+        self.assertEqual((3, 3), order_book.to_numpy(10)[1].shape)
+        self.assertEqual((0, 3), order_book.to_numpy(0)[0].shape)
+        with self.assertRaises(ValueError):
+            order_book.to_numpy(-1)
+
+    def test_snapshot_from_empty_order_book(self):
+        bids_df, asks_df = OrderBook().snapshot
+
+        self.assertEqual(0, len(bids_df))
+        self.assertEqual(list(OrderBookRow._fields), list(asks_df.columns))
+
 
 def main():
     logging.basicConfig(level=logging.INFO)
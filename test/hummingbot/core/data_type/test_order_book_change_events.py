@@ -0,0 +1,100 @@
+import unittest
+
+from hummingbot.core.data_type.array_order_book import ArrayOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.event.event_logger import EventLogger
+from hummingbot.core.event.events import OrderBookEvent, OrderBookLevelsChangedEvent, OrderBookTopOfBookChangedEvent
+
+
+class OrderBookChangeEventsTest(unittest.TestCase):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.top_of_book_logger = EventLogger()
+        self.levels_logger = EventLogger()
+
+    def _order_book(self, order_book_class, watched_depth: int) -> OrderBook:
+        order_book = order_book_class()
+        order_book.apply_snapshot(
+            [OrderBookRow(99, 1, 1), OrderBookRow(98, 1, 1), OrderBookRow(97, 1, 1)],
+            [OrderBookRow(101, 1, 1), OrderBookRow(102, 1, 1), OrderBookRow(103, 1, 1)],
+            1)
+        order_book.enable_change_events(watched_depth)
+        order_book.add_listener(OrderBookEvent.TopOfBookChanged, self.top_of_book_logger)
+        order_book.add_listener(OrderBookEvent.LevelsChanged, self.levels_logger)
+        return order_book
+
+    def test_no_events_unless_enabled(self):
+        order_book = OrderBook()
+        order_book.add_listener(OrderBookEvent.TopOfBookChanged, self.top_of_book_logger)
+
+        order_book.apply_snapshot([OrderBookRow(99, 1, 1)], [OrderBookRow(101, 1, 1)], 1)
+        order_book.apply_diffs([OrderBookRow(100, 1, 2)], [], 2)
+
+        self.assertEqual(0, len(self.top_of_book_logger.event_log))
+
+    def test_top_of_book_changed_only_when_best_prices_move(self):
+        for order_book_class in (OrderBook, ArrayOrderBook):
+            self.setUp()
+            order_book = self._order_book(order_book_class, 0)
+
+            order_book.apply_diffs([OrderBookRow(98, 5, 2)], [OrderBookRow(103, 0, 2)], 2)
+            self.assertEqual(0, len(self.top_of_book_logger.event_log))
+
+            order_book.apply_diffs([OrderBookRow(99.5, 1, 3)], [], 3)
+            order_book.apply_diffs([], [OrderBookRow(101, 0, 4)], 4)
+
+            self.assertEqual(
+                [OrderBookTopOfBookChangedEvent(3, 99.5, 101), OrderBookTopOfBookChangedEvent(4, 99.5, 102)],
+                self.top_of_book_logger.event_log)
+            self.assertEqual(0, len(self.levels_logger.event_log))
+
+    def test_levels_changed_within_watched_depth(self):
+        for order_book_class in (OrderBook, ArrayOrderBook):
+            self.setUp()
+            order_book = self._order_book(order_book_class, 2)
+
+            # Level outside of the watched depth
+            order_book.apply_diffs([OrderBookRow(97, 3, 2)], [], 2)
+            self.assertEqual(0, len(self.levels_logger.event_log))
+
+            # Amount change at the second level, and removal of the top ask
+            order_book.apply_diffs([OrderBookRow(98, 2, 3), OrderBookRow(90, 1, 3)], [OrderBookRow(101, 0, 3)], 3)
+
+            self.assertEqual(
+                [OrderBookLevelsChangedEvent(3, [OrderBookRow(98, 2, 3)], [OrderBookRow(101, 0, 3)])],
+                self.levels_logger.event_log)
+            self.assertEqual([OrderBookTopOfBookChangedEvent(3, 99, 102)], self.top_of_book_logger.event_log)
+
+    def test_snapshot_events_only_when_watched_levels_change(self):
+        for order_book_class in (OrderBook, ArrayOrderBook):
+            self.setUp()
+            order_book = self._order_book(order_book_class, 2)
+
+            order_book.apply_snapshot(
+                [OrderBookRow(99, 1, 5), OrderBookRow(98, 1, 5), OrderBookRow(96, 1, 5)],
+                [OrderBookRow(101, 1, 5), OrderBookRow(102, 1, 5)],
+                5)
+            self.assertEqual(0, len(self.levels_logger.event_log))
+            self.assertEqual(0, len(self.top_of_book_logger.event_log))
+
+            order_book.apply_snapshot([OrderBookRow(99, 1, 6)], [OrderBookRow(100, 2, 6)], 6)
+
+            self.assertEqual(
+                [OrderBookLevelsChangedEvent(6, [OrderBookRow(99, 1, 6)], [OrderBookRow(100, 2, 6)], True)],
+                self.levels_logger.event_log)
+            self.assertEqual([OrderBookTopOfBookChangedEvent(6, 99, 100)], self.top_of_book_logger.event_log)
+
+    def test_disable_change_events(self):
+        order_book = self._order_book(OrderBook, 1)
+        order_book.disable_change_events()
+
+        order_book.apply_diffs([OrderBookRow(99.5, 1, 2)], [], 2)
+
+        self.assertEqual(0, len(self.top_of_book_logger.event_log))
+        self.assertEqual(0, len(self.levels_logger.event_log))
+
+    def test_negative_watched_depth_raises(self):
+        with self.assertRaises(ValueError):
+            OrderBook().enable_change_events(-1)
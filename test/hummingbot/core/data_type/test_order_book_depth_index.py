@@ -0,0 +1,107 @@
+import math
+import random
+import unittest
+
+from hummingbot.core.data_type.array_order_book import ArrayOrderBook
+from hummingbot.core.data_type.composite_order_book import CompositeOrderBook
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+
+
+class OrderBookDepthIndexTest(unittest.TestCase):
+
+    def assert_same_result(self, expected, actual):
+        for attribute in ("query_price", "query_volume", "result_price", "result_volume"):
+            expected_value = getattr(expected, attribute)
+            actual_value = getattr(actual, attribute)
+            if math.isnan(expected_value):
+                self.assertTrue(math.isnan(actual_value), f"{attribute}: {actual_value} is not NaN")
+            else:
+                self.assertAlmostEqual(expected_value, actual_value, places=9, msg=attribute)
+
+    def assert_same_queries(self, expected: OrderBook, actual: OrderBook):
+        for is_buy in (True, False):
+            for volume in (0.5, 1, 3.3, 10, 25, 80, 1000):
+                self.assert_same_result(expected.get_price_for_volume(is_buy, volume),
+                                        actual.get_price_for_volume(is_buy, volume))
+                self.assert_same_result(expected.get_vwap_for_volume(is_buy, volume),
+                                        actual.get_vwap_for_volume(is_buy, volume))
+                self.assert_same_result(expected.get_price_for_quote_volume(is_buy, volume * 100),
+                                        actual.get_price_for_quote_volume(is_buy, volume * 100))
+
+    def test_indexed_queries_match_linear_walk_on_random_stream(self):
+        rng = random.Random(7)
+        for order_book_class in (OrderBook, ArrayOrderBook):
+            plain_book = order_book_class()
+            indexed_book = order_book_class()
+            indexed_book.enable_depth_index(10)
+            self.assertEqual(10, indexed_book.depth_index_levels)
+
+            bids = [OrderBookRow(price / 100, 1.0, 1) for price in range(9900, 9990)]
+            asks = [OrderBookRow(price / 100, 1.0, 1) for price in range(10010, 10100)]
+            plain_book.apply_snapshot(bids, asks, 1)
+            indexed_book.apply_snapshot(bids, asks, 1)
+            self.assert_same_queries(plain_book, indexed_book)
+
+            mid = 10000
+            for update_id in range(2, 500):
+                mid += rng.randint(-3, 3)
+                diff_bids = [OrderBookRow((mid - rng.randint(1, 40)) / 100,
+                                          0.0 if rng.random() < 0.3 else round(rng.uniform(0.1, 5), 3),
+                                          update_id)
+                             for _ in range(rng.randint(0, 3))]
+                diff_asks = [OrderBookRow((mid + rng.randint(1, 40)) / 100,
+                                          0.0 if rng.random() < 0.3 else round(rng.uniform(0.1, 5), 3),
+                                          update_id)
+                             for _ in range(rng.randint(0, 3))]
+                plain_book.apply_diffs(diff_bids, diff_asks, update_id)
+                indexed_book.apply_diffs(diff_bids, diff_asks, update_id)
+                if update_id % 7 == 0:
+                    self.assert_same_queries(plain_book, indexed_book)
+            self.assert_same_queries(plain_book, indexed_book)
+
+    def test_indexed_queries_on_small_and_empty_books(self):
+        plain_book = OrderBook()
+        indexed_book = OrderBook()
+        indexed_book.enable_depth_index(5)
+
+        self.assert_same_queries(plain_book, indexed_book)
+
+        bids = [OrderBookRow(9.0, 1, 1), OrderBookRow(8.0, 2, 1)]
+        asks = [OrderBookRow(11.0, 1, 1)]
+        plain_book.apply_snapshot(bids, asks, 1)
+        indexed_book.apply_snapshot(bids, asks, 1)
+
+        self.assert_same_queries(plain_book, indexed_book)
+
+    def test_crossing_diff_invalidates_opposite_side(self):
+        plain_book = OrderBook(dex=False)
+        indexed_book = OrderBook(dex=False)
+        indexed_book.enable_depth_index(1)
+        bids = [OrderBookRow(9.0, 1, 1), OrderBookRow(8.0, 2, 1)]
+        asks = [OrderBookRow(11.0, 1, 1), OrderBookRow(12.0, 1, 1)]
+        plain_book.apply_snapshot(bids, asks, 1)
+        indexed_book.apply_snapshot(bids, asks, 1)
+        self.assert_same_queries(plain_book, indexed_book)
+
+        # The new ask crosses the best bid, which is removed by the overlap truncation
+        plain_book.apply_diffs([], [OrderBookRow(8.5, 1, 2)], 2)
+        indexed_book.apply_diffs([], [OrderBookRow(8.5, 1, 2)], 2)
+
+        self.assertEqual(8.0, indexed_book.get_price_for_volume(False, 1).result_price)
+        self.assert_same_queries(plain_book, indexed_book)
+
+    def test_disable_depth_index(self):
+        order_book = OrderBook()
+        order_book.enable_depth_index(3)
+        order_book.disable_depth_index()
+
+        self.assertEqual(0, order_book.depth_index_levels)
+
+    def test_invalid_depth_index_levels_raise(self):
+        with self.assertRaises(ValueError):
+            OrderBook().enable_depth_index(0)
+
+    def test_composite_order_book_does_not_support_depth_index(self):
+        with self.assertRaises(NotImplementedError):
+            CompositeOrderBook().enable_depth_index(5)
@@ -1,7 +1,9 @@
 import time
 import unittest
 
-from hummingbot.core.data_type.order_book_message import OrderBookMessage, \
+import numpy as np
+
+from hummingbot.core.data_type.order_book_message import CompactOrderBookMessage, OrderBookMessage, \
     OrderBookMessageType
 from hummingbot.core.data_type.order_book_row import OrderBookRow
 
@@ -248,3 +250,61 @@ class OrderBookMessageTest(unittest.TestCase):
         self.assertTrue(diff1 < snapshot2)  # based on id
         self.assertTrue(trade1 < snapshot1)  # based on timestamp
         self.assertTrue(diff2 < trade1)  # if same ts, ob messages < trade messages
+
+
+class CompactOrderBookMessageTest(unittest.TestCase):
+    def test_properties_match_order_book_message(self):
+        for message_type, content in [
+            (OrderBookMessageType.SNAPSHOT, {"trading_pair": "BTC-USDT", "update_id": 1, "bids": [], "asks": []}),
+            (OrderBookMessageType.DIFF, {"trading_pair": "BTC-USDT", "update_id": 3, "first_update_id": 2}),
+            (OrderBookMessageType.DIFF, {"trading_pair": "BTC-USDT", "update_id": 3}),
+            (OrderBookMessageType.TRADE, {"trading_pair": "BTC-USDT", "trade_id": 5}),
+        ]:
+            msg = OrderBookMessage(message_type, content, timestamp=1640000000.0)
+            compact_msg = CompactOrderBookMessage(message_type, content, timestamp=1640000000.0)
+
+            self.assertEqual(msg.type, compact_msg.type)
+            self.assertEqual(msg.content, compact_msg.content)
+            self.assertEqual(msg.timestamp, compact_msg.timestamp)
+            self.assertEqual(msg.trading_pair, compact_msg.trading_pair)
+            self.assertEqual(msg.update_id, compact_msg.update_id)
+            self.assertEqual(msg.first_update_id, compact_msg.first_update_id)
+            self.assertEqual(msg.trade_id, compact_msg.trade_id)
+            self.assertEqual(msg.has_update_id, compact_msg.has_update_id)
+            self.assertEqual(msg.has_trade_id, compact_msg.has_trade_id)
+            self.assertEqual(msg, compact_msg)
+            self.assertEqual(tuple(msg), tuple(compact_msg))
+
+    def test_bids_and_asks_parsed_once(self):
+        msg = CompactOrderBookMessage(
+            message_type=OrderBookMessageType.DIFF,
+            content={
+                "update_id": 10,
+                "asks": [["1.5", "2", "77"], ["3", "4", "78"]],
+                "bids": [["0.5", "6"]],
+            },
+            timestamp=time.time(),
+        )
+
+        self.assertEqual([OrderBookRow(1.5, 2.0, 10), OrderBookRow(3.0, 4.0, 10)], msg.asks)
+        self.assertEqual([OrderBookRow(0.5, 6.0, 10)], msg.bids)
+        self.assertIs(msg.asks, msg.asks)
+        self.assertIs(msg.bids_array, msg.bids_array)
+        self.assertTrue(msg.has_level_arrays)
+        np.testing.assert_array_equal(np.array([[0.5, 6.0]]), msg.bids_array)
+
+    def test_has_no_instance_dict(self):
+        msg = CompactOrderBookMessage(OrderBookMessageType.TRADE, {"trade_id": 1}, timestamp=time.time())
+
+        self.assertFalse(hasattr(msg, "__dict__"))
+        self.assertFalse(msg.has_level_arrays)
+
+    def test_ordering_with_order_book_messages(self):
+        snapshot = CompactOrderBookMessage(OrderBookMessageType.SNAPSHOT, {"update_id": 2}, timestamp=2)
+        previous_diff = OrderBookMessage(OrderBookMessageType.DIFF, {"update_id": 1}, timestamp=1)
+        next_diff = CompactOrderBookMessage(OrderBookMessageType.DIFF, {"update_id": 3}, timestamp=3)
+        trade = OrderBookMessage(OrderBookMessageType.TRADE, {"trade_id": 1}, timestamp=2)
+
+        self.assertTrue(previous_diff < snapshot)
+        self.assertTrue(snapshot < next_diff)
+        self.assertTrue(snapshot < trade)  # if same ts, ob messages < trade messages
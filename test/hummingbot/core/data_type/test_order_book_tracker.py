@@ -0,0 +1,305 @@
+import asyncio
+import unittest
+from typing import Awaitable, Dict, List, Optional
+
+from hummingbot.core.data_type.order_book import OrderBook
+from hummingbot.core.data_type.order_book_message import OrderBookMessage, OrderBookMessageType
+from hummingbot.core.data_type.order_book_row import OrderBookRow
+from hummingbot.core.data_type.order_book_tracker import OrderBookDiffDispatcher, OrderBookTracker
+from hummingbot.core.data_type.order_book_tracker_data_source import OrderBookTrackerDataSource
+
+
+class MockDataSource(OrderBookTrackerDataSource):
+
+    def __init__(self, trading_pairs: List[str]):
+        super().__init__(trading_pairs=trading_pairs)
+        self.snapshots: List[OrderBookMessage] = []
+        self.requested_snapshots: List[str] = []
+
+    async def get_last_traded_prices(self, trading_pairs: List[str], domain: Optional[str] = None) -> Dict[str, float]:
+        return {}
+
+    async def _order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
+        self.requested_snapshots.append(trading_pair)
+        return self.snapshots.pop(0)
+
+
+class OrderBookTrackerSequenceTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+        cls.trading_pair = "COINALPHA-HBOT"
+        cls.other_trading_pair = "COINBETA-HBOT"
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.data_source = MockDataSource(trading_pairs=[self.trading_pair, self.other_trading_pair])
+        self.tracker = OrderBookTracker(data_source=self.data_source,
+                                        trading_pairs=[self.trading_pair, self.other_trading_pair])
+        self.tracker.RESYNC_RETRY_DELAY = 0
+        self.tracking_task: Optional[asyncio.Task] = None
+
+        order_book = OrderBook()
+        order_book.apply_snapshot([OrderBookRow(9, 1, 10)], [OrderBookRow(11, 1, 10)], 10)
+        self.tracker._order_books[self.trading_pair] = order_book
+        self.tracker._tracking_message_queues[self.trading_pair] = asyncio.Queue()
+
+    def tearDown(self) -> None:
+        self.tracking_task and self.tracking_task.cancel()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    def _diff_message(self, first_update_id: Optional[int], update_id: int, bids: List[List[float]]):
+        content = {
+            "trading_pair": self.trading_pair,
+            "update_id": update_id,
+            "bids": bids,
+            "asks": [],
+        }
+        if first_update_id is not None:
+            content["first_update_id"] = first_update_id
+        return OrderBookMessage(OrderBookMessageType.DIFF, content, timestamp=update_id)
+
+    def _snapshot_message(self, update_id: int, bids: List[List[float]]):
+        return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": self.trading_pair,
+            "update_id": update_id,
+            "bids": bids,
+            "asks": [[11, 1]],
+        }, timestamp=update_id)
+
+    def _process_messages(self, messages: List[OrderBookMessage]):
+        message_queue = self.tracker._tracking_message_queues[self.trading_pair]
+        for message in messages:
+            message_queue.put_nowait(message)
+        self.tracking_task = self.ev_loop.create_task(self.tracker._track_single_book(self.trading_pair))
+        self.async_run_with_timeout(self._wait_until_processed(message_queue))
+
+    async def _wait_until_processed(self, message_queue: asyncio.Queue):
+        while not message_queue.empty():
+            await asyncio.sleep(0)
+        await asyncio.sleep(0.01)
+
+    def test_consecutive_diffs_are_applied_without_resync(self):
+        self._process_messages([
+            self._diff_message(9, 11, [[8, 1]]),
+            self._diff_message(12, 13, [[7, 1]]),
+        ])
+
+        order_book = self.tracker.order_books[self.trading_pair]
+        self.assertEqual([9, 8, 7], [row.price for row in order_book.bid_entries()])
+        self.assertEqual(13, order_book.last_diff_uid)
+        self.assertEqual({}, self.tracker.sequence_gap_counts)
+        self.assertEqual([], self.data_source.requested_snapshots)
+
+    def test_gap_triggers_snapshot_for_the_gapped_pair(self):
+        self.data_source.snapshots.append(self._snapshot_message(20, [[9.5, 2]]))
+
+        self._process_messages([
+            self._diff_message(11, 12, [[8, 1]]),
+            self._diff_message(15, 16, [[7, 1]]),
+            self._diff_message(21, 21, [[6, 1]]),
+        ])
+
+        order_book = self.tracker.order_books[self.trading_pair]
+        self.assertEqual([self.trading_pair], self.data_source.requested_snapshots)
+        self.assertEqual({self.trading_pair: 1}, self.tracker.sequence_gap_counts)
+        self.assertEqual({self.trading_pair: 1}, self.tracker.resync_counts)
+        self.assertEqual(20, order_book.snapshot_uid)
+        self.assertEqual([9.5, 6], [row.price for row in order_book.bid_entries()])
+
+    def test_resync_waits_for_a_snapshot_including_the_gap(self):
+        self.data_source.snapshots.extend([
+            self._snapshot_message(12, [[8.5, 1]]),
+            self._snapshot_message(16, [[9.5, 2]]),
+        ])
+
+        self._process_messages([self._diff_message(15, 17, [[7, 1]])])
+
+        order_book = self.tracker.order_books[self.trading_pair]
+        self.assertEqual(2, len(self.data_source.requested_snapshots))
+        self.assertEqual(16, order_book.snapshot_uid)
+        self.assertEqual(17, order_book.last_diff_uid)
+        self.assertEqual([9.5, 7], [row.price for row in order_book.bid_entries()])
+
+    def test_diffs_included_in_snapshot_are_skipped(self):
+        self._process_messages([self._diff_message(5, 8, [[8, 1]])])
+
+        order_book = self.tracker.order_books[self.trading_pair]
+        self.assertEqual([9], [row.price for row in order_book.bid_entries()])
+        self.assertEqual({}, self.tracker.sequence_gap_counts)
+
+    def test_diffs_without_first_update_id_are_not_validated(self):
+        self._process_messages([
+            self._diff_message(None, 1000, [[8, 1]]),
+            self._diff_message(None, 5000, [[7, 1]]),
+        ])
+
+        order_book = self.tracker.order_books[self.trading_pair]
+        self.assertEqual([9, 8, 7], [row.price for row in order_book.bid_entries()])
+        self.assertEqual({}, self.tracker.sequence_gap_counts)
+        self.assertEqual([], self.data_source.requested_snapshots)
+
+
+class OrderBookTrackerDirectDispatchTests(OrderBookTrackerSequenceTests):
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.tracker._direct_dispatch = True
+        self.dispatcher = OrderBookDiffDispatcher(self.tracker._dispatch_diff_message)
+
+    def test_diffs_are_applied_without_queueing(self):
+        message_queue = self.tracker._tracking_message_queues[self.trading_pair]
+
+        self.dispatcher.put_nowait(self._diff_message(11, 11, [[8, 1]]))
+        self.async_run_with_timeout(self.dispatcher.put(self._diff_message(12, 12, [[7, 1]])))
+
+        order_book = self.tracker.order_books[self.trading_pair]
+        self.assertTrue(message_queue.empty())
+        self.assertEqual([9, 8, 7], [row.price for row in order_book.bid_entries()])
+        self.assertEqual(12, order_book.last_diff_uid)
+
+    def test_stale_diffs_are_rejected(self):
+        self.dispatcher.put_nowait(self._diff_message(None, 9, [[8, 1]]))
+        self.dispatcher.put_nowait(self._diff_message(5, 10, [[7, 1]]))
+
+        order_book = self.tracker.order_books[self.trading_pair]
+        self.assertTrue(self.tracker._tracking_message_queues[self.trading_pair].empty())
+        self.assertEqual([9], [row.price for row in order_book.bid_entries()])
+
+    def test_diffs_before_initialization_are_saved(self):
+        message = self._diff_message(11, 11, [[8, 1]])
+        message.content["trading_pair"] = self.other_trading_pair
+
+        self.dispatcher.put_nowait(message)
+
+        self.assertEqual([message], list(self.tracker._saved_message_queues[self.other_trading_pair]))
+
+    def test_diffs_are_queued_behind_pending_messages(self):
+        message_queue = self.tracker._tracking_message_queues[self.trading_pair]
+        message_queue.put_nowait(self._snapshot_message(11, [[9.5, 2]]))
+
+        self.dispatcher.put_nowait(self._diff_message(12, 12, [[8, 1]]))
+
+        self.assertEqual(2, message_queue.qsize())
+        self._process_messages([])
+        order_book = self.tracker.order_books[self.trading_pair]
+        self.assertEqual(11, order_book.snapshot_uid)
+        self.assertEqual([9.5, 8], [row.price for row in order_book.bid_entries()])
+
+    def test_gap_is_handed_to_the_tracking_task(self):
+        self.data_source.snapshots.append(self._snapshot_message(20, [[9.5, 2]]))
+        self.tracking_task = self.ev_loop.create_task(self.tracker._track_single_book(self.trading_pair))
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        self.dispatcher.put_nowait(self._diff_message(15, 16, [[7, 1]]))
+        self.dispatcher.put_nowait(self._diff_message(21, 21, [[6, 1]]))
+        self.async_run_with_timeout(asyncio.sleep(0.01))
+
+        order_book = self.tracker.order_books[self.trading_pair]
+        self.assertEqual({self.trading_pair: 1}, self.tracker.resync_counts)
+        self.assertEqual(20, order_book.snapshot_uid)
+        self.assertEqual([9.5, 6], [row.price for row in order_book.bid_entries()])
+
+
+class DelayedSnapshotsDataSource(MockDataSource):
+
+    def __init__(self, trading_pairs: List[str], failing_trading_pairs: Optional[List[str]] = None):
+        super().__init__(trading_pairs=trading_pairs)
+        self.failing_trading_pairs = set(failing_trading_pairs or [])
+        self.in_progress = 0
+        self.max_in_progress = 0
+
+    async def _order_book_snapshot(self, trading_pair: str) -> OrderBookMessage:
+        self.requested_snapshots.append(trading_pair)
+        self.in_progress += 1
+        self.max_in_progress = max(self.max_in_progress, self.in_progress)
+        try:
+            await asyncio.sleep(0.01)
+            if trading_pair in self.failing_trading_pairs:
+                self.failing_trading_pairs.remove(trading_pair)
+                raise IOError("Snapshot request failed")
+        finally:
+            self.in_progress -= 1
+        return OrderBookMessage(OrderBookMessageType.SNAPSHOT, {
+            "trading_pair": trading_pair,
+            "update_id": 1,
+            "bids": [[9, 1]],
+            "asks": [[11, 1]],
+        }, timestamp=1)
+
+
+class OrderBookTrackerInitializationTests(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+        cls.trading_pairs = [f"COIN{index}-HBOT" for index in range(10)]
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.tracker: Optional[OrderBookTracker] = None
+
+    def tearDown(self) -> None:
+        self.tracker and self.tracker.stop()
+        super().tearDown()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: float = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    @staticmethod
+    async def _no_sleep(delay: float):
+        pass
+
+    def test_concurrent_initialization_respects_concurrency_cap(self):
+        data_source = DelayedSnapshotsDataSource(trading_pairs=self.trading_pairs)
+        self.tracker = OrderBookTracker(data_source=data_source, trading_pairs=self.trading_pairs, init_concurrency=3)
+
+        self.async_run_with_timeout(self.tracker._init_order_books())
+
+        self.assertTrue(self.tracker.ready)
+        self.assertEqual(3, data_source.max_in_progress)
+        self.assertEqual(set(self.trading_pairs), set(self.tracker.order_books))
+        self.assertTrue(all(self.tracker.is_order_book_ready(trading_pair) for trading_pair in self.trading_pairs))
+
+    def test_each_order_book_is_ready_before_the_whole_set(self):
+        data_source = DelayedSnapshotsDataSource(trading_pairs=self.trading_pairs)
+        self.tracker = OrderBookTracker(data_source=data_source, trading_pairs=self.trading_pairs, init_concurrency=2)
+        init_task = self.ev_loop.create_task(self.tracker._init_order_books())
+
+        self.async_run_with_timeout(self.tracker.wait_order_book_ready(self.trading_pairs[0]))
+
+        self.assertTrue(self.tracker.is_order_book_ready(self.trading_pairs[0]))
+        self.assertFalse(self.tracker.is_order_book_ready(self.trading_pairs[-1]))
+        self.assertFalse(self.tracker.ready)
+        self.async_run_with_timeout(init_task)
+        self.assertTrue(self.tracker.ready)
+
+    def test_failed_order_books_are_retried(self):
+        data_source = DelayedSnapshotsDataSource(trading_pairs=self.trading_pairs,
+                                                 failing_trading_pairs=[self.trading_pairs[4]])
+        self.tracker = OrderBookTracker(data_source=data_source, trading_pairs=self.trading_pairs, init_concurrency=5)
+        self.tracker._sleep = self._no_sleep
+
+        self.async_run_with_timeout(self.tracker._init_order_books())
+
+        self.assertTrue(self.tracker.ready)
+        self.assertEqual(len(self.trading_pairs) + 1, len(data_source.requested_snapshots))
+        self.assertIn(self.trading_pairs[4], self.tracker.order_books)
+
+    def test_sequential_initialization_by_default(self):
+        data_source = DelayedSnapshotsDataSource(trading_pairs=self.trading_pairs[:3])
+        self.tracker = OrderBookTracker(data_source=data_source, trading_pairs=self.trading_pairs[:3])
+        self.tracker._sleep = self._no_sleep
+
+        self.async_run_with_timeout(self.tracker._init_order_books())
+
+        self.assertTrue(self.tracker.ready)
+        self.assertEqual(1, data_source.max_in_progress)
@@ -2,12 +2,16 @@ import asyncio
 import unittest
 from typing import Awaitable
 
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
 from hummingbot.core.web_assistant.connections.connections_factory import (
-    ConnectionsFactory
-)
-from hummingbot.core.web_assistant.connections.rest_connection import (
-    RESTConnection
+    ConnectionsFactory,
+    ConnectionsPoolConfig,
+    PooledTCPConnector,
 )
+from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest
+from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 from hummingbot.core.web_assistant.connections.ws_connection import WSConnection
 
 
@@ -34,3 +38,72 @@ class ConnectionsFactoryTest(unittest.TestCase):
         rest_connection = self.async_run_with_timeout(factory.get_ws_connection())
 
         self.assertIsInstance(rest_connection, WSConnection)
+
+    def test_shared_client_uses_pool_config(self):
+        factory = ConnectionsFactory(pool_config=ConnectionsPoolConfig(limit=10, limit_per_host=2, ttl_dns_cache=30))
+        self.assertIsNone(factory.pool_metrics)
+
+        self.async_run_with_timeout(factory.get_rest_connection())
+        connector = factory._shared_client.connector
+
+        self.assertIsInstance(connector, PooledTCPConnector)
+        self.assertEqual(10, connector.limit)
+        self.assertEqual(2, connector.limit_per_host)
+        self.assertEqual(30, connector._cached_hosts._ttl)
+        self.assertEqual(0, factory.pool_metrics.open)
+
+    def test_pool_metrics(self):
+        request_received_event = asyncio.Event()
+        release_response_event = asyncio.Event()
+
+        async def handler(request):
+            request_received_event.set()
+            await release_response_event.wait()
+            return web.json_response({"one": 1})
+
+        app = web.Application()
+        app.router.add_get("/test", handler)
+        server = TestServer(app)
+        self.async_run_with_timeout(server.start_server())
+        factory = ConnectionsFactory(pool_config=ConnectionsPoolConfig(limit_per_host=1))
+        connection = self.async_run_with_timeout(factory.get_rest_connection())
+        request = RESTRequest(method=RESTMethod.GET, url=str(server.make_url("/test")))
+
+        async def call():
+            response = await connection.call(request)
+            return await response.json()
+
+        first_call = self.ev_loop.create_task(call())
+        second_call = self.ev_loop.create_task(call())
+        self.async_run_with_timeout(request_received_event.wait())
+
+        self.assertEqual(1, factory.pool_metrics.open)
+        self.assertEqual(1, factory.pool_metrics.waits)
+
+        release_response_event.set()
+        self.async_run_with_timeout(asyncio.gather(first_call, second_call))
+        self.async_run_with_timeout(call())
+        metrics = factory.pool_metrics
+
+        self.assertEqual(1, metrics.connections_created)
+        self.assertEqual(1, metrics.open)
+        self.assertEqual(1, metrics.idle)
+
+        self.async_run_with_timeout(factory._shared_client.close())
+        self.async_run_with_timeout(server.close())
+
+    def test_pool_metrics_without_aiohttp_pool_internals(self):
+        factory = ConnectionsFactory()
+        self.async_run_with_timeout(factory.get_rest_connection())
+        connector = factory._shared_client.connector
+        acquired = connector._acquired
+        del connector._acquired
+
+        metrics = factory.pool_metrics
+        connector._acquired = acquired
+
+        self.assertIsNone(metrics.open)
+        self.assertIsNone(metrics.idle)
+        self.assertEqual(0, metrics.waits)
+        self.assertIn(connector.trace_config, factory._shared_client.trace_configs)
+        self.async_run_with_timeout(factory._shared_client.close())
@@ -7,7 +7,7 @@ import aiohttp
 from aioresponses import aioresponses
 
 from hummingbot.core.web_assistant.connections.data_types import (
-    RESTMethod, RESTResponse, EndpointRESTRequest
+    RESTMethod, RESTResponse, EndpointRESTRequest, json_dumps
 )
 
 
@@ -117,6 +117,12 @@ class EndpointRESTRequestTest(unittest.TestCase):
         self.assertIsInstance(request.data, str)
         self.assertEqual(data, json.loads(request.data))
 
+    def test_json_dumps_does_not_escape_slashes(self):
+        data = {"path": "/api/v3/order", "price": 1.5}
+
+        self.assertEqual(data, json.loads(json_dumps(data)))
+        self.assertIn("/api/v3/order", json_dumps(data))
+
     def test_raises_on_data_supplied_to_non_post_request(self):
         endpoint = "some/endpoint"
         data = {"one": 1}
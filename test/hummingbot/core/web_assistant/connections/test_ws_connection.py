@@ -5,6 +5,8 @@ from typing import Awaitable, List
 from unittest.mock import AsyncMock, patch
 
 import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 
 from hummingbot.connector.test_support.network_mocking_assistant import NetworkMockingAssistant
 from hummingbot.core.web_assistant.connections.data_types import WSJSONRequest, WSResponse
@@ -248,3 +250,110 @@ class WSConnectionTest(unittest.TestCase):
         self.mocking_assistant.run_until_all_aiohttp_messages_delivered(ws_connect_mock.return_value)
 
         self.assertNotEqual(0, self.ws_connection.last_recv_time)
+
+    def connect_with_buffered_messages(self, ws_connect_mock):
+        ws_mock = self.mocking_assistant.create_websocket_mock()
+        # The messages waiting in the mocked queue are the ones buffered by the websocket reader
+        ws_mock._reader._buffer = self.mocking_assistant._incoming_websocket_aiohttp_queues[ws_mock]._queue
+        ws_connect_mock.return_value = ws_mock
+        self.async_run_with_timeout(self.ws_connection.connect(self.ws_url))
+        return ws_mock
+
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_receive_batch_returns_buffered_messages(self, ws_connect_mock):
+        ws_mock = self.connect_with_buffered_messages(ws_connect_mock)
+        self.mocking_assistant.add_websocket_aiohttp_message(ws_mock, message=json.dumps({"one": 1}))
+        self.mocking_assistant.add_websocket_aiohttp_message(ws_mock, message="not json")
+        self.mocking_assistant.add_websocket_aiohttp_message(ws_mock, message=b"\x01", message_type=aiohttp.WSMsgType.BINARY)
+        self.mocking_assistant.add_websocket_aiohttp_message(ws_mock, message="", message_type=aiohttp.WSMsgType.PING)
+        self.mocking_assistant.add_websocket_aiohttp_message(ws_mock, message=json.dumps({"two": 2}))
+
+        responses = self.async_run_with_timeout(self.ws_connection.receive_batch())
+
+        self.assertEqual([{"one": 1}, "not json", b"\x01", {"two": 2}], [response.data for response in responses])
+        ws_mock.pong.assert_called()
+        self.assertNotEqual(0, self.ws_connection.last_recv_time)
+
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_receive_batch_limits_batch_size(self, ws_connect_mock):
+        ws_mock = self.connect_with_buffered_messages(ws_connect_mock)
+        for index in range(3):
+            self.mocking_assistant.add_websocket_aiohttp_message(ws_mock, message=json.dumps({"index": index}))
+
+        responses = self.async_run_with_timeout(self.ws_connection.receive_batch(max_batch_size=2))
+        self.assertEqual([{"index": 0}, {"index": 1}], [response.data for response in responses])
+
+        responses = self.async_run_with_timeout(self.ws_connection.receive_batch(max_batch_size=2))
+        self.assertEqual([{"index": 2}], [response.data for response in responses])
+
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_receive_batch_returns_messages_received_before_close(self, ws_connect_mock):
+        ws_mock = self.connect_with_buffered_messages(ws_connect_mock)
+        ws_mock.close_code = 1000
+        self.mocking_assistant.add_websocket_aiohttp_message(ws_mock, message=json.dumps({"u": 1}))
+        self.mocking_assistant.add_websocket_aiohttp_message(ws_mock, message=json.dumps({"u": 2}))
+        self.mocking_assistant.add_websocket_aiohttp_message(ws_mock, message="", message_type=aiohttp.WSMsgType.CLOSE)
+
+        responses = self.async_run_with_timeout(self.ws_connection.receive_batch())
+
+        self.assertEqual([{"u": 1}, {"u": 2}], [response.data for response in responses])
+        self.assertTrue(self.ws_connection.connected)
+
+        with self.assertRaises(ConnectionError):
+            self.async_run_with_timeout(self.ws_connection.receive_batch())
+
+        self.assertFalse(self.ws_connection.connected)
+
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    def test_receive_batch_disconnects_and_raises_on_aiohttp_closed(self, ws_connect_mock):
+        ws_mock = self.connect_with_buffered_messages(ws_connect_mock)
+        ws_mock.close_code = 1111
+        self.mocking_assistant.add_websocket_aiohttp_message(ws_mock, message="", message_type=aiohttp.WSMsgType.CLOSED)
+
+        with self.assertRaises(ConnectionError):
+            self.async_run_with_timeout(self.ws_connection.receive_batch())
+
+        self.assertFalse(self.ws_connection.connected)
+
+    def test_installed_aiohttp_exposes_the_buffered_messages(self):
+        async def handler(request):
+            ws = web.WebSocketResponse()
+            await ws.prepare(request)
+            for index in range(3):
+                await ws.send_str(json.dumps({"index": index}))
+            await ws.receive()
+            return ws
+
+        app = web.Application()
+        app.router.add_get("/ws", handler)
+        server = TestServer(app)
+        self.async_run_with_timeout(server.start_server())
+        connection = WSConnection(self.client_session)
+        self.async_run_with_timeout(connection.connect(str(server.make_url("/ws"))))
+
+        responses = []
+        while len(responses) < 3:
+            responses.extend(self.async_run_with_timeout(connection.receive_batch()))
+
+        # Batching relies on the queue of messages of the aiohttp websocket reader
+        self.assertIsNotNone(getattr(getattr(connection._connection, "_reader", None), "_buffer", None))
+        self.assertEqual([{"index": index} for index in range(3)], [response.data for response in responses])
+        self.async_run_with_timeout(connection.disconnect())
+        self.async_run_with_timeout(server.close())
+
+    @patch("aiohttp.client.ClientSession.ws_connect", new_callable=AsyncMock)
+    @patch("hummingbot.core.web_assistant.connections.ws_connection.WSConnection._buffer_unavailable_logged", False)
+    def test_receive_batch_logs_once_when_the_buffer_is_unavailable(self, ws_connect_mock):
+        ws_mock = self.mocking_assistant.create_websocket_mock()
+        ws_mock._reader = None
+        ws_connect_mock.return_value = ws_mock
+        self.async_run_with_timeout(self.ws_connection.connect(self.ws_url))
+        for index in range(2):
+            self.mocking_assistant.add_websocket_aiohttp_message(ws_mock, message=json.dumps({"index": index}))
+
+        with self.assertLogs(WSConnection.logger().name, level="WARNING") as logs:
+            for _ in range(2):
+                self.async_run_with_timeout(self.ws_connection.receive_batch())
+
+        self.assertEqual(1, len(logs.records))
+        self.assertIn("messages buffer is not available", logs.records[0].getMessage())
@@ -8,12 +8,14 @@ import aiohttp
 from aioresponses import aioresponses
 
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
+from hummingbot.core.api_throttler.data_types import RateLimit
 from hummingbot.core.web_assistant.auth import AuthBase
 from hummingbot.core.web_assistant.connections.data_types import RESTMethod, RESTRequest, RESTResponse, WSRequest
 from hummingbot.core.web_assistant.connections.rest_connection import RESTConnection
 from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
 from hummingbot.core.web_assistant.rest_post_processors import RESTPostProcessorBase
 from hummingbot.core.web_assistant.rest_pre_processors import RESTPreProcessorBase
+from hummingbot.core.web_assistant.rest_response_cache import RESTResponseCache
 
 
 class RESTAssistantTest(unittest.TestCase):
@@ -100,3 +102,63 @@ class RESTAssistantTest(unittest.TestCase):
         self.assertIsNotNone(call_request)
         self.assertIsNotNone(call_request.headers)
         self.assertEqual(call_request.headers, auth_header)
+        self.assertIsNone(auth_req.headers)
+
+    @aioresponses()
+    def test_execute_request_with_response_cache(self, mocked_api):
+        url = "https://www.test.com/url"
+        mocked_api.get(url, body=json.dumps({"one": 1}).encode())
+        mocked_api.post(url, body=json.dumps({"two": 2}).encode())
+        mocked_api.post(url, body=json.dumps({"three": 3}).encode())
+
+        connection = RESTConnection(aiohttp.ClientSession())
+        assistant = RESTAssistant(
+            connection=connection,
+            throttler=AsyncThrottler(rate_limits=[RateLimit(limit_id="get", limit=10, time_interval=1),
+                                                  RateLimit(limit_id="post", limit=10, time_interval=1)]),
+            response_cache=RESTResponseCache(ttl=10))
+
+        for _ in range(2):
+            ret = self.async_run_with_timeout(assistant.execute_request(url=url, throttler_limit_id="get"))
+            self.assertEqual({"one": 1}, ret)
+        ret = self.async_run_with_timeout(
+            assistant.execute_request(url=url, throttler_limit_id="post", method=RESTMethod.POST))
+        self.assertEqual({"two": 2}, ret)
+        ret = self.async_run_with_timeout(
+            assistant.execute_request(url=url, throttler_limit_id="post", method=RESTMethod.POST))
+        self.assertEqual({"three": 3}, ret)
+
+        self.assertEqual(1, assistant._response_cache.metrics["get"].hits)
+        self.assertNotIn("post", assistant._response_cache.metrics)
+
+    @patch("hummingbot.core.web_assistant.connections.rest_connection.RESTConnection.call")
+    def test_call_does_not_modify_the_request_of_the_caller(self, mocked_call):
+        call_request: Optional[RESTRequest] = None
+
+        async def register_request_and_return(request: RESTRequest):
+            nonlocal call_request
+            call_request = request
+            return {}
+
+        mocked_call.side_effect = register_request_and_return
+
+        class AuthDummy(AuthBase):
+            async def rest_authenticate(self, request: RESTRequest) -> RESTRequest:
+                request.params["signature"] = "signature"
+                request.headers["authenticated"] = True
+                return request
+
+            async def ws_authenticate(self, request: WSRequest) -> WSRequest:
+                pass
+
+        connection = RESTConnection(aiohttp.ClientSession())
+        assistant = RESTAssistant(connection, throttler=AsyncThrottler(rate_limits=[]), auth=AuthDummy())
+        req = RESTRequest(method=RESTMethod.GET, url="https://www.test.com/url", params={"one": 1}, headers={},
+                          is_auth_required=True)
+
+        self.async_run_with_timeout(assistant.call(req))
+
+        self.assertEqual({"one": 1, "signature": "signature"}, call_request.params)
+        self.assertEqual({"authenticated": True}, call_request.headers)
+        self.assertEqual({"one": 1}, req.params)
+        self.assertEqual({}, req.headers)
@@ -0,0 +1,133 @@
+import asyncio
+import unittest
+from typing import Awaitable
+from unittest.mock import patch
+
+from hummingbot.core.web_assistant.connections.data_types import RESTMethod
+from hummingbot.core.web_assistant.rest_response_cache import RESTResponseCache
+
+
+class RESTResponseCacheTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.cache = RESTResponseCache(ttl=1.0, ttl_by_limit_id={"no_cache": 0})
+        self.fetch_count = 0
+        self.fetch_event = asyncio.Event()
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    async def fetch(self):
+        self.fetch_count += 1
+        await self.fetch_event.wait()
+        return {"fetch": self.fetch_count}
+
+    async def failing_fetch(self):
+        self.fetch_count += 1
+        await self.fetch_event.wait()
+        raise IOError("Error executing request")
+
+    async def run_concurrent_requests(self, limit_id: str, fetch, requests: int = 3):
+        key = self.cache.cache_key(url="https://test.com/ticker", throttler_limit_id=limit_id, params=None,
+                                   headers=None)
+        tasks = [asyncio.ensure_future(self.cache.get_or_fetch(key, limit_id, fetch)) for _ in range(requests)]
+        await asyncio.sleep(0)
+        self.fetch_event.set()
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    def test_is_cacheable(self):
+        self.assertTrue(RESTResponseCache.is_cacheable(RESTMethod.GET, is_auth_required=False, return_err=False))
+        self.assertFalse(RESTResponseCache.is_cacheable(RESTMethod.POST, is_auth_required=False, return_err=False))
+        self.assertFalse(RESTResponseCache.is_cacheable(RESTMethod.GET, is_auth_required=True, return_err=False))
+        self.assertFalse(RESTResponseCache.is_cacheable(RESTMethod.GET, is_auth_required=False, return_err=True))
+
+    def test_cache_key_ignores_params_order(self):
+        key = RESTResponseCache.cache_key("https://test.com", "limit", {"a": 1, "b": 2}, None)
+
+        self.assertEqual(key, RESTResponseCache.cache_key("https://test.com", "limit", {"b": 2, "a": 1}, None))
+        self.assertNotEqual(key, RESTResponseCache.cache_key("https://test.com", "limit", {"a": 2, "b": 2}, None))
+
+    def test_concurrent_requests_are_coalesced(self):
+        responses = self.async_run_with_timeout(self.run_concurrent_requests("ticker", self.fetch))
+
+        self.assertEqual([{"fetch": 1}] * 3, responses)
+        self.assertEqual(1, self.fetch_count)
+        metrics = self.cache.metrics["ticker"]
+        self.assertEqual(1, metrics.misses)
+        self.assertEqual(2, metrics.coalesced)
+        self.assertEqual(0, metrics.hits)
+
+    @patch("hummingbot.core.web_assistant.rest_response_cache.RESTResponseCache._time")
+    def test_response_is_cached_until_ttl_expires(self, time_mock):
+        time_mock.return_value = 100
+        self.fetch_event.set()
+        key = self.cache.cache_key("https://test.com/ticker", "ticker", None, None)
+
+        self.assertEqual({"fetch": 1}, self.async_run_with_timeout(self.cache.get_or_fetch(key, "ticker", self.fetch)))
+        time_mock.return_value = 100.9
+        self.assertEqual({"fetch": 1}, self.async_run_with_timeout(self.cache.get_or_fetch(key, "ticker", self.fetch)))
+        time_mock.return_value = 101
+        self.assertEqual({"fetch": 2}, self.async_run_with_timeout(self.cache.get_or_fetch(key, "ticker", self.fetch)))
+
+        metrics = self.cache.metrics["ticker"]
+        self.assertEqual(2, metrics.misses)
+        self.assertEqual(1, metrics.hits)
+        self.assertAlmostEqual(1 / 3, metrics.hit_ratio)
+
+    def test_each_caller_gets_its_own_copy_of_the_response(self):
+        responses = self.async_run_with_timeout(self.run_concurrent_requests("ticker", self.fetch))
+
+        self.assertEqual(3, len({id(response) for response in responses}))
+        responses[0].update({"metadata": 1})
+        self.assertEqual({"fetch": 1}, responses[1])
+
+        key = self.cache.cache_key("https://test.com/ticker", "ticker", None, None)
+        cached_response = self.async_run_with_timeout(self.cache.get_or_fetch(key, "ticker", self.fetch))
+        self.assertEqual({"fetch": 1}, cached_response)
+        self.assertEqual(1, self.fetch_count)
+
+    def test_limit_id_without_ttl_is_only_coalesced(self):
+        self.async_run_with_timeout(self.run_concurrent_requests("no_cache", self.fetch))
+        self.async_run_with_timeout(self.run_concurrent_requests("no_cache", self.fetch))
+
+        self.assertEqual(2, self.fetch_count)
+        self.assertEqual(4, self.cache.metrics["no_cache"].coalesced)
+
+    def test_errors_are_raised_to_coalesced_requests_and_not_cached(self):
+        responses = self.async_run_with_timeout(self.run_concurrent_requests("ticker", self.failing_fetch))
+
+        self.assertEqual(3, len(responses))
+        self.assertTrue(all(isinstance(response, IOError) for response in responses))
+        self.assertEqual(1, self.fetch_count)
+
+        responses = self.async_run_with_timeout(self.run_concurrent_requests("ticker", self.fetch))
+        self.assertEqual([{"fetch": 2}] * 3, responses)
+
+    def test_cancelled_caller_does_not_cancel_coalesced_requests(self):
+        async def run():
+            key = self.cache.cache_key("https://test.com/ticker", "ticker", None, None)
+            first = asyncio.ensure_future(self.cache.get_or_fetch(key, "ticker", self.fetch))
+            second = asyncio.ensure_future(self.cache.get_or_fetch(key, "ticker", self.fetch))
+            await asyncio.sleep(0)
+            first.cancel()
+            await asyncio.sleep(0)
+            self.fetch_event.set()
+            return await second
+
+        self.assertEqual({"fetch": 1}, self.async_run_with_timeout(run()))
+        self.assertEqual(1, self.fetch_count)
+
+    def test_oldest_entries_are_evicted(self):
+        cache = RESTResponseCache(ttl=10, max_entries=2)
+        self.fetch_event.set()
+        keys = [cache.cache_key(f"https://test.com/{index}", "ticker", None, None) for index in range(3)]
+        for key in keys:
+            self.async_run_with_timeout(cache.get_or_fetch(key, "ticker", self.fetch))
+
+        self.assertEqual(keys[1:], list(cache._entries))
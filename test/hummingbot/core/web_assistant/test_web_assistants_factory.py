@@ -4,6 +4,7 @@ from typing import Awaitable
 
 from hummingbot.core.api_throttler.async_throttler import AsyncThrottler
 from hummingbot.core.web_assistant.rest_assistant import RESTAssistant
+from hummingbot.core.web_assistant.rest_response_cache import RESTResponseCache
 from hummingbot.core.web_assistant.web_assistants_factory import WebAssistantsFactory
 from hummingbot.core.web_assistant.ws_assistant import WSAssistant
 
@@ -25,6 +26,17 @@ class WebAssistantsFactoryTest(unittest.TestCase):
 
         self.assertIsInstance(rest_assistant, RESTAssistant)
 
+    def test_rest_assistants_share_the_response_cache(self):
+        cache = RESTResponseCache()
+        factory = WebAssistantsFactory(throttler=AsyncThrottler(rate_limits=[]), rest_response_cache=cache)
+
+        rest_assistant = self.async_run_with_timeout(factory.get_rest_assistant())
+        other_rest_assistant = self.async_run_with_timeout(factory.get_rest_assistant())
+
+        self.assertIs(cache, factory.rest_response_cache)
+        self.assertIs(cache, rest_assistant._response_cache)
+        self.assertIs(cache, other_rest_assistant._response_cache)
+
     def test_get_ws_assistant(self):
         factory = WebAssistantsFactory(throttler=AsyncThrottler(rate_limits=[]))
 
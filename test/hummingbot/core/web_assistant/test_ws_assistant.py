@@ -93,6 +93,7 @@ class WSAssistantTest(unittest.TestCase):
         expected = {"one": 1, "two": 2}
 
         self.assertEqual(expected, sent_request.payload)
+        self.assertEqual({"one": 1}, request.payload)
 
     @patch("hummingbot.core.web_assistant.connections.ws_connection.WSConnection.send")
     def test_subscribe(self, send_mock):
@@ -200,3 +201,30 @@ class WSAssistantTest(unittest.TestCase):
 
         with self.assertRaises(StopAsyncIteration):
             self.async_run_with_timeout(iter_messages_iterator.__anext__())
+
+    @patch(
+        "hummingbot.core.web_assistant.connections.ws_connection.WSConnection.connected",
+        new_callable=PropertyMock,
+    )
+    @patch("hummingbot.core.web_assistant.connections.ws_connection.WSConnection.receive_batch")
+    def test_iter_messages_batches(self, receive_batch_mock, connected_mock):
+        class SomePostProcessor(WSPostProcessorBase):
+            async def post_process(self, response_: WSResponse) -> WSResponse:
+                return WSResponse({"processed": response_.data})
+
+        ws_assistant = WSAssistant(connection=self.ws_connection, ws_post_processors=[SomePostProcessor()])
+        connected_mock.return_value = True
+        receive_batch_mock.side_effect = [[WSResponse({"one": 1}), WSResponse({"two": 2})], [], [WSResponse(3)]]
+        iter_batches_iterator = ws_assistant.iter_messages_batches()
+
+        responses = self.async_run_with_timeout(iter_batches_iterator.__anext__())
+        self.assertEqual([{"processed": {"one": 1}}, {"processed": {"two": 2}}], [r.data for r in responses])
+
+        # The empty batches of a disconnection are not yielded
+        responses = self.async_run_with_timeout(iter_batches_iterator.__anext__())
+        self.assertEqual([{"processed": 3}], [r.data for r in responses])
+
+        connected_mock.return_value = False
+
+        with self.assertRaises(StopAsyncIteration):
+            self.async_run_with_timeout(iter_batches_iterator.__anext__())
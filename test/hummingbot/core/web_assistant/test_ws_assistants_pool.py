@@ -0,0 +1,126 @@
+import asyncio
+import unittest
+from typing import Awaitable, Dict, List
+from unittest.mock import AsyncMock, MagicMock
+
+from hummingbot.core.web_assistant.ws_assistants_pool import WSAssistantsPool, WSShardingRules
+
+
+class WSShardingRulesTest(unittest.TestCase):
+    def test_number_of_shards(self):
+        self.assertEqual(1, WSShardingRules().number_of_shards(100))
+        self.assertEqual(4, WSShardingRules(max_subscriptions_per_connection=25).number_of_shards(100))
+        self.assertEqual(5, WSShardingRules(max_subscriptions_per_connection=25).number_of_shards(101))
+        self.assertEqual(3, WSShardingRules(min_connections=3).number_of_shards(100))
+        self.assertEqual(2, WSShardingRules(min_connections=3).number_of_shards(2))
+        self.assertEqual(2, WSShardingRules(min_connections=3, max_connections=2).number_of_shards(100))
+        self.assertEqual(1, WSShardingRules(max_subscriptions_per_connection=25).number_of_shards(0))
+
+    def test_number_of_shards_above_max_connections_raises_error(self):
+        rules = WSShardingRules(max_subscriptions_per_connection=10, max_connections=2)
+
+        with self.assertRaises(ValueError):
+            rules.number_of_shards(21)
+
+    def test_shard_balances_subscriptions(self):
+        shards = WSShardingRules(max_subscriptions_per_connection=2).shard(["A", "B", "C", "D", "E"])
+
+        self.assertEqual([["A", "D"], ["B", "E"], ["C"]], shards)
+
+
+class WSAssistantsPoolTest(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        super().setUpClass()
+        cls.ev_loop = asyncio.get_event_loop()
+
+    def setUp(self) -> None:
+        super().setUp()
+        self.connections: List[MagicMock] = []
+        self.subscriptions: List[List[str]] = []
+        self.disconnections: List[List[str]] = []
+        self.processing_events: Dict[int, asyncio.Event] = {}
+        self.failed_connection_ids: List[int] = []
+        self.pool = WSAssistantsPool(connect=self.connect,
+                                     subscribe=self.subscribe,
+                                     process_messages=self.process_messages,
+                                     sharding_rules=WSShardingRules(max_subscriptions_per_connection=2),
+                                     on_interruption=self.on_interruption,
+                                     reconnect_delay=0)
+
+    def async_run_with_timeout(self, coroutine: Awaitable, timeout: int = 1):
+        ret = self.ev_loop.run_until_complete(asyncio.wait_for(coroutine, timeout))
+        return ret
+
+    async def connect(self):
+        ws_assistant = MagicMock()
+        ws_assistant.connection_id = len(self.connections)
+        ws_assistant.last_recv_time = float(len(self.connections))
+        ws_assistant.disconnect = AsyncMock()
+        self.connections.append(ws_assistant)
+        return ws_assistant
+
+    async def subscribe(self, ws_assistant, subscriptions: List[str]):
+        self.subscriptions.append(subscriptions)
+
+    async def process_messages(self, ws_assistant):
+        event = self.processing_events[ws_assistant.connection_id] = asyncio.Event()
+        await event.wait()
+        if ws_assistant.connection_id in self.failed_connection_ids:
+            raise ConnectionError("Connection closed")
+        raise Exception("Test error")
+
+    async def on_interruption(self, ws_assistant, subscriptions: List[str]):
+        self.disconnections.append(subscriptions)
+        await ws_assistant.disconnect()
+
+    async def wait_for_connections(self, connections: int):
+        while len(self.processing_events) < connections:
+            await asyncio.sleep(0)
+
+    def test_each_shard_subscribes_to_its_subscriptions(self):
+        task = self.ev_loop.create_task(self.pool.run(["A", "B", "C", "D", "E"]))
+        self.async_run_with_timeout(self.wait_for_connections(3))
+
+        self.assertEqual([["A", "D"], ["B", "E"], ["C"]], self.subscriptions)
+        self.assertEqual(3, len(self.pool.shards))
+        self.assertEqual(2.0, self.pool.last_recv_time)
+        task.cancel()
+
+    def test_interrupted_shard_reconnects_alone(self):
+        task = self.ev_loop.create_task(self.pool.run(["A", "B", "C"]))
+        self.async_run_with_timeout(self.wait_for_connections(2))
+
+        self.failed_connection_ids.append(1)
+        self.processing_events[1].set()
+        self.async_run_with_timeout(self.wait_for_connections(3))
+
+        self.assertEqual([["A", "C"], ["B"], ["B"]], self.subscriptions)
+        self.assertEqual([["B"]], self.disconnections)
+        self.connections[1].disconnect.assert_awaited()
+        self.connections[0].disconnect.assert_not_awaited()
+        self.assertEqual([0, 1], [shard.interruptions for shard in self.pool.shards])
+        self.assertIs(self.connections[2], self.pool.shards[1].ws_assistant)
+        task.cancel()
+
+    def test_shard_reconnects_after_unexpected_error(self):
+        task = self.ev_loop.create_task(self.pool.run(["A"]))
+        self.async_run_with_timeout(self.wait_for_connections(1))
+
+        self.processing_events[0].set()
+        self.async_run_with_timeout(self.wait_for_connections(2))
+
+        self.assertEqual([["A"], ["A"]], self.subscriptions)
+        self.assertEqual(1, self.pool.shards[0].interruptions)
+        task.cancel()
+
+    def test_cancel_stops_all_shards(self):
+        task = self.ev_loop.create_task(self.pool.run(["A", "B", "C"]))
+        self.async_run_with_timeout(self.wait_for_connections(2))
+
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            self.ev_loop.run_until_complete(task)
+
+        self.assertEqual([["A", "C"], ["B"]], sorted(self.disconnections))
+        self.assertTrue(all(shard.ws_assistant is None for shard in self.pool.shards))
@@ -10,7 +10,8 @@ from hummingbot.connector.exchange.paper_trade.paper_trade_exchange import Quant
 from hummingbot.connector.test_support.mock_paper_exchange import MockPaperExchange
 from hummingbot.core.clock import Clock
 from hummingbot.core.clock_mode import ClockMode
-from hummingbot.core.event.events import OrderType
+from hummingbot.core.data_type.order_candidate import OrderCandidate
+from hummingbot.core.event.events import OrderType, TradeType
 from hummingbot.strategy.market_trading_pair_tuple import MarketTradingPairTuple
 from hummingbot.strategy.script_strategy_base import ScriptStrategyBase
 
@@ -153,3 +154,38 @@ class ScriptStrategyBaseTest(unittest.TestCase):
                 message=f"({self.trading_pair}) Canceling the limit order {order_id}."
             )
         )
+
+    def test_batch_order_create_and_cancel(self):
+        self.clock.add_iterator(self.strategy)
+        self.clock.backtest_til(self.start_timestamp + self.clock_tick_size)
+        candidates = [
+            OrderCandidate(trading_pair=self.trading_pair, is_maker=True, order_type=OrderType.LIMIT,
+                           order_side=TradeType.BUY, amount=Decimal("1"), price=Decimal("90")),
+            OrderCandidate(trading_pair=self.trading_pair, is_maker=True, order_type=OrderType.LIMIT,
+                           order_side=TradeType.SELL, amount=Decimal("1.1"), price=Decimal("110")),
+        ]
+
+        order_ids = self.strategy.batch_order_create(self.connector_name, candidates)
+
+        orders = self.strategy.get_active_orders(self.connector_name)
+        self.assertEqual(order_ids, [order.client_order_id for order in orders])
+        self.assertTrue(orders[0].is_buy)
+        self.assertEqual(Decimal("90"), orders[0].price)
+        self.assertFalse(orders[1].is_buy)
+        self.assertEqual(Decimal("1.1"), orders[1].quantity)
+
+        self.strategy.batch_order_cancel(self.connector_name, orders)
+
+        self.assertTrue(
+            self._is_logged(
+                log_level="INFO",
+                message=f"({self.trading_pair}) Canceling the limit orders {order_ids}."
+            )
+        )
+
+    def test_batch_order_create_rejects_market_orders(self):
+        candidate = OrderCandidate(trading_pair=self.trading_pair, is_maker=False, order_type=OrderType.MARKET,
+                                   order_side=TradeType.BUY, amount=Decimal("1"), price=Decimal("90"))
+
+        with self.assertRaises(ValueError):
+            self.strategy.batch_order_create(self.connector_name, [candidate])